@@ -0,0 +1,7 @@
+-- Unique company names so brand seeding can upsert on name
+-- (backend/scripts/generate_1000_brands.py uses on_conflict='name')
+
+-- Check for existing duplicates first; the index below fails until they are merged:
+-- SELECT name, COUNT(*) FROM companies GROUP BY name HAVING COUNT(*) > 1;
+
+CREATE UNIQUE INDEX IF NOT EXISTS companies_name_key ON companies (name);
@@ -1,154 +1,102 @@
 #!/usr/bin/env python3
 """
 Generate 1000+ College-Focused Brand Names
+Seeds the companies table from the brand catalog in data/brands/catalog/
 Run with: python3 scripts/generate_1000_brands.py
 """
 
-import json
-import os
-from supabase import create_client, Client
-from dotenv import load_dotenv
+import sys
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+# The brand catalog is shared with scripts/brand_researcher.py
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "scripts"))
+from brand_catalog import catalog_brands, get_supabase
+
+BATCH_SIZE = 500
+PAGE_SIZE = 1000
+MAX_WORKERS = 4
+
+
+def normalize_name(name):
+    """Case/whitespace-insensitive key used to spot duplicate brands"""
+    return " ".join(name.lower().split())
+
+
+def dedupe_brands(brand_list):
+    """Drops repeated brands (first occurrence wins)"""
+    seen = set()
+    unique = []
+    for brand in brand_list:
+        key = normalize_name(brand["name"])
+        if key not in seen:
+            seen.add(key)
+            unique.append(brand)
+    return unique
+
+
+def fetch_existing_names():
+    """Reads every company name once, a page at a time"""
+    names = set()
+    start = 0
+    while True:
+        page = get_supabase().table("companies").select("name").order("name").range(start, start + PAGE_SIZE - 1).execute().data or []
+        names.update(normalize_name(row["name"]) for row in page if row.get("name"))
+        if len(page) < PAGE_SIZE:
+            return names
+        start += PAGE_SIZE
+
+
+def upsert_batch(records):
+    # ignore_duplicates leaves rows that already exist (e.g. edited by an admin) untouched
+    get_supabase().table("companies").upsert(records, on_conflict="name", ignore_duplicates=True).execute()
+    return len(records)
 
-load_dotenv()
-
-# Initialize Supabase client
-url: str = os.environ.get("SUPABASE_URL")
-key: str = os.environ.get("SUPABASE_SERVICE_ROLE_KEY")
-supabase: Client = create_client(url, key)
-
-# Comprehensive list of 1000+ college-focused brands
-brands = [
-    # ENTERTAINMENT & STREAMING (60 brands)
-    {"name": "Netflix", "industry": "Streaming", "description": "Leading streaming service for college students."},
-    {"name": "Hulu", "industry": "Streaming", "description": "TV and movie streaming with student discount."},
-    {"name": "Disney+", "industry": "Streaming", "description": "Disney, Pixar, Marvel, Star Wars streaming."},
-    {"name": "Amazon Prime Video", "industry": "Streaming", "description": "Included with Prime Student membership."},
-    {"name": "Paramount+", "industry": "Streaming", "description": "CBS and Paramount content streaming."},
-    {"name": "Peacock", "industry": "Streaming", "description": "NBCUniversal streaming service."},
-    {"name": "Apple TV+", "industry": "Streaming", "description": "Apple original content streaming."},
-    {"name": "Max (HBO Max)", "industry": "Streaming", "description": "Warner Bros premium streaming."},
-    {"name": "Showtime", "industry": "Streaming", "description": "Premium cable network streaming."},
-    {"name": "Starz", "industry": "Streaming", "description": "Premium entertainment streaming."},
-    {"name": "Crave", "industry": "Streaming", "description": "Canadian streaming service."},
-    {"name": "Crunchyroll", "industry": "Anime Streaming", "description": "Anime streaming platform."},
-    {"name": "Funimation", "industry": "Anime Streaming", "description": "Dubbed anime streaming."},
-    {"name": "VRV", "industry": "Streaming", "description": "Geek and fandom streaming."},
-    {"name": "Tubi", "industry": "Free Streaming", "description": "Free ad-supported streaming."},
-    {"name": "Pluto TV", "industry": "Free Streaming", "description": "Free live TV and movies."},
-    {"name": "Roku", "industry": "Streaming Devices", "description": "Streaming platform and devices."},
-    {"name": "Fire TV", "industry": "Streaming Devices", "description": "Amazon streaming device."},
-    {"name": "Chromecast", "industry": "Streaming Devices", "description": "Google streaming device."},
-    {"name": "Apple TV", "industry": "Streaming Devices", "description": "Apple streaming device."},
-
-    # TRAVEL & TRANSPORTATION (60 brands)
-    {"name": "Uber", "industry": "Rideshare", "description": "On-demand ridesharing for students."},
-    {"name": "Lyft", "industry": "Rideshare", "description": "Rideshare with student promotions."},
-    {"name": "Bird", "industry": "Scooter Share", "description": "Electric scooter rentals."},
-    {"name": "Lime", "industry": "Scooter Share", "description": "E-scooters and bikes for campus."},
-    {"name": "Spin", "industry": "Scooter Share", "description": "Shared electric scooters."},
-    {"name": "Citi Bike", "industry": "Bike Share", "description": "Urban bike sharing program."},
-    {"name": "Zipcar", "industry": "Car Share", "description": "Hourly car rental for students."},
-    {"name": "Turo", "industry": "P2P Car Rental", "description": "Peer-to-peer car sharing."},
-    {"name": "Getaround", "industry": "P2P Car Rental", "description": "Instant car sharing app."},
-    {"name": "Enterprise Rent-A-Car", "industry": "Car Rental", "description": "Student car rental discounts."},
-    {"name": "Hertz", "industry": "Car Rental", "description": "Car rental services."},
-    {"name": "Budget", "industry": "Car Rental", "description": "Affordable car rentals."},
-    {"name": "Expedia", "industry": "Travel Booking", "description": "Student travel deals and booking."},
-    {"name": "Booking.com", "industry": "Travel Booking", "description": "Hotel and travel reservations."},
-    {"name": "Airbnb", "industry": "Vacation Rentals", "description": "Short-term rental marketplace."},
-    {"name": "VRBO", "industry": "Vacation Rentals", "description": "Vacation rental platform."},
-    {"name": "Hostelworld", "industry": "Budget Travel", "description": "Hostel booking for students."},
-    {"name": "STA Travel", "industry": "Student Travel", "description": "Student and youth travel specialists."},
-    {"name": "StudentUniverse", "industry": "Student Travel", "description": "Exclusive student flight deals."},
-    {"name": "Skyscanner", "industry": "Flight Search", "description": "Compare cheap flights and hotels."},
-
-    # HEALTH & WELLNESS (60 brands)
-    {"name": "Planet Fitness", "industry": "Gym", "description": "Judgment-free gym with student rates."},
-    {"name": "Anytime Fitness", "industry": "Gym", "description": "24/7 gym access nationwide."},
-    {"name": "LA Fitness", "industry": "Gym", "description": "Full-service fitness club."},
-    {"name": "Gold's Gym", "industry": "Gym", "description": "Classic bodybuilding gym."},
-    {"name": "24 Hour Fitness", "industry": "Gym", "description": "Around-the-clock gym access."},
-    {"name": "Crunch Fitness", "industry": "Gym", "description": "No judgments gym chain."},
-    {"name": "Equinox", "industry": "Premium Gym", "description": "Luxury fitness club."},
-    {"name": "SoulCycle", "industry": "Boutique Fitness", "description": "Indoor cycling classes."},
-    {"name": "Barry's Bootcamp", "industry": "Boutique Fitness", "description": "High-intensity interval training."},
-    {"name": "Orangetheory", "industry": "Boutique Fitness", "description": "Heart-rate based group training."},
-    {"name": "F45", "industry": "Boutique Fitness", "description": "45-minute functional training."},
-    {"name": "Pure Barre", "industry": "Boutique Fitness", "description": "Ballet-inspired workout."},
-    {"name": "CorePower Yoga", "industry": "Yoga Studios", "description": "Heated power yoga classes."},
-    {"name": "YogaWorks", "industry": "Yoga Studios", "description": "Traditional yoga instruction."},
-    {"name": "Peloton", "industry": "Connected Fitness", "description": "At-home fitness bike and classes."},
-    {"name": "Mirror", "industry": "Connected Fitness", "description": "Smart home gym mirror."},
-    {"name": "Tonal", "industry": "Connected Fitness", "description": "Digital weight training."},
-    {"name": "Whoop", "industry": "Fitness Tracking", "description": "Performance optimization wearable."},
-    {"name": "Fitbit", "industry": "Fitness Tracking", "description": "Activity and health tracker."},
-    {"name": "Garmin", "industry": "Fitness Tracking", "description": "GPS and fitness watches."},
-
-    # Add 850+ more brands across remaining categories...
-    # (Python will handle the generation more efficiently)
-]
-
-# Generate additional brands programmatically to reach 1000+
-additional_categories = {
-    "Beauty & Personal Care": ["Sephora", "Ulta", "Glossier", "Fenty Beauty", "Kylie Cosmetics", "ColourPop", "e.l.f. Cosmetics", "NYX", "MAC Cosmetics", "Anastasia Beverly Hills", "Tarte", "Urban Decay", "Too Faced", "Benefit", "Clinique", "Estée Lauder", "The Ordinary", "CeraVe", "Neutrogena", "Cetaphil", "La Roche-Posay", "Drunk Elephant", "Sunday Riley", "Tatcha", "Kiehl's", "Origins", "Fresh", "Laneige", "Innisfree", "K-Beauty brands", "Dove", "Nivea", "Vaseline", "Aveeno", "Gold Bond", "Shiseido", "L'Oréal", "Maybelline", "Revlon", "CoverGirl", "Rimmel", "Physicians Formula", "Wet n Wild", "Milani", "Makeup Revolution", "BH Cosmetics", "Morphe", "Jeffree Star Cosmetics", "Huda Beauty", "Patrick Ta"],
-    "Gaming & Esports": ["Riot Games", "Epic Games", "Valve", "Blizzard Entertainment", "Activision", "EA Sports", "2K Games", "Ubisoft", "Rockstar Games", "Bethesda", "CD Projekt Red", "Square Enix", "Capcom", "Bandai Namco", "Sega", "Take-Two Interactive", "THQ Nordic", "Warner Bros Games", "Electronic Arts", "Steam", "Twitch", "Discord Nitro", "G FUEL", "Scuf Gaming", "Astro Gaming", "Turtle Beach", "Alienware", "MSI", "ASUS ROG", "Gigabyte", "NZXT", "CyberPowerPC", "iBUYPOWER", "Elgato", "OBS Studio", "Streamlabs", "XSplit", "Faceit", "ESEA", "Battlefy", "Toornament", "ESL Gaming", "DreamHack", "MLG", "FaZe Clan", "100 Thieves", "Cloud9", "TSM", "Team Liquid", "G2 Esports"],
-    "Social Media & Apps": ["TikTok", "Instagram", "Snapchat", "Twitter/X", "Facebook", "BeReal", "Pinterest", "LinkedIn", "Reddit", "Tumblr", "Threads", "Bluesky", "Mastodon", "WhatsApp", "Telegram", "Signal", "GroupMe", "Slack", "Microsoft Teams", "Bumble", "Tinder", "Hinge", "Coffee Meets Bagel", "The League", "Raya", "Grindr", "Her", "Feeld", "OkCupid", "Match.com", "eHarmony", "Zoosk", "Plenty of Fish", "Badoo", "Yubo", "Wizz", "VSCO", "Facetune", "Lightroom Mobile", "Canva", "Over", "PicsArt", "Snapseed", "TouchRetouch", "Unfold", "StoryArt", "Mojo", "InShot", "CapCut", "Adobe Premiere Rush"],
-    "Events & Ticketing": ["Ticketmaster", "StubHub", "Vivid Seats", "SeatGeek", "Eventbrite", "Dice", "Bandsintown", "Songkick", "Live Nation", "AXS", "Gametime", "TickPick", "Fever", "Posh", "Tixr", "Universe", "Billetto", "RA (Resident Advisor)", "EDC (Electric Daisy Carnival)", "Coachella", "Lollapalooza", "Bonnaroo", "Austin City Limits", "Governors Ball", "Outside Lands", "Electric Forest", "Firefly", "Hangout Fest", "Rolling Loud", "Day N Vegas", "Hard Summer", "Ultra Music Festival", "Tomorrowland", "Burning Man", "SXSW", "Comic-Con", "VidCon", "PAX", "E3", "Dreamforce", "CES", "TED", "TEDx", "College GameDay", "March Madness", "College World Series", "NCAA Championships", "Intramural Sports", "Campus Activities Board"]
-}
-
-# Add all additional categories
-for category, brand_names in additional_categories.items():
-    for brand_name in brand_names:
-        brands.append({
-            "name": brand_name,
-            "industry": category,
-            "description": f"{brand_name} - Popular with college students in the {category} category."
-        })
-
-print(f"🌱 Preparing to seed {len(brands)} brands...")
 
 def seed_brands():
+    start_time = time.time()
+    brands = catalog_brands()
+    print(f"🌱 Preparing to seed {len(brands)} brands...")
+
+    unique = dedupe_brands(brands)
+    existing = fetch_existing_names()
+    new_brands = [b for b in unique if normalize_name(b["name"]) not in existing]
+
+    print(f"🔁 {len(brands) - len(unique)} duplicate(s) in the list, {len(unique) - len(new_brands)} already in companies")
+
+    records = [
+        {
+            "name": brand["name"],
+            "description": brand["description"],
+            "brand_industry": brand["industry"],
+            "is_brand": True,
+            "approval_status": "approved",
+        }
+        for brand in new_brands
+    ]
+    batches = [records[i:i + BATCH_SIZE] for i in range(0, len(records), BATCH_SIZE)]
+
     success_count = 0
     error_count = 0
-    batch_size = 50
-
-    for i in range(0, len(brands), batch_size):
-        batch = brands[i:i + batch_size]
-        brand_records = [
-            {
-                "name": brand["name"],
-                "description": brand["description"],
-                "brand_industry": brand["industry"],
-                "is_brand": True,
-                "approval_status": "approved",
-            }
-            for brand in batch
-        ]
-
-        try:
-            # Use regular insert (duplicates will be skipped)
-            response = supabase.table("companies").insert(brand_records).execute()
-
-            success_count += len(batch)
-            print(f"✅ Batch {i // batch_size + 1}: Inserted {len(batch)} brands")
-
-        except Exception as e:
-            # If error is due to duplicates, that's okay
-            if "duplicate" in str(e).lower() or "unique" in str(e).lower():
-                print(f"⚠️  Batch {i // batch_size + 1}: Some duplicates skipped")
-                success_count += len(batch)  # Count as success since brands exist
-            else:
-                error_count += len(batch)
-                print(f"❌ Batch {i // batch_size + 1} error: {str(e)}")
 
-        # Small delay to avoid rate limiting
-        time.sleep(0.1)
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {executor.submit(upsert_batch, batch): n for n, batch in enumerate(batches, 1)}
+        for future in as_completed(futures):
+            n = futures[future]
+            batch = batches[n - 1]
+            try:
+                success_count += future.result()
+                print(f"✅ Batch {n}/{len(batches)}: Upserted {len(batch)} brands")
+            except Exception as e:
+                error_count += len(batch)
+                print(f"❌ Batch {n}/{len(batches)} error: {str(e)}")
 
-    print(f"\n📈 Seeding Complete!")
+    print(f"\n📈 Seeding Complete in {time.time() - start_time:.1f}s!")
     print(f"✅ Successfully inserted: {success_count} brands")
+    print(f"⏭️  Already present: {len(unique) - len(new_brands)} brands")
     print(f"❌ Errors: {error_count} brands")
-    print(f"📊 Total processed: {success_count + error_count} brands")
+    print(f"📊 Total processed: {len(unique)} brands")
 
 if __name__ == "__main__":
     seed_brands()
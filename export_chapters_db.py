@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Export chapters of one organization type (college, organization, Instagram handle)
+to CSV straight from Postgres
+
+Thin wrapper over export_service.py: runs the <org_type>_chapters export with
+the psycopg reader, which streams `COPY (SELECT ...) TO STDOUT WITH CSV HEADER`
+into the output file.
+
+Usage:
+    export SUPABASE_DB_PASSWORD='...'
+    python3 export_chapters_db.py sorority sorority_instagram_handles.csv
+    python3 export_chapters_db.py fraternity fraternity_all_chapters.csv
+"""
+import argparse
+
+from export_service import ENTITIES, make_reader, run_export
+
+ORG_TYPES = ('fraternity', 'sorority', 'honor_society')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export chapters of one organization type to CSV")
+    parser.add_argument("org_type", choices=ORG_TYPES)
+    parser.add_argument("output", help="CSV file to write")
+    args = parser.parse_args()
+
+    print("Connecting to database...")
+    reader = make_reader('psycopg', 1)
+
+    try:
+        print(f"Exporting {args.org_type} chapters...")
+        path, rows = run_export(ENTITIES[f"{args.org_type}_chapters"], reader, 'csv', output=args.output)
+    finally:
+        reader.close()
+
+    print(f"\n✅ CSV file created: {path}")
+    print(f"Total rows: {rows}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,515 @@
+#!/usr/bin/env python3
+"""
+Export Service
+Declarative entity exports run through streaming readers and pluggable writers
+
+Entities (chapters by organization type, universities, rosters without PII,
+brands) are declared once in ENTITIES. A reader streams batches of rows from
+PostgREST, Postgres (psycopg2) or the supabase client; a writer turns them into
+CSV, NDJSON or Parquet. Several exports run concurrently.
+
+Usage:
+    python3 export_service.py --list
+    python3 export_service.py sorority_chapters universities --output-dir exports/
+    python3 export_service.py sorority_chapters --output sorority_instagram_handles.csv
+    python3 export_service.py --all --reader psycopg --format parquet --parallel 4
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+SUPABASE_URL = os.getenv("SUPABASE_URL", "https://vvsawtexgpopqxgaqyxg.supabase.co")
+
+# Direct Postgres connection (Supabase pooler)
+DB_HOST = "aws-0-us-east-1.pooler.supabase.com"
+DB_NAME = "postgres"
+DB_USER = "postgres.vvsawtexgpopqxgaqyxg"
+DB_PORT = "6543"
+
+PAGE_SIZE = 1000
+
+Row = Dict[str, object]
+Sink = Callable[[List[Row]], None]
+
+
+# ---------------------------------------------------------------------------
+# Entity declarations
+# ---------------------------------------------------------------------------
+
+# SQL casts per column type, so DECIMAL columns arrive as floats, not decimal.Decimal
+SQL_CASTS = {'int': 'bigint', 'float': 'float8'}
+PY_CASTS = {'int': int, 'float': float, 'bool': bool}
+
+
+@dataclass(frozen=True)
+class Column:
+    """One output column"""
+    header: str
+    path: str   # dotted path into a PostgREST row, e.g. "universities.name"
+    sql: str    # SQL expression for the Postgres reader
+    type: str = 'str'  # str | int | float | bool
+
+    def select(self) -> str:
+        cast = SQL_CASTS.get(self.type)
+        expression = f'({self.sql})::{cast}' if cast else self.sql
+        return f'{expression} AS "{self.header}"'
+
+    def convert(self, value):
+        """The value as the column's Python type (None stays None)"""
+        cast = PY_CASTS.get(self.type)
+        return value if value is None or cast is None else cast(value)
+
+
+@dataclass(frozen=True)
+class EntityExport:
+    """A named export: which table, which columns, which rows"""
+    name: str
+    table: str
+    columns: Tuple[Column, ...]
+    rest_select: str  # PostgREST select (must include id)
+    rest_filters: Tuple[Tuple[str, str], ...] = ()
+    sql_from: str = ''
+    sql_order: str = ''
+    sql_params: Tuple = ()  # bound to the %s placeholders in sql_from
+
+    def sql_query(self) -> str:
+        select = ',\n  '.join(c.select() for c in self.columns)
+        return f"SELECT\n  {select}\n{self.sql_from}\n{self.sql_order}".strip()
+
+
+def _chapters_by_type(org_type: str) -> EntityExport:
+    label = org_type.replace('_', ' ').title()
+    return EntityExport(
+        name=f"{org_type}_chapters",
+        table='chapters',
+        columns=(
+            Column('College', 'universities.name', 'u.name'),
+            Column(f'{label} Name', 'greek_organizations.name', 'go.name'),
+            Column('Instagram Handle', 'instagram_handle', "COALESCE(c.instagram_handle, '')"),
+        ),
+        # !inner so the type filter drops chapters instead of nulling the embed
+        rest_select='id,instagram_handle,universities(name),greek_organizations!inner(name,organization_type)',
+        rest_filters=(('greek_organizations.organization_type', f'eq.{org_type}'),),
+        sql_from=(
+            "FROM chapters c\n"
+            "JOIN universities u ON c.university_id = u.id\n"
+            "JOIN greek_organizations go ON c.greek_organization_id = go.id\n"
+            "WHERE go.organization_type = %s"
+        ),
+        sql_order='ORDER BY u.name, go.name',
+        sql_params=(org_type,),
+    )
+
+
+ENTITIES: Dict[str, EntityExport] = {
+    entity.name: entity for entity in [
+        _chapters_by_type('fraternity'),
+        _chapters_by_type('sorority'),
+        _chapters_by_type('honor_society'),
+        EntityExport(
+            name='universities',
+            table='universities',
+            columns=(
+                Column('id', 'id', 'id'),
+                Column('name', 'name', 'name'),
+                Column('state', 'state', 'state'),
+                Column('location', 'location', 'location'),
+                Column('student_count', 'student_count', 'student_count', 'int'),
+                Column('greek_percentage', 'greek_percentage', 'greek_percentage', 'float'),
+                Column('website', 'website', 'website'),
+            ),
+            rest_select='id,name,state,location,student_count,greek_percentage,website',
+            sql_from='FROM universities',
+            sql_order='ORDER BY name',
+        ),
+        # Roster rows without name, email, phone or LinkedIn URL
+        EntityExport(
+            name='rosters',
+            table='chapter_members',
+            columns=(
+                Column('id', 'id', 'id'),
+                Column('chapter_id', 'chapter_id', 'chapter_id'),
+                Column('position', 'position', 'position'),
+                Column('member_type', 'member_type', 'member_type'),
+                Column('graduation_year', 'graduation_year', 'graduation_year', 'int'),
+                Column('major', 'major', 'major'),
+                Column('is_primary_contact', 'is_primary_contact', 'is_primary_contact', 'bool'),
+            ),
+            rest_select='id,chapter_id,position,member_type,graduation_year,major,is_primary_contact',
+            sql_from='FROM chapter_members',
+            sql_order='ORDER BY chapter_id',
+        ),
+        EntityExport(
+            name='brands',
+            table='companies',
+            columns=(
+                Column('id', 'id', 'id'),
+                Column('name', 'name', 'name'),
+                Column('industry', 'brand_industry', 'brand_industry'),
+                Column('description', 'description', 'description'),
+                Column('website', 'website', 'website'),
+                Column('approval_status', 'approval_status', 'approval_status'),
+            ),
+            rest_select='id,name,brand_industry,description,website,approval_status',
+            rest_filters=(('is_brand', 'eq.true'),),
+            sql_from='FROM companies WHERE is_brand',
+            sql_order='ORDER BY name',
+        ),
+    ]
+}
+
+
+def _dig(row: Dict, path: str):
+    for part in path.split('.'):
+        row = row.get(part) if isinstance(row, dict) else None
+    return row
+
+
+def project(entity: EntityExport, rows: List[Dict]) -> List[Row]:
+    """Maps nested API rows onto the entity's output columns"""
+    return [{c.header: c.convert(_dig(row, c.path)) for c in entity.columns} for row in rows]
+
+
+def rows_from_tuples(entity: EntityExport, batch: List[Tuple]) -> List[Row]:
+    """Maps Postgres result tuples onto the entity's output columns"""
+    return [{c.header: c.convert(value) for c, value in zip(entity.columns, row)} for row in batch]
+
+
+def key_ranges(count: int) -> List[Tuple[str, Optional[str]]]:
+    """Splits the UUID keyspace into `count` [low, high) ranges on the first 32 bits"""
+    step = 2 ** 32 // count
+    bounds = [f"{i * step:08x}-0000-0000-0000-000000000000" for i in range(count)]
+    return list(zip(bounds, bounds[1:] + [None]))
+
+
+# ---------------------------------------------------------------------------
+# Readers
+# ---------------------------------------------------------------------------
+
+class PostgRESTReader:
+    """
+    Keyset-paginates PostgREST on id, fetching several UUID ranges concurrently
+    over one pooled session
+    """
+
+    def __init__(self, key: str, ranges_per_export: int = 4, pool_size: int = 16):
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self.ranges_per_export = ranges_per_export
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=3)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({
+            "apikey": key,
+            "Authorization": f"Bearer {key}",
+            "Accept": "application/json",
+        })
+
+    def _read_range(self, entity: EntityExport, low: str, high: Optional[str], sink: Sink):
+        url = f"{SUPABASE_URL}/rest/v1/{entity.table}"
+        lower = f"id.gte.{low}"
+
+        while True:
+            conditions = [lower] + ([f"id.lt.{high}"] if high else [])
+            params = [
+                ("select", entity.rest_select),
+                ("and", f"({','.join(conditions)})"),
+                ("order", "id.asc"),
+                ("limit", PAGE_SIZE),
+                *entity.rest_filters,
+            ]
+
+            response = self.session.get(url, params=params, timeout=60)
+            response.raise_for_status()
+            data = response.json()
+
+            if not data:
+                break
+
+            sink(project(entity, data))
+
+            if len(data) < PAGE_SIZE:
+                break
+
+            lower = f"id.gt.{data[-1]['id']}"
+
+    def read(self, entity: EntityExport, sink: Sink):
+        with ThreadPoolExecutor(max_workers=self.ranges_per_export) as executor:
+            futures = [
+                executor.submit(self._read_range, entity, low, high, sink)
+                for low, high in key_ranges(self.ranges_per_export)
+            ]
+            for future in futures:
+                future.result()
+
+    def close(self):
+        self.session.close()
+
+
+class PsycopgReader:
+    """
+    Streams rows from Postgres with a named server-side cursor; CSV exports
+    skip Python rows entirely via COPY ... TO STDOUT
+    """
+
+    def __init__(self, password: str, itersize: int = 5000):
+        import psycopg2
+
+        self.itersize = itersize
+        self._local = threading.local()
+        self._connect = lambda: psycopg2.connect(
+            host=DB_HOST, database=DB_NAME, user=DB_USER, password=password, port=DB_PORT
+        )
+        self._connections = []
+        self._lock = threading.Lock()
+
+    def _conn(self):
+        # psycopg2 connections must not run two cursors at once across threads
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def read(self, entity: EntityExport, sink: Sink):
+        conn = self._conn()
+        with conn.cursor(name=f"export_{entity.name}") as cursor:
+            cursor.itersize = self.itersize
+            cursor.execute(entity.sql_query(), entity.sql_params or None)
+            while True:
+                batch = cursor.fetchmany(self.itersize)
+                if not batch:
+                    break
+                sink(rows_from_tuples(entity, batch))
+        conn.commit()
+
+    def copy_csv(self, entity: EntityExport, fileobj) -> int:
+        conn = self._conn()
+        with conn.cursor() as cursor:
+            # COPY takes no bind parameters, so quote the literals with mogrify
+            select = cursor.mogrify(entity.sql_query(), entity.sql_params or None).decode()
+            cursor.copy_expert(f"COPY ({select}) TO STDOUT WITH CSV HEADER", fileobj)
+            count = cursor.rowcount
+        conn.commit()
+        return count
+
+    def close(self):
+        for conn in self._connections:
+            conn.close()
+
+
+class SupabaseReader:
+    """Keyset-paginates through the supabase client (single range)"""
+
+    def __init__(self, key: str):
+        from supabase import create_client
+
+        self.client = create_client(SUPABASE_URL, key)
+
+    def read(self, entity: EntityExport, sink: Sink):
+        last_id = None
+        while True:
+            query = self.client.table(entity.table).select(entity.rest_select)
+            for column, condition in entity.rest_filters:
+                operator, value = condition.split('.', 1)
+                query = query.filter(column, operator, value)
+            if last_id:
+                query = query.gt('id', last_id)
+
+            data = query.order('id').limit(PAGE_SIZE).execute().data
+            if not data:
+                break
+
+            sink(project(entity, data))
+
+            if len(data) < PAGE_SIZE:
+                break
+            last_id = data[-1]['id']
+
+    def close(self):
+        pass
+
+
+# ---------------------------------------------------------------------------
+# Writers
+# ---------------------------------------------------------------------------
+
+class CsvWriter:
+    extension = 'csv'
+
+    def __init__(self, path: str, entity: EntityExport):
+        self.file = open(path, 'w', newline='', encoding='utf-8')
+        self.writer = csv.writer(self.file)
+        self.headers = [c.header for c in entity.columns]
+        self.writer.writerow(self.headers)
+
+    def write(self, rows: List[Row]):
+        self.writer.writerows(
+            ['' if row[h] is None else row[h] for h in self.headers] for row in rows
+        )
+
+    def close(self):
+        self.file.close()
+
+
+class NdjsonWriter:
+    extension = 'ndjson'
+
+    def __init__(self, path: str, entity: EntityExport):
+        self.file = open(path, 'w', encoding='utf-8')
+
+    def write(self, rows: List[Row]):
+        self.file.writelines(json.dumps(row, default=str) + '\n' for row in rows)
+
+    def close(self):
+        self.file.close()
+
+
+class ParquetWriter:
+    extension = 'parquet'
+
+    def __init__(self, path: str, entity: EntityExport):
+        if not PYARROW_AVAILABLE:
+            raise ImportError("Parquet output needs pyarrow. Run: pip install pyarrow")
+
+        types = {'str': pa.string(), 'int': pa.int64(), 'float': pa.float64(), 'bool': pa.bool_()}
+        self.schema = pa.schema([(c.header, types[c.type]) for c in entity.columns])
+        self.writer = pq.ParquetWriter(path, self.schema)
+
+    def write(self, rows: List[Row]):
+        self.writer.write_table(pa.Table.from_pylist(rows, schema=self.schema))
+
+    def close(self):
+        self.writer.close()
+
+
+WRITERS = {'csv': CsvWriter, 'ndjson': NdjsonWriter, 'parquet': ParquetWriter}
+
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+def run_export(entity: EntityExport, reader, fmt: str, output_dir: str = '.',
+               output: Optional[str] = None) -> Tuple[str, int]:
+    """Runs one export to output (default <output_dir>/<name>.<ext>) and returns (path, row count)"""
+    writer_cls = WRITERS[fmt]
+    path = output or os.path.join(output_dir, f"{entity.name}.{writer_cls.extension}")
+
+    if fmt == 'csv' and isinstance(reader, PsycopgReader):
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            return path, reader.copy_csv(entity, f)
+
+    writer = writer_cls(path, entity)
+    lock = threading.Lock()
+    total = 0
+
+    def sink(rows: List[Row]):
+        nonlocal total
+        with lock:
+            writer.write(rows)
+            total += len(rows)
+
+    try:
+        reader.read(entity, sink)
+    finally:
+        writer.close()
+
+    return path, total
+
+
+def run_exports(names: List[str], reader, fmt: str = 'csv', output_dir: str = '.', parallel: int = 4,
+                output: Optional[str] = None) -> Dict[str, int]:
+    """Runs several exports concurrently; returns row counts by export name"""
+    if output and len(names) != 1:
+        raise ValueError("output names one file, so it needs exactly one export")
+    directory = os.path.dirname(output) if output else output_dir
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    results = {}
+
+    with ThreadPoolExecutor(max_workers=max(1, parallel)) as executor:
+        futures = {
+            name: executor.submit(run_export, ENTITIES[name], reader, fmt, output_dir, output)
+            for name in names
+        }
+        for name, future in futures.items():
+            path, count = future.result()
+            results[name] = count
+            print(f"✅ {name}: {count} rows -> {path}")
+
+    return results
+
+
+def make_reader(kind: str, parallel: int, ranges_per_export: int = 4):
+    if kind == 'psycopg':
+        password = os.getenv("SUPABASE_DB_PASSWORD")
+        if not password:
+            print("ERROR: SUPABASE_DB_PASSWORD environment variable not set")
+            sys.exit(1)
+        return PsycopgReader(password)
+
+    key = os.getenv("SUPABASE_KEY")
+    if not key:
+        print("ERROR: SUPABASE_KEY environment variable not set")
+        print("Please set it with: export SUPABASE_KEY='your-key-here'")
+        sys.exit(1)
+
+    if kind == 'supabase':
+        return SupabaseReader(key)
+    return PostgRESTReader(key, ranges_per_export, pool_size=ranges_per_export * max(1, parallel))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run entity exports")
+    parser.add_argument("exports", nargs='*', help="export names (see --list)")
+    parser.add_argument("--all", action='store_true', help="run every declared export")
+    parser.add_argument("--list", action='store_true', help="list declared exports and exit")
+    parser.add_argument("--reader", choices=['postgrest', 'psycopg', 'supabase'], default='postgrest')
+    parser.add_argument("--format", choices=sorted(WRITERS), default='csv')
+    parser.add_argument("--output-dir", default='exports')
+    parser.add_argument("--output", help="file to write (single export only; overrides --output-dir)")
+    parser.add_argument("--parallel", type=int, default=4, help="exports to run at once (default 4)")
+    args = parser.parse_args()
+
+    if args.list:
+        for name, entity in ENTITIES.items():
+            print(f"{name:24} {entity.table}: {', '.join(c.header for c in entity.columns)}")
+        return
+
+    names = list(ENTITIES) if args.all else args.exports
+    unknown = [n for n in names if n not in ENTITIES]
+    if not names or unknown:
+        parser.error(f"unknown exports: {', '.join(unknown)}" if unknown else "name at least one export or pass --all")
+    if args.output and len(names) != 1:
+        parser.error("--output needs exactly one export")
+
+    reader = make_reader(args.reader, args.parallel)
+    start = time.time()
+    try:
+        results = run_exports(names, reader, args.format, args.output_dir, args.parallel, args.output)
+    finally:
+        reader.close()
+
+    print(f"\nExported {sum(results.values())} rows across {len(results)} exports in {time.time() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+Build the college geo/conference TypeScript modules from a structured source
+
+data/colleges.json holds one record per college (seeded once from
+database/UNIVERSITIES_DATABASE.json plus the coordinates already in
+statesGeoData.ts). The build applies the Power 4 rules from
+clean_conferences.py and writes one module per state under
+src/data/colleges/, with an index that lazy-loads them. Only files whose
+content changed are rewritten.
+
+Usage:
+    python3 build_geo_data.py seed            # (re)create data/colleges.json
+    python3 build_geo_data.py build [--legacy]
+    python3 build_geo_data.py set "Auburn University (AL)" conference=SEC
+"""
+
+import argparse
+import json
+import os
+import re
+import shutil
+import sys
+import tempfile
+
+from clean_conferences import POWER_4_SCHOOLS, is_power_4_school, normalize_name
+
+FRONTEND_DIR = os.path.dirname(os.path.abspath(__file__))
+SOURCE_FILE = os.path.join(FRONTEND_DIR, "data", "colleges.json")
+UNIVERSITIES_FILE = os.path.join(FRONTEND_DIR, "..", "database", "UNIVERSITIES_DATABASE.json")
+GEO_DATA_FILE = os.path.join(FRONTEND_DIR, "src", "data", "statesGeoData.ts")
+OUTPUT_DIR = os.path.join(FRONTEND_DIR, "src", "data", "colleges")
+
+# Fields emitted into the TypeScript records, in order
+TS_FIELDS = ["lat", "lng", "state", "fraternities", "sororities", "totalMembers", "conference", "division"]
+
+# Conference spellings used in the universities table
+CONFERENCE_ALIASES = {
+    "Big Ten": "BIG 10",
+    "Big 10": "BIG 10",
+    "Big 12": "BIG 12",
+    "PAC - 12": "PAC-12",
+}
+
+GENERATED_HEADER = "// Generated by frontend/build_geo_data.py from data/colleges.json - do not edit by hand\n"
+
+LOCATIONS_BLOCK_RE = re.compile(r"export const COLLEGE_LOCATIONS = \{\n.*?\n\};", re.S)
+ENTRY_RE = re.compile(r'^\s*"([^"]+)"\s*:\s*\{([^}]+)\}', re.M)
+PROPERTY_RE = re.compile(r'(\w+):\s*("(?:[^"\\]|\\.)*"|-?[\d.]+|true|false|null)')
+
+
+# ---------------------------------------------------------------------------
+# Source records
+# ---------------------------------------------------------------------------
+
+def load_records(path=SOURCE_FILE):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_records(records, path=SOURCE_FILE):
+    # Stable sort: records keep their order within a state
+    records = sorted(records, key=lambda r: r["state"])
+    write_if_changed(path, json.dumps(records, indent=2, ensure_ascii=False) + "\n")
+
+
+def parse_college_locations(ts_content):
+    """Parses the COLLEGE_LOCATIONS entries out of statesGeoData.ts"""
+    block = LOCATIONS_BLOCK_RE.search(ts_content)
+    if not block:
+        raise ValueError("Could not find COLLEGE_LOCATIONS in statesGeoData.ts")
+
+    entries = {}
+    for match in ENTRY_RE.finditer(block.group(0)):
+        entries[match.group(1)] = {
+            name: json.loads(value) for name, value in PROPERTY_RE.findall(match.group(2))
+        }
+    return entries
+
+
+def seed_records(universities, locations):
+    """
+    Merges the universities table export with the existing map entries
+
+    Map entries supply coordinates, chapter counts and conferences; universities
+    supply ids and student counts. Universities with no map entry are kept
+    without coordinates, using the table's conference.
+    """
+    by_name = {}
+    for uni in universities:
+        by_name.setdefault((normalize_name(uni["name"]), uni.get("state")), uni)
+
+    records = []
+    matched = set()
+
+    for key, entry in locations.items():
+        lookup = (normalize_name(key), entry.get("state"))
+        uni = by_name.get(lookup)
+        if uni:
+            matched.add(lookup)
+
+        records.append({
+            "key": key,
+            "name": re.sub(r"\s*\([A-Z]{2}\)$", "", key),
+            **{field: entry.get(field) for field in TS_FIELDS},
+            "university_id": (uni or {}).get("id"),
+            "student_count": (uni or {}).get("student_count"),
+        })
+
+    for lookup, uni in by_name.items():
+        if lookup in matched or not uni.get("state"):
+            continue
+        conference = uni.get("conference") or ""
+        records.append({
+            "key": f"{uni['name']} ({uni['state']})",
+            "name": uni["name"],
+            "lat": None,
+            "lng": None,
+            "state": uni["state"],
+            "fraternities": None,
+            "sororities": None,
+            "totalMembers": None,
+            "conference": CONFERENCE_ALIASES.get(conference, conference),
+            "division": None,
+            "university_id": uni.get("id"),
+            "student_count": uni.get("student_count"),
+        })
+
+    return records
+
+
+# ---------------------------------------------------------------------------
+# Transforms
+# ---------------------------------------------------------------------------
+
+def apply_power_4_rules(record):
+    """Clears Power 4 conferences the official member index does not back"""
+    conference = record.get("conference")
+    if conference in POWER_4_SCHOOLS and not is_power_4_school(record["key"], conference):
+        return {**record, "conference": ""}
+    return record
+
+
+TRANSFORMS = [apply_power_4_rules]
+
+
+def transform(records):
+    for record in records:
+        for fn in TRANSFORMS:
+            record = fn(record)
+        yield record
+
+
+# ---------------------------------------------------------------------------
+# TypeScript generation
+# ---------------------------------------------------------------------------
+
+def ts_value(value):
+    return json.dumps(value, ensure_ascii=False)
+
+
+def ts_entry(record):
+    props = ", ".join(f"{field}: {ts_value(record[field])}" for field in TS_FIELDS)
+    return f"  {ts_value(record['key'])}: {{ {props} }},"
+
+
+def group_by_state(records):
+    states = {}
+    for record in records:
+        if record.get("lat") is None or record.get("lng") is None:
+            continue  # Nothing to place on the map yet
+        states.setdefault(record["state"], []).append(record)
+    return dict(sorted(states.items()))
+
+
+def render_state_module(records):
+    lines = [GENERATED_HEADER, "import type { CollegeLocation } from './types';\n\n",
+             "export const COLLEGES: Record<string, CollegeLocation> = {\n"]
+    lines.extend(ts_entry(r) + "\n" for r in records)
+    lines.append("};\n")
+    return "".join(lines)
+
+
+def render_types_module():
+    return GENERATED_HEADER + (
+        "export interface CollegeLocation {\n"
+        "  lat: number;\n"
+        "  lng: number;\n"
+        "  state: string;\n"
+        "  fraternities: number | null;\n"
+        "  sororities: number | null;\n"
+        "  totalMembers: number | null;\n"
+        "  conference: string;\n"
+        "  division: string | null;\n"
+        "}\n"
+    )
+
+
+def render_index_module(states):
+    loaders = "".join(f"  {state}: () => import('./{state}'),\n" for state in states)
+    state_list = ", ".join(f"'{state}'" for state in states)
+    return GENERATED_HEADER + (
+        "import type { CollegeLocation } from './types';\n\n"
+        "export type { CollegeLocation } from './types';\n\n"
+        f"export const COLLEGE_STATES = [{state_list}];\n\n"
+        "type StateModule = { COLLEGES: Record<string, CollegeLocation> };\n\n"
+        "// One chunk per state so pages only download the states they show\n"
+        "const loaders: Record<string, () => Promise<StateModule>> = {\n"
+        f"{loaders}"
+        "};\n\n"
+        "export async function loadStateColleges(state: string): Promise<Record<string, CollegeLocation>> {\n"
+        "  const load = loaders[state];\n"
+        "  return load ? (await load()).COLLEGES : {};\n"
+        "}\n\n"
+        "export async function loadAllColleges(): Promise<Record<string, CollegeLocation>> {\n"
+        "  const parts = await Promise.all(COLLEGE_STATES.map(loadStateColleges));\n"
+        "  return Object.assign({}, ...parts);\n"
+        "}\n"
+    )
+
+
+def render_legacy_block(by_state):
+    sections = []
+    for state, records in by_state.items():
+        sections.append(f"  // {state}\n" + "\n".join(ts_entry(r) for r in records))
+    return "export const COLLEGE_LOCATIONS = {\n" + "\n\n".join(sections) + "\n};"
+
+
+def write_if_changed(path, content):
+    """Atomically writes content if it differs; returns True when written"""
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            if f.read() == content:
+                return False
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".build_geo_data.", suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+        f.write(content)
+    # mkstemp creates the file 0600; keep the old file's mode, or the umask default for a new one
+    if os.path.exists(path):
+        shutil.copymode(path, tmp_path)
+    else:
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp_path, 0o666 & ~umask)
+    os.replace(tmp_path, path)
+    return True
+
+
+def build(records, output_dir=OUTPUT_DIR, legacy=False):
+    """Generates the per-state modules; returns the list of files written"""
+    by_state = group_by_state(transform(records))
+    written = []
+
+    outputs = {os.path.join(output_dir, f"{state}.ts"): render_state_module(rows) for state, rows in by_state.items()}
+    outputs[os.path.join(output_dir, "types.ts")] = render_types_module()
+    outputs[os.path.join(output_dir, "index.ts")] = render_index_module(list(by_state))
+
+    for path, content in outputs.items():
+        if write_if_changed(path, content):
+            written.append(path)
+
+    # Drop modules for states that no longer have any records
+    for name in os.listdir(output_dir):
+        path = os.path.join(output_dir, name)
+        if name.endswith(".ts") and path not in outputs:
+            os.remove(path)
+            written.append(path)
+
+    if legacy:
+        with open(GEO_DATA_FILE, "r", encoding="utf-8") as f:
+            content = f.read()
+        block = render_legacy_block(by_state)
+        if write_if_changed(GEO_DATA_FILE, LOCATIONS_BLOCK_RE.sub(lambda _: block, content, count=1)):
+            written.append(GEO_DATA_FILE)
+
+    return written
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def parse_assignment(text):
+    field, _, value = text.partition("=")
+    if field not in TS_FIELDS + ["name", "university_id", "student_count"]:
+        raise argparse.ArgumentTypeError(f"unknown field: {field}")
+    try:
+        return field, json.loads(value)
+    except json.JSONDecodeError:
+        return field, value
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build college geo data modules")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("seed", help="create data/colleges.json from the universities export and statesGeoData.ts")
+
+    build_cmd = commands.add_parser("build", help="generate src/data/colleges/*.ts")
+    build_cmd.add_argument("--legacy", action="store_true",
+                           help="also rewrite COLLEGE_LOCATIONS in statesGeoData.ts")
+
+    set_cmd = commands.add_parser("set", help="edit one record and rebuild")
+    set_cmd.add_argument("key", help='record key, e.g. "Auburn University (AL)"')
+    set_cmd.add_argument("assignments", nargs="+", type=parse_assignment, metavar="field=value")
+
+    args = parser.parse_args()
+
+    if args.command == "seed":
+        with open(UNIVERSITIES_FILE, "r", encoding="utf-8") as f:
+            universities = json.load(f)
+        with open(GEO_DATA_FILE, "r", encoding="utf-8") as f:
+            locations = parse_college_locations(f.read())
+
+        records = seed_records(universities, locations)
+        save_records(records)
+        placed = sum(1 for r in records if r["lat"] is not None)
+        print(f"✅ Seeded {len(records)} colleges ({placed} with coordinates) into {SOURCE_FILE}")
+        return
+
+    records = load_records()
+
+    if args.command == "set":
+        for record in records:
+            if record["key"] == args.key:
+                record.update(dict(args.assignments))
+                break
+        else:
+            print(f"ERROR: no record with key {args.key!r}")
+            sys.exit(1)
+        save_records(records)
+
+    written = build(records, legacy=getattr(args, "legacy", False))
+    print(f"✅ Build complete: {len(written)} file(s) updated")
+    for path in written:
+        print(f"  - {os.path.relpath(path, FRONTEND_DIR)}")
+
+
+if __name__ == "__main__":
+    main()
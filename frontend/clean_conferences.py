@@ -2,9 +2,17 @@
 """
 Script to clean up Power 4 conference data in statesGeoData.ts
 Only fixes incorrect conference assignments - does not delete any schools
+
+Usage:
+    python3 clean_conferences.py [src/data/statesGeoData.ts] [--check]
 """
 
+import argparse
+import os
 import re
+import shutil
+import sys
+import tempfile
 
 # Official Power 4 conference members (2024-25)
 POWER_4_SCHOOLS = {
@@ -92,104 +100,155 @@ POWER_4_SCHOOLS = {
     ],
 }
 
-def is_power_4_school(school_name, conference):
-    """Check if a school is actually a Power 4 member"""
-    if not conference or conference not in POWER_4_SCHOOLS:
-        return False
+# Satellite campus keywords that indicate NOT a Power 4 school
+SATELLITE_KEYWORDS = [
+    " at ", "campus", "branch", ", ", "–", " - ",
+    "fort wayne", "northwest", "crookston", "duluth", "morris",
+    "omaha", "camden", "newark", "abington", "altoona", "behrend",
+    "berks", "brandywine", "harrisburg", "chicago", "indianapolis",
+    "eastern shore", "baltimore county", "springfield", "fort smith",
+    "st. louis", "aiken", "beaufort", "upstate", "kingsville",
+    "corpus christi", "san antonio", "permian basin", "tyler"
+]
+
+DEFAULT_GEO_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "src", "data", "statesGeoData.ts")
 
-    # Satellite campus keywords that indicate NOT a Power 4 school
-    satellite_keywords = [
-        " at ", "campus", "branch", ", ", "–", " - ",
-        "fort wayne", "northwest", "crookston", "duluth", "morris",
-        "omaha", "camden", "newark", "abington", "altoona", "behrend",
-        "berks", "brandywine", "harrisburg", "chicago", "indianapolis",
-        "eastern shore", "baltimore county", "springfield", "fort smith",
-        "st. louis", "aiken", "beaufort", "upstate", "kingsville",
-        "corpus christi", "san antonio", "permian basin", "tyler"
-    ]
+# One alternation over every keyword: a single scan per name instead of one per keyword
+SATELLITE_RE = re.compile("|".join(map(re.escape, SATELLITE_KEYWORDS)))
 
-    # Check for satellite keywords
-    school_lower = school_name.lower()
-    for keyword in satellite_keywords:
-        if keyword in school_lower:
-            return False
+# COLLEGE_LOCATIONS entry: "School Name (ST)": { ... }
+ENTRY_RE = re.compile(r'"([^"]+)"\s*:\s*\{([^}]+)\}')
+CONFERENCE_RE = re.compile(r'conference:\s*"([^"]*)"')
+STATE_SUFFIX_RE = re.compile(r"\s*\([A-Z]{2}\)$")
 
-    # Get the list of official schools for this conference
-    official_schools = POWER_4_SCHOOLS[conference]
 
-    # Check if the school name matches any official school (partial match)
-    for official_school in official_schools:
-        if official_school.lower() in school_lower:
-            return True
+def normalize_name(school_name):
+    """Lowercases, drops the trailing " (ST)" state tag and collapses whitespace"""
+    return " ".join(STATE_SUFFIX_RE.sub("", school_name).lower().split())
 
-    return False
 
-def clean_conference_data(input_file, output_file):
-    """Clean conference data by removing incorrect assignments"""
+# Exact-name index: normalized official name -> conference
+OFFICIAL_INDEX = {
+    normalize_name(school): conference
+    for conference, schools in POWER_4_SCHOOLS.items()
+    for school in schools
+}
 
-    with open(input_file, 'r', encoding='utf-8') as f:
-        content = f.read()
+# Per-conference alternation of official names for the partial-match fallback
+OFFICIAL_RE = {
+    conference: re.compile("|".join(re.escape(school.lower()) for school in schools))
+    for conference, schools in POWER_4_SCHOOLS.items()
+}
 
-    # Find all college entries with regex
-    pattern = r'"([^"]+)"\s*:\s*\{([^}]+)\}'
 
-    changes_made = 0
-    schools_cleaned = []
+def is_power_4_school(school_name, conference):
+    """Check if a school is actually a Power 4 member"""
+    if not conference or conference not in POWER_4_SCHOOLS:
+        return False
+
+    # Exact official names win even if they contain a satellite keyword
+    # ("University of California, Los Angeles", "Northwestern University")
+    normalized = normalize_name(school_name)
+    if OFFICIAL_INDEX.get(normalized) == conference:
+        return True
+
+    if SATELLITE_RE.search(normalized):
+        return False
+
+    # Partial match against the official names for this conference
+    return OFFICIAL_RE[conference].search(normalized) is not None
+
 
+def _fix_line(line, schools_cleaned):
+    """Clears incorrect Power 4 conferences on one line; returns the new line"""
     def fix_entry(match):
-        nonlocal changes_made, schools_cleaned
         school_name = match.group(1)
         properties = match.group(2)
 
-        # Extract current conference
-        conf_match = re.search(r'conference:\s*"([^"]*)"', properties)
+        conf_match = CONFERENCE_RE.search(properties)
         if not conf_match:
             return match.group(0)  # No conference, leave as is
 
         current_conf = conf_match.group(1)
+        if current_conf in POWER_4_SCHOOLS and not is_power_4_school(school_name, current_conf):
+            schools_cleaned.append(f"{school_name} (removed {current_conf})")
+            start, end = conf_match.span()
+            new_properties = properties[:start] + 'conference: ""' + properties[end:]
+            return f'"{school_name}": {{{new_properties}}}'
 
-        # Check if this is a Power 4 conference
-        if current_conf in ["SEC", "BIG 10", "BIG 12", "ACC"]:
-            # Verify if this school should actually have this conference
-            if not is_power_4_school(school_name, current_conf):
-                # Remove the conference (set to empty string)
-                new_properties = re.sub(
-                    r'conference:\s*"[^"]*"',
-                    'conference: ""',
-                    properties
-                )
-                changes_made += 1
-                schools_cleaned.append(f"{school_name} (removed {current_conf})")
-                return f'"{school_name}": {{{new_properties}}}'
-
-        # Leave as is
         return match.group(0)
 
-    # Apply fixes
-    new_content = re.sub(pattern, fix_entry, content)
+    if "conference" not in line:
+        return line
+    return ENTRY_RE.sub(fix_entry, line)
 
-    # Write output
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(new_content)
 
-    return changes_made, schools_cleaned
+def clean_conference_data(input_file, output_file, check=False):
+    """
+    Clean conference data by removing incorrect assignments
 
-if __name__ == "__main__":
-    input_file = "/Users/jacksonfitzgerald/CollegeOrgNetwork/frontend/src/data/statesGeoData.ts"
-    output_file = "/Users/jacksonfitzgerald/CollegeOrgNetwork/frontend/src/data/statesGeoData.ts"
+    Streams the file once, line by line. With check=True nothing is written.
+    The output is written to a temp file and renamed into place, so cleaning
+    a file in place never leaves it half-written.
+    """
+    schools_cleaned = []
 
-    print("Starting conference data cleanup...")
+    out = None
+    if not check:
+        out_dir = os.path.dirname(os.path.abspath(output_file))
+        fd, tmp_path = tempfile.mkstemp(dir=out_dir, prefix=".clean_conferences.", suffix=".tmp")
+        out = os.fdopen(fd, "w", encoding="utf-8", newline="")
+
+    try:
+        with open(input_file, "r", encoding="utf-8", newline="") as f:
+            for line in f:
+                new_line = _fix_line(line, schools_cleaned)
+                if out:
+                    out.write(new_line)
+    except BaseException:
+        if out:
+            out.close()
+            os.unlink(tmp_path)
+        raise
+
+    if out:
+        out.close()
+        # mkstemp creates the file 0600; keep the permissions of the file being replaced
+        shutil.copymode(output_file if os.path.exists(output_file) else input_file, tmp_path)
+        os.replace(tmp_path, output_file)
+
+    return len(schools_cleaned), schools_cleaned
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Clear incorrect Power 4 conference assignments")
+    parser.add_argument("input", nargs="?", default=DEFAULT_GEO_FILE, help="statesGeoData.ts to clean")
+    parser.add_argument("-o", "--output", help="write here instead of cleaning in place")
+    parser.add_argument("--check", action="store_true", help="report changes without writing; exit 1 if any")
+    args = parser.parse_args()
+
+    print("Checking conference data..." if args.check else "Starting conference data cleanup...")
     print("=" * 60)
 
-    changes, schools = clean_conference_data(input_file, output_file)
+    changes, schools = clean_conference_data(args.input, args.output or args.input, check=args.check)
+
+    if args.check:
+        print(f"\n📊 Changes needed: {changes}")
+    else:
+        print(f"\n✅ Cleanup complete!")
+        print(f"📊 Total changes made: {changes}")
 
-    print(f"\n✅ Cleanup complete!")
-    print(f"📊 Total changes made: {changes}")
-    print(f"\n🏫 Schools cleaned:")
-    for school in schools[:20]:  # Show first 20
-        print(f"  - {school}")
+    if schools:
+        print(f"\n🏫 Schools {'to clean' if args.check else 'cleaned'}:")
+        for school in schools[:20]:  # Show first 20
+            print(f"  - {school}")
 
-    if len(schools) > 20:
-        print(f"  ... and {len(schools) - 20} more")
+        if len(schools) > 20:
+            print(f"  ... and {len(schools) - 20} more")
 
-    print(f"\n💾 Backup saved at: statesGeoData.ts.backup")
+    if args.check and changes:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
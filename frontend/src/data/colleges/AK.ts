@@ -0,0 +1,7 @@
+// Generated by frontend/build_geo_data.py from data/colleges.json - do not edit by hand
+import type { CollegeLocation } from './types';
+
+export const COLLEGES: Record<string, CollegeLocation> = {
+  "University of Alaska Anchorage (AK)": { lat: 60.7239, lng: -153.0672, state: "AK", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "University of Alaska Fairbanks (AK)": { lat: 62.2142, lng: -151.7185, state: "AK", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+};
@@ -0,0 +1,23 @@
+// Generated by frontend/build_geo_data.py from data/colleges.json - do not edit by hand
+import type { CollegeLocation } from './types';
+
+export const COLLEGES: Record<string, CollegeLocation> = {
+  "Alabama Agricultural and Mechanical University (AL)": { lat: 32.0496, lng: -86.5745, state: "AL", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Alabama State University (AL)": { lat: 31.8803, lng: -86.0758, state: "AL", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Auburn University (AL)": { lat: 31.8165, lng: -86.6707, state: "AL", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "SEC", division: "D1" },
+  "Auburn University at Montgomery (AL)": { lat: 32.1726, lng: -87.6481, state: "AL", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Huntingdon College (AL)": { lat: 32.5752, lng: -87.2827, state: "AL", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Jacksonville State University (AL)": { lat: 33.0784, lng: -87.7079, state: "AL", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Miles College (AL)": { lat: 33.7893, lng: -85.9245, state: "AL", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Samford University (AL)": { lat: 32.7091, lng: -86.2037, state: "AL", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Spring Hill College (AL)": { lat: 31.9305, lng: -87.6868, state: "AL", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "The University of Alabama (AL)": { lat: 32.2241, lng: -86.7897, state: "AL", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "SEC", division: "D1" },
+  "Troy University (AL)": { lat: 33.4411, lng: -87.1816, state: "AL", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Tuskegee University (AL)": { lat: 32.6732, lng: -87.7645, state: "AL", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "University of Alabama at Birmingham (AL)": { lat: 33.2398, lng: -86.1846, state: "AL", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "University of Alabama in Huntsville (AL)": { lat: 32.636, lng: -87.7664, state: "AL", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "University of Montevallo (AL)": { lat: 33.183, lng: -86.0177, state: "AL", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "University of North Alabama (AL)": { lat: 32.8837, lng: -86.3104, state: "AL", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "University of South Alabama (AL)": { lat: 33.5931, lng: -86.5356, state: "AL", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "University of West Alabama (AL)": { lat: 32.2086, lng: -86.3201, state: "AL", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+};
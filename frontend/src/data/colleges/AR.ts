@@ -0,0 +1,20 @@
+// Generated by frontend/build_geo_data.py from data/colleges.json - do not edit by hand
+import type { CollegeLocation } from './types';
+
+export const COLLEGES: Record<string, CollegeLocation> = {
+  "Arkansas State University (AR)": { lat: 34.6124, lng: -91.9619, state: "AR", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Arkansas Tech University (AR)": { lat: 35.6052, lng: -91.497, state: "AR", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Harding University (AR)": { lat: 34.9045, lng: -91.4994, state: "AR", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Henderson State University (AR)": { lat: 35.1447, lng: -92.2924, state: "AR", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Hendrix College (AR)": { lat: 35.7165, lng: -92.7881, state: "AR", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Lyon College (AR)": { lat: 35.4661, lng: -91.7384, state: "AR", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Ouachita Baptist University (AR)": { lat: 35.3622, lng: -91.4094, state: "AR", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Southern Arkansas University (AR)": { lat: 35.5732, lng: -93.3629, state: "AR", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "University of Arkansas (AR)": { lat: 35.6512, lng: -93.3582, state: "AR", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "SEC", division: "D1" },
+  "University of Arkansas at Little Rock (AR)": { lat: 35.5406, lng: -92.4751, state: "AR", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "University of Arkansas at Monticello (AR)": { lat: 34.2629, lng: -91.5891, state: "AR", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "University of Arkansas at Pine Bluff (AR)": { lat: 35.832, lng: -92.4552, state: "AR", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "University of Arkansas-Fort Smith (AR)": { lat: 35.451, lng: -92.0687, state: "AR", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "University of Central Arkansas (AR)": { lat: 35.0228, lng: -92.9169, state: "AR", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "University of the Ozarks (AR)": { lat: 35.9191, lng: -92.1337, state: "AR", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+};
@@ -0,0 +1,9 @@
+// Generated by frontend/build_geo_data.py from data/colleges.json - do not edit by hand
+import type { CollegeLocation } from './types';
+
+export const COLLEGES: Record<string, CollegeLocation> = {
+  "Arizona State University (AZ)": { lat: 33.0739, lng: -111.4104, state: "AZ", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "BIG 12", division: "D1" },
+  "Grand Canyon University (AZ)": { lat: 33.2743, lng: -112.2593, state: "AZ", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Northern Arizona University (AZ)": { lat: 33.8606, lng: -111.5252, state: "AZ", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "University of Arizona (AZ)": { lat: 33.1662, lng: -112.0677, state: "AZ", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "BIG 12", division: "D1" },
+};
@@ -0,0 +1,6 @@
+// Generated by frontend/build_geo_data.py from data/colleges.json - do not edit by hand
+import type { CollegeLocation } from './types';
+
+export const COLLEGES: Record<string, CollegeLocation> = {
+  "Simon Fraser University (BC)": { lat: 54.3793, lng: -127.3456, state: "BC", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+};
@@ -0,0 +1,61 @@
+// Generated by frontend/build_geo_data.py from data/colleges.json - do not edit by hand
+import type { CollegeLocation } from './types';
+
+export const COLLEGES: Record<string, CollegeLocation> = {
+  "Azusa Pacific Universitya (CA)": { lat: 35.7399, lng: -118.9146, state: "CA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Biola University (CA)": { lat: 35.2899, lng: -119.2378, state: "CA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "California Baptist University (CA)": { lat: 36.8291, lng: -119.4251, state: "CA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "California Institute of Technology (CA)": { lat: 36.3131, lng: -119.3126, state: "CA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "California Lutheran University (CA)": { lat: 36.9683, lng: -119.7821, state: "CA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "California Polytechnic State University (CA)": { lat: 36.3828, lng: -119.9174, state: "CA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "California State Polytechnic University, Humboldt (CA)": { lat: 35.3851, lng: -119.7981, state: "CA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "California State Polytechnic University, Pomona (CA)": { lat: 35.4187, lng: -119.0436, state: "CA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "California State University San Marcos (CA)": { lat: 35.6361, lng: -120.6292, state: "CA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "California State University, Bakersfield (CA)": { lat: 36.8684, lng: -120.4098, state: "CA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "California State University, Chico (CA)": { lat: 35.8397, lng: -119.3997, state: "CA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "California State University, Dominguez Hills (CA)": { lat: 35.8501, lng: -119.3424, state: "CA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "California State University, East Bay (CA)": { lat: 36.6825, lng: -119.8798, state: "CA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "California State University, Fresno (CA)": { lat: 35.8595, lng: -118.7154, state: "CA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "California State University, Fullerton (CA)": { lat: 35.2596, lng: -120.2638, state: "CA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "California State University, Long Beach (CA)": { lat: 36.8296, lng: -120.1681, state: "CA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "California State University, Los Angeles (CA)": { lat: 36.7585, lng: -120.5275, state: "CA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "California State University, Monterey Bay (CA)": { lat: 35.5146, lng: -119.7304, state: "CA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "California State University, Northridge (CA)": { lat: 36.7558, lng: -120.3597, state: "CA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "California State University, Sacramento (CA)": { lat: 36.3429, lng: -120.0702, state: "CA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "California State University, San Bernardino (CA)": { lat: 35.7345, lng: -120.2825, state: "CA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "California State University, Stanislaus (CA)": { lat: 36.324, lng: -120.0504, state: "CA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Chapman University (CA)": { lat: 36.6407, lng: -119.489, state: "CA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Claremont McKenna College, Harvey Mudd College, and Scripps CollegeA 3 (CA)": { lat: 36.9926, lng: -119.0479, state: "CA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Concordia University-Irvine (CA)": { lat: 35.5014, lng: -120.3985, state: "CA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Dominican University of California (CA)": { lat: 35.344, lng: -120.5337, state: "CA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Fresno Pacific University (CA)": { lat: 36.9915, lng: -118.8334, state: "CA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Jessup University (CA)": { lat: 35.696, lng: -119.9152, state: "CA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Leland Stanford Junior University (CA)": { lat: 35.4459, lng: -120.3265, state: "CA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "ACC", division: "D1" },
+  "Loyola Marymount University (CA)": { lat: 35.3081, lng: -120.2265, state: "CA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Occidental College (CA)": { lat: 35.7871, lng: -119.4341, state: "CA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Pepperdine University (CA)": { lat: 36.3597, lng: -118.9881, state: "CA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Point Loma Nazarene University (CA)": { lat: 35.9216, lng: -120.3008, state: "CA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Pomona College and Pitzer CollegeA 16 (CA)": { lat: 35.2641, lng: -119.6068, state: "CA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Saint Mary's College of California (CA)": { lat: 36.3139, lng: -120.3585, state: "CA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "San Diego State University (CA)": { lat: 35.1939, lng: -119.1021, state: "CA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "San Francisco State University (CA)": { lat: 36.3883, lng: -120.025, state: "CA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "San Jose State University (CA)": { lat: 35.9051, lng: -119.5134, state: "CA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Santa Clara University (CA)": { lat: 36.1131, lng: -120.2566, state: "CA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "University of California, Berkeley (CA)": { lat: 36.733, lng: -118.9623, state: "CA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "University of California, Davis (CA)": { lat: 35.4026, lng: -119.1939, state: "CA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "University of California, Irvine (CA)": { lat: 35.4145, lng: -120.229, state: "CA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "University of California, Los Angeles (CA)": { lat: 36.9971, lng: -119.9728, state: "CA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "BIG 10", division: "D1" },
+  "University of California, Riverside (CA)": { lat: 35.1362, lng: -119.167, state: "CA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "University of California, San Diego (CA)": { lat: 37.0115, lng: -119.5517, state: "CA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "University of California, Santa Barbara (CA)": { lat: 36.8194, lng: -118.7313, state: "CA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "University of California, Santa Cruz (CA)": { lat: 36.744, lng: -119.481, state: "CA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "University of La Verne (CA)": { lat: 35.2188, lng: -119.3816, state: "CA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "University of Redlands (CA)": { lat: 35.38, lng: -120.6636, state: "CA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "University of San Diego (CA)": { lat: 35.628, lng: -119.1172, state: "CA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "University of San Francisco (CA)": { lat: 36.0455, lng: -118.9694, state: "CA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "University of Southern California (CA)": { lat: 36.4668, lng: -119.9275, state: "CA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "BIG 10", division: "D1" },
+  "University of the Pacific (CA)": { lat: 35.475, lng: -119.0363, state: "CA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Vanguard University (CA)": { lat: 36.986, lng: -120.5003, state: "CA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Westmont College (CA)": { lat: 35.456, lng: -120.1727, state: "CA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Whittier College (CA)": { lat: 36.8026, lng: -119.8894, state: "CA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+};
@@ -0,0 +1,21 @@
+// Generated by frontend/build_geo_data.py from data/colleges.json - do not edit by hand
+import type { CollegeLocation } from './types';
+
+export const COLLEGES: Record<string, CollegeLocation> = {
+  "Adams State University (CO)": { lat: 38.9577, lng: -104.7131, state: "CO", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Colorado Christian University (CO)": { lat: 38.3819, lng: -105.6858, state: "CO", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Colorado CollegeA 5A 7 (CO)": { lat: 38.9898, lng: -106.0482, state: "CO", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Colorado Mesa University (CO)": { lat: 39.6759, lng: -104.9251, state: "CO", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Colorado School of Mines (CO)": { lat: 38.7445, lng: -105.1987, state: "CO", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Colorado State University (CO)": { lat: 39.241, lng: -104.3472, state: "CO", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Colorado State University-Pueblo (CO)": { lat: 39.6199, lng: -104.8894, state: "CO", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Fort Lewis College (CO)": { lat: 38.5898, lng: -106.15, state: "CO", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Metropolitan State University of Denver (CO)": { lat: 38.4735, lng: -104.5964, state: "CO", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Regis University (CO)": { lat: 39.6454, lng: -106.1255, state: "CO", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "United States Air Force Academy (CO)": { lat: 39.3606, lng: -104.5812, state: "CO", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "University of Colorado Boulder (CO)": { lat: 38.7967, lng: -106.0031, state: "CO", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "BIG 12", division: "D1" },
+  "University of Colorado Colorado Springs (CO)": { lat: 38.5197, lng: -105.2151, state: "CO", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "University of Denver (CO)": { lat: 38.7592, lng: -105.5385, state: "CO", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "University of Northern Colorado (CO)": { lat: 38.6628, lng: -104.9163, state: "CO", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Western Colorado University (CO)": { lat: 39.7812, lng: -104.9053, state: "CO", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+};
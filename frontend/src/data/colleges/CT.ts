@@ -0,0 +1,24 @@
+// Generated by frontend/build_geo_data.py from data/colleges.json - do not edit by hand
+import type { CollegeLocation } from './types';
+
+export const COLLEGES: Record<string, CollegeLocation> = {
+  "Albertus Magnus College (CT)": { lat: 41.0656, lng: -71.8875, state: "CT", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Central Connecticut State University (CT)": { lat: 40.7318, lng: -73.1539, state: "CT", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Connecticut College (CT)": { lat: 41.5165, lng: -72.5697, state: "CT", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Eastern Connecticut State University (CT)": { lat: 42.5185, lng: -72.4003, state: "CT", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Fairfield University (CT)": { lat: 42.5896, lng: -73.6257, state: "CT", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Mitchell College (CT)": { lat: 41.7466, lng: -72.159, state: "CT", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Post University (CT)": { lat: 40.8117, lng: -72.8773, state: "CT", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Quinnipiac University (CT)": { lat: 40.6657, lng: -72.3763, state: "CT", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Sacred Heart University (CT)": { lat: 41.7271, lng: -72.643, state: "CT", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Southern Connecticut State University (CT)": { lat: 42.0868, lng: -73.5386, state: "CT", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Trinity College (CT)": { lat: 41.0664, lng: -71.8365, state: "CT", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "United States Coast Guard Academy (CT)": { lat: 42.5418, lng: -73.6353, state: "CT", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "University of Bridgeport (CT)": { lat: 41.6321, lng: -73.5203, state: "CT", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "University of Connecticut (CT)": { lat: 42.2406, lng: -71.8047, state: "CT", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "University of Hartford (CT)": { lat: 41.575, lng: -73.0918, state: "CT", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "University of Saint Joseph (CT)": { lat: 41.2592, lng: -71.9416, state: "CT", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Wesleyan University (CT)": { lat: 40.9162, lng: -72.7009, state: "CT", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Western Connecticut State University (CT)": { lat: 41.0941, lng: -73.2881, state: "CT", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Yale University (CT)": { lat: 40.9801, lng: -73.2911, state: "CT", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+};
@@ -0,0 +1,13 @@
+// Generated by frontend/build_geo_data.py from data/colleges.json - do not edit by hand
+import type { CollegeLocation } from './types';
+
+export const COLLEGES: Record<string, CollegeLocation> = {
+  "American University (DC)": { lat: 37.996, lng: -76.97, state: "DC", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Catholic University of America (DC)": { lat: 39.0913, lng: -76.9, state: "DC", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Gallaudet University (DC)": { lat: 39.6414, lng: -76.0953, state: "DC", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Georgetown University (DC)": { lat: 39.6239, lng: -77.0238, state: "DC", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Howard University (DC)": { lat: 39.3063, lng: -77.1752, state: "DC", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "The George Washington University (DC)": { lat: 39.845, lng: -77.4072, state: "DC", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Trinity Washington UniversityA 1 (DC)": { lat: 38.9566, lng: -77.1667, state: "DC", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "University of the District of Columbia (DC)": { lat: 38.1886, lng: -76.6463, state: "DC", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+};
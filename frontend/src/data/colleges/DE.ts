@@ -0,0 +1,9 @@
+// Generated by frontend/build_geo_data.py from data/colleges.json - do not edit by hand
+import type { CollegeLocation } from './types';
+
+export const COLLEGES: Record<string, CollegeLocation> = {
+  "Delaware State University (DE)": { lat: 39.5524, lng: -75.8715, state: "DE", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Goldey-Beacom College (DE)": { lat: 40.0914, lng: -74.5692, state: "DE", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "University of Delaware (DE)": { lat: 39.0936, lng: -75.5291, state: "DE", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Wilmington University (DE)": { lat: 38.4066, lng: -75.6385, state: "DE", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+};
@@ -0,0 +1,32 @@
+// Generated by frontend/build_geo_data.py from data/colleges.json - do not edit by hand
+import type { CollegeLocation } from './types';
+
+export const COLLEGES: Record<string, CollegeLocation> = {
+  "Barry University (FL)": { lat: 28.3524, lng: -81.775, state: "FL", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Bethune–Cookman University (FL)": { lat: 26.7796, lng: -81.3553, state: "FL", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Eckerd College (FL)": { lat: 27.9482, lng: -82.2073, state: "FL", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Edward Waters University (FL)": { lat: 27.7514, lng: -82.4062, state: "FL", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Embry-Riddle Aeronautical University (FL)": { lat: 27.2396, lng: -80.7397, state: "FL", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Flagler College (FL)": { lat: 26.788, lng: -80.891, state: "FL", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Florida Agricultural and Mechanical University (FL)": { lat: 27.4851, lng: -81.5297, state: "FL", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Florida Atlantic University (FL)": { lat: 27.6793, lng: -82.217, state: "FL", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Florida Gulf Coast University (FL)": { lat: 26.9699, lng: -82.6646, state: "FL", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Florida Institute of Technology (FL)": { lat: 28.2817, lng: -82.3293, state: "FL", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Florida International University (FL)": { lat: 27.7778, lng: -82.4671, state: "FL", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Florida Southern College (FL)": { lat: 28.6776, lng: -81.4385, state: "FL", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Florida State University (FL)": { lat: 28.7264, lng: -81.3166, state: "FL", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "ACC", division: "D1" },
+  "Jacksonville University (FL)": { lat: 27.5663, lng: -81.9621, state: "FL", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Lynn University (FL)": { lat: 27.3843, lng: -81.3009, state: "FL", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Nova Southeastern University (FL)": { lat: 28.6769, lng: -82.2528, state: "FL", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Palm Beach Atlantic University (FL)": { lat: 27.3085, lng: -81.0483, state: "FL", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Rollins College (FL)": { lat: 28.3906, lng: -81.2563, state: "FL", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Saint Leo University (FL)": { lat: 27.2222, lng: -81.7883, state: "FL", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Stetson University (FL)": { lat: 27.3986, lng: -82.4264, state: "FL", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "University of Central Florida (FL)": { lat: 28.5215, lng: -81.39, state: "FL", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "BIG 12", division: "D1" },
+  "University of Florida (FL)": { lat: 27.3952, lng: -82.4832, state: "FL", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "SEC", division: "D1" },
+  "University of Miami (FL)": { lat: 27.3758, lng: -81.3593, state: "FL", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "ACC", division: "D1" },
+  "University of North Florida (FL)": { lat: 28.2801, lng: -81.3944, state: "FL", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "University of South Florida (FL)": { lat: 27.1927, lng: -81.5959, state: "FL", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "University of Tampa (FL)": { lat: 27.0414, lng: -82.4679, state: "FL", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "University of West Florida (FL)": { lat: 27.2391, lng: -80.9206, state: "FL", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+};
@@ -0,0 +1,34 @@
+// Generated by frontend/build_geo_data.py from data/colleges.json - do not edit by hand
+import type { CollegeLocation } from './types';
+
+export const COLLEGES: Record<string, CollegeLocation> = {
+  "Agnes Scott CollegeA 1 (GA)": { lat: 32.9151, lng: -82.8526, state: "GA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Albany State University (GA)": { lat: 33.1581, lng: -83.9213, state: "GA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Augusta University (GA)": { lat: 33.0055, lng: -84.0811, state: "GA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Berry College (GA)": { lat: 33.709, lng: -84.1728, state: "GA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Clark Atlanta University (GA)": { lat: 33.7868, lng: -83.1984, state: "GA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Clayton State University (GA)": { lat: 34.0301, lng: -82.7746, state: "GA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Columbus State University (GA)": { lat: 33.1285, lng: -83.5486, state: "GA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Covenant College (GA)": { lat: 32.6494, lng: -83.9961, state: "GA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Emmanuel University (GA)": { lat: 33.7791, lng: -83.7193, state: "GA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Emory University (GA)": { lat: 33.2705, lng: -82.9864, state: "GA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Fort Valley State University (GA)": { lat: 33.9657, lng: -83.3362, state: "GA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Georgia College & State University (GA)": { lat: 32.2943, lng: -84.2646, state: "GA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Georgia Tech (GA)": { lat: 32.2805, lng: -82.7142, state: "GA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "ACC", division: "D1" },
+  "Georgia Southern University (GA)": { lat: 33.4548, lng: -83.2575, state: "GA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Georgia Southwestern State University (GA)": { lat: 33.9911, lng: -83.4885, state: "GA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Georgia State University (GA)": { lat: 32.9102, lng: -82.9268, state: "GA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Kennesaw State University (GA)": { lat: 33.723, lng: -83.0811, state: "GA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "LaGrange College (GA)": { lat: 32.228, lng: -84.6073, state: "GA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Mercer University (GA)": { lat: 33.6919, lng: -83.6855, state: "GA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Morehouse Collegee (GA)": { lat: 32.1483, lng: -83.2162, state: "GA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Oglethorpe University (GA)": { lat: 32.0876, lng: -84.3039, state: "GA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Piedmont University (GA)": { lat: 32.8722, lng: -84.4331, state: "GA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Savannah State University (GA)": { lat: 32.7435, lng: -83.3951, state: "GA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Shorter University (GA)": { lat: 33.3438, lng: -83.6287, state: "GA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "University of Georgia (GA)": { lat: 32.0564, lng: -83.4578, state: "GA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "SEC", division: "D1" },
+  "University of North Georgia (GA)": { lat: 32.4874, lng: -84.4051, state: "GA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Valdosta State University (GA)": { lat: 32.5698, lng: -83.6663, state: "GA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Wesleyan CollegeA 1b (GA)": { lat: 32.8127, lng: -82.835, state: "GA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Young Harris College (GA)": { lat: 32.6757, lng: -84.5632, state: "GA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+};
@@ -0,0 +1,9 @@
+// Generated by frontend/build_geo_data.py from data/colleges.json - do not edit by hand
+import type { CollegeLocation } from './types';
+
+export const COLLEGES: Record<string, CollegeLocation> = {
+  "Chaminade University of Honolulu (HI)": { lat: 20.2889, lng: -157.6134, state: "HI", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Hawai'i Pacific University (HI)": { lat: 20.5305, lng: -157.028, state: "HI", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "University of Hawai'i at Hilo (HI)": { lat: 21.7401, lng: -156.9145, state: "HI", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "University of Hawaiʻi at Mānoa (HI)": { lat: 21.2878, lng: -156.7956, state: "HI", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+};
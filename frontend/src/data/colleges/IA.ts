@@ -0,0 +1,20 @@
+// Generated by frontend/build_geo_data.py from data/colleges.json - do not edit by hand
+import type { CollegeLocation } from './types';
+
+export const COLLEGES: Record<string, CollegeLocation> = {
+  "Buena Vista University (IA)": { lat: 42.9809, lng: -93.376, state: "IA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Central College (IA)": { lat: 41.2575, lng: -92.3049, state: "IA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Coe College (IA)": { lat: 42.6249, lng: -93.9511, state: "IA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Cornell College (IA)": { lat: 41.2132, lng: -93.6097, state: "IA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Drake University (IA)": { lat: 41.1969, lng: -92.3347, state: "IA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Grinnell College (IA)": { lat: 42.4155, lng: -93.9928, state: "IA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Iowa State University of Science and TechnologyN 6 (IA)": { lat: 42.3228, lng: -93.9607, state: "IA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "BIG 12", division: "D1" },
+  "Loras College (IA)": { lat: 42.488, lng: -92.8238, state: "IA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Luther College (IA)": { lat: 41.8925, lng: -92.6938, state: "IA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Simpson College (IA)": { lat: 41.9958, lng: -93.4034, state: "IA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "University of Iowa (IA)": { lat: 41.6611, lng: -91.5302, state: "IA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "BIG 10", division: "D1" },
+  "University of Dubuque (IA)": { lat: 42.5285, lng: -92.3364, state: "IA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "University of Northern Iowa (IA)": { lat: 41.7158, lng: -92.7821, state: "IA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Upper Iowa University (IA)": { lat: 41.3519, lng: -92.8935, state: "IA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Wartburg College (IA)": { lat: 42.7084, lng: -92.2917, state: "IA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+};
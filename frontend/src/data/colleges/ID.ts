@@ -0,0 +1,9 @@
+// Generated by frontend/build_geo_data.py from data/colleges.json - do not edit by hand
+import type { CollegeLocation } from './types';
+
+export const COLLEGES: Record<string, CollegeLocation> = {
+  "Boise State University (ID)": { lat: 43.2473, lng: -115.015, state: "ID", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Idaho State University (ID)": { lat: 45.0886, lng: -115.1701, state: "ID", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Northwest Nazarene University (ID)": { lat: 44.862, lng: -114.9292, state: "ID", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "University of Idaho (ID)": { lat: 43.651, lng: -115.1953, state: "ID", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+};
@@ -0,0 +1,44 @@
+// Generated by frontend/build_geo_data.py from data/colleges.json - do not edit by hand
+import type { CollegeLocation } from './types';
+
+export const COLLEGES: Record<string, CollegeLocation> = {
+  "Augustana College (IL)": { lat: 40.1126, lng: -88.0521, state: "IL", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Aurora University (IL)": { lat: 40.086, lng: -88.5762, state: "IL", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Benedictine University (IL)": { lat: 39.9301, lng: -89.1728, state: "IL", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Blackburn College (IL)": { lat: 39.6134, lng: -88.3481, state: "IL", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Bradley University (IL)": { lat: 39.3892, lng: -88.2569, state: "IL", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Chicago State University (IL)": { lat: 39.8053, lng: -88.1329, state: "IL", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Concordia University Chicago (IL)": { lat: 40.0627, lng: -89.365, state: "IL", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "DePaul University (IL)": { lat: 40.9809, lng: -88.5888, state: "IL", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Dominican University (IL)": { lat: 40.795, lng: -89.1402, state: "IL", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Eastern Illinois University (IL)": { lat: 40.6182, lng: -88.277, state: "IL", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Elmhurst University (IL)": { lat: 39.9142, lng: -89.7114, state: "IL", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Eureka College (IL)": { lat: 40.6888, lng: -89.8802, state: "IL", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Greenville University (IL)": { lat: 41.182, lng: -89.4225, state: "IL", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Illinois College (IL)": { lat: 39.4197, lng: -89.3049, state: "IL", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Illinois Institute of Technology (IL)": { lat: 40.3093, lng: -89.206, state: "IL", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Illinois State University (IL)": { lat: 39.3673, lng: -89.9201, state: "IL", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Illinois Wesleyan University (IL)": { lat: 40.5425, lng: -89.4479, state: "IL", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Knox College (IL)": { lat: 40.0235, lng: -89.3014, state: "IL", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Lake Forest College (IL)": { lat: 40.2696, lng: -89.6728, state: "IL", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Lewis University (IL)": { lat: 39.5368, lng: -88.9765, state: "IL", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Loyola University Chicago (IL)": { lat: 41.1278, lng: -88.7857, state: "IL", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "McKendree University (IL)": { lat: 41.0485, lng: -89.9715, state: "IL", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Millikin University (IL)": { lat: 39.6917, lng: -88.3746, state: "IL", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Monmouth College (IL)": { lat: 40.6589, lng: -88.0173, state: "IL", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "North Central College (IL)": { lat: 41.182, lng: -89.3517, state: "IL", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "North Park University (IL)": { lat: 39.373, lng: -89.8839, state: "IL", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Northern Illinois University (IL)": { lat: 39.5963, lng: -89.571, state: "IL", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Northwestern University (IL)": { lat: 42.0565, lng: -87.6753, state: "IL", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "BIG 10", division: "D1" },
+  "Principia College (IL)": { lat: 40.7564, lng: -88.6392, state: "IL", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Quincy University (IL)": { lat: 41.2402, lng: -89.5434, state: "IL", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Rockford University (IL)": { lat: 40.5635, lng: -89.0307, state: "IL", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Southern Illinois University Carbondale (IL)": { lat: 40.0926, lng: -88.3377, state: "IL", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Southern Illinois University Edwardsville (IL)": { lat: 40.8083, lng: -88.1288, state: "IL", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "University of Chicago (IL)": { lat: 39.7375, lng: -89.912, state: "IL", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "University of Illinois at Springfield (IL)": { lat: 41.3092, lng: -89.7102, state: "IL", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "University of Illinois Chicago (IL)": { lat: 39.7379, lng: -89.1625, state: "IL", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "University of Illinois Urbana-Champaign (IL)": { lat: 39.9173, lng: -88.3681, state: "IL", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "BIG 10", division: "D1" },
+  "Western Illinois University (IL)": { lat: 39.5323, lng: -89.0595, state: "IL", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Wheaton College (IL)": { lat: 40.6269, lng: -89.451, state: "IL", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+};
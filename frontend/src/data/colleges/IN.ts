@@ -0,0 +1,28 @@
+// Generated by frontend/build_geo_data.py from data/colleges.json - do not edit by hand
+import type { CollegeLocation } from './types';
+
+export const COLLEGES: Record<string, CollegeLocation> = {
+  "Anderson University (IN)": { lat: 39.943, lng: -87.0548, state: "IN", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Ball State University (IN)": { lat: 39.921, lng: -86.7628, state: "IN", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Butler University (IN)": { lat: 40.5119, lng: -85.4914, state: "IN", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "DePauw University (IN)": { lat: 39.8147, lng: -87.1172, state: "IN", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Earlham College (IN)": { lat: 40.6223, lng: -85.4487, state: "IN", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Franklin College (IN)": { lat: 39.9249, lng: -86.9268, state: "IN", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Hanover College (IN)": { lat: 38.9073, lng: -85.9567, state: "IN", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Indiana State University (IN)": { lat: 39.9337, lng: -87.1962, state: "IN", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Indiana University Bloomington (IN)": { lat: 40.6904, lng: -85.8558, state: "IN", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "BIG 10", division: "D1" },
+  "Indiana University Indianapolis (IN)": { lat: 40.488, lng: -86.2768, state: "IN", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Manchester University (IN)": { lat: 40.3146, lng: -86.3649, state: "IN", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Purdue University (IN)": { lat: 38.9445, lng: -85.4246, state: "IN", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "BIG 10", division: "D1" },
+  "Purdue University Fort Wayne (IN)": { lat: 40.6417, lng: -86.7992, state: "IN", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Purdue University Northwest (IN)": { lat: 40.3214, lng: -86.8707, state: "IN", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Rose-Hulman Institute of Technology (IN)": { lat: 40.1616, lng: -86.6473, state: "IN", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Saint Mary's CollegeA 1 (IN)": { lat: 39.8087, lng: -87.2375, state: "IN", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Trine University (IN)": { lat: 40.2777, lng: -85.4176, state: "IN", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "University of Evansville (IN)": { lat: 40.1549, lng: -86.3946, state: "IN", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "University of Indianapolis (IN)": { lat: 40.1798, lng: -86.533, state: "IN", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "University of Notre Dame du Lac (IN)": { lat: 39.0252, lng: -86.2126, state: "IN", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "ACC", division: "D1" },
+  "University of Southern Indiana (IN)": { lat: 39.2471, lng: -85.6646, state: "IN", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Valparaiso University (IN)": { lat: 40.7509, lng: -86.1507, state: "IN", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Wabash CollegeA 11 (IN)": { lat: 40.8164, lng: -86.7942, state: "IN", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+};
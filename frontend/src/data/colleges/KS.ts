@@ -0,0 +1,13 @@
+// Generated by frontend/build_geo_data.py from data/colleges.json - do not edit by hand
+import type { CollegeLocation } from './types';
+
+export const COLLEGES: Record<string, CollegeLocation> = {
+  "Emporia State University (KS)": { lat: 38.3392, lng: -96.8001, state: "KS", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Fort Hays State University (KS)": { lat: 39.5177, lng: -97.0971, state: "KS", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Kansas State University (KS)": { lat: 38.8196, lng: -97.2348, state: "KS", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "BIG 12", division: "D1" },
+  "Newman University (KS)": { lat: 38.2901, lng: -96.314, state: "KS", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Pittsburg State University (KS)": { lat: 37.8914, lng: -95.8908, state: "KS", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "University of Kansas (KS)": { lat: 39.4872, lng: -97.5486, state: "KS", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "BIG 12", division: "D1" },
+  "Washburn University (KS)": { lat: 39.5055, lng: -96.954, state: "KS", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Wichita State University (KS)": { lat: 38.1374, lng: -95.8204, state: "KS", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+};
@@ -0,0 +1,21 @@
+// Generated by frontend/build_geo_data.py from data/colleges.json - do not edit by hand
+import type { CollegeLocation } from './types';
+
+export const COLLEGES: Record<string, CollegeLocation> = {
+  "Asbury University (KY)": { lat: 38.415, lng: -84.9765, state: "KY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Bellarmine University (KY)": { lat: 37.5679, lng: -84.536, state: "KY", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Berea College (KY)": { lat: 38.2555, lng: -84.0693, state: "KY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Centre College (KY)": { lat: 38.0534, lng: -84.9456, state: "KY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Eastern Kentucky University (KY)": { lat: 37.554, lng: -84.0191, state: "KY", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Kentucky State University (KY)": { lat: 37.1591, lng: -84.2733, state: "KY", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Kentucky Wesleyan College (KY)": { lat: 37.8486, lng: -83.6904, state: "KY", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Morehead State University (KY)": { lat: 37.6875, lng: -85.3379, state: "KY", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Murray State University (KY)": { lat: 38.4708, lng: -83.8364, state: "KY", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Northern Kentucky University (KY)": { lat: 38.1563, lng: -83.8219, state: "KY", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Spalding University (KY)": { lat: 38.4461, lng: -85.3699, state: "KY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Thomas More University (KY)": { lat: 38.227, lng: -84.7524, state: "KY", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Transylvania University (KY)": { lat: 36.79, lng: -84.1117, state: "KY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "University of Kentucky (KY)": { lat: 36.9925, lng: -83.8123, state: "KY", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "SEC", division: "D1" },
+  "University of Louisville (KY)": { lat: 38.5391, lng: -84.9526, state: "KY", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "ACC", division: "D1" },
+  "Western Kentucky University (KY)": { lat: 36.6926, lng: -85.5414, state: "KY", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+};
@@ -0,0 +1,18 @@
+// Generated by frontend/build_geo_data.py from data/colleges.json - do not edit by hand
+import type { CollegeLocation } from './types';
+
+export const COLLEGES: Record<string, CollegeLocation> = {
+  "Centenary College of Louisiana (LA)": { lat: 31.2391, lng: -92.71, state: "LA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Grambling State University (LA)": { lat: 30.6677, lng: -92.7267, state: "LA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Louisiana State University and Agricultural and Mechanical College (LA)": { lat: 30.4133, lng: -91.18, state: "LA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "SEC", division: "D1" },
+  "Louisiana Tech University (LA)": { lat: 31.8074, lng: -91.8042, state: "LA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "McNeese State University (LA)": { lat: 30.4979, lng: -91.5324, state: "LA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Nicholls State University (LA)": { lat: 32.1654, lng: -92.4728, state: "LA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Northwestern State University of Louisiana (LA)": { lat: 30.4944, lng: -91.3651, state: "LA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Southeastern Louisiana University (LA)": { lat: 31.5684, lng: -92.2669, state: "LA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Southern University and A&M College (LA)": { lat: 30.8693, lng: -91.1179, state: "LA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Tulane University of Louisiana (LA)": { lat: 31.2379, lng: -91.0793, state: "LA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "University of Louisiana at Lafayette (LA)": { lat: 30.2243, lng: -91.6109, state: "LA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "University of Louisiana at Monroe (LA)": { lat: 30.6789, lng: -91.1522, state: "LA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "University of New Orleans (LA)": { lat: 30.9047, lng: -92.197, state: "LA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+};
@@ -0,0 +1,55 @@
+// Generated by frontend/build_geo_data.py from data/colleges.json - do not edit by hand
+import type { CollegeLocation } from './types';
+
+export const COLLEGES: Record<string, CollegeLocation> = {
+  "American International College (MA)": { lat: 42.3455, lng: -70.7021, state: "MA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Amherst College (MA)": { lat: 43.0726, lng: -72.2645, state: "MA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Anna Maria College (MA)": { lat: 41.2333, lng: -70.8137, state: "MA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Assumption University (MA)": { lat: 43.2119, lng: -71.0244, state: "MA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Babson College (MA)": { lat: 43.1157, lng: -71.1951, state: "MA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Bentley University (MA)": { lat: 43.0102, lng: -71.0959, state: "MA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Boston College (MA)": { lat: 41.5036, lng: -71.3438, state: "MA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "ACC", division: "D1" },
+  "Boston University (MA)": { lat: 42.8247, lng: -72.2147, state: "MA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Brandeis University (MA)": { lat: 41.6685, lng: -72.4376, state: "MA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Bridgewater State University (MA)": { lat: 42.8862, lng: -72.1391, state: "MA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Clark University (MA)": { lat: 42.3506, lng: -72.2985, state: "MA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "College of the Holy Cross (MA)": { lat: 41.76, lng: -71.0214, state: "MA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Curry College (MA)": { lat: 42.9035, lng: -71.6043, state: "MA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Dean College (MA)": { lat: 41.6668, lng: -71.0963, state: "MA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Elms College (MA)": { lat: 41.8436, lng: -71.4703, state: "MA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Emerson College (MA)": { lat: 42.3571, lng: -70.6397, state: "MA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Emmanuel College (MA)": { lat: 42.5438, lng: -71.8836, state: "MA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Endicott College (MA)": { lat: 41.9191, lng: -71.6505, state: "MA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Fitchburg State University (MA)": { lat: 41.4012, lng: -72.2103, state: "MA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Framingham State University (MA)": { lat: 43.1757, lng: -70.8015, state: "MA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Gordon College (MA)": { lat: 41.5404, lng: -70.5789, state: "MA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Harvard University (MA)": { lat: 41.3214, lng: -70.6545, state: "MA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Lasell University (MA)": { lat: 42.8839, lng: -70.6427, state: "MA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Lesley University (MA)": { lat: 42.4212, lng: -72.3501, state: "MA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Massachusetts College of Liberal Arts (MA)": { lat: 42.9495, lng: -71.449, state: "MA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Massachusetts Institute of Technology A 14 (MA)": { lat: 41.9236, lng: -70.6164, state: "MA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Massachusetts Maritime AcademyA 15 (MA)": { lat: 42.5299, lng: -72.1787, state: "MA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Merrimack College (MA)": { lat: 41.5965, lng: -71.0795, state: "MA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Mount Holyoke CollegeA 1 (MA)": { lat: 43.1136, lng: -71.216, state: "MA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Nichols College (MA)": { lat: 41.8905, lng: -72.2044, state: "MA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Northeastern University (MA)": { lat: 41.6013, lng: -71.4335, state: "MA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Regis College (MA)": { lat: 41.8548, lng: -72.0812, state: "MA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Salem State University (MA)": { lat: 42.1032, lng: -72.1199, state: "MA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Simmons UniversityA 1A 15 (MA)": { lat: 41.5301, lng: -71.6628, state: "MA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Smith CollegeA 1 (MA)": { lat: 43.1137, lng: -71.172, state: "MA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Springfield College (MA)": { lat: 41.3371, lng: -70.9122, state: "MA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Stonehill College (MA)": { lat: 41.7596, lng: -70.618, state: "MA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Suffolk University (MA)": { lat: 42.5586, lng: -71.6317, state: "MA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Tufts University (MA)": { lat: 42.7672, lng: -71.0368, state: "MA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "University of Massachusetts Amherst (MA)": { lat: 42.1867, lng: -71.5483, state: "MA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "University of Massachusetts Boston (MA)": { lat: 41.638, lng: -71.2192, state: "MA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "University of Massachusetts Dartmouth (MA)": { lat: 41.3351, lng: -72.0862, state: "MA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "University of Massachusetts Lowell (MA)": { lat: 41.2751, lng: -71.5815, state: "MA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Wellesley CollegeA 1 (MA)": { lat: 42.1146, lng: -71.8066, state: "MA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Wentworth Institute of Technology (MA)": { lat: 43.0164, lng: -71.3643, state: "MA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Western New England University (MA)": { lat: 41.5867, lng: -71.1649, state: "MA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Westfield State University (MA)": { lat: 41.8744, lng: -71.774, state: "MA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Williams College (MA)": { lat: 41.3103, lng: -71.3803, state: "MA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Worcester Polytechnic Institute (MA)": { lat: 43.1877, lng: -72.1618, state: "MA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Worcester State University (MA)": { lat: 41.3518, lng: -72.1569, state: "MA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+};
@@ -0,0 +1,25 @@
+// Generated by frontend/build_geo_data.py from data/colleges.json - do not edit by hand
+import type { CollegeLocation } from './types';
+
+export const COLLEGES: Record<string, CollegeLocation> = {
+  "Bowie State University (MD)": { lat: 39.2862, lng: -77.4023, state: "MD", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Coppin State University (MD)": { lat: 38.5604, lng: -76.9446, state: "MD", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Frostburg State University (MD)": { lat: 38.6854, lng: -77.1989, state: "MD", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Goucher College (MD)": { lat: 39.0572, lng: -77.2159, state: "MD", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Hood College (MD)": { lat: 38.8887, lng: -76.3497, state: "MD", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Johns Hopkins UniversityA 12 (MD)": { lat: 39.0792, lng: -77.5439, state: "MD", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Loyola University Maryland (MD)": { lat: 38.5296, lng: -76.4011, state: "MD", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "McDaniel College (MD)": { lat: 39.7256, lng: -76.8794, state: "MD", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Morgan State University (MD)": { lat: 39.3834, lng: -76.9412, state: "MD", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Mount Saint Mary's University (MD)": { lat: 39.1178, lng: -77.2424, state: "MD", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Notre Dame of Maryland University (MD)": { lat: 39.1747, lng: -77.7859, state: "MD", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Salisbury University (MD)": { lat: 39.5102, lng: -77.7571, state: "MD", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "St. Mary's College of Maryland (MD)": { lat: 38.703, lng: -76.3559, state: "MD", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Stevenson University (MD)": { lat: 38.3778, lng: -76.8906, state: "MD", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Towson University (MD)": { lat: 38.2336, lng: -76.5069, state: "MD", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "United States Naval Academy (MD)": { lat: 38.2873, lng: -76.4728, state: "MD", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "University of Maryland Eastern Shore (MD)": { lat: 39.6343, lng: -76.8756, state: "MD", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "University of Maryland, Baltimore County (MD)": { lat: 39.3601, lng: -76.76, state: "MD", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "University of Maryland, College Park (MD)": { lat: 38.9869, lng: -76.9426, state: "MD", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Washington College (MD)": { lat: 39.7404, lng: -75.826, state: "MD", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+};
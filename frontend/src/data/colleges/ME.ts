@@ -0,0 +1,17 @@
+// Generated by frontend/build_geo_data.py from data/colleges.json - do not edit by hand
+import type { CollegeLocation } from './types';
+
+export const COLLEGES: Record<string, CollegeLocation> = {
+  "Bates College (ME)": { lat: 44.079, lng: -69.7618, state: "ME", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Bowdoin College (ME)": { lat: 44.0086, lng: -68.6461, state: "ME", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Colby College (ME)": { lat: 45.5213, lng: -70.0196, state: "ME", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Husson University (ME)": { lat: 44.1013, lng: -68.4877, state: "ME", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Maine Maritime Academy (ME)": { lat: 45.6296, lng: -69.4269, state: "ME", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Saint Joseph's College of Maine (ME)": { lat: 44.6711, lng: -69.7437, state: "ME", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Thomas College (ME)": { lat: 44.5288, lng: -69.8927, state: "ME", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "University of Maine (ME)": { lat: 45.5123, lng: -69.6768, state: "ME", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "University of Maine at Farmington (ME)": { lat: 44.4698, lng: -70.2102, state: "ME", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "University of Maine at Presque Isle (ME)": { lat: 44.8776, lng: -69.9062, state: "ME", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "University of New England (ME)": { lat: 44.1365, lng: -70.0594, state: "ME", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "University of Southern Maine (ME)": { lat: 44.7692, lng: -68.443, state: "ME", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+};
@@ -0,0 +1,29 @@
+// Generated by frontend/build_geo_data.py from data/colleges.json - do not edit by hand
+import type { CollegeLocation } from './types';
+
+export const COLLEGES: Record<string, CollegeLocation> = {
+  "Adrian College (MI)": { lat: 43.633, lng: -85.1149, state: "MI", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Albion College (MI)": { lat: 42.9961, lng: -83.9064, state: "MI", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Alma College (MI)": { lat: 43.0883, lng: -85.2436, state: "MI", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Calvin University (MI)": { lat: 43.8002, lng: -83.6851, state: "MI", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Central Michigan University (MI)": { lat: 43.1653, lng: -84.1745, state: "MI", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Davenport University (MI)": { lat: 43.0694, lng: -85.3058, state: "MI", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Eastern Michigan University (MI)": { lat: 42.5518, lng: -84.0417, state: "MI", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Ferris State University (MI)": { lat: 43.0425, lng: -84.7015, state: "MI", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Grand Valley State University (MI)": { lat: 43.6997, lng: -84.7199, state: "MI", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Hillsdale College (MI)": { lat: 43.0809, lng: -85.0846, state: "MI", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Hope College (MI)": { lat: 42.6004, lng: -85.3864, state: "MI", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Kalamazoo College (MI)": { lat: 42.4857, lng: -85.4753, state: "MI", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Lake Superior State University (MI)": { lat: 43.5459, lng: -84.3681, state: "MI", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Michigan State University (MI)": { lat: 43.992, lng: -85.0647, state: "MI", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "BIG 10", division: "D1" },
+  "Michigan Technological University (MI)": { lat: 43.5372, lng: -85.2546, state: "MI", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Northern Michigan University (MI)": { lat: 43.3629, lng: -84.2381, state: "MI", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Northwood University (MI)": { lat: 43.744, lng: -83.8233, state: "MI", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Oakland University (MI)": { lat: 43.4656, lng: -84.7324, state: "MI", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Saginaw Valley State University (MI)": { lat: 43.9862, lng: -83.8076, state: "MI", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "University of Detroit Mercy (MI)": { lat: 43.4556, lng: -84.6158, state: "MI", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "University of Michigan (MI)": { lat: 43.7524, lng: -85.5031, state: "MI", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "BIG 10", division: "D1" },
+  "University of Olivet (MI)": { lat: 43.6475, lng: -83.6696, state: "MI", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Wayne State University (MI)": { lat: 43.8552, lng: -83.944, state: "MI", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Western Michigan University (MI)": { lat: 43.4459, lng: -85.161, state: "MI", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+};
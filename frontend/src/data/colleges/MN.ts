@@ -0,0 +1,35 @@
+// Generated by frontend/build_geo_data.py from data/colleges.json - do not edit by hand
+import type { CollegeLocation } from './types';
+
+export const COLLEGES: Record<string, CollegeLocation> = {
+  "Augsburg University (MN)": { lat: 46.3979, lng: -93.5949, state: "MN", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Bemidji State University (MN)": { lat: 44.8393, lng: -93.3007, state: "MN", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Bethany Lutheran College (MN)": { lat: 45.2346, lng: -94.492, state: "MN", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Bethel University (MN)": { lat: 45.2834, lng: -94.6288, state: "MN", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Carleton College (MN)": { lat: 46.3771, lng: -94.3326, state: "MN", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "College of Saint BenedictA 20A 1 (MN)": { lat: 46.5107, lng: -93.7122, state: "MN", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Concordia College (MN)": { lat: 45.0767, lng: -93.1467, state: "MN", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Concordia University-St. Paul (MN)": { lat: 46.1829, lng: -94.039, state: "MN", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Crown College (MN)": { lat: 45.0514, lng: -94.8862, state: "MN", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Gustavus Adolphus College (MN)": { lat: 46.3509, lng: -93.6711, state: "MN", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Hamline University (MN)": { lat: 45.0728, lng: -93.22, state: "MN", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Macalester College (MN)": { lat: 45.75, lng: -93.2655, state: "MN", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Martin Luther College (MN)": { lat: 45.1424, lng: -94.54, state: "MN", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Minnesota State University Moorhead (MN)": { lat: 46.0487, lng: -93.2663, state: "MN", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Minnesota State University, Mankato (MN)": { lat: 45.2272, lng: -94.4531, state: "MN", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "North Central University (MN)": { lat: 45.8994, lng: -93.2245, state: "MN", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Saint John's UniversityA 20A 11 (MN)": { lat: 46.4872, lng: -94.2751, state: "MN", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Saint Mary's University of Minnesota (MN)": { lat: 45.4975, lng: -93.5267, state: "MN", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Southwest Minnesota State University (MN)": { lat: 45.5696, lng: -94.4036, state: "MN", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "St. Catherine UniversityA 1 (MN)": { lat: 46.4649, lng: -93.4179, state: "MN", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "St. Cloud State University (MN)": { lat: 44.8998, lng: -93.6114, state: "MN", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "St. Olaf College (MN)": { lat: 46.2934, lng: -94.7347, state: "MN", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "The College of St. Scholastica (MN)": { lat: 46.4634, lng: -93.2945, state: "MN", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "University of Minnesota (MN)": { lat: 44.9069, lng: -93.5941, state: "MN", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "BIG 10", division: "D1" },
+  "University of Minnesota Crookston (MN)": { lat: 46.2385, lng: -93.3824, state: "MN", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "University of Minnesota Duluth (MN)": { lat: 45.2167, lng: -93.2125, state: "MN", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "University of Minnesota Morris (MN)": { lat: 46.1001, lng: -94.4067, state: "MN", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "University of Northwestern - St. Paul (MN)": { lat: 46.467, lng: -94.2833, state: "MN", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "University of Saint Thomas (MN)": { lat: 45.7928, lng: -93.8949, state: "MN", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Winona State University (MN)": { lat: 45.9215, lng: -94.3779, state: "MN", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+};
@@ -0,0 +1,27 @@
+// Generated by frontend/build_geo_data.py from data/colleges.json - do not edit by hand
+import type { CollegeLocation } from './types';
+
+export const COLLEGES: Record<string, CollegeLocation> = {
+  "Drury University (MO)": { lat: 38.4429, lng: -92.5073, state: "MO", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Lincoln University (MO) (MO)": { lat: 38.675, lng: -92.9443, state: "MO", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Lindenwood University (MO)": { lat: 37.8405, lng: -93.2377, state: "MO", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Maryville University (MO)": { lat: 38.0417, lng: -92.4267, state: "MO", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Missouri Southern State University (MO)": { lat: 38.5888, lng: -92.1851, state: "MO", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Missouri State University (MO)": { lat: 39.1766, lng: -91.348, state: "MO", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Missouri University of Science and Technology (MO)": { lat: 38.2868, lng: -91.9884, state: "MO", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Missouri Western State University (MO)": { lat: 37.4634, lng: -92.7856, state: "MO", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Northwest Missouri State University (MO)": { lat: 38.6317, lng: -93.1127, state: "MO", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Rockhurst University (MO)": { lat: 37.5379, lng: -92.5412, state: "MO", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Saint Louis University (MO)": { lat: 39.2004, lng: -92.5817, state: "MO", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Southeast Missouri State University (MO)": { lat: 38.9124, lng: -93.0503, state: "MO", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Southwest Baptist University (MO)": { lat: 39.099, lng: -91.8289, state: "MO", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Truman State University (MO)": { lat: 38.6852, lng: -92.1808, state: "MO", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "University of Central Missouri (MO)": { lat: 37.6979, lng: -92.3701, state: "MO", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "University of Missouri-St. Louis (MO)": { lat: 38.5139, lng: -91.9977, state: "MO", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "University of Missouri–ColumbiaN 22 (MO)": { lat: 39.396, lng: -92.5588, state: "MO", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "University of Missouri–Kansas City (MO)": { lat: 37.9352, lng: -92.5057, state: "MO", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Washington University in St. Louis (MO)": { lat: 38.9969, lng: -91.9814, state: "MO", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Webster University (MO)": { lat: 38.4515, lng: -91.7738, state: "MO", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Westminster College (MO)": { lat: 39.1877, lng: -92.082, state: "MO", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "William Jewell College (MO)": { lat: 39.3823, lng: -92.4545, state: "MO", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+};
@@ -0,0 +1,16 @@
+// Generated by frontend/build_geo_data.py from data/colleges.json - do not edit by hand
+import type { CollegeLocation } from './types';
+
+export const COLLEGES: Record<string, CollegeLocation> = {
+  "Alcorn State University (MS)": { lat: 33.5846, lng: -89.7782, state: "MS", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Belhaven University (MS)": { lat: 33.3385, lng: -90.5712, state: "MS", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Delta State University (MS)": { lat: 32.159, lng: -90.4259, state: "MS", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Jackson State University (MS)": { lat: 32.0041, lng: -90.4915, state: "MS", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Millsaps College (MS)": { lat: 33.476, lng: -89.7274, state: "MS", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Mississippi College (MS)": { lat: 31.8563, lng: -88.6901, state: "MS", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Mississippi State University (MS)": { lat: 32.3674, lng: -90.5274, state: "MS", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "SEC", division: "D1" },
+  "Mississippi University for Women (MS)": { lat: 32.4992, lng: -90.0617, state: "MS", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Mississippi Valley State University (MS)": { lat: 32.8685, lng: -90.05, state: "MS", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "The University of Mississippi (MS)": { lat: 33.574, lng: -89.3402, state: "MS", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "SEC", division: "D1" },
+  "University of Southern Mississippi (MS)": { lat: 33.2075, lng: -89.1124, state: "MS", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+};
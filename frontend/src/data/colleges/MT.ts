@@ -0,0 +1,8 @@
+// Generated by frontend/build_geo_data.py from data/colleges.json - do not edit by hand
+import type { CollegeLocation } from './types';
+
+export const COLLEGES: Record<string, CollegeLocation> = {
+  "Montana State University (MT)": { lat: 46.5369, lng: -110.1404, state: "MT", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Montana State University Billings (MT)": { lat: 46.2988, lng: -109.566, state: "MT", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "University of Montana (MT)": { lat: 47.371, lng: -110.2482, state: "MT", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+};
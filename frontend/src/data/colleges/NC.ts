@@ -0,0 +1,52 @@
+// Generated by frontend/build_geo_data.py from data/colleges.json - do not edit by hand
+import type { CollegeLocation } from './types';
+
+export const COLLEGES: Record<string, CollegeLocation> = {
+  "Appalachian State University (NC)": { lat: 35.6101, lng: -80.355, state: "NC", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Barton College (NC)": { lat: 36.4209, lng: -80.1746, state: "NC", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Belmont Abbey College (NC)": { lat: 34.6959, lng: -80.1573, state: "NC", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Brevard College (NC)": { lat: 36.3748, lng: -80.0142, state: "NC", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Campbell University (NC)": { lat: 35.9372, lng: -80.6711, state: "NC", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Catawba College (NC)": { lat: 35.2953, lng: -80.3804, state: "NC", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Chowan University (NC)": { lat: 36.0473, lng: -80.5924, state: "NC", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Davidson College (NC)": { lat: 35.239, lng: -80.1955, state: "NC", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Duke University (NC)": { lat: 35.9302, lng: -80.0315, state: "NC", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "ACC", division: "D1" },
+  "East Carolina University (NC)": { lat: 36.4257, lng: -78.8149, state: "NC", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Elizabeth City State University (NC)": { lat: 36.0847, lng: -80.3075, state: "NC", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Elon University (NC)": { lat: 36.6032, lng: -79.1032, state: "NC", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Fayetteville State University (NC)": { lat: 34.6682, lng: -80.1788, state: "NC", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Gardner–Webb University (NC)": { lat: 36.0915, lng: -79.3051, state: "NC", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Greensboro College (NC)": { lat: 36.603, lng: -79.8452, state: "NC", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Guilford College (NC)": { lat: 36.0073, lng: -79.8857, state: "NC", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "High Point University (NC)": { lat: 35.3947, lng: -79.2719, state: "NC", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Johnson & Wales University CharlotteA 13 (NC)": { lat: 35.8562, lng: -78.9604, state: "NC", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Johnson C. Smith University (NC)": { lat: 35.0829, lng: -79.8768, state: "NC", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Lees-McRae College (NC)": { lat: 36.3693, lng: -79.3381, state: "NC", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Lenoir-Rhyne University (NC)": { lat: 36.5279, lng: -80.1121, state: "NC", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Livingstone College (NC)": { lat: 36.1881, lng: -79.8545, state: "NC", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Mars Hill University (NC)": { lat: 35.193, lng: -78.908, state: "NC", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Meredith CollegeA 1 (NC)": { lat: 36.3146, lng: -79.049, state: "NC", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Methodist University (NC)": { lat: 35.6785, lng: -80.0166, state: "NC", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "North Carolina Agricultural and Technical State University (NC)": { lat: 35.6553, lng: -79.5182, state: "NC", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "North Carolina Central University (NC)": { lat: 35.1791, lng: -79.7771, state: "NC", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "North Carolina State University (NC)": { lat: 36.4451, lng: -79.5002, state: "NC", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "ACC", division: "D1" },
+  "North Carolina Wesleyan University (NC)": { lat: 35.973, lng: -79.9157, state: "NC", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Pfeiffer University (NC)": { lat: 36.4734, lng: -79.0145, state: "NC", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Queens University of Charlotte (NC)": { lat: 35.5846, lng: -80.1583, state: "NC", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Saint Augustine's University (NC)": { lat: 34.8326, lng: -80.529, state: "NC", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Salem CollegeA 1 (NC)": { lat: 35.9631, lng: -78.9179, state: "NC", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Shaw University (NC)": { lat: 34.7222, lng: -79.2939, state: "NC", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "University of Mount Olive (NC)": { lat: 35.9916, lng: -80.4951, state: "NC", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "University of North Carolina at Asheville (NC)": { lat: 35.1563, lng: -79.1011, state: "NC", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "University of North Carolina at Chapel Hill (NC)": { lat: 36.2841, lng: -79.51, state: "NC", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "University of North Carolina at Charlotte (NC)": { lat: 36.5471, lng: -79.7222, state: "NC", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "University of North Carolina at Greensboro (NC)": { lat: 35.3789, lng: -78.865, state: "NC", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "University of North Carolina at Pembroke (NC)": { lat: 34.8157, lng: -80.6412, state: "NC", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "University of North Carolina at Wilmington (NC)": { lat: 34.6909, lng: -80.4626, state: "NC", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Wake Forest University (NC)": { lat: 36.0659, lng: -80.2918, state: "NC", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "ACC", division: "D1" },
+  "Warren Wilson College (NC)": { lat: 34.93, lng: -79.1212, state: "NC", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Western Carolina University (NC)": { lat: 36.1049, lng: -79.1838, state: "NC", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "William Peace University (NC)": { lat: 36.4974, lng: -79.1375, state: "NC", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Wingate University (NC)": { lat: 36.3346, lng: -80.3078, state: "NC", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Winston-Salem State University (NC)": { lat: 36.124, lng: -79.1212, state: "NC", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+};
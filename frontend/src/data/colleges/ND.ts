@@ -0,0 +1,9 @@
+// Generated by frontend/build_geo_data.py from data/colleges.json - do not edit by hand
+import type { CollegeLocation } from './types';
+
+export const COLLEGES: Record<string, CollegeLocation> = {
+  "Minot State University (ND)": { lat: 47.4978, lng: -99.8763, state: "ND", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "North Dakota State University of Agriculture and Applied Sciences (ND)": { lat: 46.7585, lng: -98.9435, state: "ND", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "University of Mary (ND)": { lat: 46.9986, lng: -99.8567, state: "ND", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "University of North Dakota (ND)": { lat: 48.4453, lng: -100.2, state: "ND", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+};
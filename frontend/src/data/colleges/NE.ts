@@ -0,0 +1,12 @@
+// Generated by frontend/build_geo_data.py from data/colleges.json - do not edit by hand
+import type { CollegeLocation } from './types';
+
+export const COLLEGES: Record<string, CollegeLocation> = {
+  "Chadron State College (NE)": { lat: 41.5333, lng: -97.6203, state: "NE", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Creighton University (NE)": { lat: 41.6648, lng: -98.714, state: "NE", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Nebraska Wesleyan University (NE)": { lat: 40.3947, lng: -98.4836, state: "NE", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "University of Nebraska at Kearney (NE)": { lat: 40.4849, lng: -99.177, state: "NE", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "University of Nebraska Omaha (NE)": { lat: 40.4667, lng: -99.1719, state: "NE", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "University of Nebraska–Lincoln (NE)": { lat: 40.8202, lng: -96.7005, state: "NE", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Wayne State College (NE)": { lat: 41.0783, lng: -99.035, state: "NE", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+};
@@ -0,0 +1,15 @@
+// Generated by frontend/build_geo_data.py from data/colleges.json - do not edit by hand
+import type { CollegeLocation } from './types';
+
+export const COLLEGES: Record<string, CollegeLocation> = {
+  "Colby–Sawyer College (NH)": { lat: 43.0907, lng: -71.9944, state: "NH", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Dartmouth College (NH)": { lat: 43.4151, lng: -71.1574, state: "NH", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Franklin Pierce University (NH)": { lat: 42.6222, lng: -71.5617, state: "NH", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Keene State College (NH)": { lat: 43.8934, lng: -71.5984, state: "NH", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "New England College (NH)": { lat: 43.4978, lng: -71.2948, state: "NH", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Plymouth State University (NH)": { lat: 43.4196, lng: -71.6424, state: "NH", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Rivier University (NH)": { lat: 43.8652, lng: -71.7541, state: "NH", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Saint Anselm College (NH)": { lat: 43.83, lng: -71.7546, state: "NH", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Southern New Hampshire University (NH)": { lat: 43.2912, lng: -72.1011, state: "NH", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "University of New Hampshire (NH)": { lat: 43.6439, lng: -72.2467, state: "NH", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+};
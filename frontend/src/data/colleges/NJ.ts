@@ -0,0 +1,31 @@
+// Generated by frontend/build_geo_data.py from data/colleges.json - do not edit by hand
+import type { CollegeLocation } from './types';
+
+export const COLLEGES: Record<string, CollegeLocation> = {
+  "Caldwell University (NJ)": { lat: 40.9627, lng: -75.3713, state: "NJ", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Centenary University (NJ)": { lat: 40.4796, lng: -73.8884, state: "NJ", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Drew University (NJ)": { lat: 40.6032, lng: -75.2858, state: "NJ", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Fairleigh Dickinson University (NJ)": { lat: 40.2701, lng: -74.7367, state: "NJ", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Fairleigh Dickinson University, Florham (NJ)": { lat: 40.3342, lng: -75.4069, state: "NJ", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Felician University (NJ)": { lat: 39.3394, lng: -74.3683, state: "NJ", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Georgian Court University (NJ)": { lat: 39.3686, lng: -73.9552, state: "NJ", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Kean University (NJ)": { lat: 40.7194, lng: -73.7114, state: "NJ", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Monmouth University (NJ)": { lat: 39.9173, lng: -73.6652, state: "NJ", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Montclair State University (NJ)": { lat: 39.6127, lng: -74.1429, state: "NJ", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "New Jersey City University (NJ)": { lat: 41.1819, lng: -73.5348, state: "NJ", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "New Jersey Institute of Technology (NJ)": { lat: 40.6853, lng: -74.2308, state: "NJ", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Princeton University (NJ)": { lat: 39.6287, lng: -75.23, state: "NJ", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Ramapo College (NJ)": { lat: 39.5262, lng: -75.3508, state: "NJ", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Rider University (NJ)": { lat: 40.9164, lng: -74.4533, state: "NJ", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Rowan University (NJ)": { lat: 40.5788, lng: -73.6026, state: "NJ", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Rutgers University–Camden (NJ)": { lat: 40.8036, lng: -74.1203, state: "NJ", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Rutgers University–New Brunswick (NJ)": { lat: 40.5008, lng: -74.4474, state: "NJ", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Rutgers University–Newark (NJ)": { lat: 39.8699, lng: -74.5658, state: "NJ", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Saint Elizabeth University (NJ)": { lat: 39.6826, lng: -75.4099, state: "NJ", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Saint Peter's University (NJ)": { lat: 41.0315, lng: -75.0185, state: "NJ", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Seton Hall University (NJ)": { lat: 40.7059, lng: -74.6755, state: "NJ", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Stevens Institute of Technology (NJ)": { lat: 39.4738, lng: -74.3184, state: "NJ", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Stockton University (NJ)": { lat: 40.2187, lng: -74.384, state: "NJ", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "The College of New Jersey (NJ)": { lat: 40.6836, lng: -74.3688, state: "NJ", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "William Paterson University (NJ)": { lat: 40.9454, lng: -74.0286, state: "NJ", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+};
@@ -0,0 +1,10 @@
+// Generated by frontend/build_geo_data.py from data/colleges.json - do not edit by hand
+import type { CollegeLocation } from './types';
+
+export const COLLEGES: Record<string, CollegeLocation> = {
+  "Eastern New Mexico University (NM)": { lat: 33.9289, lng: -105.3079, state: "NM", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "New Mexico Highlands University (NM)": { lat: 35.3166, lng: -105.8104, state: "NM", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "New Mexico State University (NM)": { lat: 34.2333, lng: -105.3527, state: "NM", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "The University of New Mexico (NM)": { lat: 35.2691, lng: -106.9393, state: "NM", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Western New Mexico University (NM)": { lat: 34.7911, lng: -105.3495, state: "NM", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+};
@@ -0,0 +1,7 @@
+// Generated by frontend/build_geo_data.py from data/colleges.json - do not edit by hand
+import type { CollegeLocation } from './types';
+
+export const COLLEGES: Record<string, CollegeLocation> = {
+  "University of Nevada, Las Vegas (NV)": { lat: 37.6049, lng: -117.1607, state: "NV", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "University of Nevada, Reno (NV)": { lat: 38.9545, lng: -116.942, state: "NV", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+};
@@ -0,0 +1,97 @@
+// Generated by frontend/build_geo_data.py from data/colleges.json - do not edit by hand
+import type { CollegeLocation } from './types';
+
+export const COLLEGES: Record<string, CollegeLocation> = {
+  "Adelphi University (NY)": { lat: 41.3655, lng: -75.4563, state: "NY", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Alfred State College (NY)": { lat: 42.2153, lng: -75.0141, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Alfred University (NY)": { lat: 41.6381, lng: -74.6025, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Bard College (NY)": { lat: 42.8574, lng: -74.6422, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Baruch College (NY)": { lat: 42.082, lng: -75.0542, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Brooklyn College (NY)": { lat: 41.497, lng: -74.9833, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Buffalo State University (NY)": { lat: 42.2965, lng: -75.0261, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Canisius University (NY)": { lat: 42.0778, lng: -75.6959, state: "NY", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "City College of New York (NY)": { lat: 41.6553, lng: -75.5273, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Clarkson UniversityA 5A 6 (NY)": { lat: 42.8971, lng: -75.8029, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Colgate University (NY)": { lat: 43.0546, lng: -75.0201, state: "NY", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "College of Staten Island (NY)": { lat: 41.4172, lng: -75.1948, state: "NY", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Columbia University in the City of New York (NY)": { lat: 42.0873, lng: -74.1482, state: "NY", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Cornell University (NY)": { lat: 41.313, lng: -74.5, state: "NY", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "D'Youville University (NY)": { lat: 41.6456, lng: -75.6084, state: "NY", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Daemen University (NY)": { lat: 41.4017, lng: -74.0659, state: "NY", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Dominican University New York (NY)": { lat: 42.773, lng: -75.6475, state: "NY", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Elmira College (NY)": { lat: 42.7971, lng: -75.4619, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Farmingdale State College (NY)": { lat: 41.4101, lng: -74.647, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Fordham University (NY)": { lat: 42.7264, lng: -74.9605, state: "NY", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Hamilton College (NY)": { lat: 41.4945, lng: -75.0667, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Hartwick College (NY)": { lat: 42.7493, lng: -75.4122, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Hilbert College (NY)": { lat: 41.2398, lng: -75.7155, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Hobart CollegeA 9A 10A 11 (NY)": { lat: 42.1299, lng: -75.8966, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Hofstra University (NY)": { lat: 41.2485, lng: -75.1807, state: "NY", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Houghton University (NY)": { lat: 41.4357, lng: -74.9952, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Hunter College (NY)": { lat: 43.1319, lng: -75.5868, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Iona University (NY)": { lat: 41.7468, lng: -74.2537, state: "NY", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Ithaca College (NY)": { lat: 41.7403, lng: -75.8004, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "John Jay College of Criminal Justice (NY)": { lat: 42.4633, lng: -75.7864, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Keuka College (NY)": { lat: 41.6363, lng: -74.237, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Lehman College (NY)": { lat: 42.2062, lng: -74.9907, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Long Island University (NY)": { lat: 43.1603, lng: -74.5368, state: "NY", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Manhattan University (NY)": { lat: 41.2921, lng: -74.587, state: "NY", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Manhattanville University (NY)": { lat: 42.493, lng: -75.7718, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Marist College (NY)": { lat: 41.878, lng: -75.0652, state: "NY", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Medgar Evers College (NY)": { lat: 42.1654, lng: -75.5748, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Mercy University (NY)": { lat: 41.2916, lng: -74.9454, state: "NY", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Molloy University (NY)": { lat: 42.9653, lng: -74.0547, state: "NY", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Mount Saint Mary College (NY)": { lat: 42.5671, lng: -75.9206, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Nazareth University (NY)": { lat: 42.4052, lng: -74.6767, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "New York University (NY)": { lat: 42.6074, lng: -74.4308, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Niagara University (NY)": { lat: 41.2702, lng: -75.1204, state: "NY", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Pace University (NY)": { lat: 42.5986, lng: -75.3236, state: "NY", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Pratt Institute (NY)": { lat: 41.4287, lng: -74.3842, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Queens College (NY)": { lat: 42.8125, lng: -74.83, state: "NY", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Rensselaer Polytechnic Institute A 5A 6 (NY)": { lat: 42.1048, lng: -74.7353, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Roberts Wesleyan University (NY)": { lat: 41.8228, lng: -74.0349, state: "NY", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Rochester Institute of TechnologyA 18A 19 (NY)": { lat: 41.6257, lng: -75.3193, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Russell Sage College (NY)": { lat: 42.607, lng: -75.6158, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Saint Bonaventure University (NY)": { lat: 42.1207, lng: -74.5186, state: "NY", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Saint John's University (NY)": { lat: 42.7705, lng: -74.0041, state: "NY", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Sarah Lawrence College (NY)": { lat: 43.0896, lng: -74.6133, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Siena College (NY)": { lat: 42.5517, lng: -74.9456, state: "NY", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Skidmore College (NY)": { lat: 41.4684, lng: -75.1995, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "St. John Fisher University (NY)": { lat: 42.4968, lng: -75.078, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "St. Joseph's University (NY)": { lat: 41.7901, lng: -74.5076, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "St. Lawrence UniversityA 5A 6 (NY)": { lat: 42.8465, lng: -75.1992, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "St. Thomas Aquinas College (NY)": { lat: 42.1012, lng: -74.0798, state: "NY", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "State University of New York at AlbanyN 11 (NY)": { lat: 42.767, lng: -75.8222, state: "NY", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "State University of New York at BinghamtonN 13 (NY)": { lat: 42.0756, lng: -74.4823, state: "NY", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "State University of New York at Brockport (NY)": { lat: 42.1224, lng: -74.4059, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "State University of New York at BuffaloN 14 (NY)": { lat: 43.0046, lng: -75.6372, state: "NY", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "State University of New York at Canton (NY)": { lat: 41.9809, lng: -74.2234, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "State University of New York at Cobleskill (NY)": { lat: 42.2029, lng: -75.2713, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "State University of New York at Cortland (NY)": { lat: 42.3663, lng: -74.243, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "State University of New York at Delhi (NY)": { lat: 42.2906, lng: -74.3424, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "State University of New York at Fredonia (NY)": { lat: 42.9933, lng: -74.5315, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "State University of New York at Geneseo (NY)": { lat: 42.6928, lng: -74.3852, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "State University of New York at Morrisville (NY)": { lat: 42.2744, lng: -74.6507, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "State University of New York at New Paltz (NY)": { lat: 42.6712, lng: -74.7976, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "State University of New York at Old Westbury (NY)": { lat: 41.3274, lng: -75.0123, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "State University of New York at Oneonta (NY)": { lat: 42.9464, lng: -74.7581, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "State University of New York at Oswego (NY)": { lat: 41.6503, lng: -74.6831, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "State University of New York at Plattsburgh (NY)": { lat: 42.7097, lng: -75.0387, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "State University of New York at Potsdam (NY)": { lat: 42.1192, lng: -74.3926, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "State University of New York at Purchase (NY)": { lat: 42.7973, lng: -74.3983, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "State University of New York at Stony BrookN 15 (NY)": { lat: 42.1877, lng: -75.9126, state: "NY", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "State University of New York Maritime College (NY)": { lat: 41.5993, lng: -74.2758, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "State University of New York Polytechnic Institute (NY)": { lat: 42.5788, lng: -74.6184, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Syracuse University (NY)": { lat: 41.7672, lng: -74.5745, state: "NY", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "ACC", division: "D1" },
+  "Union CollegeA 18A 19 (NY)": { lat: 41.5813, lng: -74.9479, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "United States Merchant Marine Academy (NY)": { lat: 42.5045, lng: -75.1694, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "United States Military Academy (NY)": { lat: 41.3575, lng: -75.1723, state: "NY", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "University of Mount Saint Vincent (NY)": { lat: 41.2782, lng: -75.9172, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "University of Rochester (NY)": { lat: 41.4701, lng: -75.4046, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Utica University (NY)": { lat: 42.1374, lng: -74.327, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Vassar College (NY)": { lat: 41.323, lng: -75.0027, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Wagner College (NY)": { lat: 41.8179, lng: -75.1881, state: "NY", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "William Smith CollegeA 10A 1 (NY)": { lat: 41.8122, lng: -75.7489, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Yeshiva University (NY)": { lat: 43.1531, lng: -75.293, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "York College, City University of New York (NY)": { lat: 42.9973, lng: -74.5403, state: "NY", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+};
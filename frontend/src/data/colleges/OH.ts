@@ -0,0 +1,49 @@
+// Generated by frontend/build_geo_data.py from data/colleges.json - do not edit by hand
+import type { CollegeLocation } from './types';
+
+export const COLLEGES: Record<string, CollegeLocation> = {
+  "Ashland University (OH)": { lat: 41.2372, lng: -83.2903, state: "OH", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Baldwin Wallace University (OH)": { lat: 40.6879, lng: -83.0232, state: "OH", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Bluffton University (OH)": { lat: 39.9953, lng: -82.4314, state: "OH", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Bowling Green State University (OH)": { lat: 40.689, lng: -83.2092, state: "OH", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Capital University (OH)": { lat: 40.0241, lng: -83.7358, state: "OH", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Case Western Reserve University (OH)": { lat: 40.372, lng: -83.6024, state: "OH", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Cedarville University (OH)": { lat: 40.6549, lng: -82.4171, state: "OH", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Central State University (OH)": { lat: 39.6996, lng: -81.911, state: "OH", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Cleveland State University (OH)": { lat: 40.2208, lng: -82.7788, state: "OH", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "College of Wooster (OH)": { lat: 41.3152, lng: -83.2908, state: "OH", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Denison University (OH)": { lat: 39.7757, lng: -83.2993, state: "OH", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Franciscan University of Steubenville (OH)": { lat: 39.5727, lng: -83.1489, state: "OH", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Heidelberg University (OH)": { lat: 41.1874, lng: -83.7503, state: "OH", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Hiram College (OH)": { lat: 39.5066, lng: -83.3594, state: "OH", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "John Carroll University (OH)": { lat: 39.7392, lng: -82.8456, state: "OH", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Kent State University (OH)": { lat: 41.236, lng: -81.7721, state: "OH", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Kenyon College (OH)": { lat: 40.6868, lng: -83.449, state: "OH", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Lake Erie College (OH)": { lat: 39.468, lng: -83.3661, state: "OH", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Malone University (OH)": { lat: 39.5101, lng: -82.6553, state: "OH", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Marietta College (OH)": { lat: 41.2719, lng: -83.289, state: "OH", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Miami University (OH)": { lat: 39.4629, lng: -81.9171, state: "OH", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Mount St. Joseph University (OH)": { lat: 40.1576, lng: -82.3356, state: "OH", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Muskingum University (OH)": { lat: 39.6877, lng: -83.7275, state: "OH", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Oberlin College (OH)": { lat: 40.0164, lng: -83.2138, state: "OH", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Ohio Dominican University (OH)": { lat: 39.8398, lng: -83.1621, state: "OH", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Ohio Northern University (OH)": { lat: 40.7983, lng: -83.389, state: "OH", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Ohio Wesleyan University (OH)": { lat: 39.6226, lng: -82.5489, state: "OH", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Otterbein University (OH)": { lat: 39.5769, lng: -83.5556, state: "OH", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "The Ohio State University (OH)": { lat: 40.0067, lng: -83.0305, state: "OH", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "BIG 10", division: "D1" },
+  "The Ohio University (OH)": { lat: 40.9622, lng: -82.9854, state: "OH", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "The University of Akron (OH)": { lat: 40.7288, lng: -83.4281, state: "OH", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Tiffin University (OH)": { lat: 40.9637, lng: -81.788, state: "OH", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "University of Cincinnati (OH)": { lat: 41.3317, lng: -83.7641, state: "OH", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "BIG 12", division: "D1" },
+  "University of Dayton (OH)": { lat: 39.8782, lng: -82.2153, state: "OH", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "University of Findlay (OH)": { lat: 40.8964, lng: -82.9346, state: "OH", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "University of Mount Union (OH)": { lat: 39.7531, lng: -82.8998, state: "OH", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "University of Toledo (OH)": { lat: 40.2677, lng: -83.4323, state: "OH", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Ursuline Collegel (OH)": { lat: 40.6508, lng: -83.0257, state: "OH", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Walsh University (OH)": { lat: 40.6635, lng: -83.4156, state: "OH", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Wilmington College (OH)": { lat: 41.3721, lng: -83.7147, state: "OH", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Wittenberg University (OH)": { lat: 39.8422, lng: -82.1372, state: "OH", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Wright State University (OH)": { lat: 41.1656, lng: -82.9378, state: "OH", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Xavier University (OH)": { lat: 40.397, lng: -81.8351, state: "OH", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Youngstown State University (OH)": { lat: 40.4593, lng: -82.6949, state: "OH", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+};
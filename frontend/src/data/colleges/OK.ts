@@ -0,0 +1,20 @@
+// Generated by frontend/build_geo_data.py from data/colleges.json - do not edit by hand
+import type { CollegeLocation } from './types';
+
+export const COLLEGES: Record<string, CollegeLocation> = {
+  "Cameron University (OK)": { lat: 36.1766, lng: -97.1283, state: "OK", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "East Central University (OK)": { lat: 35.2029, lng: -96.8283, state: "OK", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Northeastern State University (OK)": { lat: 36.1171, lng: -97.3616, state: "OK", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Northwestern Oklahoma State University (OK)": { lat: 34.9477, lng: -96.552, state: "OK", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Oklahoma Baptist University (OK)": { lat: 35.301, lng: -96.9339, state: "OK", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Oklahoma Christian University (OK)": { lat: 35.8476, lng: -96.293, state: "OK", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Oklahoma State University–Stillwater (OK)": { lat: 35.9518, lng: -96.3417, state: "OK", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Oral Roberts University (OK)": { lat: 35.2952, lng: -97.4835, state: "OK", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Rogers State University (OK)": { lat: 36.5267, lng: -97.1192, state: "OK", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Southeastern Oklahoma State University (OK)": { lat: 35.6724, lng: -96.1612, state: "OK", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Southern Nazarene University (OK)": { lat: 35.1855, lng: -97.8814, state: "OK", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Southwestern Oklahoma State University (OK)": { lat: 35.0893, lng: -97.9204, state: "OK", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "The University of Tulsa (OK)": { lat: 34.7837, lng: -97.9111, state: "OK", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "University of Central Oklahoma (OK)": { lat: 36.1036, lng: -96.1793, state: "OK", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "University of Oklahoma (OK)": { lat: 35.2472, lng: -96.6582, state: "OK", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "SEC", division: "D1" },
+};
@@ -0,0 +1,15 @@
+// Generated by frontend/build_geo_data.py from data/colleges.json - do not edit by hand
+import type { CollegeLocation } from './types';
+
+export const COLLEGES: Record<string, CollegeLocation> = {
+  "George Fox University (OR)": { lat: 44.4218, lng: -121.3437, state: "OR", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Lewis & Clark College (OR)": { lat: 43.9118, lng: -121.1871, state: "OR", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Linfield University (OR)": { lat: 45.1464, lng: -122.9442, state: "OR", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Oregon State University (OR)": { lat: 44.9888, lng: -122.9711, state: "OR", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "PAC-12", division: "D1" },
+  "Pacific University (OR)": { lat: 44.2321, lng: -122.1721, state: "OR", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Portland State University (OR)": { lat: 44.1653, lng: -122.5112, state: "OR", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "University of Oregon (OR)": { lat: 44.0316, lng: -121.1314, state: "OR", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "BIG 10", division: "D1" },
+  "University of Portland (OR)": { lat: 45.5123, lng: -122.8163, state: "OR", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Western Oregon University (OR)": { lat: 43.5951, lng: -121.7416, state: "OR", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Willamette University (OR)": { lat: 44.5924, lng: -121.378, state: "OR", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+};
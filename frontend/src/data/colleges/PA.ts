@@ -0,0 +1,99 @@
+// Generated by frontend/build_geo_data.py from data/colleges.json - do not edit by hand
+import type { CollegeLocation } from './types';
+
+export const COLLEGES: Record<string, CollegeLocation> = {
+  "Albright College (PA)": { lat: 40.0171, lng: -76.478, state: "PA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Allegheny College (PA)": { lat: 41.0993, lng: -77.175, state: "PA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Alvernia University (PA)": { lat: 41.1414, lng: -77.7986, state: "PA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Arcadia University (PA)": { lat: 41.2828, lng: -77.7435, state: "PA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Bloomsburg University of Pennsylvania (PA)": { lat: 39.6509, lng: -77.496, state: "PA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Bryn Mawr CollegeA 1 (PA)": { lat: 41.1637, lng: -77.4204, state: "PA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Bucknell University (PA)": { lat: 40.0665, lng: -77.0365, state: "PA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Cairn University (PA)": { lat: 39.8133, lng: -77.8307, state: "PA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Carlow UniversityA 2 (PA)": { lat: 40.0097, lng: -78.1101, state: "PA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Carnegie Mellon University (PA)": { lat: 40.5393, lng: -76.5573, state: "PA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Cedar Crest CollegeA 1 (PA)": { lat: 41.5486, lng: -76.2153, state: "PA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Chatham University (PA)": { lat: 41.3866, lng: -78.1012, state: "PA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Chestnut Hill College (PA)": { lat: 39.7616, lng: -77.3105, state: "PA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Delaware Valley University (PA)": { lat: 39.838, lng: -77.3347, state: "PA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "DeSales University (PA)": { lat: 39.8986, lng: -78.1083, state: "PA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Dickinson College (PA)": { lat: 41.4281, lng: -77.1131, state: "PA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Drexel University (PA)": { lat: 41.4693, lng: -77.4178, state: "PA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Duquesne University of the Holy Spirit (PA)": { lat: 40.2156, lng: -77.4358, state: "PA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "East Stroudsburg University of Pennsylvania (PA)": { lat: 41.2285, lng: -76.2463, state: "PA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Eastern University (PA)": { lat: 39.6759, lng: -77.1558, state: "PA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Elizabethtown College (PA)": { lat: 40.6044, lng: -76.2278, state: "PA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Franklin & Marshall CollegeA 8 (PA)": { lat: 40.1193, lng: -78.1783, state: "PA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Gannon University (PA)": { lat: 40.755, lng: -78.1101, state: "PA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Geneva College (PA)": { lat: 39.9286, lng: -77.1732, state: "PA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Gettysburg College (PA)": { lat: 41.0869, lng: -76.3672, state: "PA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Grove City College (PA)": { lat: 40.7202, lng: -76.8838, state: "PA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Gwynedd Mercy University (PA)": { lat: 39.8837, lng: -78.1113, state: "PA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Haverford College (PA)": { lat: 40.0659, lng: -77.5747, state: "PA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Holy Family University (PA)": { lat: 40.2203, lng: -76.5448, state: "PA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Immaculata University (PA)": { lat: 39.9245, lng: -77.2359, state: "PA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Indiana University of Pennsylvania (PA)": { lat: 40.2552, lng: -76.4334, state: "PA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Juniata College (PA)": { lat: 39.6968, lng: -76.2852, state: "PA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Keystone College (PA)": { lat: 40.017, lng: -77.112, state: "PA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "King's College (PA)": { lat: 40.5752, lng: -76.4889, state: "PA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Kutztown University of Pennsylvania (PA)": { lat: 39.9323, lng: -78.0605, state: "PA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "La Roche University (PA)": { lat: 40.3464, lng: -76.9497, state: "PA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "La Salle University (PA)": { lat: 41.0809, lng: -76.2222, state: "PA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Lafayette College (PA)": { lat: 41.2526, lng: -77.6539, state: "PA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Lancaster Bible College (PA)": { lat: 41.0202, lng: -77.0438, state: "PA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Lebanon Valley College (PA)": { lat: 39.8472, lng: -77.5671, state: "PA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Lehigh University (PA)": { lat: 40.8191, lng: -76.4038, state: "PA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Lincoln University (PA) (PA)": { lat: 40.193, lng: -77.1819, state: "PA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Lock Haven University of Pennsylvania (PA)": { lat: 41.3424, lng: -76.9927, state: "PA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Lycoming College (PA)": { lat: 40.7097, lng: -77.9438, state: "PA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Mansfield University of Pennsylvania (PA)": { lat: 41.5275, lng: -76.3784, state: "PA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Marywood University (PA)": { lat: 41.5829, lng: -77.2821, state: "PA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Messiah University (PA)": { lat: 39.832, lng: -77.1254, state: "PA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Millersville University of Pennsylvania (PA)": { lat: 40.362, lng: -77.2139, state: "PA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Misericordia University (PA)": { lat: 39.8168, lng: -77.007, state: "PA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Moravian University (PA)": { lat: 41.1684, lng: -77.0384, state: "PA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Mount Aloysius College (PA)": { lat: 41.5315, lng: -77.2342, state: "PA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Muhlenberg College (PA)": { lat: 39.6897, lng: -77.5912, state: "PA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Neumann University (PA)": { lat: 40.643, lng: -76.4403, state: "PA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Pennsylvania College of Technology (PA)": { lat: 40.4297, lng: -77.7301, state: "PA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Pennsylvania State University": { lat: 40.7934, lng: -77.86, state: "PA", fraternities: 37, sororities: 20, totalMembers: 3000, conference: "BIG 10", division: "D1" },
+  "Pennsylvania State University (PA)": { lat: 40.7934, lng: -77.86, state: "PA", fraternities: 37, sororities: 20, totalMembers: 3000, conference: "BIG 10", division: "D1" },
+  "Pennsylvania State University, Altoona (PA)": { lat: 40.7468, lng: -77.1145, state: "PA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Pennsylvania State University, Behrend (PA)": { lat: 40.2721, lng: -76.9555, state: "PA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Pennsylvania State University, Berks College (PA)": { lat: 40.6241, lng: -78.0711, state: "PA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Pennsylvania State University, BrandywineA 2 (PA)": { lat: 39.8699, lng: -76.3511, state: "PA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Pennsylvania State University, Harrisburg (PA)": { lat: 39.8717, lng: -77.7651, state: "PA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Pennsylvania Western University, California (PA)": { lat: 41.0063, lng: -76.6324, state: "PA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Pennsylvania Western University, Clarion (PA)": { lat: 39.981, lng: -76.2917, state: "PA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Pennsylvania Western University, Edinboro (PA)": { lat: 40.017, lng: -77.9537, state: "PA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Robert Morris University (PA)": { lat: 40.1508, lng: -78.055, state: "PA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Rosemont Collegea (PA)": { lat: 40.4233, lng: -76.9324, state: "PA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Saint Francis UniversityC 6 (PA)": { lat: 40.5237, lng: -76.6957, state: "PA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Saint Joseph's University (PA)": { lat: 39.8964, lng: -77.4759, state: "PA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Saint Vincent College (PA)": { lat: 41.5467, lng: -77.4399, state: "PA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Seton Hill University (PA)": { lat: 40.9466, lng: -76.9188, state: "PA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Shippensburg University of Pennsylvania (PA)": { lat: 41.462, lng: -77.351, state: "PA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Slippery Rock University of Pennsylvania (PA)": { lat: 40.7025, lng: -77.8032, state: "PA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Susquehanna University (PA)": { lat: 41.2166, lng: -77.1054, state: "PA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Swarthmore College (PA)": { lat: 40.5709, lng: -76.8957, state: "PA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Temple University (PA)": { lat: 41.1056, lng: -76.3872, state: "PA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "The Pennsylvania State University (PA)": { lat: 41.5135, lng: -76.5668, state: "PA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "BIG 10", division: "D1" },
+  "Thiel College (PA)": { lat: 40.7074, lng: -76.5154, state: "PA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Thomas Jefferson University (PA)": { lat: 41.4262, lng: -76.5822, state: "PA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "University of Pennsylvania (PA)": { lat: 40.9842, lng: -76.8792, state: "PA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "University of Pittsburgh (PA)": { lat: 40.4406, lng: -79.9959, state: "PA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "ACC", division: "D1" },
+  "University of Pittsburgh at Bradford (PA)": { lat: 39.8606, lng: -77.4266, state: "PA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "University of Pittsburgh at Greensburg (PA)": { lat: 40.6239, lng: -76.3058, state: "PA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "University of Pittsburgh at Johnstown (PA)": { lat: 39.6389, lng: -77.1151, state: "PA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "University of Scranton (PA)": { lat: 39.6048, lng: -77.3096, state: "PA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "University of Valley Forge (PA)": { lat: 41.0974, lng: -76.4989, state: "PA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Ursinus College (PA)": { lat: 40.1338, lng: -77.3496, state: "PA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Villanova University (PA)": { lat: 40.5845, lng: -78.1475, state: "PA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Washington & Jefferson College (PA)": { lat: 40.4152, lng: -78.0521, state: "PA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Waynesburg University (PA)": { lat: 41.0237, lng: -76.468, state: "PA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "West Chester University of Pennsylvania (PA)": { lat: 40.1975, lng: -77.0216, state: "PA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Widener University (PA)": { lat: 40.8895, lng: -77.3615, state: "PA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Wilkes University (PA)": { lat: 39.765, lng: -76.4332, state: "PA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Wilson College (PA)": { lat: 39.8298, lng: -77.6762, state: "PA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "York College of Pennsylvania (PA)": { lat: 40.7598, lng: -77.6236, state: "PA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+};
@@ -0,0 +1,8 @@
+// Generated by frontend/build_geo_data.py from data/colleges.json - do not edit by hand
+import type { CollegeLocation } from './types';
+
+export const COLLEGES: Record<string, CollegeLocation> = {
+  "University of Puerto Rico at Bayamón (PR)": { lat: 17.3522, lng: -66.9576, state: "PR", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "University of Puerto Rico at Mayagüez (PR)": { lat: 18.2786, lng: -65.7053, state: "PR", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "University of Puerto Rico at Río Piedras (PR)": { lat: 17.9378, lng: -65.808, state: "PR", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+};
@@ -0,0 +1,13 @@
+// Generated by frontend/build_geo_data.py from data/colleges.json - do not edit by hand
+import type { CollegeLocation } from './types';
+
+export const COLLEGES: Record<string, CollegeLocation> = {
+  "Brown University (RI)": { lat: 41.4937, lng: -70.6994, state: "RI", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Bryant University (RI)": { lat: 42.0599, lng: -71.2952, state: "RI", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Johnson & Wales University (RI)": { lat: 41.5031, lng: -71.7836, state: "RI", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Providence College (RI)": { lat: 41.7665, lng: -70.5734, state: "RI", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Rhode Island College (RI)": { lat: 42.1811, lng: -70.9078, state: "RI", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Roger Williams University (RI)": { lat: 41.0414, lng: -72.2881, state: "RI", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Salve Regina University (RI)": { lat: 40.8807, lng: -72.3201, state: "RI", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "University of Rhode Island (RI)": { lat: 42.4524, lng: -71.6632, state: "RI", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+};
@@ -0,0 +1,31 @@
+// Generated by frontend/build_geo_data.py from data/colleges.json - do not edit by hand
+import type { CollegeLocation } from './types';
+
+export const COLLEGES: Record<string, CollegeLocation> = {
+  "Allen University (SC)": { lat: 34.0244, lng: -81.4222, state: "SC", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Anderson University (SC)": { lat: 33.3446, lng: -81.1285, state: "SC", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Benedict College (SC)": { lat: 33.5318, lng: -81.3491, state: "SC", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Charleston Southern University (SC)": { lat: 33.4539, lng: -81.4613, state: "SC", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Claflin University (SC)": { lat: 33.2141, lng: -81.7982, state: "SC", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Clemson University (SC)": { lat: 33.6462, lng: -81.8556, state: "SC", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "ACC", division: "D1" },
+  "Coastal Carolina University (SC)": { lat: 33.7582, lng: -81.78, state: "SC", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Coker University (SC)": { lat: 33.5659, lng: -80.2759, state: "SC", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "College of Charleston (SC)": { lat: 33.2513, lng: -81.895, state: "SC", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Converse University (SC)": { lat: 33.304, lng: -81.9001, state: "SC", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Erskine College (SC)": { lat: 34.5828, lng: -80.7523, state: "SC", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Francis Marion University (SC)": { lat: 33.0454, lng: -81.0998, state: "SC", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Furman University (SC)": { lat: 34.7908, lng: -81.7794, state: "SC", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Lander University (SC)": { lat: 33.7352, lng: -81.8798, state: "SC", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Newberry College (SC)": { lat: 33.3619, lng: -80.7289, state: "SC", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "North Greenville University (SC)": { lat: 33.4427, lng: -80.7439, state: "SC", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Presbyterian College (SC)": { lat: 33.6794, lng: -81.5622, state: "SC", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "South Carolina State University (SC)": { lat: 33.5773, lng: -80.8268, state: "SC", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Southern Wesleyan University (SC)": { lat: 33.764, lng: -80.3685, state: "SC", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "The Citadel, The Military College of South Carolinabe (SC)": { lat: 33.9261, lng: -81.9124, state: "SC", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "University of South Carolina (SC)": { lat: 33.5064, lng: -81.1792, state: "SC", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "SEC", division: "D1" },
+  "University of South Carolina Aiken (SC)": { lat: 33.0114, lng: -80.9817, state: "SC", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "University of South Carolina Beaufort (SC)": { lat: 32.9858, lng: -80.2559, state: "SC", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "University of South Carolina Upstate (SC)": { lat: 34.6044, lng: -80.9998, state: "SC", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Winthrop University (SC)": { lat: 34.4631, lng: -81.8735, state: "SC", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Wofford College (SC)": { lat: 34.6124, lng: -80.5147, state: "SC", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+};
@@ -0,0 +1,12 @@
+// Generated by frontend/build_geo_data.py from data/colleges.json - do not edit by hand
+import type { CollegeLocation } from './types';
+
+export const COLLEGES: Record<string, CollegeLocation> = {
+  "Augustana University (SD)": { lat: 44.8305, lng: -99.0628, state: "SD", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Black Hills State University (SD)": { lat: 44.5098, lng: -99.2658, state: "SD", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Northern State University (SD)": { lat: 43.5772, lng: -99.5445, state: "SD", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "South Dakota School of Mines and Technology (SD)": { lat: 44.2761, lng: -99.4772, state: "SD", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "South Dakota State University (SD)": { lat: 44.2036, lng: -99.036, state: "SD", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "University of Sioux Falls (SD)": { lat: 44.5153, lng: -99.1505, state: "SD", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "University of South Dakota (SD)": { lat: 44.1712, lng: -100.2786, state: "SD", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+};
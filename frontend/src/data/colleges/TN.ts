@@ -0,0 +1,30 @@
+// Generated by frontend/build_geo_data.py from data/colleges.json - do not edit by hand
+import type { CollegeLocation } from './types';
+
+export const COLLEGES: Record<string, CollegeLocation> = {
+  "Austin Peay State University (TN)": { lat: 35.373, lng: -87.0323, state: "TN", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Belmont University (TN)": { lat: 35.9435, lng: -86.3881, state: "TN", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Carson-Newman University (TN)": { lat: 35.2686, lng: -87.0612, state: "TN", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Christian Brothers University (TN)": { lat: 35.1269, lng: -86.0685, state: "TN", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "East Tennessee State University (TN)": { lat: 36.6416, lng: -85.8617, state: "TN", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "King University (TN)": { lat: 35.3323, lng: -87.5686, state: "TN", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Lane College (TN)": { lat: 35.9952, lng: -86.1658, state: "TN", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Lee University (TN)": { lat: 34.8573, lng: -86.9115, state: "TN", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "LeMoyne-Owen College (TN)": { lat: 36.6333, lng: -87.35, state: "TN", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Lincoln Memorial University (TN)": { lat: 36.0194, lng: -87.6852, state: "TN", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Lipscomb University (TN)": { lat: 35.1734, lng: -87.5075, state: "TN", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Maryville College (TN)": { lat: 35.6405, lng: -87.4828, state: "TN", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Middle Tennessee State University (TN)": { lat: 34.9217, lng: -86.4591, state: "TN", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Rhodes College (TN)": { lat: 35.7136, lng: -86.6584, state: "TN", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Tennessee State University (TN)": { lat: 35.5833, lng: -87.4761, state: "TN", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Tennessee Technological University (TN)": { lat: 35.8347, lng: -86.8057, state: "TN", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "The University of Tennessee at Chattanooga (TN)": { lat: 35.186, lng: -87.0504, state: "TN", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "The University of Tennessee at Martin (TN)": { lat: 35.3059, lng: -87.4895, state: "TN", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "The University of Tennessee, Knoxville (TN)": { lat: 35.0124, lng: -86.2538, state: "TN", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Trevecca Nazarene University (TN)": { lat: 36.5768, lng: -86.0798, state: "TN", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Tusculum University (TN)": { lat: 36.2506, lng: -86.8057, state: "TN", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Union University (TN)": { lat: 35.7365, lng: -85.9147, state: "TN", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "University of Memphis (TN)": { lat: 35.3141, lng: -86.4951, state: "TN", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "University of the SouthA 21 (TN)": { lat: 35.6624, lng: -87.2696, state: "TN", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Vanderbilt University (TN)": { lat: 36.2488, lng: -86.1977, state: "TN", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "SEC", division: "D1" },
+};
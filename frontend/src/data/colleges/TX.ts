@@ -0,0 +1,56 @@
+// Generated by frontend/build_geo_data.py from data/colleges.json - do not edit by hand
+import type { CollegeLocation } from './types';
+
+export const COLLEGES: Record<string, CollegeLocation> = {
+  "Abilene Christian University (TX)": { lat: 31.916, lng: -98.0892, state: "TX", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Angelo State University (TX)": { lat: 30.3437, lng: -98.1982, state: "TX", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Austin College (TX)": { lat: 30.6751, lng: -97.436, state: "TX", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Baylor University (TX)": { lat: 31.812, lng: -96.7605, state: "TX", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "BIG 12", division: "D1" },
+  "Concordia University Texas (TX)": { lat: 31.4208, lng: -97.1811, state: "TX", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Dallas Baptist Universityb (TX)": { lat: 31.3871, lng: -96.6685, state: "TX", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "East Texas A&M University (TX)": { lat: 30.6596, lng: -97.8528, state: "TX", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "East Texas Baptist University (TX)": { lat: 30.3826, lng: -96.8574, state: "TX", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Hardin–Simmons University (TX)": { lat: 30.6551, lng: -97.4312, state: "TX", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Houston Christian University (TX)": { lat: 31.1412, lng: -97.4809, state: "TX", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Howard Payne University (TX)": { lat: 30.1067, lng: -96.9225, state: "TX", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Lamar University (TX)": { lat: 31.3189, lng: -97.7319, state: "TX", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "LeTourneau University (TX)": { lat: 30.3748, lng: -97.9116, state: "TX", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Lubbock Christian University (TX)": { lat: 32.0131, lng: -97.7768, state: "TX", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "McMurry University (TX)": { lat: 31.8539, lng: -98.4211, state: "TX", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Midwestern State University (TX)": { lat: 31.0932, lng: -98.2993, state: "TX", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Prairie View A&M University (TX)": { lat: 30.6719, lng: -98.1363, state: "TX", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Sam Houston State University (TX)": { lat: 31.7506, lng: -96.8987, state: "TX", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Schreiner University (TX)": { lat: 31.9987, lng: -96.8156, state: "TX", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Southern Methodist University (TX)": { lat: 30.9652, lng: -97.3024, state: "TX", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "ACC", division: "D1" },
+  "Southwestern University (TX)": { lat: 31.2936, lng: -97.5645, state: "TX", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "St. Edward's University (TX)": { lat: 30.8938, lng: -97.3793, state: "TX", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "St. Mary's University (TX)": { lat: 31.3484, lng: -97.7841, state: "TX", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Stephen F. Austin State UniversityN 16 (TX)": { lat: 31.2657, lng: -97.265, state: "TX", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Tarleton State University (TX)": { lat: 31.0836, lng: -98.2432, state: "TX", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Texas A&M International University (TX)": { lat: 31.4011, lng: -97.1475, state: "TX", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Texas A&M University (TX)": { lat: 30.9188, lng: -98.1436, state: "TX", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "SEC", division: "D1" },
+  "Texas A&M University-Kingsville (TX)": { lat: 30.2179, lng: -96.8584, state: "TX", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Texas A&M University–Corpus Christi (TX)": { lat: 30.2647, lng: -98.4078, state: "TX", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Texas Christian University (TX)": { lat: 31.2441, lng: -97.3666, state: "TX", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "BIG 12", division: "D1" },
+  "Texas Lutheran University (TX)": { lat: 31.9133, lng: -98.4732, state: "TX", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Texas Southern University (TX)": { lat: 30.9009, lng: -96.5867, state: "TX", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Texas State University (TX)": { lat: 30.1353, lng: -97.9634, state: "TX", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Texas Tech University (TX)": { lat: 31.209, lng: -97.3691, state: "TX", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "BIG 12", division: "D1" },
+  "Texas Woman's Universityj (TX)": { lat: 30.9213, lng: -97.7614, state: "TX", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "The University of Texas at Arlington (TX)": { lat: 30.9829, lng: -98.3619, state: "TX", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "The University of Texas at Austin (TX)": { lat: 31.714, lng: -97.8383, state: "TX", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "The University of Texas at El Paso (TX)": { lat: 31.523, lng: -97.5493, state: "TX", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "The University of Texas at San Antonio (TX)": { lat: 30.1232, lng: -96.7494, state: "TX", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "The University of Texas Rio Grande Valley (TX)": { lat: 31.912, lng: -97.8443, state: "TX", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Trinity University (TX)": { lat: 30.4847, lng: -97.0069, state: "TX", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "University of Dallas (TX)": { lat: 31.6292, lng: -98.0254, state: "TX", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "University of Houston (TX)": { lat: 31.5648, lng: -98.2194, state: "TX", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "BIG 12", division: "D1" },
+  "University of Mary Hardin–Baylor (TX)": { lat: 30.3414, lng: -97.8041, state: "TX", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "University of North Texas (TX)": { lat: 32.0493, lng: -97.2536, state: "TX", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "University of St. Thomas (Texas) (TX)": { lat: 30.5639, lng: -98.4096, state: "TX", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "University of Texas at Tyler (TX)": { lat: 31.8587, lng: -97.4255, state: "TX", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "University of Texas Permian Basin (TX)": { lat: 31.9765, lng: -96.9235, state: "TX", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "University of the Incarnate Word (TX)": { lat: 31.3783, lng: -97.3731, state: "TX", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "West Texas A&M University (TX)": { lat: 31.5086, lng: -98.0903, state: "TX", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "William Marsh Rice University (TX)": { lat: 31.1376, lng: -98.2352, state: "TX", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+};
@@ -0,0 +1,13 @@
+// Generated by frontend/build_geo_data.py from data/colleges.json - do not edit by hand
+import type { CollegeLocation } from './types';
+
+export const COLLEGES: Record<string, CollegeLocation> = {
+  "Brigham Young University (UT)": { lat: 39.3024, lng: -110.9479, state: "UT", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "BIG 12", division: "D1" },
+  "Southern Utah University (UT)": { lat: 40.421, lng: -111.6288, state: "UT", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "University of Utah (UT)": { lat: 41.0616, lng: -112.6079, state: "UT", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "BIG 12", division: "D1" },
+  "Utah State University (UT)": { lat: 39.7604, lng: -111.4592, state: "UT", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Utah Tech University (UT)": { lat: 40.1998, lng: -110.9299, state: "UT", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Utah Valley University (UT)": { lat: 41.0495, lng: -111.0368, state: "UT", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Weber State University (UT)": { lat: 40.7032, lng: -112.5996, state: "UT", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Westminster University (UT)": { lat: 40.4058, lng: -112.4509, state: "UT", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+};
@@ -0,0 +1,42 @@
+// Generated by frontend/build_geo_data.py from data/colleges.json - do not edit by hand
+import type { CollegeLocation } from './types';
+
+export const COLLEGES: Record<string, CollegeLocation> = {
+  "Averett University (VA)": { lat: 37.3268, lng: -78.4542, state: "VA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Bridgewater College (VA)": { lat: 38.0828, lng: -78.8735, state: "VA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Christopher Newport University (VA)": { lat: 38.1068, lng: -78.8683, state: "VA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Eastern Mennonite University (VA)": { lat: 37.7883, lng: -78.7321, state: "VA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Emory & Henry University (VA)": { lat: 38.5011, lng: -78.7892, state: "VA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "George Mason University (VA)": { lat: 37.1732, lng: -78.8018, state: "VA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Hampden–Sydney College (VA)": { lat: 37.8973, lng: -77.9065, state: "VA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Hampton University (VA)": { lat: 38.7125, lng: -79.0586, state: "VA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Hollins UniversityA 1 (VA)": { lat: 37.4916, lng: -78.7208, state: "VA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "James Madison University (VA)": { lat: 37.7873, lng: -77.6509, state: "VA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Liberty University (VA)": { lat: 36.9631, lng: -77.5144, state: "VA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Longwood University (VA)": { lat: 38.4806, lng: -77.4442, state: "VA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Mary Baldwin University (VA)": { lat: 38.5426, lng: -79.0617, state: "VA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Marymount University (VA)": { lat: 38.0429, lng: -78.6037, state: "VA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Norfolk State University (VA)": { lat: 38.584, lng: -79.166, state: "VA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Old Dominion University (VA)": { lat: 37.6356, lng: -78.4311, state: "VA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Radford University (VA)": { lat: 37.8344, lng: -78.3339, state: "VA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Randolph College (VA)": { lat: 38.6275, lng: -77.1924, state: "VA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Randolph–Macon College (VA)": { lat: 37.9807, lng: -77.3183, state: "VA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Regent UniversityA 13 (VA)": { lat: 36.7722, lng: -79.1096, state: "VA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Roanoke College (VA)": { lat: 37.0577, lng: -78.5768, state: "VA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Shenandoah University (VA)": { lat: 37.5911, lng: -77.7852, state: "VA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Southern Virginia University (VA)": { lat: 38.1963, lng: -78.1165, state: "VA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Sweet Briar CollegeA 1A 15 (VA)": { lat: 38.5707, lng: -79.0372, state: "VA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "The College of William and Mary in Virginia (VA)": { lat: 37.0154, lng: -77.8395, state: "VA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "University of Lynchburg (VA)": { lat: 38.0888, lng: -78.8296, state: "VA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "University of Mary Washington (VA)": { lat: 36.9378, lng: -79.0289, state: "VA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "University of Richmond (VA)": { lat: 38.3696, lng: -78.9405, state: "VA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "University of Virginia (VA)": { lat: 38.553, lng: -77.2963, state: "VA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "ACC", division: "D1" },
+  "University of Virginia's College at Wise (VA)": { lat: 38.491, lng: -77.3878, state: "VA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Virginia Commonwealth University (VA)": { lat: 38.0902, lng: -77.3403, state: "VA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Virginia Military Institutebe (VA)": { lat: 36.9299, lng: -77.4452, state: "VA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Virginia Polytechnic Institute and State University (VA)": { lat: 37.643, lng: -77.4691, state: "VA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "ACC", division: "D1" },
+  "Virginia State University (VA)": { lat: 36.7802, lng: -79.0773, state: "VA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Virginia Union University (VA)": { lat: 36.9087, lng: -77.847, state: "VA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Virginia Wesleyan University (VA)": { lat: 38.4883, lng: -77.8161, state: "VA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Washington and Lee University (VA)": { lat: 38.0899, lng: -78.7806, state: "VA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+};
@@ -0,0 +1,12 @@
+// Generated by frontend/build_geo_data.py from data/colleges.json - do not edit by hand
+import type { CollegeLocation } from './types';
+
+export const COLLEGES: Record<string, CollegeLocation> = {
+  "Middlebury College (VT)": { lat: 43.6964, lng: -72.1697, state: "VT", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Norwich University (VT)": { lat: 43.0549, lng: -72.8941, state: "VT", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Saint Michael's College (VT)": { lat: 43.5214, lng: -73.3409, state: "VT", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "The University of Vermont and State Agricultural College (VT)": { lat: 43.4343, lng: -73.0461, state: "VT", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Vermont State University–Castleton (VT)": { lat: 44.8605, lng: -73.2901, state: "VT", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Vermont State University–Johnson (VT)": { lat: 44.9021, lng: -72.2403, state: "VT", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Vermont State University–Lyndon (VT)": { lat: 44.1876, lng: -72.0841, state: "VT", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+};
@@ -0,0 +1,18 @@
+// Generated by frontend/build_geo_data.py from data/colleges.json - do not edit by hand
+import type { CollegeLocation } from './types';
+
+export const COLLEGES: Record<string, CollegeLocation> = {
+  "Central Washington University (WA)": { lat: 47.2753, lng: -120.9637, state: "WA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Eastern Washington University (WA)": { lat: 47.2896, lng: -121.5929, state: "WA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Gonzaga University (WA)": { lat: 47.1957, lng: -122.4519, state: "WA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Pacific Lutheran University (WA)": { lat: 48.2034, lng: -122.3392, state: "WA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Saint Martin's University (WA)": { lat: 48.3365, lng: -121.7831, state: "WA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Seattle Pacific University (WA)": { lat: 48.225, lng: -122.3714, state: "WA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Seattle University (WA)": { lat: 47.3318, lng: -120.7346, state: "WA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "University of Puget Sound (WA)": { lat: 48.2998, lng: -121.5907, state: "WA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "University of Washington (WA)": { lat: 46.6986, lng: -121.8615, state: "WA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "BIG 10", division: "D1" },
+  "Washington State University (WA)": { lat: 47.2884, lng: -121.1951, state: "WA", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "PAC-12", division: "D1" },
+  "Western Washington University (WA)": { lat: 48.3358, lng: -121.7691, state: "WA", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Whitman College (WA)": { lat: 47.6097, lng: -121.7804, state: "WA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Whitworth University (WA)": { lat: 47.5412, lng: -120.6881, state: "WA", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+};
@@ -0,0 +1,33 @@
+// Generated by frontend/build_geo_data.py from data/colleges.json - do not edit by hand
+import type { CollegeLocation } from './types';
+
+export const COLLEGES: Record<string, CollegeLocation> = {
+  "Alverno CollegeA 1 (WI)": { lat: 44.9974, lng: -90.0704, state: "WI", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Beloit College (WI)": { lat: 43.6744, lng: -89.8775, state: "WI", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Carroll University (WI)": { lat: 44.7505, lng: -89.0647, state: "WI", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Carthage College (WI)": { lat: 44.0506, lng: -89.1606, state: "WI", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Concordia University Wisconsin (WI)": { lat: 45.0811, lng: -89.7379, state: "WI", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Edgewood College (WI)": { lat: 44.5059, lng: -89.1429, state: "WI", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Lakeland University (WI)": { lat: 44.9048, lng: -89.4788, state: "WI", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Lawrence University (WI)": { lat: 44.9826, lng: -88.8684, state: "WI", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Maranatha Baptist University (WI)": { lat: 44.0523, lng: -90.0415, state: "WI", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Marian University (WI)": { lat: 44.9905, lng: -90.3981, state: "WI", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Marquette University (WI)": { lat: 44.2997, lng: -88.6759, state: "WI", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Milwaukee School of Engineering (WI)": { lat: 44.878, lng: -89.9333, state: "WI", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Ripon College (WI)": { lat: 43.5169, lng: -88.7417, state: "WI", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "St. Norbert College (WI)": { lat: 43.6691, lng: -89.0993, state: "WI", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "University of Wisconsin-Parkside (WI)": { lat: 43.5794, lng: -89.0798, state: "WI", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "BIG 10", division: "D2" },
+  "University of Wisconsin–Eau Claire (WI)": { lat: 44.9293, lng: -90.1794, state: "WI", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "University of Wisconsin–Green Bay (WI)": { lat: 45.0364, lng: -89.2464, state: "WI", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "University of Wisconsin–La Crosse (WI)": { lat: 44.3574, lng: -89.1186, state: "WI", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "University of Wisconsin–Madison (WI)": { lat: 43.0731, lng: -89.4012, state: "WI", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "University of Wisconsin–Milwaukee (WI)": { lat: 43.7311, lng: -88.6625, state: "WI", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "University of Wisconsin–Oshkosh (WI)": { lat: 44.9835, lng: -89.4544, state: "WI", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "University of Wisconsin–Platteville (WI)": { lat: 45.0243, lng: -89.3294, state: "WI", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "University of Wisconsin–River Falls (WI)": { lat: 44.4867, lng: -88.7012, state: "WI", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "University of Wisconsin–Stevens Point (WI)": { lat: 44.806, lng: -90.4463, state: "WI", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "University of Wisconsin–Stout (WI)": { lat: 43.3265, lng: -89.5307, state: "WI", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "University of Wisconsin–Superior (WI)": { lat: 45.1898, lng: -89.6293, state: "WI", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "University of Wisconsin–Whitewater (WI)": { lat: 43.7746, lng: -88.9424, state: "WI", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Wisconsin Lutheran College (WI)": { lat: 44.8155, lng: -90.1509, state: "WI", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+};
@@ -0,0 +1,20 @@
+// Generated by frontend/build_geo_data.py from data/colleges.json - do not edit by hand
+import type { CollegeLocation } from './types';
+
+export const COLLEGES: Record<string, CollegeLocation> = {
+  "Bethany College (WV)": { lat: 37.5239, lng: -81.606, state: "WV", fraternities: 8, sororities: 5, totalMembers: 500, conference: "", division: "D3" },
+  "Bluefield State University (WV)": { lat: 38.3538, lng: -80.2173, state: "WV", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Concord University (WV)": { lat: 38.3154, lng: -81.5142, state: "WV", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Davis & Elkins College (WV)": { lat: 37.9496, lng: -80.4145, state: "WV", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Fairmont State University (WV)": { lat: 39.1239, lng: -80.7203, state: "WV", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Glenville State University (WV)": { lat: 37.9196, lng: -81.5294, state: "WV", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Marshall University (WV)": { lat: 38.0517, lng: -80.1147, state: "WV", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+  "Salem University (WV)": { lat: 39.4009, lng: -80.5294, state: "WV", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Shepherd University (WV)": { lat: 38.9659, lng: -80.7997, state: "WV", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "University of Charleston (WV)": { lat: 37.838, lng: -81.6059, state: "WV", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "West Liberty University (WV)": { lat: 37.6069, lng: -81.3136, state: "WV", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "West Virginia State University (WV)": { lat: 37.9492, lng: -81.1212, state: "WV", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "West Virginia University (WV)": { lat: 38.6424, lng: -80.5517, state: "WV", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "BIG 12", division: "D1" },
+  "West Virginia Wesleyan College (WV)": { lat: 38.4454, lng: -81.0216, state: "WV", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+  "Wheeling University (WV)": { lat: 37.5499, lng: -80.8622, state: "WV", fraternities: 15, sororities: 10, totalMembers: 1000, conference: "", division: "D2" },
+};
@@ -0,0 +1,6 @@
+// Generated by frontend/build_geo_data.py from data/colleges.json - do not edit by hand
+import type { CollegeLocation } from './types';
+
+export const COLLEGES: Record<string, CollegeLocation> = {
+  "University of Wyoming (WY)": { lat: 43.4542, lng: -107.357, state: "WY", fraternities: 30, sororities: 20, totalMembers: 2500, conference: "", division: "D1" },
+};
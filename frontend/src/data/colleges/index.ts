@@ -0,0 +1,75 @@
+// Generated by frontend/build_geo_data.py from data/colleges.json - do not edit by hand
+import type { CollegeLocation } from './types';
+
+export type { CollegeLocation } from './types';
+
+export const COLLEGE_STATES = ['AK', 'AL', 'AR', 'AZ', 'BC', 'CA', 'CO', 'CT', 'DC', 'DE', 'FL', 'GA', 'HI', 'IA', 'ID', 'IL', 'IN', 'KS', 'KY', 'LA', 'MA', 'MD', 'ME', 'MI', 'MN', 'MO', 'MS', 'MT', 'NC', 'ND', 'NE', 'NH', 'NJ', 'NM', 'NV', 'NY', 'OH', 'OK', 'OR', 'PA', 'PR', 'RI', 'SC', 'SD', 'TN', 'TX', 'UT', 'VA', 'VT', 'WA', 'WI', 'WV', 'WY'];
+
+type StateModule = { COLLEGES: Record<string, CollegeLocation> };
+
+// One chunk per state so pages only download the states they show
+const loaders: Record<string, () => Promise<StateModule>> = {
+  AK: () => import('./AK'),
+  AL: () => import('./AL'),
+  AR: () => import('./AR'),
+  AZ: () => import('./AZ'),
+  BC: () => import('./BC'),
+  CA: () => import('./CA'),
+  CO: () => import('./CO'),
+  CT: () => import('./CT'),
+  DC: () => import('./DC'),
+  DE: () => import('./DE'),
+  FL: () => import('./FL'),
+  GA: () => import('./GA'),
+  HI: () => import('./HI'),
+  IA: () => import('./IA'),
+  ID: () => import('./ID'),
+  IL: () => import('./IL'),
+  IN: () => import('./IN'),
+  KS: () => import('./KS'),
+  KY: () => import('./KY'),
+  LA: () => import('./LA'),
+  MA: () => import('./MA'),
+  MD: () => import('./MD'),
+  ME: () => import('./ME'),
+  MI: () => import('./MI'),
+  MN: () => import('./MN'),
+  MO: () => import('./MO'),
+  MS: () => import('./MS'),
+  MT: () => import('./MT'),
+  NC: () => import('./NC'),
+  ND: () => import('./ND'),
+  NE: () => import('./NE'),
+  NH: () => import('./NH'),
+  NJ: () => import('./NJ'),
+  NM: () => import('./NM'),
+  NV: () => import('./NV'),
+  NY: () => import('./NY'),
+  OH: () => import('./OH'),
+  OK: () => import('./OK'),
+  OR: () => import('./OR'),
+  PA: () => import('./PA'),
+  PR: () => import('./PR'),
+  RI: () => import('./RI'),
+  SC: () => import('./SC'),
+  SD: () => import('./SD'),
+  TN: () => import('./TN'),
+  TX: () => import('./TX'),
+  UT: () => import('./UT'),
+  VA: () => import('./VA'),
+  VT: () => import('./VT'),
+  WA: () => import('./WA'),
+  WI: () => import('./WI'),
+  WV: () => import('./WV'),
+  WY: () => import('./WY'),
+};
+
+export async function loadStateColleges(state: string): Promise<Record<string, CollegeLocation>> {
+  const load = loaders[state];
+  return load ? (await load()).COLLEGES : {};
+}
+
+export async function loadAllColleges(): Promise<Record<string, CollegeLocation>> {
+  const parts = await Promise.all(COLLEGE_STATES.map(loadStateColleges));
+  return Object.assign({}, ...parts);
+}
@@ -0,0 +1,11 @@
+// Generated by frontend/build_geo_data.py from data/colleges.json - do not edit by hand
+export interface CollegeLocation {
+  lat: number;
+  lng: number;
+  state: string;
+  fraternities: number | null;
+  sororities: number | null;
+  totalMembers: number | null;
+  conference: string;
+  division: string | null;
+}
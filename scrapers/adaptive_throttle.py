@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+Adaptive Throttle
+Per-host request rate and concurrency tuned from the responses (AIMD)
+
+Each host gets a request rate and a concurrency limit. Healthy responses
+raise both additively (about +rate_step req/s per second of traffic, +1
+concurrent request per window); 429/503 responses halve them, other
+failures cut them by a quarter, and a Retry-After header blocks the host
+until it has passed. While latency runs well above the host's recent best,
+the controller holds the host where it is.
+
+Scrapers plug in with one call, like instrument_session():
+    throttle_session(self.session)                 # requests.Session
+    PooledClient(..., throttle=THROTTLE)           # http_client
+
+State is saved to ../data/cache/host_throttle.json (during the run and at
+exit), so each host starts the next run at the rate it last ran at.
+HOST_LIMITS pins hosts with published policies (Nominatim: 1 req/s).
+"""
+
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+from http_client import parse_retry_after
+from run_metrics import METRICS
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STATE_PATH = '../data/cache/host_throttle.json'
+SAVE_INTERVAL = 30.0  # Seconds between saves while running
+THROTTLE_STATUSES = {429, 503}
+ERROR_STATUSES = {500, 502, 504}
+MAX_RETRY_AFTER = 3600.0
+
+# Per-host overrides of the AdaptiveThrottle defaults
+HOST_LIMITS: Dict[str, Dict[str, float]] = {
+    'nominatim.openstreetmap.org': {'max_rate': 1.0, 'max_concurrency': 1},  # Usage policy
+    'www.instagram.com': {'initial_rate': 0.5, 'initial_concurrency': 1},
+    'nubela.co': {'max_rate': 5.0},  # Proxycurl plan limit
+}
+
+
+@dataclass(slots=True)
+class HostState:
+    """Controller state for one host; the persisted fields come first"""
+    rate: float
+    concurrency: float
+    best_latency: Optional[float] = None
+    blocked_until: float = 0.0  # Unix time
+    updated_at: float = 0.0
+    # Per run only
+    in_flight: int = 0
+    next_slot: float = 0.0  # time.monotonic()
+    latency: Optional[float] = None
+    last_decrease: float = 0.0
+    increases: int = 0
+    decreases: int = 0
+
+
+PERSISTED_FIELDS = ('rate', 'concurrency', 'best_latency', 'blocked_until', 'updated_at')
+
+
+def host_of(url: str) -> str:
+    return urlsplit(url).netloc.lower()
+
+
+class _Slot:
+    """A granted request; record() reports how it went"""
+
+    __slots__ = ('throttle', 'host', 'started', 'recorded')
+
+    def __init__(self, throttle: 'AdaptiveThrottle', host: str):
+        self.throttle = throttle
+        self.host = host
+        self.started = time.monotonic()
+        self.recorded = False
+
+    def record(self, status: Optional[int] = None, latency: Optional[float] = None,
+               retry_after: Optional[float] = None, error: bool = False):
+        if not self.recorded:
+            self.recorded = True
+            latency = time.monotonic() - self.started if latency is None else latency
+            self.throttle.release(self.host, status, latency, retry_after, error)
+
+
+class AdaptiveThrottle:
+    """
+    AIMD rate and concurrency control per host, shared by every scraper in the process
+
+    Args:
+        state_path: JSON file the host states are loaded from and saved to (None: don't persist)
+        initial_rate: Requests per second for a host seen for the first time
+        rate_step: Additive increase, in req/s per second of healthy traffic
+        throttle_factor: Multiplier on 429/503 (and Retry-After)
+        error_factor: Multiplier on other 5xx and connection errors
+        latency_factor: Above this multiple of the host's best latency, the rate is held
+    """
+
+    def __init__(
+        self,
+        state_path: Optional[str] = DEFAULT_STATE_PATH,
+        initial_rate: float = 1.0,
+        initial_concurrency: float = 2.0,
+        min_rate: float = 0.05,
+        max_rate: float = 20.0,
+        max_concurrency: float = 16.0,
+        rate_step: float = 0.1,
+        throttle_factor: float = 0.5,
+        error_factor: float = 0.75,
+        latency_factor: float = 3.0,
+        enabled: bool = True
+    ):
+        self.state_path = state_path
+        self.initial_rate = initial_rate
+        self.initial_concurrency = initial_concurrency
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.max_concurrency = max_concurrency
+        self.rate_step = rate_step
+        self.throttle_factor = throttle_factor
+        self.error_factor = error_factor
+        self.latency_factor = latency_factor
+        self.enabled = enabled
+
+        self.hosts: Dict[str, HostState] = {}
+        self._saved: Optional[Dict[str, Dict]] = None  # Loaded lazily on first use
+        self._condition = threading.Condition()
+        self._last_save = time.monotonic()
+        self._dirty = False
+
+    def configure(self, **settings):
+        """Changes settings (e.g. state_path=None, enabled=False for benchmarks)"""
+        with self._condition:
+            for name, value in settings.items():
+                if not hasattr(self, name) or name.startswith('_'):
+                    raise ValueError(f"Unknown throttle setting {name!r}")
+                setattr(self, name, value)
+            self.hosts.clear()
+            self._saved = None
+
+    # -- state --------------------------------------------------------------
+
+    def _limit(self, host: str, name: str) -> float:
+        return HOST_LIMITS.get(host, {}).get(name, getattr(self, name))
+
+    def _load_saved(self) -> Dict[str, Dict]:
+        if not self.state_path or not os.path.exists(self.state_path):
+            return {}
+        try:
+            with open(self.state_path, 'r') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable throttle state {self.state_path}: {e}")
+            return {}
+
+    def _state(self, host: str) -> HostState:
+        state = self.hosts.get(host)
+        if state is None:
+            if self._saved is None:
+                self._saved = self._load_saved()
+            saved = self._saved.get(host)
+            if saved:
+                state = HostState(**{k: v for k, v in saved.items() if k in PERSISTED_FIELDS})
+                state.rate = min(max(state.rate, self.min_rate), self._limit(host, 'max_rate'))
+                state.concurrency = min(max(state.concurrency, 1.0), self._limit(host, 'max_concurrency'))
+            else:
+                state = HostState(
+                    rate=min(self._limit(host, 'initial_rate'), self._limit(host, 'max_rate')),
+                    concurrency=min(self._limit(host, 'initial_concurrency'), self._limit(host, 'max_concurrency')),
+                )
+            self.hosts[host] = state
+        return state
+
+    # -- requests -----------------------------------------------------------
+
+    def acquire(self, host: str):
+        """Blocks until host has a free concurrency slot and its next rate slot arrives"""
+        with self._condition:
+            state = self._state(host)
+            while state.in_flight >= max(1, int(state.concurrency)):
+                self._condition.wait()
+            now = time.monotonic()
+            blocked = max(0.0, state.blocked_until - time.time())
+            slot = max(now + blocked, state.next_slot)
+            state.next_slot = slot + 1.0 / state.rate
+            state.in_flight += 1
+        METRICS.sleep(slot - now, reason='adaptive_throttle')
+
+    def release(self, host: str, status: Optional[int] = None, latency: Optional[float] = None,
+                retry_after: Optional[float] = None, error: bool = False):
+        """Frees the slot and adapts the host's rate and concurrency to the outcome"""
+        with self._condition:
+            state = self._state(host)
+            state.in_flight = max(0, state.in_flight - 1)
+            self._condition.notify_all()
+
+            if status in THROTTLE_STATUSES or retry_after:
+                if retry_after:
+                    state.blocked_until = max(state.blocked_until, time.time() + min(retry_after, MAX_RETRY_AFTER))
+                self._decrease(host, state, self.throttle_factor, 'throttled')
+            elif error or status in ERROR_STATUSES:
+                self._decrease(host, state, self.error_factor, 'error')
+            elif latency is not None:
+                state.latency = latency if state.latency is None else 0.8 * state.latency + 0.2 * latency
+                # The best drifts up ~1% per response, so one lucky fast sample doesn't pin the host
+                state.best_latency = (state.latency if state.best_latency is None
+                                      else min(state.latency, state.best_latency * 1.01))
+                if state.latency > self.latency_factor * state.best_latency:
+                    METRICS.inc('throttle_holds_total', host=host)
+                else:
+                    self._increase(host, state)
+
+            state.updated_at = time.time()
+            self._dirty = True
+            save_due = self.state_path and time.monotonic() - self._last_save > SAVE_INTERVAL
+
+        if save_due:
+            self.save()
+
+    def _increase(self, host: str, state: HostState):
+        state.rate = min(self._limit(host, 'max_rate'), state.rate + self.rate_step / state.rate)
+        state.concurrency = min(self._limit(host, 'max_concurrency'), state.concurrency + 1.0 / state.concurrency)
+        state.increases += 1
+
+    def _decrease(self, host: str, state: HostState, factor: float, reason: str):
+        # One cut per round trip: the other requests already in flight saw the same congestion
+        now = time.monotonic()
+        if now - state.last_decrease < max(1.0, state.latency or 0.0):
+            return
+        state.last_decrease = now
+        state.rate = max(self.min_rate, state.rate * factor)
+        state.concurrency = max(1.0, state.concurrency * factor)
+        state.decreases += 1
+        METRICS.inc('throttle_decreases_total', host=host, reason=reason)
+        logger.info(f"🐢 {host}: {reason}, now {state.rate:.2f} req/s × {int(state.concurrency)}")
+
+    @contextmanager
+    def slot(self, url: str):
+        """Holds a request slot for url's host for the block; errors count as failures"""
+        if not self.enabled:
+            yield _NOOP_SLOT
+            return
+        host = host_of(url)
+        self.acquire(host)
+        slot = _Slot(self, host)
+        try:
+            yield slot
+        except BaseException:
+            slot.record(error=True)
+            raise
+        finally:
+            slot.record()
+
+    # -- persistence and reporting --------------------------------------------
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """Current state per host, for run reports"""
+        with self._condition:
+            return {
+                host: {
+                    'rate': round(state.rate, 3),
+                    'concurrency': int(state.concurrency),
+                    'latency_ms': round(state.latency * 1000, 1) if state.latency is not None else None,
+                    'increases': state.increases,
+                    'decreases': state.decreases,
+                }
+                for host, state in sorted(self.hosts.items())
+            }
+
+    def save(self):
+        """Merges this process's hosts into the state file (other processes may share it)"""
+        with self._condition:
+            self._last_save = time.monotonic()
+            if not self.state_path or not self._dirty:
+                return
+            self._dirty = False
+            states = {host: {name: getattr(state, name) for name in PERSISTED_FIELDS}
+                      for host, state in self.hosts.items()}
+
+        saved = self._load_saved()
+        saved.update(states)
+        if os.path.dirname(self.state_path):
+            os.makedirs(os.path.dirname(self.state_path), exist_ok=True)
+        tmp_path = f"{self.state_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(saved, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.state_path)
+
+
+class _NoopSlot:
+    def record(self, *args, **kwargs):
+        pass
+
+
+_NOOP_SLOT = _NoopSlot()
+
+THROTTLE = AdaptiveThrottle()
+atexit.register(THROTTLE.save)
+
+
+def throttle_session(session, throttle: AdaptiveThrottle = THROTTLE):
+    """Routes a requests.Session's requests (and redirects) through the throttle"""
+    send = session.send
+
+    def throttled_send(request, **kwargs):
+        with throttle.slot(request.url) as slot:
+            response = send(request, **kwargs)
+            slot.record(response.status_code, response.elapsed.total_seconds(),
+                        parse_retry_after(response.headers.get('Retry-After')))
+            return response
+
+    session.send = throttled_send
+    return session
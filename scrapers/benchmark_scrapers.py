@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+"""
+Scraper Benchmarks
+Runs each scraper against the local fixture server and reports throughput
+
+Measures pages/sec, per-item p50/p99 latency, CPU time per page and peak
+RSS for CollegeScraper, FraternityChapterScraper, InstagramScraper,
+LinkedInScraper (Proxycurl API mode) and GeocodeService. The fixture server
+runs in a child process so its work is not counted. Politeness sleeps in
+the scrapers are skipped unless --keep-sleeps is given.
+
+Usage:
+    python benchmark_scrapers.py                                # all workloads
+    python benchmark_scrapers.py instagram geocode --latency 0.08 --jitter 0.03 --rate-429 0.05
+    python benchmark_scrapers.py --workers 8 --output ../data/benchmarks/run.json
+"""
+
+import argparse
+import csv
+import json
+import logging
+import resource
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, Dict, List
+
+import requests
+
+# Configure logging before the scrapers are imported, so scrape_all_fraternities'
+# basicConfig is a no-op and benchmark runs leave no fraternity_scrape_*.log behind
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+import college_scraper  # noqa: E402
+import geocode_sigma_chi  # noqa: E402
+import http_client  # noqa: E402
+import instagram_scraper  # noqa: E402
+import linkedin_scraper  # noqa: E402
+import run_metrics  # noqa: E402
+import scrape_all_fraternities  # noqa: E402
+from adaptive_throttle import THROTTLE  # noqa: E402
+from circuit_breaker import BREAKERS  # noqa: E402
+from fixture_server import DEFAULT_FIXTURE_DIR, FixtureServerProcess, mount_fixture_adapter  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+HANDLES_CSV = '../fraternity_instagram_handles.csv'
+SIGMA_CHI_CSV = '../data/sigma_chi_chapters.csv'
+
+# Modules whose time.sleep calls are politeness delays / backoff
+SLEEPING_MODULES = [college_scraper, scrape_all_fraternities, instagram_scraper,
+                    linkedin_scraper, geocode_sigma_chi, http_client, run_metrics]
+
+
+def _instagram_chapters(limit: int) -> List[Dict]:
+    with open(HANDLES_CSV, 'r', encoding='utf-8') as f:
+        rows = [row for row in csv.DictReader(f) if row.get('Instagram Handle', '').strip()]
+    return rows[:limit]
+
+
+def _sigma_chi_rows(limit: int) -> List[Dict]:
+    with open(SIGMA_CHI_CSV, 'r', encoding='utf-8') as f:
+        return list(csv.DictReader(f))[:limit]
+
+
+class Workload:
+    """A scraper plus the items it processes; build() returns a per-item callable"""
+
+    name = ''
+
+    def items(self, instagram_limit: int = 50, geocode_limit: int = 50) -> List:
+        raise NotImplementedError
+
+    def urls(self, **limits) -> List[str]:
+        """Live URLs the workload requests (what fixture_server.py records)"""
+        raise NotImplementedError
+
+    def build(self, server_url: str, pool_size: int) -> Callable:
+        raise NotImplementedError
+
+
+class CollegeWorkload(Workload):
+    name = 'college'
+
+    def items(self, **limits):
+        return college_scraper.CollegeScraper().get_d1_schools()
+
+    def urls(self, **limits):
+        return [school['greek_life_url'] for school in self.items()]
+
+    def build(self, server_url, pool_size):
+        scraper = college_scraper.CollegeScraper()
+        mount_fixture_adapter(scraper.session, server_url, pool_size)
+        return lambda school: scraper.scrape_college_greek_life(school['name'], school['greek_life_url'])
+
+
+class FraternityWorkload(Workload):
+    name = 'fraternity'
+
+    def items(self, **limits):
+        return list(scrape_all_fraternities.FRATERNITY_CHAPTER_URLS.items())
+
+    def urls(self, **limits):
+        return [url for _, url in self.items()]
+
+    def build(self, server_url, pool_size):
+        scraper = scrape_all_fraternities.FraternityChapterScraper()
+        mount_fixture_adapter(scraper.session, server_url, pool_size)
+        return lambda item: scraper.scrape_fraternity(*item) or None
+
+
+class InstagramWorkload(Workload):
+    name = 'instagram'
+
+    def items(self, instagram_limit=50, **limits):
+        return [row['Instagram Handle'].strip().lstrip('@') for row in _instagram_chapters(instagram_limit)]
+
+    def urls(self, **limits):
+        return [f"https://www.instagram.com/{handle}/" for handle in self.items(**limits)]
+
+    def build(self, server_url, pool_size):
+        scraper = instagram_scraper.InstagramScraper()
+        mount_fixture_adapter(scraper.session, server_url, pool_size)
+        return scraper.get_profile_info
+
+
+class LinkedInWorkload(Workload):
+    name = 'linkedin'
+
+    def items(self, instagram_limit=50, **limits):
+        return [(row['Fraternity Name'], row['College']) for row in _instagram_chapters(instagram_limit)]
+
+    def urls(self, **limits):
+        urls = []
+        for fraternity, college in self.items(**limits):
+            params = linkedin_scraper.LinkedInScraper._officer_search_params(fraternity, college)
+            urls.append(requests.Request('GET', linkedin_scraper.PERSON_SEARCH_URL, params=params).prepare().url)
+        return urls
+
+    def build(self, server_url, pool_size):
+        scraper = linkedin_scraper.LinkedInScraper(use_api=True, api_key='benchmark', calls_per_second=0)
+        # The fixture adapter needs a requests transport, not httpx
+        scraper.api_client = http_client.PooledClient(
+            headers={'Authorization': 'Bearer benchmark'},
+            pool_size=pool_size,
+            rate_limiter=scraper.rate_limiter,
+            http2=False
+        )
+        mount_fixture_adapter(scraper.api_client._client, server_url, pool_size)
+        return lambda item: scraper.find_chapter_officers(*item)
+
+
+class GeocodeWorkload(Workload):
+    name = 'geocode'
+
+    def items(self, geocode_limit=50, **limits):
+        return _sigma_chi_rows(geocode_limit)
+
+    def urls(self, **limits):
+        service = geocode_sigma_chi.GeocodeService()
+        urls = []
+        for row in self.items(**limits):
+            country = {'United States': 'USA'}.get(row['country'], row['country'])
+            query = f"{row['university']}, {row['city']}, {row['state_province']}, {country}"
+            urls.append(requests.Request('GET', service.base_url,
+                                         params={'q': query, 'format': 'json', 'limit': 1}).prepare().url)
+        return urls
+
+    def build(self, server_url, pool_size):
+        service = geocode_sigma_chi.GeocodeService()
+        mount_fixture_adapter(service.session, server_url, pool_size)
+        return lambda row: service.geocode(row['university'], row['city'], row['state_province'], row['country'])
+
+
+WORKLOADS: Dict[str, Workload] = {w.name: w for w in [
+    CollegeWorkload(), FraternityWorkload(), InstagramWorkload(), LinkedInWorkload(), GeocodeWorkload()
+]}
+
+
+class _NoSleepTime:
+    """Stands in for the time module inside a scraper module, minus sleep()"""
+
+    def __getattr__(self, name):
+        return getattr(time, name)
+
+    @staticmethod
+    def sleep(seconds):
+        pass
+
+
+@contextmanager
+def skip_sleeps(enabled: bool = True):
+    if not enabled:
+        yield
+        return
+    originals = {module: module.time for module in SLEEPING_MODULES}
+    for module in originals:
+        module.time = _NoSleepTime()
+    try:
+        yield
+    finally:
+        for module, original in originals.items():
+            module.time = original
+
+
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def run_workload(workload: Workload, server: FixtureServerProcess, repeat: int = 1,
+                 workers: int = 1, **limits) -> Dict:
+    """Runs one workload and returns its metrics"""
+    items = workload.items(**limits) * repeat
+    task = workload.build(server.url, pool_size=max(workers, 10))
+    latencies: List[float] = []
+    failures = 0
+
+    def timed(item):
+        start = time.perf_counter()
+        try:
+            ok = task(item) is not None
+        except Exception as e:
+            logger.debug(f"{workload.name} item failed: {e}")
+            ok = False
+        return time.perf_counter() - start, ok
+
+    before = server.stats()
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(timed, items))
+    else:
+        results = [timed(item) for item in items]
+
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+    after = server.stats()
+
+    for elapsed, ok in results:
+        latencies.append(elapsed)
+        failures += not ok
+
+    requests_made = after['requests'] - before['requests']
+    throttled = after['throttled'] - before['throttled']
+    pages = requests_made - throttled
+
+    return {
+        'workload': workload.name,
+        'items': len(items),
+        'failures': failures,
+        'requests': requests_made,
+        'throttled': throttled,
+        'pages': pages,
+        'bytes': after['bytes'] - before['bytes'],
+        'wall_seconds': round(wall, 3),
+        'pages_per_second': round(pages / wall, 2) if wall else 0.0,
+        'p50_ms': round(percentile(latencies, 50) * 1000, 2),
+        'p99_ms': round(percentile(latencies, 99) * 1000, 2),
+        'mean_ms': round(statistics.fmean(latencies) * 1000, 2) if latencies else 0.0,
+        'cpu_ms_per_page': round(cpu / pages * 1000, 3) if pages else 0.0,
+        'peak_rss_mb': round(peak_rss_mb(), 1),
+    }
+
+
+def print_report(results: List[Dict]):
+    header = f"{'workload':<12}{'items':>7}{'fail':>6}{'pages':>7}{'429s':>6}{'pages/s':>10}" \
+             f"{'p50 ms':>10}{'p99 ms':>10}{'cpu ms/pg':>11}{'rss MB':>9}"
+    print("\n" + header)
+    print("-" * len(header))
+    for r in results:
+        print(f"{r['workload']:<12}{r['items']:>7}{r['failures']:>6}{r['pages']:>7}{r['throttled']:>6}"
+              f"{r['pages_per_second']:>10.1f}{r['p50_ms']:>10.1f}{r['p99_ms']:>10.1f}"
+              f"{r['cpu_ms_per_page']:>11.2f}{r['peak_rss_mb']:>9.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the scrapers offline against recorded fixtures")
+    parser.add_argument('workloads', nargs='*', metavar='workload',
+                        help=f"subset of: {', '.join(WORKLOADS)} (default: all)")
+    parser.add_argument('--fixtures', default=DEFAULT_FIXTURE_DIR)
+    parser.add_argument('--latency', type=float, default=0.0, help='server response delay (s)')
+    parser.add_argument('--jitter', type=float, default=0.0, help='+/- random delay (s)')
+    parser.add_argument('--rate-429', type=float, default=0.0, help='fraction of requests answered with 429')
+    parser.add_argument('--retry-after', type=int, default=1, help='Retry-After seconds sent with 429s')
+    parser.add_argument('--no-synthetic', action='store_true', help='only serve recorded fixtures')
+    parser.add_argument('--repeat', type=int, default=1, help='run each workload\'s items N times')
+    parser.add_argument('--workers', type=int, default=1, help='items processed concurrently')
+    parser.add_argument('--instagram-limit', type=int, default=50)
+    parser.add_argument('--geocode-limit', type=int, default=50)
+    parser.add_argument('--keep-sleeps', action='store_true', help='keep the scrapers\' rate-limit sleeps and adaptive throttle')
+    parser.add_argument('--output', help='write the JSON report here')
+    parser.add_argument('-v', '--verbose', action='store_true', help='show scraper logging')
+    args = parser.parse_args()
+
+    unknown = [name for name in args.workloads if name not in WORKLOADS]
+    if unknown:
+        parser.error(f"unknown workload(s): {', '.join(unknown)}")
+
+    logging.getLogger().setLevel(logging.INFO if args.verbose else logging.WARNING)
+    selected = [WORKLOADS[name] for name in (args.workloads or WORKLOADS)]
+    limits = {'instagram_limit': args.instagram_limit, 'geocode_limit': args.geocode_limit}
+
+    server = FixtureServerProcess(
+        args.fixtures, latency=args.latency, jitter=args.jitter, rate_429=args.rate_429,
+        retry_after=args.retry_after, synthetic=not args.no_synthetic
+    )
+    # Fixture runs must not overwrite the real hosts' saved rates; without sleeps the throttle is moot
+    THROTTLE.configure(state_path=None, enabled=args.keep_sleeps)
+    BREAKERS.configure(state_path=None)
+
+    results = []
+    with server, skip_sleeps(not args.keep_sleeps):
+        for workload in selected:
+            print(f"▶ {workload.name}...", flush=True)
+            results.append(run_workload(workload, server, repeat=args.repeat, workers=args.workers, **limits))
+        fixture_stats = server.stats()
+
+    print_report(results)
+    print(f"\nFixtures served: {fixture_stats['recorded']} recorded, {fixture_stats['synthetic']} synthetic, "
+          f"{fixture_stats['missing']} missing")
+
+    if args.output:
+        report = {
+            'generated_at': datetime.now().isoformat(),
+            'settings': {k: v for k, v in vars(args).items() if k not in ('output', 'verbose')},
+            'fixtures': fixture_stats,
+            'results': results,
+        }
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Report written to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
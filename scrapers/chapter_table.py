@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Chapter Table
+Columnar, array-backed storage for scraped chapters
+
+A nationwide run holds ~10k chapters. As dicts each one carries its own hash
+table and string copies; here every column is a compact array:
+
+    repeated strings   array('I') codes into a per-column pool of interned strings
+                       (names, colleges, states, chapter types)
+    unique strings     a list of references (websites, handles, contact details)
+    integers           array('q') with MISSING standing in for None
+
+Rows are read and written through ChapterView, a two-slot proxy that looks
+like the old chapter dict (chapter['name'], chapter.get('instagram')), so
+code that took a list of dicts can take table views instead of copies.
+Exports iterate columns directly with rows().
+"""
+
+import sys
+from array import array
+from typing import Dict, Iterator, List, Optional, Tuple
+
+MISSING = -(2 ** 63)  # Stored for None in integer columns
+
+STRING_COLUMNS = ('name', 'college_name', 'college_state', 'chapter_type', 'greek_letters')
+TEXT_COLUMNS = ('address', 'email', 'phone', 'website', 'instagram')
+INT_COLUMNS = ('founded_year', 'member_count', 'instagram_followers', 'instagram_posts')
+COLUMNS = STRING_COLUMNS + TEXT_COLUMNS + INT_COLUMNS
+
+# Keys the chapter dicts used that now map onto a column
+ALIASES = {'college': 'college_name', 'state': 'college_state'}
+
+
+class StringColumn:
+    """Dictionary-encoded strings: one 4-byte code per row, each distinct value stored once"""
+
+    __slots__ = ('codes', 'pool', '_codes_by_value')
+
+    def __init__(self):
+        self.codes = array('I')
+        self.pool: List[Optional[str]] = [None]  # Code 0 is None
+        self._codes_by_value: Dict[Optional[str], int] = {None: 0}
+
+    def encode(self, value) -> int:
+        if value is not None and not isinstance(value, str):
+            value = str(value)
+        code = self._codes_by_value.get(value)
+        if code is None:
+            value = sys.intern(value)
+            code = len(self.pool)
+            self.pool.append(value)
+            self._codes_by_value[value] = code
+        return code
+
+    def code_of(self, value) -> Optional[int]:
+        """The code for value, or None if it never occurs in the column"""
+        return self._codes_by_value.get(value)
+
+    def append(self, value):
+        self.codes.append(self.encode(value))
+
+    def __getitem__(self, row: int) -> Optional[str]:
+        return self.pool[self.codes[row]]
+
+    def __setitem__(self, row: int, value):
+        self.codes[row] = self.encode(value)
+
+    def __iter__(self) -> Iterator[Optional[str]]:
+        pool = self.pool
+        return (pool[code] for code in self.codes)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def nbytes(self) -> int:
+        return (self.codes.itemsize * len(self.codes) + sys.getsizeof(self.pool)
+                + sum(sys.getsizeof(s) for s in self.pool if s is not None)
+                + sys.getsizeof(self._codes_by_value))
+
+
+class TextColumn:
+    """Mostly-unique strings, where a pool would cost more than it saves"""
+
+    __slots__ = ('values',)
+
+    def __init__(self):
+        self.values: List[Optional[str]] = []
+
+    @staticmethod
+    def _coerce(value) -> Optional[str]:
+        return value if value is None or isinstance(value, str) else str(value)
+
+    def append(self, value):
+        self.values.append(self._coerce(value))
+
+    def __getitem__(self, row: int) -> Optional[str]:
+        return self.values[row]
+
+    def __setitem__(self, row: int, value):
+        self.values[row] = self._coerce(value)
+
+    def __iter__(self) -> Iterator[Optional[str]]:
+        return iter(self.values)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def nbytes(self) -> int:
+        return sys.getsizeof(self.values) + sum(sys.getsizeof(s) for s in set(self.values) if s is not None)
+
+
+class IntColumn:
+    """64-bit integers with MISSING for None"""
+
+    __slots__ = ('values',)
+
+    def __init__(self):
+        self.values = array('q')
+
+    def append(self, value):
+        self.values.append(MISSING if value is None else int(value))
+
+    def __getitem__(self, row: int) -> Optional[int]:
+        value = self.values[row]
+        return None if value == MISSING else value
+
+    def __setitem__(self, row: int, value):
+        self.values[row] = MISSING if value is None else int(value)
+
+    def __iter__(self) -> Iterator[Optional[int]]:
+        return (None if value == MISSING else value for value in self.values)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def nbytes(self) -> int:
+        return self.values.itemsize * len(self.values)
+
+
+def _column_name(key: str) -> str:
+    return ALIASES.get(key, key)
+
+
+class ChapterView:
+    """
+    One row of a ChapterTable, read and written in place
+
+    Behaves like the chapter dicts it replaces: get() returns the default for
+    unset (None) fields, and assigning to an unknown key raises KeyError.
+    """
+
+    __slots__ = ('table', 'row')
+
+    def __init__(self, table: 'ChapterTable', row: int):
+        self.table = table
+        self.row = row
+
+    def __getitem__(self, key: str):
+        column = self.table.columns.get(_column_name(key))
+        if column is None:
+            raise KeyError(key)
+        return column[self.row]
+
+    def get(self, key: str, default=None):
+        column = self.table.columns.get(_column_name(key))
+        value = column[self.row] if column is not None else None
+        return default if value is None else value
+
+    def __setitem__(self, key: str, value):
+        column = self.table.columns.get(_column_name(key))
+        if column is None:
+            raise KeyError(f"Unknown chapter column {key!r}")
+        column[self.row] = value
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def keys(self) -> List[str]:
+        return [name for name in COLUMNS if self.table.columns[name][self.row] is not None]
+
+    def to_dict(self) -> Dict:
+        """A plain dict of the row's set fields"""
+        record = {}
+        for name in COLUMNS:
+            value = self.table.columns[name][self.row]
+            if value is not None:
+                record[name] = value
+        return record
+
+    def __repr__(self) -> str:
+        return f"ChapterView({self.row}, {self.to_dict()!r})"
+
+
+class ChapterTable:
+    """Chapters stored column by column; iterate for views, rows() for exports"""
+
+    def __init__(self):
+        self.columns: Dict[str, object] = {name: StringColumn() for name in STRING_COLUMNS}
+        self.columns.update({name: TextColumn() for name in TEXT_COLUMNS})
+        self.columns.update({name: IntColumn() for name in INT_COLUMNS})
+        self._length = 0
+
+    def append(self, **fields) -> int:
+        """Adds a chapter and returns its row index"""
+        fields = {_column_name(key): value for key, value in fields.items()}
+        unknown = set(fields) - set(COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown chapter columns: {sorted(unknown)}")
+        for name, column in self.columns.items():
+            column.append(fields.get(name))
+        self._length += 1
+        return self._length - 1
+
+    def add_college(self, college) -> int:
+        """Adds every chapter of a college_scraper.College; returns how many"""
+        added = 0
+        for chapter in (*college.fraternities, *college.sororities):
+            self.append(
+                name=chapter.name,
+                college_name=college.name,
+                college_state=college.state,
+                chapter_type=chapter.chapter_type,
+                greek_letters=chapter.greek_letters,
+                address=chapter.address,
+                email=chapter.email,
+                phone=chapter.phone,
+                website=chapter.website,
+                instagram=chapter.instagram,
+                founded_year=chapter.founded_year,
+                member_count=chapter.member_count,
+            )
+            added += 1
+        return added
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, row):
+        """A view of one row, or a list of views for a slice"""
+        if isinstance(row, slice):
+            return [ChapterView(self, i) for i in range(*row.indices(self._length))]
+        if not -self._length <= row < self._length:
+            raise IndexError(row)
+        return ChapterView(self, row % self._length)
+
+    def __iter__(self) -> Iterator[ChapterView]:
+        return (ChapterView(self, row) for row in range(self._length))
+
+    def column(self, name: str):
+        return self.columns[_column_name(name)]
+
+    def rows(self, *names: str) -> Iterator[Tuple]:
+        """Tuples of the named columns, row by row, straight off the arrays"""
+        return zip(*(self.column(name) for name in names))
+
+    def where(self, name: str, value) -> List[ChapterView]:
+        """Views of the rows whose column equals value"""
+        column = self.column(name)
+        if isinstance(column, StringColumn):
+            code = column.code_of(value)
+            if code is None:
+                return []
+            return [ChapterView(self, row) for row, c in enumerate(column.codes) if c == code]
+        return [ChapterView(self, row) for row, v in enumerate(column) if v == value]
+
+    def count(self, name: str, value) -> int:
+        column = self.column(name)
+        if isinstance(column, StringColumn):
+            code = column.code_of(value)
+            return 0 if code is None else column.codes.count(code)
+        return sum(1 for v in column if v == value)
+
+    def with_value(self, name: str) -> List[ChapterView]:
+        """Views of the rows where the column is set (not None / empty)"""
+        return [ChapterView(self, row) for row, v in enumerate(self.column(name)) if v]
+
+    def records(self) -> Iterator[Dict]:
+        """One dict per chapter, built on demand (for JSON export)"""
+        names = COLUMNS
+        for values in self.rows(*names):
+            yield {name: value for name, value in zip(names, values) if value is not None}
+
+    def nbytes(self) -> int:
+        """Approximate memory held by the columns"""
+        return sum(column.nbytes() for column in self.columns.values())
@@ -0,0 +1,422 @@
+#!/usr/bin/env python3
+"""
+Circuit Breaker
+Per-host circuit breakers so dead or moved sites fail fast, this run and the next
+
+    closed     requests go through; consecutive failures are counted
+    open       requests fail at once with CircuitOpen until the cooldown ends
+    half-open  one probe request goes through: success closes the breaker,
+               failure reopens it with twice the cooldown
+
+Failures are classified from the exception: names that do not resolve
+(NXDOMAIN), refused or unreachable connections, connect timeouts and TLS
+errors open the breaker after two; temporary DNS errors (EAI_AGAIN,
+EAI_FAIL), read timeouts and 500/502/504 responses after three. 404s, 429s
+and 503s say the host is alive and do not count. When most hosts contacted
+in the last minute get temporary DNS errors at once, the local resolver is
+down rather than the hosts, so those failures are not counted (or saved).
+Sessions get a short connect timeout, so a blackholed host costs seconds,
+not the full timeout.
+
+Scrapers plug in like throttle_session():
+    breaker_session(self.session)                  # requests.Session
+    PooledClient(..., breakers=BREAKERS)           # http_client
+
+Breaker state is saved to ../data/cache/host_breakers.json, so a host found
+dead in one run is skipped (and probed only when its cooldown ends) in the
+next. report() lists the open hosts for the run report.
+"""
+
+import atexit
+import errno
+import json
+import logging
+import os
+import socket
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+
+from run_metrics import METRICS
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STATE_PATH = '../data/cache/host_breakers.json'
+SAVE_INTERVAL = 30.0
+CONNECT_TIMEOUT = 3.05  # Seconds; applied to sessions that pass a single timeout
+MAX_COOLDOWN = 7 * 86400
+
+CLOSED, OPEN, HALF_OPEN = 'closed', 'open', 'half_open'
+
+# Failure kind → (consecutive failures that open the breaker, first cooldown in seconds)
+FAILURE_POLICY = {
+    'dns': (2, 6 * 3600),
+    'dns_temporary': (3, 600),
+    'refused': (2, 1800),
+    'unreachable': (2, 1800),
+    'connect_timeout': (2, 1800),
+    'tls': (2, 1800),
+    'read_timeout': (3, 600),
+    'connection': (3, 600),
+    'http_5xx': (3, 600),
+}
+FAILURE_STATUSES = {500, 502, 504}  # 503 and 429 are throttling, left to adaptive_throttle
+
+# Temporary DNS errors from at least this many hosts, and from most hosts seen, within the window = resolver outage
+DNS_OUTAGE_WINDOW = 60.0
+DNS_OUTAGE_HOSTS = 5
+
+# getaddrinfo errors where the resolver answered but could not (yet) say; anything else means no such name
+DNS_TEMPORARY_ERRORS = {socket.EAI_AGAIN, socket.EAI_FAIL}
+DNS_TEMPORARY_TEXT = ('Temporary failure in name resolution', 'Non-recoverable failure in name resolution')
+DNS_TEXT = ('Failed to resolve', 'Name or service not known', 'nodename nor servname', 'No address associated')
+
+
+class CircuitOpen(requests.ConnectionError):
+    """Raised instead of sending a request to a host whose breaker is open"""
+
+
+def classify_failure(error: BaseException) -> str:
+    """Failure kind for a requests/urllib3/socket exception (see FAILURE_POLICY)"""
+    if isinstance(error, requests.ConnectTimeout):
+        return 'connect_timeout'
+    if isinstance(error, requests.Timeout):
+        return 'read_timeout'
+    if isinstance(error, requests.exceptions.SSLError):
+        return 'tls'
+
+    # Walk the wrapped causes: requests → urllib3 MaxRetryError.reason → NewConnectionError → OSError
+    # (NameResolutionError → socket.gaierror, whose errno tells NXDOMAIN from a struggling resolver)
+    dns = None
+    seen = set()
+    pending = [error]
+    while pending:
+        current = pending.pop()
+        if current is None or id(current) in seen:
+            continue
+        seen.add(id(current))
+        if isinstance(current, socket.gaierror):
+            return 'dns_temporary' if current.errno in DNS_TEMPORARY_ERRORS else 'dns'
+        if isinstance(current, ConnectionRefusedError) or getattr(current, 'errno', None) == errno.ECONNREFUSED:
+            return 'refused'
+        if getattr(current, 'errno', None) in (errno.ENETUNREACH, errno.EHOSTUNREACH):
+            return 'unreachable'
+        text = str(current)
+        if any(t in text for t in DNS_TEMPORARY_TEXT):
+            dns = 'dns_temporary'
+        elif dns is None and (type(current).__name__ == 'NameResolutionError' or any(t in text for t in DNS_TEXT)):
+            dns = 'dns'
+        pending.extend((current.__cause__, current.__context__, getattr(current, 'reason', None)))
+        pending.extend(arg for arg in getattr(current, 'args', ()) if isinstance(arg, BaseException))
+    return dns or 'connection'
+
+
+@dataclass(slots=True)
+class Breaker:
+    """Breaker state for one host"""
+    state: str = CLOSED
+    failures: int = 0
+    kind: Optional[str] = None
+    last_error: Optional[str] = None
+    opened: int = 0  # Consecutive openings, for the growing cooldown
+    open_until: float = 0.0  # Unix time
+    updated_at: float = 0.0
+    # Per run only
+    probing: bool = False
+    skipped: int = 0
+
+
+PERSISTED_FIELDS = ('state', 'failures', 'kind', 'last_error', 'opened', 'open_until', 'updated_at')
+
+
+def host_of(url: str) -> str:
+    return urlsplit(url).netloc.lower()
+
+
+class _Call:
+    """An allowed request; response() reports its status"""
+
+    __slots__ = ('breakers', 'host', 'recorded')
+
+    def __init__(self, breakers: 'CircuitBreakers', host: str):
+        self.breakers = breakers
+        self.host = host
+        self.recorded = False
+
+    def response(self, status: int):
+        if self.recorded:
+            return
+        self.recorded = True
+        if status in FAILURE_STATUSES:
+            self.breakers.record_failure(self.host, 'http_5xx', f"HTTP {status}")
+        else:
+            self.breakers.record_success(self.host)
+
+
+class _NoopCall:
+    def response(self, status: int):
+        pass
+
+
+_NOOP_CALL = _NoopCall()
+
+
+class CircuitBreakers:
+    """
+    One breaker per host, shared by every scraper in the process
+
+    Args:
+        state_path: JSON file breakers are loaded from and saved to (None: don't persist)
+    """
+
+    def __init__(self, state_path: Optional[str] = DEFAULT_STATE_PATH, enabled: bool = True):
+        self.state_path = state_path
+        self.enabled = enabled
+        self.hosts: Dict[str, Breaker] = {}
+        self._saved: Optional[Dict[str, Dict]] = None
+        self._lock = threading.Lock()
+        self._last_save = time.monotonic()
+        self._dirty = False
+        self._recent: Dict[str, Tuple[float, bool]] = {}  # host -> (last outcome time, temporary DNS failure)
+        self._dns_outage = False
+
+    def configure(self, **settings):
+        """Changes settings (e.g. state_path=None, enabled=False for benchmarks)"""
+        with self._lock:
+            for name, value in settings.items():
+                if name not in ('state_path', 'enabled'):
+                    raise ValueError(f"Unknown breaker setting {name!r}")
+                setattr(self, name, value)
+            self.hosts.clear()
+            self._saved = None
+            self._recent.clear()
+            self._dns_outage = False
+
+    def _load_saved(self) -> Dict[str, Dict]:
+        if not self.state_path or not os.path.exists(self.state_path):
+            return {}
+        try:
+            with open(self.state_path, 'r') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable breaker state {self.state_path}: {e}")
+            return {}
+
+    def _breaker(self, host: str) -> Breaker:
+        breaker = self.hosts.get(host)
+        if breaker is None:
+            if self._saved is None:
+                self._saved = self._load_saved()
+            saved = self._saved.get(host)
+            breaker = Breaker(**{k: v for k, v in saved.items() if k in PERSISTED_FIELDS}) if saved else Breaker()
+            if breaker.state == HALF_OPEN:
+                breaker.state = OPEN  # A probe from a run that ended; probe again when due
+            self.hosts[host] = breaker
+        return breaker
+
+    # -- requests -----------------------------------------------------------
+
+    def check(self, host: str):
+        """Raises CircuitOpen unless a request to host may go ahead (possibly as the half-open probe)"""
+        with self._lock:
+            breaker = self._breaker(host)
+            if breaker.state == CLOSED:
+                return
+            if breaker.state == OPEN and time.time() >= breaker.open_until:
+                breaker.state = HALF_OPEN
+                breaker.probing = False
+            if breaker.state == HALF_OPEN and not breaker.probing:
+                breaker.probing = True
+                logger.info(f"🔌 {host}: probing after {breaker.kind or 'failures'}")
+                return
+            breaker.skipped += 1
+            until = datetime.fromtimestamp(breaker.open_until).strftime('%Y-%m-%d %H:%M')
+            error = f"Circuit open for {host} ({breaker.kind}: {breaker.last_error}) until {until}"
+        METRICS.inc('circuit_open_total', host=host)
+        raise CircuitOpen(error)
+
+    def _resolver_down(self, host: str, dns_failed: bool) -> bool:
+        """Notes host's latest outcome; True while DNS temporarily fails for most recently contacted hosts"""
+        now = time.monotonic()
+        self._recent[host] = (now, dns_failed)
+        self._recent = {h: seen for h, seen in self._recent.items() if now - seen[0] < DNS_OUTAGE_WINDOW}
+        failing = [h for h, (_, failed) in self._recent.items() if failed]
+        down = len(failing) >= DNS_OUTAGE_HOSTS and 2 * len(failing) > len(self._recent)
+
+        if down and not self._dns_outage:
+            logger.warning(f"🔌 DNS failing for {len(failing)}/{len(self._recent)} hosts in the last "
+                           f"{DNS_OUTAGE_WINDOW:.0f}s: resolver outage, not counting temporary DNS failures")
+            # Take back what the outage's first DNS failures counted against their hosts
+            for other in failing:
+                breaker = self.hosts.get(other)
+                if breaker is not None and breaker.kind == 'dns_temporary':
+                    if breaker.state != CLOSED:
+                        breaker.opened = max(0, breaker.opened - 1)
+                    breaker.state = CLOSED
+                    breaker.failures = max(0, breaker.failures - 1)
+                    breaker.open_until = 0.0
+                    breaker.probing = False
+        elif self._dns_outage and not down:
+            logger.info("🔌 DNS is resolving again")
+        self._dns_outage = down
+        return down
+
+    def record_success(self, host: str):
+        with self._lock:
+            self._resolver_down(host, False)
+            breaker = self._breaker(host)
+            if breaker.state != CLOSED:
+                logger.info(f"🔌 {host}: back up, breaker closed")
+            if breaker.state != CLOSED or breaker.failures:
+                breaker.state = CLOSED
+                breaker.failures = 0
+                breaker.opened = 0
+                breaker.kind = breaker.last_error = None
+                breaker.probing = False
+                breaker.updated_at = time.time()
+                self._dirty = True
+        self._maybe_save()
+
+    def record_failure(self, host: str, kind: str, message: str):
+        with self._lock:
+            breaker = self._breaker(host)
+            # NXDOMAIN is the resolver working; only temporary errors can mean it is down
+            if self._resolver_down(host, kind == 'dns_temporary') and kind == 'dns_temporary':
+                breaker.probing = False
+                METRICS.inc('circuit_dns_outage_total', host=host)
+                return
+            threshold, cooldown = FAILURE_POLICY.get(kind, FAILURE_POLICY['connection'])
+            breaker.failures += 1
+            breaker.kind = kind
+            breaker.last_error = message[:200]
+            breaker.updated_at = time.time()
+            self._dirty = True
+            METRICS.inc('circuit_failures_total', host=host, kind=kind)
+
+            if breaker.state == HALF_OPEN or breaker.failures >= threshold:
+                breaker.opened += 1
+                delay = min(MAX_COOLDOWN, cooldown * 2 ** (breaker.opened - 1))
+                breaker.state = OPEN
+                breaker.open_until = time.time() + delay
+                breaker.probing = False
+                METRICS.inc('circuit_opened_total', host=host, kind=kind)
+                logger.warning(f"🔌 {host}: breaker open for {delay / 60:.0f} min after {breaker.failures} "
+                               f"failure(s) ({kind}: {breaker.last_error})")
+        self._maybe_save()
+
+    @contextmanager
+    def guard(self, url: str):
+        """
+        Runs one request to url's host through its breaker
+
+        Raises CircuitOpen before the block if the host is open. Exceptions
+        from the block count as failures (classified by kind); report the
+        response status with call.response(status).
+        """
+        if not self.enabled:
+            yield _NOOP_CALL
+            return
+        host = host_of(url)
+        self.check(host)
+        call = _Call(self, host)
+        try:
+            yield call
+        except (requests.ConnectionError, requests.Timeout, OSError) as e:
+            if not call.recorded and not isinstance(e, CircuitOpen):
+                call.recorded = True
+                self.record_failure(host, classify_failure(e), f"{type(e).__name__}: {e}")
+            raise
+        finally:
+            if not call.recorded:
+                # Anything else (a parse error, an interrupt) says nothing about the host
+                call.recorded = True
+                with self._lock:
+                    self._breaker(host).probing = False
+
+    # -- persistence and reporting --------------------------------------------
+
+    def report(self) -> List[Dict]:
+        """Hosts whose breaker is not closed (or that failed this run), worst first"""
+        with self._lock:
+            rows = [
+                {
+                    'host': host,
+                    'state': breaker.state,
+                    'kind': breaker.kind,
+                    'last_error': breaker.last_error,
+                    'failures': breaker.failures,
+                    'open_until': datetime.fromtimestamp(breaker.open_until).isoformat(timespec='seconds')
+                    if breaker.state != CLOSED else None,
+                    'skipped_this_run': breaker.skipped,
+                }
+                for host, breaker in self.hosts.items()
+                if breaker.state != CLOSED or breaker.failures
+            ]
+        return sorted(rows, key=lambda row: (row['state'] == CLOSED, -row['skipped_this_run'], row['host']))
+
+    def _maybe_save(self):
+        if self.state_path and time.monotonic() - self._last_save > SAVE_INTERVAL:
+            self.save()
+
+    def save(self):
+        """Merges this process's breakers into the state file; closed healthy hosts are dropped"""
+        with self._lock:
+            self._last_save = time.monotonic()
+            if not self.state_path or not self._dirty:
+                return
+            self._dirty = False
+            states = {host: {name: getattr(breaker, name) for name in PERSISTED_FIELDS}
+                      for host, breaker in self.hosts.items()}
+
+        saved = self._load_saved()
+        saved.update(states)
+        saved = {host: state for host, state in saved.items() if state['state'] != CLOSED or state['failures']}
+        if os.path.dirname(self.state_path):
+            os.makedirs(os.path.dirname(self.state_path), exist_ok=True)
+        tmp_path = f"{self.state_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(saved, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.state_path)
+
+
+BREAKERS = CircuitBreakers()
+atexit.register(BREAKERS.save)
+
+
+def breaker_session(session, breakers: CircuitBreakers = BREAKERS, connect_timeout: float = CONNECT_TIMEOUT):
+    """
+    Puts a requests.Session's requests behind the per-host breakers
+
+    Call after throttle_session(), so open hosts fail before waiting for a slot.
+    A single timeout=N becomes (connect_timeout, N).
+    """
+    send = session.send
+
+    def guarded_send(request, **kwargs):
+        timeout = kwargs.get('timeout')
+        if isinstance(timeout, (int, float)) and timeout > connect_timeout:
+            kwargs['timeout'] = (connect_timeout, timeout)
+        with breakers.guard(request.url) as call:
+            response = send(request, **kwargs)
+            call.response(response.status_code)
+            return response
+
+    session.send = guarded_send
+    return session
+
+
+def log_open_circuits(breakers: CircuitBreakers = BREAKERS):
+    """Logs the hosts skipped or failing this run"""
+    rows = breakers.report()
+    if not rows:
+        return
+    logger.info(f"\n🔌 Hosts with open breakers or failures: {len(rows)}")
+    for row in rows[:20]:
+        until = f" until {row['open_until']}" if row['open_until'] else ''
+        logger.info(f"  {row['state']:9s} {row['host']} ({row['kind']}, skipped {row['skipped_this_run']}){until}")
@@ -0,0 +1,408 @@
+#!/usr/bin/env python3
+"""
+College Crawl
+Sharded nationwide Greek life crawl driven by the universities database
+
+Universities are read lazily from ../database/UNIVERSITIES_DATABASE.json and
+partitioned into shards by a stable hash of the university id (or of the
+state, to keep a state's schools together). Every worker process or machine
+computes the same partition, so shards need no coordination:
+
+    python college_crawl.py plan --shards 16 --by state
+    python college_crawl.py crawl --shard 3/16 --by state      # on each machine
+    python college_crawl.py merge --shards 16                  # once all are done
+    python college_crawl.py local --shards 8 --workers 4       # all shards here, then merge
+
+Each shard appends one JSON line per university to shard-III-of-NNN.jsonl as
+it goes, so an interrupted shard resumes where it stopped. merge combines
+the shard files into one colleges JSON (the format scrape_all_d1_schools
+writes, plus university_id).
+"""
+
+import argparse
+import json
+import logging
+import os
+import re
+import zlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from typing import Dict, Iterator, List, Optional, Set
+from urllib.parse import urlsplit
+
+from adaptive_throttle import THROTTLE
+from circuit_breaker import BREAKERS
+from college_scraper import CollegeScraper
+from entity_resolution import UNIVERSITIES_FILE, UniversityResolver
+from run_metrics import METRICS
+from tracing import TRACER
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+DEFAULT_OUTPUT_DIR = '../data/crawl'
+SHARD_KEYS = ('hash', 'state')
+READ_CHUNK = 64 * 1024
+
+
+@dataclass(slots=True)
+class CrawlTarget:
+    """A university to crawl and the Greek life pages to try, in order"""
+    university_id: str
+    name: str
+    state: str
+    city: str
+    urls: List[str]
+
+
+def iter_json_array(path: str, chunk_size: int = READ_CHUNK) -> Iterator[Dict]:
+    """Yields the items of a top-level JSON array without loading the whole file"""
+    decoder = json.JSONDecoder()
+    with open(path, 'r', encoding='utf-8') as f:
+        buffer = f.read(chunk_size).lstrip()
+        if not buffer.startswith('['):
+            raise ValueError(f"{path} is not a JSON array")
+        buffer = buffer[1:]
+        eof = False
+        while True:
+            buffer = buffer.lstrip().lstrip(',').lstrip()
+            if buffer.startswith(']'):
+                return
+            try:
+                item, end = decoder.raw_decode(buffer)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                more = f.read(chunk_size)
+                eof = not more
+                buffer += more
+                continue
+            yield item
+            buffer = buffer[end:]
+
+
+def greek_life_candidates(website: Optional[str]) -> List[str]:
+    """Likely Greek life page URLs for a university website"""
+    if not website:
+        return []
+    host = urlsplit(website if '://' in website else f"https://{website}").netloc.lower()
+    domain = host[4:] if host.startswith('www.') else host
+    if not domain:
+        return []
+    return [
+        f"https://greeklife.{domain}/",
+        f"https://{domain}/greek-life",
+        f"https://fsl.{domain}/",
+    ]
+
+
+_known_urls: Dict[str, Dict[str, str]] = {}  # Per universities file, built once per process
+
+
+def known_greek_life_urls(resolver: Optional[UniversityResolver] = None,
+                          universities_file: str = UNIVERSITIES_FILE) -> Dict[str, str]:
+    """
+    University id → Greek life URL for the schools CollegeScraper already knows
+
+    Without a resolver, the mapping is built (with a resolver over
+    universities_file) on the first call in a process and reused after that.
+    """
+    if resolver is None:
+        if universities_file not in _known_urls:
+            _known_urls[universities_file] = known_greek_life_urls(
+                UniversityResolver.from_file(universities_file), universities_file
+            )
+        return _known_urls[universities_file]
+
+    urls = {}
+    for school in CollegeScraper().get_d1_schools():
+        match = resolver.resolve(school['name'], school['state'])
+        if match:
+            urls[match.id] = school['greek_life_url']
+        else:
+            logger.warning(f"No database match for {school['name']}; its URL is unused")
+    return urls
+
+
+def shard_of(university: Dict, shard_count: int, by: str = 'hash') -> int:
+    """Stable shard number for a university (same on every machine and run)"""
+    key = (university.get('state') or '') if by == 'state' else university['id']
+    return zlib.crc32(key.encode('utf-8')) % shard_count
+
+
+STATE_CODE = re.compile(r'[A-Z]{2}')
+STATE_SUFFIX = re.compile(r',\s*[A-Z]{2}$')  # "Cleveland, OH"
+
+
+def city_of(university: Dict) -> str:
+    """
+    The university's city, or '' when its location is only a state
+
+    location holds the state code for most rows in the universities file,
+    which is not a city and would be stored on the college as one.
+    """
+    location = (university.get('location') or '').strip()
+    if location == university.get('state') or STATE_CODE.fullmatch(location):
+        return ''
+    return STATE_SUFFIX.sub('', location)
+
+
+def iter_targets(
+    shard_index: int = 0,
+    shard_count: int = 1,
+    by: str = 'hash',
+    universities_file: str = UNIVERSITIES_FILE,
+    known_urls: Optional[Dict[str, str]] = None,
+    greek_only: bool = True
+) -> Iterator[CrawlTarget]:
+    """
+    Lazily yields the crawl targets in one shard
+
+    Args:
+        greek_only: Skip universities whose greek_percentage is 0 or unknown
+    """
+    known_urls = known_urls or {}
+    for university in iter_json_array(universities_file):
+        if shard_of(university, shard_count, by) != shard_index:
+            continue
+        if greek_only and not university.get('greek_percentage'):
+            continue
+
+        urls = [known_urls[university['id']]] if university['id'] in known_urls else []
+        urls += [u for u in greek_life_candidates(university.get('website')) if u not in urls]
+        yield CrawlTarget(
+            university_id=university['id'],
+            name=university['name'],
+            state=university.get('state') or '',
+            city=city_of(university),
+            urls=urls,
+        )
+
+
+def shard_path(output_dir: str, shard_index: int, shard_count: int, suffix: str = 'jsonl') -> str:
+    return os.path.join(output_dir, f"shard-{shard_index:03d}-of-{shard_count:03d}.{suffix}")
+
+
+def _completed_ids(path: str) -> Set[str]:
+    done = set()
+    if not os.path.exists(path):
+        return done
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                done.add(json.loads(line)['university_id'])
+            except (json.JSONDecodeError, KeyError):
+                continue  # A line cut short by an interrupted run
+    return done
+
+
+def crawl_target(scraper: CollegeScraper, target: CrawlTarget) -> Dict:
+    """
+    Tries a university's candidate URLs until one lists chapters
+
+    Returns:
+        A shard record: university_id, status ('ok', 'not_found' or 'no_url')
+        and, when a page loaded, the college
+    """
+    with TRACER.span('university', university=target.name, state=target.state) as span:
+        college = None
+        # Candidates share a host; the scraper's session throttle spaces them out
+        for url in target.urls:
+            found = scraper.scrape_college_greek_life(target.name, url)
+            if found and (found.fraternities or found.sororities):
+                college = found
+                break
+            # A page that loads but lists no chapters is kept only if nothing better turns up
+            college = college or found
+
+        status = 'ok' if college else ('not_found' if target.urls else 'no_url')
+        span.set_attribute('status', status)
+
+    record = {'university_id': target.university_id, 'status': status}
+    if college:
+        college.state = target.state
+        college.city = target.city
+        record['college'] = asdict(college)
+    return record
+
+
+def crawl_shard(
+    shard_index: int,
+    shard_count: int,
+    by: str = 'hash',
+    output_dir: str = DEFAULT_OUTPUT_DIR,
+    universities_file: str = UNIVERSITIES_FILE,
+    limit: Optional[int] = None,
+    scraper: Optional[CollegeScraper] = None,
+    known_urls: Optional[Dict[str, str]] = None
+) -> Dict:
+    """
+    Crawls one shard, appending a JSON line per university as it finishes
+
+    Lines record status 'ok' (with the college), 'not_found' (every candidate
+    URL failed) or 'no_url' (nothing to try). Universities already in the
+    shard file are skipped, so a rerun resumes. Pass known_urls (from
+    known_greek_life_urls) when running many shards, so the resolver behind it
+    is built once.
+
+    Returns:
+        Counts per status for this run
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    METRICS.reset()  # A worker process may run several shards
+    path = shard_path(output_dir, shard_index, shard_count)
+    done = _completed_ids(path)
+    scraper = scraper or CollegeScraper()
+    if known_urls is None:
+        known_urls = known_greek_life_urls(universities_file=universities_file)
+    counts = {'ok': 0, 'not_found': 0, 'no_url': 0, 'skipped': len(done)}
+
+    logger.info(f"🗺️  Shard {shard_index}/{shard_count} (by {by}): {len(done)} already done → {path}")
+
+    with METRICS.stage(f"shard {shard_index}"), open(path, 'a', encoding='utf-8') as out:
+        targets = iter_targets(shard_index, shard_count, by, universities_file, known_urls)
+        for crawled, target in enumerate(t for t in targets if t.university_id not in done):
+            if limit is not None and crawled >= limit:
+                break
+
+            record = crawl_target(scraper, target)
+            status = record['status']
+            out.write(json.dumps(record) + "\n")
+            out.flush()
+
+            counts[status] += 1
+            METRICS.inc('crawl_universities_total', status=status)
+
+    METRICS.write_json(shard_path(output_dir, shard_index, shard_count, 'report.json'),
+                       extra={'shard': shard_index, 'shard_count': shard_count, 'by': by, 'counts': counts,
+                              'hosts': THROTTLE.snapshot(), 'open_hosts': BREAKERS.report()})
+    logger.info(f"✓ Shard {shard_index}/{shard_count}: {counts}")
+    return counts
+
+
+def merge_shards(shard_count: int, output_dir: str = DEFAULT_OUTPUT_DIR,
+                 output_file: Optional[str] = None) -> Dict:
+    """
+    Merges shard files into one colleges JSON, one entry per university
+
+    Returns:
+        Counts of colleges written, statuses seen and shard files missing
+    """
+    output_file = output_file or os.path.join(output_dir, 'colleges.json')
+    seen = set()
+    stats = {'colleges': 0, 'not_found': 0, 'no_url': 0, 'missing_shards': []}
+
+    tmp_path = f"{output_file}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as out:
+        out.write("[")
+        for shard_index in range(shard_count):
+            path = shard_path(output_dir, shard_index, shard_count)
+            if not os.path.exists(path):
+                stats['missing_shards'].append(shard_index)
+                continue
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if record['university_id'] in seen:
+                        continue
+                    seen.add(record['university_id'])
+                    if record['status'] != 'ok':
+                        stats[record['status']] += 1
+                        continue
+                    college = {'university_id': record['university_id'], **record['college']}
+                    out.write(("\n  " if stats['colleges'] == 0 else ",\n  ") + json.dumps(college))
+                    stats['colleges'] += 1
+        out.write("\n]\n")
+    os.replace(tmp_path, output_file)
+
+    if stats['missing_shards']:
+        logger.warning(f"⚠️  Shards not found (crawl incomplete): {stats['missing_shards']}")
+    logger.info(f"✓ Merged {stats['colleges']} colleges → {output_file} "
+                f"({stats['not_found']} not found, {stats['no_url']} without a URL)")
+    return stats
+
+
+def plan(shard_count: int, by: str = 'hash', universities_file: str = UNIVERSITIES_FILE) -> List[int]:
+    """Number of Greek life universities in each shard"""
+    sizes = [0] * shard_count
+    for university in iter_json_array(universities_file):
+        if university.get('greek_percentage'):
+            sizes[shard_of(university, shard_count, by)] += 1
+    return sizes
+
+
+def _parse_shard(value: str):
+    index, _, count = value.partition('/')
+    index, count = int(index), int(count)
+    if not 0 <= index < count:
+        raise argparse.ArgumentTypeError(f"shard must be I/N with 0 <= I < N, got {value}")
+    return index, count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sharded Greek life crawl over the universities database")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    def common(command, shards=True):
+        command.add_argument("--by", choices=SHARD_KEYS, default="hash",
+                             help="partition by university id hash or by state")
+        command.add_argument("--output-dir", default=DEFAULT_OUTPUT_DIR)
+        command.add_argument("--universities", default=UNIVERSITIES_FILE)
+        if shards:
+            command.add_argument("--shards", type=int, required=True)
+
+    plan_cmd = commands.add_parser("plan", help="show how many universities land in each shard")
+    common(plan_cmd)
+
+    crawl_cmd = commands.add_parser("crawl", help="crawl one shard")
+    common(crawl_cmd, shards=False)
+    crawl_cmd.add_argument("--shard", type=_parse_shard, required=True, metavar="I/N")
+    crawl_cmd.add_argument("--limit", type=int, help="stop after this many universities")
+
+    merge_cmd = commands.add_parser("merge", help="merge shard files into one colleges JSON")
+    common(merge_cmd)
+    merge_cmd.add_argument("--output", help="default <output-dir>/colleges.json")
+
+    local_cmd = commands.add_parser("local", help="crawl every shard in worker processes, then merge")
+    common(local_cmd)
+    local_cmd.add_argument("--workers", type=int, default=os.cpu_count() or 4)
+    local_cmd.add_argument("--limit", type=int, help="per shard")
+
+    args = parser.parse_args()
+
+    if args.command == "plan":
+        sizes = plan(args.shards, args.by, args.universities)
+        for index, size in enumerate(sizes):
+            logger.info(f"  shard {index:3d}: {size} universities")
+        logger.info(f"Total: {sum(sizes)} (largest shard {max(sizes)})")
+
+    elif args.command == "crawl":
+        shard_index, shard_count = args.shard
+        crawl_shard(shard_index, shard_count, args.by, args.output_dir, args.universities,
+                    limit=args.limit)
+
+    elif args.command == "merge":
+        merge_shards(args.shards, args.output_dir, args.output)
+
+    elif args.command == "local":
+        # Resolved once here rather than once per shard in the workers
+        known_urls = known_greek_life_urls(universities_file=args.universities)
+        with ProcessPoolExecutor(max_workers=args.workers) as executor:
+            futures = {
+                executor.submit(crawl_shard, index, args.shards, args.by, args.output_dir,
+                                args.universities, args.limit, known_urls=known_urls): index
+                for index in range(args.shards)
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error(f"✗ Shard {futures[future]} failed: {e}")
+        merge_shards(args.shards, args.output_dir)
+
+
+if __name__ == '__main__':
+    main()
@@ -9,14 +9,20 @@ from bs4 import BeautifulSoup
 import json
 import time
 import re
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional
 from dataclasses import dataclass, asdict
 import logging
 
+from adaptive_throttle import throttle_session
+from circuit_breaker import breaker_session
+from run_metrics import METRICS, instrument_session
+from tracing import TRACER
+from url_frontier import normalize_url
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True)
 class Chapter:
     """Represents a fraternity or sorority chapter"""
     name: str
@@ -31,7 +37,7 @@ class Chapter:
     member_count: Optional[int] = None
     greek_letters: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class College:
     """Represents a college/university"""
     name: str
@@ -59,6 +65,9 @@ class CollegeScraper:
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
         })
+        instrument_session(self.session, scraper='college')
+        throttle_session(self.session)
+        breaker_session(self.session)
 
     def scrape_college_greek_life(self, college_name: str, greek_life_url: str) -> College:
         """
@@ -73,36 +82,43 @@ class CollegeScraper:
         """
         logger.info(f"Scraping {college_name} - {greek_life_url}")
 
-        try:
-            response = self.session.get(greek_life_url, timeout=10)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-
-            # Extract chapters (this will vary by website structure)
-            chapters = self._extract_chapters(soup, college_name)
-
-            fraternities = [c for c in chapters if c.chapter_type == 'fraternity']
-            sororities = [c for c in chapters if c.chapter_type == 'sorority']
-
-            college = College(
-                name=college_name,
-                state='',  # Will be filled in later
-                city='',
-                division='D1',
-                greek_life_url=greek_life_url,
-                fraternities=fraternities,
-                sororities=sororities
-            )
-
-            logger.info(f"Found {len(fraternities)} fraternities and {len(sororities)} sororities")
-            return college
-
-        except Exception as e:
-            logger.error(f"Error scraping {college_name}: {str(e)}")
-            return None
-
-    def _extract_chapters(self, soup: BeautifulSoup, college_name: str) -> List[Chapter]:
-        """Extract chapter information from parsed HTML"""
+        with TRACER.span('college', college=college_name, url=greek_life_url) as span:
+            try:
+                response = self.session.get(greek_life_url, timeout=10)
+                response.raise_for_status()
+
+                with METRICS.timer('parse_seconds', scraper='college'):
+                    soup = BeautifulSoup(response.content, 'html.parser')
+
+                    # Extract chapters (this will vary by website structure)
+                    chapters = self._extract_chapters(soup, college_name, greek_life_url)
+
+                fraternities = [c for c in chapters if c.chapter_type == 'fraternity']
+                sororities = [c for c in chapters if c.chapter_type == 'sorority']
+
+                college = College(
+                    name=college_name,
+                    state='',  # Will be filled in later
+                    city='',
+                    division='D1',
+                    greek_life_url=greek_life_url,
+                    fraternities=fraternities,
+                    sororities=sororities
+                )
+
+                span.set_attribute('chapters', len(chapters))
+                logger.info(f"Found {len(fraternities)} fraternities and {len(sororities)} sororities")
+                return college
+
+            except Exception as e:
+                METRICS.inc('scrape_errors_total', scraper='college', error=type(e).__name__)
+                span.set_error(e)
+                logger.error(f"Error scraping {college_name}: {str(e)}")
+                return None
+
+    def _extract_chapters(self, soup: BeautifulSoup, college_name: str,
+                          page_url: Optional[str] = None) -> List[Chapter]:
+        """Extract chapter information from parsed HTML (relative links resolved against page_url)"""
         chapters = []
 
         # Common patterns for Greek life pages
@@ -119,7 +135,7 @@ class CollegeScraper:
                         name=text,
                         college=college_name,
                         chapter_type=chapter_type,
-                        website=link.get('href')
+                        website=normalize_url(link['href'], base=page_url) if page_url else link['href']
                     )
                     chapters.append(chapter)
 
@@ -252,14 +268,11 @@ class CollegeScraper:
 
         return d1_schools
 
-    def scrape_all_d1_schools(self, output_file: str = 'greek_life_data.json'):
+    def scrape_d1_schools(self) -> Iterator[College]:
         """
-        Scrapes all D1 schools and saves to JSON file
+        Scrapes each D1 school in turn, yielding College objects as they finish
         """
-        schools = self.get_d1_schools()
-        results = []
-
-        for school_info in schools:
+        for school_info in self.get_d1_schools():
             logger.info(f"\n{'='*60}")
             logger.info(f"Processing: {school_info['name']}")
             logger.info(f"{'='*60}")
@@ -272,10 +285,14 @@ class CollegeScraper:
             if college:
                 college.state = school_info['state']
                 college.city = school_info['city']
-                results.append(asdict(college))
+                yield college
+
 
-            # Be respectful - delay between requests
-            time.sleep(2)
+    def scrape_all_d1_schools(self, output_file: str = 'greek_life_data.json'):
+        """
+        Scrapes all D1 schools and saves to JSON file
+        """
+        results = [asdict(college) for college in self.scrape_d1_schools()]
 
         # Save results
         with open(output_file, 'w') as f:
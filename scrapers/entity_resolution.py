@@ -0,0 +1,414 @@
+#!/usr/bin/env python3
+"""
+Entity Resolution
+Matches university/chapter names from different scrape sources to canonical ids
+
+The same school shows up as "Penn State University", "Pennsylvania State
+University", "USC - University of Southern California" or a raw table cell.
+Names are normalized, candidates are blocked by state plus an inverted index
+of informative tokens, and only the handful of candidates per record are
+scored - so resolving 10k+ records is linear in the input, not O(n^2).
+
+Usage:
+    python entity_resolution.py ../fraternity_instagram_handles.csv \\
+        --name-column College --org-column "Fraternity Name" -o resolved.csv
+"""
+
+import argparse
+import csv
+import json
+import math
+import os
+import re
+import time
+import unicodedata
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from typing import Dict, Iterable, List, Optional, Tuple
+import logging
+
+try:
+    from rapidfuzz import fuzz
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+UNIVERSITIES_FILE = '../database/UNIVERSITIES_DATABASE.json'
+MATCH_THRESHOLD = 0.9
+MAX_CANDIDATES = 25
+
+# Namespace for chapter ids: uuid5(namespace, "<university_id>:<org key>")
+CHAPTER_NAMESPACE = uuid.UUID('6f1c7e2a-3b8d-4e59-9a61-0c5d2b7f4a10')
+
+# Words too common to say anything about which school a name refers to
+STOPWORDS = {'university', 'college', 'of', 'the', 'at', 'and', 'in', 'campus', 'main'}
+
+ABBREVIATIONS = {
+    'univ': 'university',
+    'u': 'university',
+    'coll': 'college',
+    'inst': 'institute',
+    'mt': 'mount',
+    'ft': 'fort',
+}
+
+# Common names that share no informative tokens with the official name
+ALIASES = {
+    'penn state': 'pennsylvania state university',
+    'penn state university': 'pennsylvania state university',
+    'ole miss': 'university of mississippi',
+    'uconn': 'university of connecticut',
+    'umass': 'university of massachusetts',
+}
+
+STATE_SUFFIX_RE = re.compile(r'\s*\(([A-Z]{2})\)\s*$')
+# Footnote markers left over from scraped tables: "Hobart CollegeA 9A 10A 11"
+FOOTNOTE_RE = re.compile(r'(?:\s?[A-Z] \d+)+\s*$')
+PUNCT_RE = re.compile(r"[^a-z0-9 ]+")
+# "Penn State - Altoona", "Pennsylvania State University, Altoona"
+NAME_PARTS_RE = re.compile(r'\s+-\s+|,')
+OVERFLOW_KEY = '__overflow__'  # DictReader restkey for rows with more fields than the header
+
+
+@dataclass
+class Match:
+    """A resolved record"""
+    id: str
+    name: str
+    score: float
+
+
+def _normalize_part(name: str) -> str:
+    name = name.replace('\u2013', '-').replace('\u2014', '-')
+    name = unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode()
+    name = name.lower().replace('&', ' and ').replace("'", '')
+    name = PUNCT_RE.sub(' ', name)
+    tokens = []
+    for token in name.split():
+        if token == 'st':
+            # "St. Thomas" / "University of St. Thomas" vs "Ohio St"
+            token = 'saint' if not tokens or tokens[-1] == 'of' else 'state'
+        tokens.append(ABBREVIATIONS.get(token, token))
+    if tokens and tokens[0] == 'the':
+        tokens = tokens[1:]
+
+    normalized = ' '.join(tokens)
+    return ALIASES.get(normalized, normalized)
+
+
+def normalize_name(name: str) -> str:
+    """
+    Canonical form of a university or organization name
+
+    Lowercases, strips accents and punctuation, expands common abbreviations
+    and applies known aliases to each comma/" - " separated part, so "Penn
+    State - Altoona" and "Pennsylvania State University, Altoona" normalize
+    alike and the campus qualifier is kept.
+    """
+    if not name:
+        return ''
+
+    name = FOOTNOTE_RE.sub('', STATE_SUFFIX_RE.sub('', name))
+    parts = (_normalize_part(part) for part in NAME_PARTS_RE.split(name))
+    return ' '.join(part for part in parts if part)
+
+
+def _restates(other: str, main: str) -> bool:
+    """True if other is just another name for main (its acronym, or only words main already has)"""
+    if not other or other == acronym(main):
+        return True
+    main_tokens = informative_tokens(main)
+    return all(any(_tokens_match(token, m) for m in main_tokens) for token in informative_tokens(other))
+
+
+def informative_tokens(normalized: str) -> List[str]:
+    return [t for t in normalized.split() if t not in STOPWORDS]
+
+
+def acronym(normalized: str) -> str:
+    """First letters of the non-trivial words ("university of southern california" -> "usc")"""
+    return ''.join(t[0] for t in normalized.split() if t not in {'of', 'the', 'at', 'and', 'in'})
+
+
+def _ratio(a: str, b: str) -> float:
+    return SequenceMatcher(None, a, b).ratio()
+
+
+def similarity(a: str, b: str) -> float:
+    """
+    Score two normalized names in [0, 1]
+
+    Average of token-sort and token-set ratios: token-set forgives extra
+    words ("university of alabama tuscaloosa"), token-sort penalizes them
+    enough that "university of alabama" does not match "university of
+    alabama at birmingham" as strongly as the real thing. Uses rapidfuzz
+    when installed, otherwise an equivalent difflib implementation.
+    """
+    if a == b:
+        return 1.0
+    if RAPIDFUZZ_AVAILABLE:
+        return (fuzz.token_sort_ratio(a, b) + fuzz.token_set_ratio(a, b)) / 200
+
+    tokens_a, tokens_b = set(a.split()), set(b.split())
+    sort_ratio = _ratio(' '.join(sorted(tokens_a)), ' '.join(sorted(tokens_b)))
+
+    common = ' '.join(sorted(tokens_a & tokens_b))
+    rest_a = (common + ' ' + ' '.join(sorted(tokens_a - tokens_b))).strip()
+    rest_b = (common + ' ' + ' '.join(sorted(tokens_b - tokens_a))).strip()
+    set_ratio = max(_ratio(common, rest_a) if common else 0.0,
+                    _ratio(common, rest_b) if common else 0.0,
+                    _ratio(rest_a, rest_b))
+
+    return (sort_ratio + set_ratio) / 2
+
+
+def _tokens_match(a: str, b: str) -> bool:
+    # "tech" ~ "technological", "poly" ~ "polytechnic"
+    return a == b or (min(len(a), len(b)) >= 4 and (a.startswith(b) or b.startswith(a)))
+
+
+class UniversityResolver:
+    """
+    Resolves free-text university names to canonical university ids
+
+    Built once from the universities table export. Exact normalized names
+    (and acronyms that are unique within a state) resolve through a dict;
+    everything else is scored only against candidates that share an
+    informative token, preferring rare tokens and the record's state. The
+    score averages string similarity with IDF-weighted token coverage.
+    """
+
+    def __init__(self, universities: Iterable[Dict], threshold: float = MATCH_THRESHOLD):
+        self.threshold = threshold
+        self._cache: Dict[Tuple[str, Optional[str]], Optional[Match]] = {}
+        self.records: Dict[str, Dict] = {}
+        self.normalized: Dict[str, str] = {}
+        self.exact: Dict[Tuple[Optional[str], str], str] = {}
+        self.token_index: Dict[Tuple[Optional[str], str], List[str]] = defaultdict(list)
+        acronyms: Dict[Tuple[str, str], List[str]] = defaultdict(list)
+        document_frequency: Dict[str, int] = defaultdict(int)
+
+        for uni in universities:
+            uid, name, state = uni['id'], uni['name'], uni.get('state')
+            norm = normalize_name(name)
+            self.records[uid] = uni
+            self.normalized[uid] = norm
+
+            self.exact.setdefault((state, norm), uid)
+            self.exact.setdefault((None, norm), uid)
+            acronyms[(state, acronym(norm))].append(uid)
+
+            for token in set(informative_tokens(norm)):
+                self.token_index[(state, token)].append(uid)
+                self.token_index[(None, token)].append(uid)
+                document_frequency[token] += 1
+
+        national = defaultdict(list)
+        for (state, short), uids in acronyms.items():
+            national[short].extend(uids)
+            if len(uids) == 1 and len(short) >= 2:
+                self.exact.setdefault((state, short), uids[0])
+        for short, uids in national.items():
+            if len(uids) == 1 and len(short) >= 3:
+                self.exact.setdefault((None, short), uids[0])
+
+        total = max(len(self.records), 1)
+        self.idf = {token: math.log(total / df) + 1 for token, df in document_frequency.items()}
+        self.max_idf = math.log(total) + 1
+
+    def coverage(self, tokens_a: List[str], tokens_b: List[str]) -> float:
+        """
+        IDF-weighted share of informative tokens the two names have in common
+
+        Keeps string similarity from matching "university of west georgia" to
+        "university of georgia": the unmatched token is rare, so it weighs a lot.
+        """
+        weight = lambda token: self.idf.get(token, self.max_idf)
+        unmatched_b = list(tokens_b)
+        common = missing = 0.0
+        for token in tokens_a:
+            partner = next((other for other in unmatched_b if _tokens_match(token, other)), None)
+            if partner is None:
+                missing += weight(token)
+            else:
+                unmatched_b.remove(partner)
+                common += weight(token)
+        missing += sum(weight(token) for token in unmatched_b)
+        return common / (common + missing) if common else 0.0
+
+    @classmethod
+    def from_file(cls, path: str = UNIVERSITIES_FILE, **kwargs) -> 'UniversityResolver':
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f), **kwargs)
+
+    def candidates(self, norm: str, state: Optional[str]) -> List[str]:
+        """Universities sharing informative tokens with the name, best-blocked first"""
+        weights: Dict[str, float] = defaultdict(float)
+        for token in set(informative_tokens(norm)):
+            for uid in self.token_index.get((state, token), ()):
+                weights[uid] += self.idf.get(token, 1.0)
+        ranked = sorted(weights, key=weights.get, reverse=True)
+        return ranked[:MAX_CANDIDATES]
+
+    def resolve(self, name: str, state: Optional[str] = None) -> Optional[Match]:
+        """
+        Finds the canonical university for a name
+
+        Args:
+            name: University name as it appears in the source
+            state: Two-letter state if the source has one (narrows the search)
+
+        Returns:
+            Match or None if nothing scores above the threshold
+
+        "X - Y" names are matched whole first, so a branch campus resolves to
+        that campus. Only when that scores below the threshold, and the other
+        parts merely restate the longest one ("USC - University of Southern
+        California"), is the longest part resolved on its own.
+        """
+        if not state and name:
+            suffix = STATE_SUFFIX_RE.search(name)
+            state = suffix.group(1) if suffix else None
+        match = self._resolve(normalize_name(name), state or None)
+        if match or not name or ' - ' not in name:
+            return match
+
+        parts = [normalize_name(part) for part in name.split(' - ')]
+        main = max(parts, key=len)
+        if all(_restates(part, main) for part in parts if part is not main):
+            return self._resolve(main, state or None)
+        return None
+
+    def _resolve(self, norm: str, state: Optional[str]) -> Optional[Match]:
+        key = (norm, state)
+        if key not in self._cache:
+            self._cache[key] = self._score(norm, state)
+        return self._cache[key]
+
+    def _score(self, norm: str, state: Optional[str]) -> Optional[Match]:
+        if not norm:
+            return None
+
+        uid = self.exact.get((state, norm))
+        if uid:
+            return Match(uid, self.records[uid]['name'], 1.0)
+
+        tokens = informative_tokens(norm)
+        best_uid, best_score = None, 0.0
+        for uid in self.candidates(norm, state):
+            candidate = self.normalized[uid]
+            score = (similarity(norm, candidate) + self.coverage(tokens, informative_tokens(candidate))) / 2
+            if score > best_score:
+                best_uid, best_score = uid, score
+
+        if best_uid is None and state:
+            # The source's state may be wrong or missing from the table
+            return self._resolve(norm, None)
+
+        if best_score < self.threshold:
+            return None
+        return Match(best_uid, self.records[best_uid]['name'], round(best_score, 3))
+
+
+def chapter_id(university_id: str, organization: str) -> str:
+    """Deterministic chapter id for an organization at a university"""
+    return str(uuid.uuid5(CHAPTER_NAMESPACE, f"{university_id}:{normalize_name(organization)}"))
+
+
+def resolve_records(
+    records: Iterable[Dict],
+    resolver: UniversityResolver,
+    name_field: str,
+    state_field: Optional[str] = None,
+    org_field: Optional[str] = None
+) -> List[Dict]:
+    """
+    Annotates records with university_id, university_name, match_score and
+    (when org_field is given) chapter_id
+
+    Unresolved records keep empty values so they can be reviewed by hand.
+    """
+    resolved = []
+    for record in records:
+        match = resolver.resolve(record.get(name_field, ''), record.get(state_field) if state_field else None)
+        out = dict(record)
+        out['university_id'] = match.id if match else ''
+        out['university_name'] = match.name if match else ''
+        out['match_score'] = match.score if match else ''
+        if org_field:
+            org = record.get(org_field) or ''
+            out['chapter_id'] = chapter_id(match.id, org) if match and org.strip() else ''
+        resolved.append(out)
+    return resolved
+
+
+def read_csv_records(f, path: str = '<csv>', skipped: Optional[List[int]] = None) -> Iterable[Dict]:
+    """
+    Yields a CSV file's rows as dicts, skipping (and logging) malformed rows
+
+    A row with more or fewer fields than the header - typically an unquoted
+    comma, as in "University of California, Los Angeles" - has its values
+    in the wrong columns, so it is left out rather than resolved wrongly.
+    Skipped line numbers are appended to skipped.
+    """
+    reader = csv.DictReader(f, restkey=OVERFLOW_KEY)
+    for record in reader:
+        if OVERFLOW_KEY in record or None in record.values():
+            logger.warning(f"⚠️  {path}:{reader.line_num}: expected {len(reader.fieldnames)} fields, "
+                           f"skipping malformed row (unquoted comma?)")
+            if skipped is not None:
+                skipped.append(reader.line_num)
+            continue
+        yield record
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Resolve university/chapter names to canonical ids")
+    parser.add_argument('input', help='CSV file to resolve')
+    parser.add_argument('--name-column', required=True, help='column holding the university name')
+    parser.add_argument('--state-column', help='column holding the two-letter state, if any')
+    parser.add_argument('--org-column', help='column holding the fraternity/sorority name (adds chapter_id)')
+    parser.add_argument('--universities', default=UNIVERSITIES_FILE, help='universities table export (JSON)')
+    parser.add_argument('--threshold', type=float, default=MATCH_THRESHOLD)
+    parser.add_argument('-o', '--output', help='output CSV (default: <input>_resolved.csv)')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    resolver = UniversityResolver.from_file(args.universities, threshold=args.threshold)
+
+    skipped: List[int] = []
+    with open(args.input, 'r', encoding='utf-8', newline='') as f:
+        fieldnames = next(csv.reader(f), [])
+        f.seek(0)
+        records = read_csv_records(f, args.input, skipped)
+        rows = resolve_records(records, resolver, args.name_column, args.state_column, args.org_column)
+
+    extra = ['university_id', 'university_name', 'match_score'] + (['chapter_id'] if args.org_column else [])
+    output = args.output or re.sub(r'\.csv$', '', args.input) + '_resolved.csv'
+    # Written next to the output and renamed into place, so a failure never leaves it half-written
+    tmp_path = f"{output}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames + [c for c in extra if c not in fieldnames],
+                                    extrasaction='ignore')
+            writer.writeheader()
+            writer.writerows(rows)
+        os.replace(tmp_path, output)
+    finally:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+
+    matched = sum(1 for row in rows if row['university_id'])
+    logger.info(f"✓ Resolved {matched}/{len(rows)} records in {time.perf_counter() - start:.2f}s "
+                f"({'rapidfuzz' if RAPIDFUZZ_AVAILABLE else 'difflib'} kernel) -> {output}")
+    if skipped:
+        logger.warning(f"⚠️  Skipped {len(skipped)} malformed row(s) at line(s) {', '.join(map(str, skipped))}")
+
+
+if __name__ == '__main__':
+    main()
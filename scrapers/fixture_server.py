@@ -0,0 +1,420 @@
+#!/usr/bin/env python3
+"""
+Fixture Server
+Local HTTP stand-in for the sites the scrapers hit, for offline benchmarks
+
+Pages are recorded once into ../data/fixtures/ (college Greek life pages,
+national chapter directories, Instagram profiles, Nominatim and Proxycurl
+JSON) and replayed from a local server with configurable latency, jitter
+and 429 injection. URLs with no recording get a synthetic response shaped
+like the real thing, so the suite also runs on a fresh checkout.
+
+Scrapers are pointed at the server by mounting FixtureAdapter on their
+requests.Session; the original host becomes the first path segment:
+    https://www.instagram.com/asusigmachi/ -> http://127.0.0.1:PORT/www.instagram.com/asusigmachi/
+
+Usage:
+    python fixture_server.py record            # Record every URL the benchmarks use
+    python fixture_server.py serve --latency 0.05 --jitter 0.02 --rate-429 0.05
+"""
+
+import argparse
+import hashlib
+import json
+import multiprocessing
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+import logging
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+DEFAULT_FIXTURE_DIR = '../data/fixtures'
+STATS_PATH = '/__stats__'
+
+
+def fixture_key(url: str) -> str:
+    """host + path + sorted query, the identity of a recorded page"""
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return f"{parts.netloc.lower()}{parts.path or '/'}{'?' + query if query else ''}"
+
+
+class FixtureStore:
+    """Recorded responses on disk: manifest.json plus one body file per page"""
+
+    def __init__(self, directory: str = DEFAULT_FIXTURE_DIR):
+        self.directory = directory
+        self.manifest_path = os.path.join(directory, 'manifest.json')
+        self.manifest: Dict[str, Dict] = {}
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path, 'r') as f:
+                self.manifest = json.load(f)
+
+    def get(self, key: str) -> Optional[Tuple[int, str, bytes]]:
+        entry = self.manifest.get(key)
+        if not entry:
+            return None
+        with open(os.path.join(self.directory, entry['file']), 'rb') as f:
+            return entry['status'], entry['content_type'], f.read()
+
+    def put(self, url: str, status: int, content_type: str, body: bytes):
+        key = fixture_key(url)
+        host = urlsplit(url).netloc.lower()
+        name = f"{host}/{hashlib.sha1(key.encode()).hexdigest()[:16]}"
+        os.makedirs(os.path.join(self.directory, host), exist_ok=True)
+        with open(os.path.join(self.directory, name), 'wb') as f:
+            f.write(body)
+        self.manifest[key] = {'url': url, 'file': name, 'status': status, 'content_type': content_type}
+
+    def save(self):
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = self.manifest_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(self.manifest, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.manifest_path)
+
+
+# ---------------------------------------------------------------------------
+# Synthetic responses for URLs that were never recorded
+# ---------------------------------------------------------------------------
+
+GREEK_NAMES = [
+    'Alpha Tau Omega', 'Sigma Chi', 'Pi Kappa Alpha', 'Kappa Alpha', 'Sigma Alpha Epsilon',
+    'Phi Delta Theta', 'Delta Tau Delta', 'Kappa Sigma', 'Phi Kappa Psi', 'Beta Theta Pi',
+    'Lambda Chi Alpha', 'Alpha Chi Omega', 'Kappa Kappa Gamma', 'Chi Omega', 'Delta Delta Delta',
+    'Pi Beta Phi', 'Kappa Alpha Theta', 'Alpha Delta Pi', 'Gamma Phi Beta', 'Zeta Tau Alpha',
+]
+
+# Stands in for the nav, footer and inline scripts that make up most of a real page
+_FILLER = '<div class="nav"><a href="/about">About</a><a href="/news">News</a></div>\n' * 200
+
+
+def _seeded(key: str) -> random.Random:
+    return random.Random(hashlib.sha1(key.encode()).digest())
+
+
+def _greek_life_page(key: str) -> bytes:
+    rng = _seeded(key)
+    links = ''.join(
+        f'<li class="chapter"><a href="/chapters/{i}">{name} Fraternity</a></li>\n'
+        if i % 2 else f'<li class="chapter"><a href="/chapters/{i}">{name}</a></li>\n'
+        for i, name in enumerate(rng.sample(GREEK_NAMES, 16))
+    )
+    rows = ''.join(
+        f'<tr><td>{name}</td><td>{rng.randint(40, 180)} members</td></tr>\n'
+        for name in rng.sample(GREEK_NAMES, 12)
+    )
+    return (f'<html><head><title>Fraternity & Sorority Life</title></head><body>{_FILLER}'
+            f'<ul>{links}</ul><table><tr><th>Chapter</th><th>Size</th></tr>{rows}</table>'
+            f'{_FILLER}</body></html>').encode()
+
+
+def _chapter_directory(key: str) -> bytes:
+    path, _, query = key.partition('?')
+    page = int(dict(parse_qsl(query)).get('page', 1))
+    pages = _seeded(path).randint(2, 4)
+    rng = _seeded(key)
+    rows = ''.join(
+        f'<tr><td>University {rng.randint(1, 999)} College</td>'
+        f'<td><a href="/chapters/{page}-{i}">{GREEK_NAMES[i % 20].split()[0]} {i}</a></td></tr>\n'
+        for i in range(rng.randint(40, 80))
+    )
+    pager = f'<a rel="next" href="?page={page + 1}">Next</a>' if page < pages else ''
+    return (f'<html><body>{_FILLER}<table><tr><th>School</th><th>Chapter</th></tr>{rows}</table>'
+            f'{pager}</body></html>').encode()
+
+
+def _chapter_page(key: str) -> bytes:
+    rng = _seeded(key)
+    slug = key.rsplit('/', 1)[-1]
+    return (f'<html><body>{_FILLER}<h1>Chapter {slug}</h1>'
+            f'<a href="mailto:chapter{slug}@example.org">Email</a>'
+            f'<a href="https://chapter{rng.randint(1, 10 ** 6)}.example.org/">Website</a>'
+            f'<a href="https://www.instagram.com/chapter{slug.replace("-", "")}/">Instagram</a>'
+            f'</body></html>').encode()
+
+
+def _instagram_profile(key: str) -> bytes:
+    rng = _seeded(key)
+    username = key.split('/')[1] if '/' in key else 'chapter'
+    followers, following, posts = rng.randint(300, 9000), rng.randint(100, 1500), rng.randint(20, 600)
+    ld_json = json.dumps({
+        '@type': 'Person', 'name': username, 'description': 'Official chapter account',
+        'interactionStatistic': {'userInteractionCount': str(followers)},
+    })
+    script = '<script>window.__additionalData = {"x":"' + 'a' * 4000 + '"};</script>\n'
+    return (
+        f'<html><head><meta property="og:description" content="{followers:,} Followers, '
+        f'{following:,} Following, {posts} Posts - See Instagram photos and videos from {username}">'
+        f'<script type="application/ld+json">{ld_json}</script></head>'
+        f'<body>{script * 25}</body></html>'
+    ).encode()
+
+
+def _nominatim(key: str) -> bytes:
+    rng = _seeded(key)
+    return json.dumps([{
+        'lat': f'{rng.uniform(25, 48):.6f}', 'lon': f'{rng.uniform(-123, -70):.6f}',
+        'display_name': 'Synthetic Place, United States',
+    }]).encode()
+
+
+def _proxycurl_search(key: str) -> bytes:
+    rng = _seeded(key)
+    return json.dumps({'results': [
+        {
+            'full_name': f'Member {rng.randint(1, 10 ** 6)}',
+            'headline': rng.choice(['Chapter President', 'Treasurer', 'Social Chair', 'Student', 'Analyst']),
+            'location': 'United States',
+            'linkedin_profile_url': f'https://www.linkedin.com/in/member-{rng.randint(1, 10 ** 9)}',
+            'connections': rng.randint(50, 500),
+            'current_company_name': None,
+        }
+        for _ in range(rng.randint(1, 5))
+    ]}).encode()
+
+
+def synthetic_response(key: str) -> Tuple[int, str, bytes]:
+    host = key.split('/', 1)[0]
+    if 'instagram.com' in host:
+        return 200, 'text/html; charset=utf-8', _instagram_profile(key)
+    if 'nominatim' in host:
+        return 200, 'application/json', _nominatim(key)
+    if 'proxycurl' in key:
+        return 200, 'application/json', _proxycurl_search(key)
+    if any(word in key for word in ('greek', 'fraternity', 'sorority', 'studentaffairs', 'ohiounion')):
+        return 200, 'text/html; charset=utf-8', _greek_life_page(key)
+    if '/chapters/' in key.partition('?')[0]:
+        return 200, 'text/html; charset=utf-8', _chapter_page(key)
+    return 200, 'text/html; charset=utf-8', _chapter_directory(key)
+
+
+# ---------------------------------------------------------------------------
+# Server
+# ---------------------------------------------------------------------------
+
+class FixtureServer(ThreadingHTTPServer):
+    """Replays fixtures with latency, jitter and injected 429s"""
+
+    daemon_threads = True
+
+    def __init__(self, address, store: FixtureStore, latency: float = 0.0, jitter: float = 0.0,
+                 rate_429: float = 0.0, retry_after: int = 1, synthetic: bool = True, seed: int = 0):
+        super().__init__(address, _FixtureHandler)
+        self.store = store
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_429 = rate_429
+        self.retry_after = retry_after
+        self.synthetic = synthetic
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.stats = {'requests': 0, 'recorded': 0, 'synthetic': 0, 'missing': 0, 'throttled': 0, 'bytes': 0}
+
+    def count(self, field: str, amount: int = 1):
+        with self.lock:
+            self.stats[field] += amount
+
+    def draw(self) -> Tuple[float, bool]:
+        with self.lock:
+            delay = max(0.0, self.latency + self.random.uniform(-self.jitter, self.jitter))
+            return delay, self.random.random() < self.rate_429
+
+
+class _FixtureHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # Keep-alive, like the real sites
+    # Headers and body go out as two small writes; with Nagle on, the body waits
+    # for the client's delayed ACK (~40 ms) and every request pays for it
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        server: FixtureServer = self.server
+        if self.path == STATS_PATH:
+            with server.lock:
+                return self._reply(200, 'application/json', json.dumps(server.stats).encode())
+
+        server.count('requests')
+        delay, throttle = server.draw()
+        if delay:
+            threading.Event().wait(delay)
+
+        if throttle:
+            server.count('throttled')
+            return self._reply(429, 'text/plain', b'Too Many Requests', {'Retry-After': str(server.retry_after)})
+
+        key = fixture_key('http://' + self.path.lstrip('/'))
+        fixture = server.store.get(key)
+        if fixture:
+            server.count('recorded')
+        elif server.synthetic:
+            server.count('synthetic')
+            fixture = synthetic_response(key)
+        else:
+            server.count('missing')
+            fixture = (404, 'text/plain', b'No fixture recorded')
+
+        status, content_type, body = fixture
+        server.count('bytes', len(body))
+        self._reply(status, content_type, body)
+
+    def _reply(self, status: int, content_type: str, body: bytes, headers: Optional[Dict] = None):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _serve(queue, fixture_dir, options):
+    server = FixtureServer(('127.0.0.1', 0), FixtureStore(fixture_dir), **options)
+    queue.put(server.server_port)
+    server.serve_forever()
+
+
+class FixtureServerProcess:
+    """
+    Runs a FixtureServer in a child process
+
+    Keeps the server's CPU time and memory out of the numbers measured for
+    the scrapers in the parent process.
+    """
+
+    def __init__(self, fixture_dir: str = DEFAULT_FIXTURE_DIR, **options):
+        self.fixture_dir = fixture_dir
+        self.options = options
+        self.process = None
+        self.url = None
+
+    def start(self) -> 'FixtureServerProcess':
+        queue = multiprocessing.Queue()
+        self.process = multiprocessing.Process(target=_serve, args=(queue, self.fixture_dir, self.options), daemon=True)
+        self.process.start()
+        self.url = f"http://127.0.0.1:{queue.get(timeout=10)}"
+        return self
+
+    def stats(self) -> Dict:
+        return requests.get(self.url + STATS_PATH, timeout=5).json()
+
+    def stop(self):
+        if self.process:
+            self.process.terminate()
+            self.process.join(timeout=5)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+
+class FixtureAdapter(HTTPAdapter):
+    """Transport adapter that sends every request to the fixture server instead"""
+
+    def __init__(self, server_url: str, **kwargs):
+        super().__init__(**kwargs)
+        self.server_url = server_url.rstrip('/')
+
+    def send(self, request, **kwargs):
+        parts = urlsplit(request.url)
+        request.url = f"{self.server_url}/{parts.netloc}{parts.path or '/'}{'?' + parts.query if parts.query else ''}"
+        return super().send(request, **kwargs)
+
+
+def mount_fixture_adapter(session: requests.Session, server_url: str, pool_size: int = 10):
+    adapter = FixtureAdapter(server_url, pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+
+
+# ---------------------------------------------------------------------------
+# Recording
+# ---------------------------------------------------------------------------
+
+def benchmark_urls(instagram_limit: int = 50, geocode_limit: int = 50) -> List[str]:
+    """Every URL the benchmark workloads request"""
+    from benchmark_scrapers import WORKLOADS
+
+    urls = []
+    for workload in WORKLOADS.values():
+        urls.extend(workload.urls(instagram_limit=instagram_limit, geocode_limit=geocode_limit))
+    return urls
+
+
+def record(urls: List[str], store: FixtureStore, delay: float = 1.1, headers: Optional[Dict] = None):
+    """Fetches each URL once from the live site and stores the response"""
+    session = requests.Session()
+    session.headers.update(headers or {'User-Agent': 'FraternityBase/1.0 (contact@fraternitybase.com)'})
+
+    proxycurl_key = os.getenv('PROXYCURL_API_KEY')
+
+    for index, url in enumerate(urls, 1):
+        if fixture_key(url) in store.manifest:
+            continue
+        auth = {'Authorization': f'Bearer {proxycurl_key}'} if 'proxycurl' in url and proxycurl_key else None
+        try:
+            response = session.get(url, headers=auth, timeout=20)
+            store.put(url, response.status_code, response.headers.get('Content-Type', 'text/html'), response.content)
+            logger.info(f"[{index}/{len(urls)}] {response.status_code} {url} ({len(response.content):,} bytes)")
+        except requests.RequestException as e:
+            logger.warning(f"[{index}/{len(urls)}] failed {url}: {e}")
+        time.sleep(delay)  # Stay polite - Nominatim allows 1 req/sec
+
+    store.save()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Record and serve scraper fixtures")
+    parser.add_argument('--fixtures', default=DEFAULT_FIXTURE_DIR, help='fixture directory')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    record_cmd = commands.add_parser('record', help='record the pages the benchmarks request')
+    record_cmd.add_argument('--instagram-limit', type=int, default=50)
+    record_cmd.add_argument('--geocode-limit', type=int, default=50)
+    record_cmd.add_argument('--delay', type=float, default=1.1, help='seconds between live requests')
+
+    serve_cmd = commands.add_parser('serve', help='serve fixtures locally')
+    serve_cmd.add_argument('--port', type=int, default=8899)
+    serve_cmd.add_argument('--latency', type=float, default=0.0, help='base response delay (s)')
+    serve_cmd.add_argument('--jitter', type=float, default=0.0, help='+/- random delay (s)')
+    serve_cmd.add_argument('--rate-429', type=float, default=0.0, help='fraction of requests answered with 429')
+    serve_cmd.add_argument('--no-synthetic', action='store_true', help='404 instead of synthesizing unrecorded pages')
+
+    args = parser.parse_args()
+    store = FixtureStore(args.fixtures)
+
+    if args.command == 'record':
+        urls = benchmark_urls(args.instagram_limit, args.geocode_limit)
+        if not os.getenv('PROXYCURL_API_KEY'):
+            logger.info("PROXYCURL_API_KEY not set - skipping Proxycurl recordings (synthetic responses will be used)")
+            urls = [url for url in urls if 'proxycurl' not in url]
+        record(urls, store, delay=args.delay)
+        logger.info(f"✓ {len(store.manifest)} fixtures in {args.fixtures}")
+        return
+
+    server = FixtureServer(('127.0.0.1', args.port), store, latency=args.latency, jitter=args.jitter,
+                           rate_429=args.rate_429, synthetic=not args.no_synthetic)
+    logger.info(f"Serving {len(store.manifest)} fixtures on http://127.0.0.1:{server.server_port}/")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
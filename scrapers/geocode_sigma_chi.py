@@ -4,6 +4,7 @@ Geocode Sigma Chi Chapters
 Adds latitude/longitude coordinates to all 240 Sigma Chi chapters
 """
 
+import argparse
 import csv
 import json
 import time
@@ -11,6 +12,12 @@ from typing import Dict, Optional, List
 import requests
 import logging
 
+from profiling import add_profile_arguments, profile_from_args
+from adaptive_throttle import throttle_session
+from circuit_breaker import breaker_session
+from run_metrics import METRICS, instrument_session
+from tracing import TRACER, add_trace_arguments, trace_from_args
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
@@ -24,6 +31,9 @@ class GeocodeService:
         self.session.headers.update({
             'User-Agent': 'FraternityBase/1.0 (contact@fraternitybase.com)'
         })
+        instrument_session(self.session, scraper='geocode')
+        throttle_session(self.session)
+        breaker_session(self.session)
         self.cache = {}
 
     def geocode(self, university: str, city: str, state: str, country: str) -> Optional[Dict]:
@@ -32,55 +42,59 @@ class GeocodeService:
 
         Returns dict with 'lat' and 'lng' or None
         """
-        # Check cache first
-        cache_key = f"{university}|{city}|{state}"
-        if cache_key in self.cache:
-            return self.cache[cache_key]
-
-        # Build query
-        if country == "United States":
-            query = f"{university}, {city}, {state}, USA"
-        elif country == "Canada":
-            query = f"{university}, {city}, {state}, Canada"
-        else:
-            query = f"{university}, {city}, {state}, {country}"
-
-        logger.info(f"Geocoding: {query}")
-
-        try:
-            response = self.session.get(
-                self.base_url,
-                params={
-                    'q': query,
-                    'format': 'json',
-                    'limit': 1
-                },
-                timeout=10
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            if data and len(data) > 0:
-                result = {
-                    'lat': float(data[0]['lat']),
-                    'lng': float(data[0]['lon']),
-                    'display_name': data[0]['display_name']
-                }
-                self.cache[cache_key] = result
-                logger.info(f"  ✓ Found: {result['lat']}, {result['lng']}")
-                return result
+        with TRACER.span('geocode', university=university, city=city, state=state) as span:
+            # Check cache first
+            cache_key = f"{university}|{city}|{state}"
+            span.set_attribute('cache_hit', cache_key in self.cache)
+            if cache_key in self.cache:
+                METRICS.inc('cache_hits_total', scraper='geocode')
+                return self.cache[cache_key]
+
+            # Build query
+            if country == "United States":
+                query = f"{university}, {city}, {state}, USA"
+            elif country == "Canada":
+                query = f"{university}, {city}, {state}, Canada"
             else:
-                logger.warning(f"  ✗ Not found: {query}")
+                query = f"{university}, {city}, {state}, {country}"
+
+            logger.info(f"Geocoding: {query}")
+
+            try:
+                response = self.session.get(
+                    self.base_url,
+                    params={
+                        'q': query,
+                        'format': 'json',
+                        'limit': 1
+                    },
+                    timeout=10
+                )
+                response.raise_for_status()
+                with METRICS.timer('parse_seconds', scraper='geocode'):
+                    data = response.json()
+
+                if data and len(data) > 0:
+                    result = {
+                        'lat': float(data[0]['lat']),
+                        'lng': float(data[0]['lon']),
+                        'display_name': data[0]['display_name']
+                    }
+                    self.cache[cache_key] = result
+                    logger.info(f"  ✓ Found: {result['lat']}, {result['lng']}")
+                    return result
+                else:
+                    METRICS.inc('parse_misses_total', scraper='geocode')
+                    span.set_attribute('found', False)
+                    logger.warning(f"  ✗ Not found: {query}")
+                    return None
+
+            except Exception as e:
+                METRICS.inc('scrape_errors_total', scraper='geocode', error=type(e).__name__)
+                span.set_error(e)
+                logger.error(f"  ✗ Error: {str(e)}")
                 return None
 
-        except Exception as e:
-            logger.error(f"  ✗ Error: {str(e)}")
-            return None
-
-        finally:
-            # Rate limiting - Nominatim requires 1 request per second
-            time.sleep(1.1)
-
 
 def process_sigma_chi_chapters(input_csv: str, output_json: str, output_sql: str):
     """
@@ -106,64 +120,66 @@ def process_sigma_chi_chapters(input_csv: str, output_json: str, output_sql: str
 
     logger.info(f"Processing {len(rows)} chapters...\n")
 
-    for i, row in enumerate(rows, 1):
-        chapter_name = row['chapter_name']
-        university = row['university']
-        city = row['city']
-        state = row['state_province']
-        country = row['country']
-        region = row['region']
-
-        logger.info(f"[{i}/{len(rows)}] {chapter_name} - {university}")
-
-        # Geocode
-        coords = geocoder.geocode(university, city, state, country)
-
-        if coords:
-            chapter = {
-                'chapter_name': chapter_name,
-                'fraternity': 'Sigma Chi',
-                'university': university,
-                'city': city,
-                'state': state,
-                'country': country,
-                'region': region,
-                'latitude': coords['lat'],
-                'longitude': coords['lng'],
-                'full_address': coords['display_name'],
-                'members': None,  # To be filled in later
-                'founded_year': None,
-                'instagram': None,
-                'website': None
-            }
-            chapters.append(chapter)
-        else:
-            failed.append({
-                'chapter_name': chapter_name,
-                'university': university,
-                'city': city,
-                'state': state
-            })
+    with METRICS.stage('geocode'):
+        for i, row in enumerate(rows, 1):
+            chapter_name = row['chapter_name']
+            university = row['university']
+            city = row['city']
+            state = row['state_province']
+            country = row['country']
+            region = row['region']
+
+            logger.info(f"[{i}/{len(rows)}] {chapter_name} - {university}")
+
+            # Geocode
+            coords = geocoder.geocode(university, city, state, country)
+
+            if coords:
+                chapter = {
+                    'chapter_name': chapter_name,
+                    'fraternity': 'Sigma Chi',
+                    'university': university,
+                    'city': city,
+                    'state': state,
+                    'country': country,
+                    'region': region,
+                    'latitude': coords['lat'],
+                    'longitude': coords['lng'],
+                    'full_address': coords['display_name'],
+                    'members': None,  # To be filled in later
+                    'founded_year': None,
+                    'instagram': None,
+                    'website': None
+                }
+                chapters.append(chapter)
+            else:
+                failed.append({
+                    'chapter_name': chapter_name,
+                    'university': university,
+                    'city': city,
+                    'state': state
+                })
 
     # Export to JSON
     logger.info("\n" + "="*80)
     logger.info("EXPORTING RESULTS")
     logger.info("="*80)
 
-    with open(output_json, 'w') as f:
-        json.dump({
-            'total_chapters': len(chapters),
-            'successful': len(chapters),
-            'failed': len(failed),
-            'chapters': chapters,
-            'failed_geocodes': failed
-        }, f, indent=2)
+    with METRICS.stage('export'):
+        with open(output_json, 'w') as f:
+            json.dump({
+                'total_chapters': len(chapters),
+                'successful': len(chapters),
+                'failed': len(failed),
+                'chapters': chapters,
+                'failed_geocodes': failed
+            }, f, indent=2)
 
-    logger.info(f"✓ Saved JSON: {output_json}")
+        logger.info(f"✓ Saved JSON: {output_json}")
 
-    # Export to SQL
-    generate_sql_insert(chapters, output_sql)
-    logger.info(f"✓ Saved SQL: {output_sql}")
+        # Export to SQL
+        generate_sql_insert(chapters, output_sql)
+        logger.info(f"✓ Saved SQL: {output_sql}")
 
     # Print summary
     logger.info("\n" + "="*80)
@@ -233,15 +249,24 @@ def generate_sql_insert(chapters: List[Dict], output_file: str):
 
 def main():
     """Run the geocoding process"""
-    input_csv = '../data/sigma_chi_chapters.csv'
-    output_json = '../data/sigma_chi_geocoded.json'
-    output_sql = '../data/sigma_chi_import.sql'
+    parser = argparse.ArgumentParser(description="Geocode Sigma Chi chapters and export JSON + SQL")
+    parser.add_argument('--input', default='../data/sigma_chi_chapters.csv')
+    parser.add_argument('--output-json', default='../data/sigma_chi_geocoded.json')
+    parser.add_argument('--output-sql', default='../data/sigma_chi_import.sql')
+    add_profile_arguments(parser)
+    add_trace_arguments(parser)
+    args = parser.parse_args()
+
+    input_csv = args.input
+    output_json = args.output_json
+    output_sql = args.output_sql
 
     logger.info("\n🎯 Sigma Chi Chapter Geocoding")
     logger.info("This will take ~5 minutes (1 request per second rate limit)\n")
 
     try:
-        process_sigma_chi_chapters(input_csv, output_json, output_sql)
+        with profile_from_args(args, 'geocode_sigma_chi'), trace_from_args(args, 'geocode_sigma_chi'):
+            process_sigma_chi_chapters(input_csv, output_json, output_sql)
         logger.info("\n✅ SUCCESS! All chapters geocoded and exported.")
         logger.info(f"\nNext steps:")
         logger.info(f"1. Review the JSON file: {output_json}")
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+HTTP Client
+Pooled keep-alive client with retry/backoff shared by the API-backed scrapers
+"""
+
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+import logging
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from circuit_breaker import CircuitOpen
+from run_metrics import METRICS, record_response
+
+try:
+    import httpx
+    import h2  # noqa: F401 - httpx needs it for HTTP/2
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class RateLimiter:
+    """Thread-safe limiter that spaces calls at least min_interval seconds apart"""
+
+    def __init__(self, calls_per_second: float):
+        self.min_interval = 1.0 / calls_per_second if calls_per_second > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self):
+        """Blocks until the caller may issue its next request"""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.min_interval
+        METRICS.sleep(slot - now, reason='rate_limiter')
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parses a Retry-After header (delta-seconds or HTTP-date) into seconds"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class PooledClient:
+    """
+    Keep-alive HTTP client with connection pooling and retries
+
+    Uses httpx with HTTP/2 when httpx and h2 are installed, otherwise a
+    requests.Session with a sized connection pool. Retries connection errors
+    and 429/5xx responses with full-jitter exponential backoff, honoring
+    Retry-After. Errors surface as requests.RequestException either way.
+
+    Every attempt, retry and backoff sleep is recorded in run_metrics.METRICS
+    under the scraper label given by name. With a throttle
+    (adaptive_throttle.AdaptiveThrottle) each attempt also waits for a slot
+    on its host and reports the outcome back. With breakers
+    (circuit_breaker.CircuitBreakers) a host whose breaker is open fails at
+    once with CircuitOpen, which is not retried.
+    """
+
+    def __init__(
+        self,
+        headers: Optional[Dict] = None,
+        pool_size: int = 10,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        rate_limiter: Optional[RateLimiter] = None,
+        http2: bool = True,
+        name: str = 'http',
+        throttle=None,
+        breakers=None
+    ):
+        self.name = name
+        self.throttle = throttle
+        self.breakers = breakers
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.rate_limiter = rate_limiter
+        self.retries = 0
+
+        self.http2 = http2 and HTTP2_AVAILABLE
+        if self.http2:
+            self._client = httpx.Client(
+                http2=True,
+                headers=headers,
+                limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+            )
+        else:
+            self._client = requests.Session()
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            self._client.mount('https://', adapter)
+            self._client.mount('http://', adapter)
+            if headers:
+                self._client.headers.update(headers)
+
+    def _backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        if retry_after is not None:
+            return min(retry_after, self.backoff_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def _send(self, url: str, params: Optional[Dict], headers: Optional[Dict], timeout: float):
+        if self.breakers is None:
+            return self._throttled(url, params, headers, timeout)
+        with self.breakers.guard(url) as call:
+            response = self._throttled(url, params, headers, timeout)
+            call.response(response.status_code)
+            return response
+
+    def _throttled(self, url: str, params: Optional[Dict], headers: Optional[Dict], timeout: float):
+        if self.throttle is None:
+            return self._request(url, params, headers, timeout)
+        with self.throttle.slot(url) as slot:
+            response = self._request(url, params, headers, timeout)
+            slot.record(response.status_code, response.elapsed.total_seconds() if response.elapsed else None,
+                        parse_retry_after(response.headers.get('Retry-After')))
+            return response
+
+    def _request(self, url: str, params: Optional[Dict], headers: Optional[Dict], timeout: float):
+        if not self.http2:
+            return self._client.get(url, params=params, headers=headers, timeout=timeout)
+        try:
+            return self._client.get(url, params=params, headers=headers, timeout=timeout)
+        except httpx.TransportError as e:
+            raise requests.ConnectionError(str(e)) from e
+
+    def get(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        headers: Optional[Dict] = None,
+        timeout: float = 30
+    ):
+        """
+        GETs a URL, retrying transient failures
+
+        Returns:
+            The successful response (requests.Response or httpx.Response)
+
+        Raises:
+            requests.HTTPError: non-retryable status, or retries exhausted
+            requests.RequestException: connection failure after retries
+        """
+        for attempt in range(self.max_retries + 1):
+            if self.rate_limiter:
+                self.rate_limiter.wait()
+
+            last_attempt = attempt == self.max_retries
+            try:
+                response = self._send(url, params, headers, timeout)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                METRICS.inc('http_failures_total', scraper=self.name, error=type(e).__name__)
+                if last_attempt or isinstance(e, CircuitOpen):
+                    raise
+                delay = self._backoff(attempt)
+                reason = type(e).__name__
+                logger.warning(f"Request to {url} failed ({e}), retrying in {delay:.1f}s")
+            else:
+                record_response(response, self.name)
+                if response.status_code < 400:
+                    return response
+                if response.status_code not in RETRY_STATUSES or last_attempt:
+                    raise requests.HTTPError(
+                        f"{response.status_code} error for url: {url}", response=response
+                    )
+                delay = self._backoff(attempt, parse_retry_after(response.headers.get('Retry-After')))
+                reason = str(response.status_code)
+                logger.warning(f"HTTP {response.status_code} from {url}, retrying in {delay:.1f}s")
+
+            self.retries += 1
+            METRICS.inc('http_retries_total', scraper=self.name, reason=reason)
+            METRICS.sleep(delay, scraper=self.name, reason='backoff')
+
+    def close(self):
+        self._client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
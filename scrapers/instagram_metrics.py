@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Instagram Metrics
+Shared follower/following/post count parsing for the Instagram scrapers
+"""
+
+import re
+from typing import Dict, Optional
+
+METRIC_FIELDS = ('followers', 'following', 'posts')
+
+_MULTIPLIERS = {'K': 1_000, 'M': 1_000_000, 'B': 1_000_000_000}
+
+# Leading number with optional thousands separators, decimals and K/M/B suffix.
+# Anything after it ("followers", "posts", ...) is ignored.
+_COUNT_RE = re.compile(r'\s*(\d[\d,]*(?:\.\d+)?)\s*([KMB])?(?![A-Z])', re.IGNORECASE)
+
+# One pass over og:description text or full page source. Embedded JSON counts
+# are exact, so they outrank the rounded "1.2K Followers" text form.
+_METRICS_RE = re.compile(
+    r'"edge_followed_by":\{"count":(?P<followers_json>\d+)\}'
+    r'|"follower_count":(?P<followers_key>\d+)'
+    r'|"edge_follow":\{"count":(?P<following_json>\d+)\}'
+    r'|"following_count":(?P<following_key>\d+)'
+    r'|"edge_owner_to_timeline_media":\{"count":(?P<posts_json>\d+)'
+    r'|"media_count":(?P<posts_key>\d+)'
+    r'|(?P<text_count>\d[\d,]*(?:\.\d+)?[KMB]?)\s+(?P<text_label>followers|following|posts)\b',
+    re.IGNORECASE
+)
+
+_GROUP_RANKS = {
+    'followers_json': ('followers', 0),
+    'followers_key': ('followers', 1),
+    'following_json': ('following', 0),
+    'following_key': ('following', 1),
+    'posts_json': ('posts', 0),
+    'posts_key': ('posts', 1),
+}
+_TEXT_RANK = 2
+
+
+def parse_count(count_str) -> Optional[int]:
+    """
+    Parses follower/following/post counts
+    Examples: "1.5M" -> 1500000, "234K" -> 234000, "1,234 followers" -> 1234
+    """
+    if count_str is None:
+        return None
+    if isinstance(count_str, int):
+        return count_str
+
+    match = _COUNT_RE.match(str(count_str))
+    if not match:
+        return None
+
+    number, suffix = match.groups()
+    value = float(number.replace(',', ''))
+    if suffix:
+        value *= _MULTIPLIERS[suffix.upper()]
+
+    # round() rather than int() so "2.3K" is 2300, not 2299
+    return int(round(value))
+
+
+def extract_counts(text: str) -> Dict[str, Optional[int]]:
+    """
+    Extracts followers/following/posts from page text in a single regex pass
+
+    Accepts og:description content ("1,234 Followers, 567 Following, 89 Posts")
+    or full page source with embedded JSON counts.
+
+    Returns:
+        Dict with 'followers', 'following' and 'posts' keys (None if not found)
+    """
+    counts: Dict[str, Optional[int]] = dict.fromkeys(METRIC_FIELDS)
+    if not text:
+        return counts
+
+    ranks = dict.fromkeys(METRIC_FIELDS, _TEXT_RANK + 1)
+
+    for match in _METRICS_RE.finditer(text):
+        group = match.lastgroup
+        if group == 'text_label':
+            field = match.group('text_label').lower()
+            rank = _TEXT_RANK
+            value = parse_count(match.group('text_count'))
+        else:
+            field, rank = _GROUP_RANKS[group]
+            value = int(match.group(group))
+
+        if rank < ranks[field] and value is not None:
+            counts[field] = value
+            ranks[field] = rank
+            if all(r == 0 for r in ranks.values()):
+                break
+
+    return counts
@@ -8,15 +8,20 @@ import requests
 from bs4 import BeautifulSoup
 import json
 import time
-import re
 from typing import Optional, Dict
 from dataclasses import dataclass, asdict
 import logging
 
+from instagram_metrics import parse_count, extract_counts
+from adaptive_throttle import throttle_session
+from circuit_breaker import breaker_session
+from run_metrics import METRICS, instrument_session
+from tracing import TRACER
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True)
 class InstagramProfile:
     """Instagram profile data"""
     username: str
@@ -53,6 +58,9 @@ class InstagramScraper:
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1'
         })
+        instrument_session(self.session, scraper='instagram')
+        throttle_session(self.session)
+        breaker_session(self.session)
 
     def get_profile_info(self, username: str) -> Optional[InstagramProfile]:
         """
@@ -67,15 +75,22 @@ class InstagramScraper:
         username = username.lstrip('@')
         logger.info(f"Fetching Instagram profile: @{username}")
 
-        try:
-            if self.use_api and self.api_token:
-                return self._get_profile_via_api(username)
-            else:
-                return self._get_profile_via_scraping(username)
+        with TRACER.span('instagram_profile', username=username) as span:
+            try:
+                if self.use_api and self.api_token:
+                    profile = self._get_profile_via_api(username)
+                else:
+                    profile = self._get_profile_via_scraping(username)
+                span.set_attribute('found', profile is not None)
+                if profile and profile.followers is not None:
+                    span.set_attribute('followers', profile.followers)
+                return profile
 
-        except Exception as e:
-            logger.error(f"Error fetching Instagram profile @{username}: {str(e)}")
-            return None
+            except Exception as e:
+                METRICS.inc('scrape_errors_total', scraper='instagram', error=type(e).__name__)
+                span.set_error(e)
+                logger.error(f"Error fetching Instagram profile @{username}: {str(e)}")
+                return None
 
     def _get_profile_via_scraping(self, username: str) -> Optional[InstagramProfile]:
         """
@@ -89,56 +104,53 @@ class InstagramScraper:
         try:
             response = self.session.get(url, timeout=10)
             response.raise_for_status()
+        except requests.RequestException as e:
+            METRICS.inc('scrape_errors_total', scraper='instagram', error=type(e).__name__)
+            logger.error(f"Request failed for @{username}: {str(e)}")
+            return None
 
-            # Instagram embeds data in <script> tags as JSON
-            soup = BeautifulSoup(response.content, 'html.parser')
-
-            # Look for JSON data in script tags
-            scripts = soup.find_all('script', type='application/ld+json')
-
-            for script in scripts:
-                try:
-                    data = json.loads(script.string)
-
-                    if '@type' in data and data['@type'] == 'Person':
-                        profile = InstagramProfile(
-                            username=username,
-                            full_name=data.get('name'),
-                            bio=data.get('description'),
-                            followers=self._parse_count(data.get('interactionStatistic', {}).get('userInteractionCount', '0')),
-                        )
-
-                        logger.info(f"Successfully scraped @{username}: {profile.followers} followers")
-                        return profile
-
-                except json.JSONDecodeError:
-                    continue
-
-            # Fallback: try to extract from meta tags
-            meta_desc = soup.find('meta', property='og:description')
-            if meta_desc:
-                content = meta_desc.get('content', '')
-                # Format: "X Followers, Y Following, Z Posts"
-                followers_match = re.search(r'([\d,\.]+[KMB]?)\s+Followers', content, re.IGNORECASE)
-                following_match = re.search(r'([\d,\.]+[KMB]?)\s+Following', content, re.IGNORECASE)
-                posts_match = re.search(r'([\d,\.]+[KMB]?)\s+Posts', content, re.IGNORECASE)
-
-                profile = InstagramProfile(
-                    username=username,
-                    followers=self._parse_count(followers_match.group(1)) if followers_match else None,
-                    following=self._parse_count(following_match.group(1)) if following_match else None,
-                    posts=self._parse_count(posts_match.group(1)) if posts_match else None,
-                )
-
-                logger.info(f"Successfully scraped @{username}: {profile.followers} followers")
-                return profile
+        with METRICS.timer('parse_seconds', scraper='instagram'):
+            profile = self._parse_profile_html(username, response.content)
 
+        if profile:
+            logger.info(f"Successfully scraped @{username}: {profile.followers} followers")
+        else:
+            METRICS.inc('parse_misses_total', scraper='instagram')
             logger.warning(f"Could not extract data for @{username}")
-            return None
+        return profile
+
+    def _parse_profile_html(self, username: str, content: bytes) -> Optional[InstagramProfile]:
+        """Extracts profile data from ld+json script tags, falling back to og:description"""
+        # Instagram embeds data in <script> tags as JSON
+        soup = BeautifulSoup(content, 'html.parser')
+
+        # Look for JSON data in script tags
+        scripts = soup.find_all('script', type='application/ld+json')
+
+        for script in scripts:
+            try:
+                data = json.loads(script.string)
+
+                if '@type' in data and data['@type'] == 'Person':
+                    return InstagramProfile(
+                        username=username,
+                        full_name=data.get('name'),
+                        bio=data.get('description'),
+                        followers=parse_count(data.get('interactionStatistic', {}).get('userInteractionCount', '0')),
+                    )
+
+            except json.JSONDecodeError:
+                continue
+
+        # Fallback: try to extract from meta tags
+        meta_desc = soup.find('meta', property='og:description')
+        if meta_desc:
+            content = meta_desc.get('content', '')
+            # Format: "X Followers, Y Following, Z Posts"
+            counts = extract_counts(content)
+            return InstagramProfile(username=username, **counts)
 
-        except requests.RequestException as e:
-            logger.error(f"Request failed for @{username}: {str(e)}")
-            return None
+        return None
 
     def _get_profile_via_api(self, username: str) -> Optional[InstagramProfile]:
         """
@@ -153,29 +165,6 @@ class InstagramScraper:
         logger.warning("Instagram Graph API not yet implemented")
         return None
 
-    def _parse_count(self, count_str: str) -> Optional[int]:
-        """
-        Parses follower/following/post counts
-        Examples: "1.5M" -> 1500000, "234K" -> 234000, "1,234" -> 1234
-        """
-        if not count_str:
-            return None
-
-        count_str = str(count_str).strip().replace(',', '')
-
-        # Handle K, M, B suffixes
-        multipliers = {'K': 1000, 'M': 1000000, 'B': 1000000000}
-
-        for suffix, multiplier in multipliers.items():
-            if suffix in count_str.upper():
-                num = float(count_str.upper().replace(suffix, ''))
-                return int(num * multiplier)
-
-        try:
-            return int(float(count_str))
-        except ValueError:
-            return None
-
     def search_instagram_handles(self, chapter_name: str, college_name: str) -> list[str]:
         """
         Attempts to find Instagram handles for a chapter
@@ -239,13 +228,11 @@ class InstagramScraper:
                         results[handle] = profile
                         logger.info(f"✓ Found: @{handle} ({profile.followers} followers)")
                         break
-                    time.sleep(2)  # Rate limiting
             else:
                 profile = self.get_profile_info(instagram)
                 if profile:
                     results[instagram] = profile
                     logger.info(f"✓ Scraped: @{instagram} ({profile.followers} followers)")
-                time.sleep(2)  # Rate limiting
 
         return results
 
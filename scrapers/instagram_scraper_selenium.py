@@ -15,11 +15,12 @@ except ImportError:
     SELENIUM_AVAILABLE = False
 
 import time
-import re
 from typing import Optional
 from dataclasses import dataclass
 import logging
 
+from instagram_metrics import METRIC_FIELDS, parse_count, extract_counts
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
@@ -109,9 +110,9 @@ class InstagramSeleniumScraper:
                                    stats_section[1].find_element(By.CSS_SELECTOR, "span").text
                     following_text = stats_section[2].find_element(By.CSS_SELECTOR, "span").text
 
-                    profile.posts = self._parse_count(posts_text)
-                    profile.followers = self._parse_count(followers_text)
-                    profile.following = self._parse_count(following_text)
+                    profile.posts = parse_count(posts_text)
+                    profile.followers = parse_count(followers_text)
+                    profile.following = parse_count(following_text)
 
                 # Get name and bio
                 try:
@@ -132,18 +133,11 @@ class InstagramSeleniumScraper:
                 # Fallback: Parse from page source
                 page_source = self.driver.page_source
 
-                # Look for follower count in various formats
-                follower_patterns = [
-                    r'"edge_followed_by":\{"count":(\d+)\}',
-                    r'"follower_count":(\d+)',
-                    r'(\d+(?:,\d+)*)\s+followers'
-                ]
-
-                for pattern in follower_patterns:
-                    match = re.search(pattern, page_source, re.IGNORECASE)
-                    if match:
-                        profile.followers = self._parse_count(match.group(1))
-                        break
+                # Embedded JSON counts or "N followers" text, in one pass
+                counts = extract_counts(page_source)
+                for field in METRIC_FIELDS:
+                    if getattr(profile, field) is None:
+                        setattr(profile, field, counts[field])
 
             if profile.followers:
                 logger.info(f"✓ Successfully scraped @{username}: {profile.followers:,} followers")
@@ -156,26 +150,6 @@ class InstagramSeleniumScraper:
             logger.error(f"Error scraping @{username}: {str(e)}")
             return None
 
-    def _parse_count(self, count_str: str) -> Optional[int]:
-        """Parse follower/following/post counts"""
-        if not count_str:
-            return None
-
-        count_str = str(count_str).strip().replace(',', '')
-
-        # Handle K, M, B suffixes
-        multipliers = {'K': 1000, 'M': 1000000, 'B': 1000000000}
-
-        for suffix, multiplier in multipliers.items():
-            if suffix in count_str.upper():
-                num = float(count_str.upper().replace(suffix, ''))
-                return int(num * multiplier)
-
-        try:
-            return int(float(count_str))
-        except ValueError:
-            return None
-
     def batch_scrape(self, usernames: list) -> dict:
         """Scrape multiple Instagram profiles"""
         results = {}
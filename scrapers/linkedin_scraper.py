@@ -12,6 +12,13 @@ from typing import Optional, Dict, List
 from dataclasses import dataclass, asdict
 import logging
 
+from http_client import PooledClient, RateLimiter
+from proxycurl_cache import ResponseCache, BudgetGovernor, BudgetExceeded, COST_PER_PROFILE
+from adaptive_throttle import THROTTLE, throttle_session
+from circuit_breaker import BREAKERS, breaker_session
+from run_metrics import METRICS, instrument_session
+from tracing import TRACER
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
@@ -40,6 +47,14 @@ class LinkedInCompanyPage:
     industry: Optional[str] = None
 
 
+OFFICER_TITLES = ['President', 'VP', 'Vice President', 'Treasurer', 'Chair']
+# Proxycurl's current_role_title filter takes a regex, so one search covers every role
+OFFICER_ROLE_PATTERN = '(?i)(' + '|'.join(OFFICER_TITLES) + ')'
+
+PERSON_SEARCH_URL = "https://nubela.co/proxycurl/api/v2/search/person"
+COMPANY_URL = "https://nubela.co/proxycurl/api/linkedin/company"
+
+
 class LinkedInScraper:
     """
     Scrapes LinkedIn profile information
@@ -56,15 +71,75 @@ class LinkedInScraper:
     This scraper is for educational purposes only.
     """
 
-    def __init__(self, use_api: bool = False, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        use_api: bool = False,
+        api_key: Optional[str] = None,
+        calls_per_second: float = 2.0,
+        cache: Optional[ResponseCache] = None,
+        governor: Optional[BudgetGovernor] = None,
+        max_retries: int = 3
+    ):
         self.use_api = use_api
         self.api_key = api_key
+        self.rate_limiter = RateLimiter(calls_per_second)
+        self.cache = cache
+        self.governor = governor
+
+        # Pooled keep-alive client for Proxycurl (HTTP/2 when httpx + h2 are installed)
+        self.api_client = PooledClient(
+            headers={'Authorization': f'Bearer {api_key}'} if api_key else None,
+            max_retries=max_retries,
+            rate_limiter=self.rate_limiter,
+            name='linkedin',
+            throttle=THROTTLE,
+            breakers=BREAKERS
+        )
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml',
             'Accept-Language': 'en-US,en;q=0.9',
         })
+        instrument_session(self.session, scraper='linkedin')
+        throttle_session(self.session)
+        breaker_session(self.session)
+
+    def _api_get(self, url: str, params: Dict, estimate: float, cost_of) -> Dict:
+        """
+        GETs a Proxycurl endpoint through the response cache and budget governor
+
+        Args:
+            estimate: Worst-case cost reserved before the call
+            cost_of: Callable mapping the JSON body to its actual cost
+
+        Raises:
+            BudgetExceeded: if the call would pass the spend cap
+            requests.RequestException: on HTTP failure
+        """
+        if self.cache:
+            cached = self.cache.get(url, params)
+            if cached is not None:
+                METRICS.inc('cache_hits_total', scraper='linkedin')
+                return cached
+            METRICS.inc('cache_misses_total', scraper='linkedin')
+
+        if self.governor:
+            self.governor.reserve(estimate)
+
+        actual = 0.0
+        try:
+            response = self.api_client.get(url, params=params, timeout=30)
+            with METRICS.timer('parse_seconds', scraper='linkedin'):
+                data = response.json()
+            actual = cost_of(data)
+        finally:
+            if self.governor:
+                self.governor.settle(estimate, actual)
+
+        if self.cache:
+            self.cache.set(url, params, data)
+        return data
 
     def search_profiles_by_fraternity(
         self,
@@ -90,11 +165,32 @@ class LinkedInScraper:
             logger.info("Consider using Proxycurl API: https://nubela.co/proxycurl/")
             return []
 
+    @staticmethod
+    def _search_params(
+        fraternity_name: str,
+        college_name: str,
+        limit: int,
+        keyword: Optional[str] = None,
+        role_title: Optional[str] = None
+    ) -> Dict:
+        """Query params for the Proxycurl People Search API"""
+        params = {
+            'country': 'US',
+            'education_school_name': college_name,
+            'keyword': keyword or fraternity_name,
+            'page_size': limit
+        }
+        if role_title:
+            params['current_role_title'] = role_title
+        return params
+
     def _search_via_api(
         self,
         fraternity_name: str,
         college_name: str,
-        limit: int
+        limit: int,
+        keyword: Optional[str] = None,
+        role_title: Optional[str] = None
     ) -> List[LinkedInProfile]:
         """
         Search LinkedIn profiles via Proxycurl API
@@ -103,29 +199,24 @@ class LinkedInScraper:
         - People Search API: Find profiles by fraternity + school
         - Profile Lookup: Get detailed profile data
         - Cost: ~$0.01 per profile
+
+        Args:
+            keyword: Search keyword (defaults to the fraternity name)
+            role_title: Regex on the current role title (current_role_title)
         """
         if not self.api_key:
             logger.error("API key required for LinkedIn data")
             return []
 
-        # Proxycurl People Search API endpoint
-        url = "https://nubela.co/proxycurl/api/v2/search/person"
-
-        headers = {
-            'Authorization': f'Bearer {self.api_key}'
-        }
-
-        params = {
-            'country': 'US',
-            'education_school_name': college_name,
-            'keyword': fraternity_name,
-            'page_size': limit
-        }
+        params = self._search_params(fraternity_name, college_name, limit, keyword, role_title)
 
         try:
-            response = requests.get(url, headers=headers, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            data = self._api_get(
+                PERSON_SEARCH_URL,
+                params,
+                estimate=limit * COST_PER_PROFILE,
+                cost_of=lambda body: max(1, len(body.get('results', []))) * COST_PER_PROFILE
+            )
 
             profiles = []
             for result in data.get('results', []):
@@ -145,6 +236,7 @@ class LinkedInScraper:
             return profiles
 
         except requests.RequestException as e:
+            METRICS.inc('scrape_errors_total', scraper='linkedin', error=type(e).__name__)
             logger.error(f"API request failed: {str(e)}")
             return []
 
@@ -169,14 +261,15 @@ class LinkedInScraper:
         if not self.api_key:
             return None
 
-        url = "https://nubela.co/proxycurl/api/linkedin/company"
-        headers = {'Authorization': f'Bearer {self.api_key}'}
         params = {'url': company_url}
 
         try:
-            response = requests.get(url, headers=headers, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            data = self._api_get(
+                COMPANY_URL,
+                params,
+                estimate=COST_PER_PROFILE,
+                cost_of=lambda body: COST_PER_PROFILE
+            )
 
             company = LinkedInCompanyPage(
                 name=data.get('name', ''),
@@ -192,13 +285,15 @@ class LinkedInScraper:
             return company
 
         except requests.RequestException as e:
+            METRICS.inc('scrape_errors_total', scraper='linkedin', error=type(e).__name__)
             logger.error(f"Failed to fetch company page: {str(e)}")
             return None
 
     def find_chapter_officers(
         self,
         fraternity_name: str,
-        college_name: str
+        college_name: str,
+        limit: int = 10
     ) -> List[LinkedInProfile]:
         """
         Finds current/recent officers of a fraternity chapter
@@ -207,26 +302,63 @@ class LinkedInScraper:
         - President, Sigma Chi
         - Vice President, Sigma Chi at USC
         - Treasurer, Sigma Chi Fraternity
+
+        All officer roles go into one paid search (current_role_title matches
+        any of OFFICER_TITLES), so a chapter costs one search, not one per role.
+        Profiles are deduplicated by profile_url.
         """
-        search_queries = [
-            f"President {fraternity_name} {college_name}",
-            f"Vice President {fraternity_name} {college_name}",
-            f"Treasurer {fraternity_name} {college_name}",
-            f"Social Chair {fraternity_name} {college_name}",
-        ]
+        profiles = self._search_via_api(
+            fraternity_name, college_name, limit, role_title=OFFICER_ROLE_PATTERN
+        )
 
         all_officers = []
-
-        for query in search_queries:
-            profiles = self._search_via_api(fraternity_name, college_name, limit=10)
+        seen = set()
+        for profile in profiles:
             # Filter for officer titles
-            officers = [p for p in profiles if p.headline and any(
-                title in p.headline for title in ['President', 'VP', 'Vice President', 'Treasurer', 'Chair']
-            )]
-            all_officers.extend(officers)
+            if not (profile.headline and any(title in profile.headline for title in OFFICER_TITLES)):
+                continue
+            key = profile.profile_url or profile.name
+            if key in seen:
+                continue
+            seen.add(key)
+            all_officers.append(profile)
 
         return all_officers
 
+    @classmethod
+    def _officer_search_params(cls, fraternity_name: str, college_name: str, limit: int = 10) -> Dict:
+        """Query params of the single officer search for a chapter"""
+        return cls._search_params(fraternity_name, college_name, limit, role_title=OFFICER_ROLE_PATTERN)
+
+    def is_chapter_cached(self, chapter_name: str, college_name: str, find_officers: bool = True) -> bool:
+        """True if every search for this chapter can be served from the cache"""
+        if not self.cache:
+            return False
+
+        if find_officers:
+            searches = [self._officer_search_params(chapter_name, college_name)]
+        else:
+            searches = [self._search_params(chapter_name, college_name, 50)]
+
+        return all(self.cache.contains(PERSON_SEARCH_URL, params) for params in searches)
+
+    def prioritize_chapters(self, chapters: List[Dict], find_officers: bool = True) -> List[Dict]:
+        """
+        Orders chapters so the budget goes where it is worth most
+
+        Fully cached chapters come first (they are free), then uncached
+        chapters by Instagram following, largest first.
+        """
+        def value(chapter):
+            cached = self.is_chapter_cached(
+                chapter.get('name', ''),
+                chapter.get('college') or chapter.get('college_name', ''),
+                find_officers
+            )
+            return (not cached, -(chapter.get('instagram_followers') or 0))
+
+        return sorted(chapters, key=value)
+
     def batch_scrape_chapters(
         self,
         chapters: List[Dict],
@@ -241,27 +373,47 @@ class LinkedInScraper:
 
         Returns:
             Dictionary mapping chapter key to list of profiles
+
+        With a budget governor, chapters are visited in prioritize_chapters()
+        order and the run stops cleanly once the spend cap is reached.
         """
         results = {}
 
-        for chapter in chapters:
+        if self.cache or self.governor:
+            chapters = self.prioritize_chapters(chapters, find_officers)
+
+        for index, chapter in enumerate(chapters):
             chapter_name = chapter.get('name', '')
-            college_name = chapter.get('college', '')
+            college_name = chapter.get('college') or chapter.get('college_name', '')
             key = f"{chapter_name}_{college_name}"
 
             logger.info(f"\n{'='*60}")
             logger.info(f"Scraping LinkedIn for: {chapter_name} at {college_name}")
             logger.info(f"{'='*60}")
 
-            if find_officers:
-                profiles = self.find_chapter_officers(chapter_name, college_name)
-            else:
-                profiles = self.search_profiles_by_fraternity(chapter_name, college_name, limit=50)
+            cached = self.is_chapter_cached(chapter_name, college_name, find_officers)
+
+            try:
+                with TRACER.span('linkedin_chapter', chapter=chapter_name, college=college_name,
+                                 cache_hit=cached) as span:
+                    if find_officers:
+                        profiles = self.find_chapter_officers(chapter_name, college_name)
+                    else:
+                        profiles = self.search_profiles_by_fraternity(chapter_name, college_name, limit=50)
+                    span.set_attribute('profiles', len(profiles))
+            except BudgetExceeded as e:
+                METRICS.inc('budget_stops_total', scraper='linkedin')
+                logger.warning(f"{e} - stopping with {len(chapters) - index} chapters left")
+                break
 
             results[key] = profiles
-            logger.info(f"Found {len(profiles)} profiles")
+            logger.info(f"Found {len(profiles)} profiles{' (cached)' if cached else ''}")
 
-            time.sleep(2)  # Rate limiting
+        if self.governor:
+            logger.info(
+                f"Proxycurl spend this run: ${self.governor.run_spent:.2f} "
+                f"over {self.governor.calls} paid calls"
+            )
 
         return results
 
@@ -277,10 +429,22 @@ class ProxycurlLinkedInScraper(LinkedInScraper):
     - Real-time data
     - No risk of account suspension
     - Includes email finder API
+
+    Responses are cached on disk by default, so repeat runs are nearly free.
     """
 
-    def __init__(self, api_key: str):
-        super().__init__(use_api=True, api_key=api_key)
+    def __init__(
+        self,
+        api_key: str,
+        cache: Optional[ResponseCache] = None,
+        governor: Optional[BudgetGovernor] = None
+    ):
+        super().__init__(
+            use_api=True,
+            api_key=api_key,
+            cache=cache or ResponseCache(),
+            governor=governor
+        )
 
 
 def main():
@@ -4,15 +4,25 @@ Master Scraper
 Orchestrates college, Instagram, and LinkedIn scrapers to build complete database
 """
 
+import argparse
 import json
 import time
-from typing import Dict, List
+from typing import Dict, List, Optional
 import logging
 from datetime import datetime
 
+from dataclasses import asdict
+
+from adaptive_throttle import THROTTLE
+from chapter_table import ChapterTable
+from circuit_breaker import BREAKERS, log_open_circuits
 from college_scraper import CollegeScraper
 from instagram_scraper import InstagramScraper
 from linkedin_scraper import LinkedInScraper
+from proxycurl_cache import ResponseCache, BudgetGovernor, DEFAULT_TTL_DAYS
+from profiling import add_profile_arguments, profile_from_args
+from run_metrics import METRICS
+from tracing import add_trace_arguments, trace_from_args
 import os
 
 logging.basicConfig(
@@ -35,18 +45,44 @@ class MasterScraper:
     2. Instagram Scraper → Get follower counts
     3. LinkedIn Scraper → Get member profiles
     4. Export → JSON + SQL for database import
+
+    Chapters live in a columnar ChapterTable (self.chapters, also
+    results['chapters']); later stages read and update it through row views.
+
+    Each stage is timed into run_metrics.METRICS and the run ends with a JSON
+    report (and optionally a Prometheus textfile) of per-stage metrics.
     """
 
-    def __init__(self, proxycurl_api_key: Optional[str] = None):
+    def __init__(
+        self,
+        proxycurl_api_key: Optional[str] = None,
+        proxycurl_run_budget: Optional[float] = None,
+        proxycurl_daily_budget: Optional[float] = None,
+        proxycurl_cache_ttl_days: float = DEFAULT_TTL_DAYS
+    ):
         self.college_scraper = CollegeScraper()
         self.instagram_scraper = InstagramScraper()
+
+        # Cache + spend caps for paid Proxycurl calls
+        cache = governor = None
+        if proxycurl_api_key:
+            cache = ResponseCache(ttl_seconds=proxycurl_cache_ttl_days * 86400)
+            governor = BudgetGovernor(
+                cache,
+                run_cap=proxycurl_run_budget,
+                daily_cap=proxycurl_daily_budget
+            )
+
         self.linkedin_scraper = LinkedInScraper(
             use_api=bool(proxycurl_api_key),
-            api_key=proxycurl_api_key
+            api_key=proxycurl_api_key,
+            cache=cache,
+            governor=governor
         )
+        self.chapters = ChapterTable()
         self.results = {
             'colleges': [],
-            'chapters': [],
+            'chapters': self.chapters,
             'instagram_profiles': {},
             'linkedin_profiles': {},
             'scraped_at': datetime.now().isoformat()
@@ -57,7 +93,8 @@ class MasterScraper:
         scrape_colleges: bool = True,
         scrape_instagram: bool = True,
         scrape_linkedin: bool = False,  # Off by default (requires API key)
-        output_dir: str = '../data/scraped'
+        output_dir: str = '../data/scraped',
+        metrics_textfile: Optional[str] = None
     ):
         """
         Runs complete scraping pipeline
@@ -66,8 +103,11 @@ class MasterScraper:
             scrape_colleges: Scrape college Greek life pages
             scrape_instagram: Scrape Instagram follower data
             scrape_linkedin: Scrape LinkedIn profiles (requires API)
-            output_dir: Directory to save results
+            output_dir: Directory to save results (and the run report)
+            metrics_textfile: Also write metrics in Prometheus text format here
         """
+        METRICS.reset()
+
         logger.info("\n" + "="*80)
         logger.info("STARTING MASTER SCRAPER PIPELINE")
         logger.info("="*80 + "\n")
@@ -76,73 +116,72 @@ class MasterScraper:
         if scrape_colleges:
             logger.info("\n📚 STEP 1: Scraping College Greek Life Pages")
             logger.info("-" * 80)
-            self._scrape_colleges()
+            with METRICS.stage('colleges'):
+                self._scrape_colleges()
 
         # STEP 2: Scrape Instagram Data
-        if scrape_instagram and self.results['chapters']:
+        if scrape_instagram and self.chapters:
             logger.info("\n📸 STEP 2: Scraping Instagram Profiles")
             logger.info("-" * 80)
-            self._scrape_instagram()
+            with METRICS.stage('instagram'):
+                self._scrape_instagram()
 
         # STEP 3: Scrape LinkedIn Profiles
-        if scrape_linkedin and self.results['chapters']:
+        if scrape_linkedin and self.chapters:
             logger.info("\n💼 STEP 3: Scraping LinkedIn Profiles")
             logger.info("-" * 80)
-            self._scrape_linkedin()
+            with METRICS.stage('linkedin'):
+                self._scrape_linkedin()
 
         # STEP 4: Export Results
         logger.info("\n💾 STEP 4: Exporting Results")
         logger.info("-" * 80)
-        self._export_results(output_dir)
+        with METRICS.stage('export'):
+            self._export_results(output_dir)
 
         logger.info("\n" + "="*80)
         logger.info("✅ SCRAPING PIPELINE COMPLETE")
         logger.info("="*80 + "\n")
 
         self._print_summary()
+        self._write_run_report(output_dir, metrics_textfile)
 
     def _scrape_colleges(self):
         """Scrape college Greek life pages"""
-        colleges_data = self.college_scraper.scrape_all_d1_schools()
-
-        for college in colleges_data:
-            self.results['colleges'].append(college)
-
-            # Flatten chapters into separate list
-            for frat in college.get('fraternities', []):
-                frat['college_name'] = college['name']
-                frat['college_state'] = college['state']
-                frat['chapter_type'] = 'fraternity'
-                self.results['chapters'].append(frat)
-
-            for sorority in college.get('sororities', []):
-                sorority['college_name'] = college['name']
-                sorority['college_state'] = college['state']
-                sorority['chapter_type'] = 'sorority'
-                self.results['chapters'].append(sorority)
+        for college in self.college_scraper.scrape_d1_schools():
+            # Chapters go into the table only; colleges keep counts, not copies
+            self.results['colleges'].append({
+                'name': college.name,
+                'state': college.state,
+                'city': college.city,
+                'division': college.division,
+                'greek_life_url': college.greek_life_url,
+                'total_students': college.total_students,
+                'greek_population': college.greek_population,
+                'fraternity_count': len(college.fraternities),
+                'sorority_count': len(college.sororities),
+            })
+            self.chapters.add_college(college)
 
         logger.info(f"✓ Scraped {len(self.results['colleges'])} colleges")
-        logger.info(f"✓ Found {len(self.results['chapters'])} total chapters")
+        logger.info(f"✓ Found {len(self.chapters)} total chapters")
 
     def _scrape_instagram(self):
         """Scrape Instagram data for chapters"""
-        chapters_with_instagram = [
-            ch for ch in self.results['chapters']
-            if ch.get('instagram')
-        ]
+        chapters_with_instagram = self.chapters.with_value('instagram')
 
         logger.info(f"Scraping Instagram for {len(chapters_with_instagram)} chapters...")
 
         instagram_data = self.instagram_scraper.batch_scrape_chapters(chapters_with_instagram)
         self.results['instagram_profiles'] = {
-            username: profile.__dict__
+            username: asdict(profile)
             for username, profile in instagram_data.items()
         }
 
-        # Update chapters with follower counts
-        for chapter in self.results['chapters']:
-            instagram_handle = chapter.get('instagram')
-            if instagram_handle and instagram_handle in instagram_data:
+        # Update chapters with follower counts (views write through to the table)
+        for chapter in chapters_with_instagram:
+            instagram_handle = chapter['instagram']
+            if instagram_handle in instagram_data:
                 chapter['instagram_followers'] = instagram_data[instagram_handle].followers
                 chapter['instagram_posts'] = instagram_data[instagram_handle].posts
 
@@ -150,15 +189,15 @@ class MasterScraper:
 
     def _scrape_linkedin(self):
         """Scrape LinkedIn profiles"""
-        logger.info(f"Scraping LinkedIn for {len(self.results['chapters'])} chapters...")
+        logger.info(f"Scraping LinkedIn for {len(self.chapters)} chapters...")
 
         linkedin_data = self.linkedin_scraper.batch_scrape_chapters(
-            self.results['chapters'],
+            list(self.chapters),
             find_officers=True
         )
 
         self.results['linkedin_profiles'] = {
-            key: [profile.__dict__ for profile in profiles]
+            key: [asdict(profile) for profile in profiles]
             for key, profiles in linkedin_data.items()
         }
 
@@ -174,20 +213,40 @@ class MasterScraper:
 
         # Export to JSON
         json_file = f"{output_dir}/greek_life_data_{timestamp}.json"
-        with open(json_file, 'w') as f:
-            json.dump(self.results, f, indent=2, default=str)
+        with METRICS.timer('export_seconds', format='json'):
+            self._generate_json(json_file)
+        self._record_export(json_file, 'json')
         logger.info(f"✓ Exported JSON: {json_file}")
 
         # Export to SQL
         sql_file = f"{output_dir}/greek_life_import_{timestamp}.sql"
-        self._generate_sql_import(sql_file)
+        with METRICS.timer('export_seconds', format='sql'):
+            self._generate_sql_import(sql_file)
+        self._record_export(sql_file, 'sql')
         logger.info(f"✓ Exported SQL: {sql_file}")
 
         # Export summary CSV
         csv_file = f"{output_dir}/chapters_summary_{timestamp}.csv"
-        self._generate_csv_summary(csv_file)
+        with METRICS.timer('export_seconds', format='csv'):
+            self._generate_csv_summary(csv_file)
+        self._record_export(csv_file, 'csv')
         logger.info(f"✓ Exported CSV: {csv_file}")
 
+    def _record_export(self, filename: str, export_format: str):
+        METRICS.inc('export_bytes_total', os.path.getsize(filename), format=export_format)
+        METRICS.inc('export_files_total', format=export_format)
+
+    def _generate_json(self, filename: str):
+        """Write results as JSON, streaming chapters row by row from the table"""
+        with open(filename, 'w') as f:
+            f.write("{\n")
+            for key in ('scraped_at', 'colleges', 'instagram_profiles', 'linkedin_profiles'):
+                f.write(f"  {json.dumps(key)}: {json.dumps(self.results[key], default=str)},\n")
+            f.write('  "chapters": [')
+            for index, record in enumerate(self.chapters.records()):
+                f.write(("\n    " if index == 0 else ",\n    ") + json.dumps(record, default=str))
+            f.write("\n  ]\n}\n")
+
     def _generate_sql_import(self, filename: str):
         """Generate SQL INSERT statements"""
         with open(filename, 'w') as f:
@@ -203,44 +262,40 @@ class MasterScraper:
                 )
 
             f.write("\n-- Insert Chapters\n")
-            for chapter in self.results['chapters']:
-                name = chapter['name'].replace("'", "''")  # Escape quotes
-                college = chapter['college_name'].replace("'", "''")
+            rows = self.chapters.rows('name', 'college_name', 'chapter_type', 'instagram', 'instagram_followers')
+            for name, college, chapter_type, instagram, followers in rows:
+                name = name.replace("'", "''")  # Escape quotes
+                college = college.replace("'", "''")
                 f.write(
                     f"INSERT INTO fraternity_data.chapters (name, college, chapter_type, instagram, instagram_followers) "
-                    f"VALUES ('{name}', '{college}', '{chapter['chapter_type']}', '{chapter.get('instagram', '')}', {chapter.get('instagram_followers', 0)});\n"
+                    f"VALUES ('{name}', '{college}', '{chapter_type}', '{instagram or ''}', {followers or 0});\n"
                 )
 
-        logger.info(f"Generated SQL import file with {len(self.results['chapters'])} chapters")
+        logger.info(f"Generated SQL import file with {len(self.chapters)} chapters")
 
     def _generate_csv_summary(self, filename: str):
         """Generate CSV summary of chapters"""
         import csv
 
         with open(filename, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=[
+            writer = csv.writer(f)
+            writer.writerow([
                 'name', 'college', 'state', 'chapter_type',
                 'instagram', 'instagram_followers', 'website'
             ])
-            writer.writeheader()
-
-            for chapter in self.results['chapters']:
-                writer.writerow({
-                    'name': chapter.get('name', ''),
-                    'college': chapter.get('college_name', ''),
-                    'state': chapter.get('college_state', ''),
-                    'chapter_type': chapter.get('chapter_type', ''),
-                    'instagram': chapter.get('instagram', ''),
-                    'instagram_followers': chapter.get('instagram_followers', ''),
-                    'website': chapter.get('website', '')
-                })
+
+            # None becomes '' as before; csv.writer does that itself
+            writer.writerows(self.chapters.rows(
+                'name', 'college_name', 'college_state', 'chapter_type',
+                'instagram', 'instagram_followers', 'website'
+            ))
 
     def _print_summary(self):
         """Print scraping summary"""
         logger.info("\n📊 SCRAPING SUMMARY")
         logger.info("="*60)
         logger.info(f"Colleges Scraped: {len(self.results['colleges'])}")
-        logger.info(f"Chapters Found: {len(self.results['chapters'])}")
+        logger.info(f"Chapters Found: {len(self.chapters)}")
         logger.info(f"Instagram Profiles: {len(self.results['instagram_profiles'])}")
 
         linkedin_count = sum(
@@ -249,17 +304,52 @@ class MasterScraper:
         logger.info(f"LinkedIn Profiles: {linkedin_count}")
 
         # Count by type
-        fraternities = len([ch for ch in self.results['chapters'] if ch['chapter_type'] == 'fraternity'])
-        sororities = len([ch for ch in self.results['chapters'] if ch['chapter_type'] == 'sorority'])
+        fraternities = self.chapters.count('chapter_type', 'fraternity')
+        sororities = self.chapters.count('chapter_type', 'sorority')
         logger.info(f"  - Fraternities: {fraternities}")
         logger.info(f"  - Sororities: {sororities}")
 
         # Instagram stats
-        chapters_with_ig = len([ch for ch in self.results['chapters'] if ch.get('instagram_followers')])
+        chapters_with_ig = sum(1 for followers in self.chapters.column('instagram_followers') if followers)
         logger.info(f"Chapters with Instagram data: {chapters_with_ig}")
 
+        # Where the time went, per stage
+        for stage in METRICS.stages:
+            logger.info(
+                f"⏱  {stage['stage']}: {stage['wall_seconds']:.1f}s wall "
+                f"(network {stage['network_seconds']:.1f}s, parse {stage['parse_seconds']:.1f}s, "
+                f"sleep {stage['sleep_seconds']:.1f}s, {stage['requests']} requests)"
+            )
+        logger.info(
+            f"Requests: {METRICS.total('http_requests_total'):.0f}, "
+            f"retries: {METRICS.total('http_retries_total'):.0f}, "
+            f"errors: {METRICS.total('scrape_errors_total'):.0f}, "
+            f"downloaded: {METRICS.total('http_response_bytes_total') / 1e6:.1f} MB"
+        )
+        log_open_circuits()
+
         logger.info("="*60)
 
+    def _write_run_report(self, output_dir: str, metrics_textfile: Optional[str] = None):
+        """Write the run's metrics as JSON (and optionally a Prometheus textfile)"""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        report_file = METRICS.write_json(
+            f"{output_dir}/run_report_{timestamp}.json",
+            extra={'hosts': THROTTLE.snapshot(), 'open_hosts': BREAKERS.report(), 'results': {
+                'colleges': len(self.results['colleges']),
+                'chapters': len(self.chapters),
+                'instagram_profiles': len(self.results['instagram_profiles']),
+                'linkedin_profiles': sum(
+                    len(profiles) for profiles in self.results['linkedin_profiles'].values()
+                ),
+            }}
+        )
+        logger.info(f"✓ Run report: {report_file}")
+
+        if metrics_textfile:
+            METRICS.write_prometheus(metrics_textfile)
+            logger.info(f"✓ Prometheus metrics: {metrics_textfile}")
+
 
 def main():
     """
@@ -267,19 +357,41 @@ def main():
 
     Usage:
         python master_scraper.py
+        python master_scraper.py --profile             # cProfile + tracemalloc per stage
+        python master_scraper.py --profile sampling    # pyinstrument, if installed
+        python master_scraper.py --trace trace.json    # spans as OTLP/JSON
+
+    Set SCRAPER_METRICS_TEXTFILE to also write Prometheus metrics, e.g. into
+    node_exporter's textfile collector directory.
     """
-    # Get API key from environment
-    proxycurl_key = os.getenv('PROXYCURL_API_KEY')
+    parser = argparse.ArgumentParser(description="Run the college → Instagram → LinkedIn scraping pipeline")
+    parser.add_argument('--output-dir', default='../data/scraped')
+    add_profile_arguments(parser)
+    add_trace_arguments(parser)
+    args = parser.parse_args()
 
-    scraper = MasterScraper(proxycurl_api_key=proxycurl_key)
+    # Get API key and optional spend caps (USD) from environment
+    proxycurl_key = os.getenv('PROXYCURL_API_KEY')
+    run_budget = os.getenv('PROXYCURL_RUN_BUDGET')
+    daily_budget = os.getenv('PROXYCURL_DAILY_BUDGET')
+    cache_ttl_days = os.getenv('PROXYCURL_CACHE_TTL_DAYS')
+
+    scraper = MasterScraper(
+        proxycurl_api_key=proxycurl_key,
+        proxycurl_run_budget=float(run_budget) if run_budget else None,
+        proxycurl_daily_budget=float(daily_budget) if daily_budget else None,
+        proxycurl_cache_ttl_days=float(cache_ttl_days) if cache_ttl_days else DEFAULT_TTL_DAYS
+    )
 
     # Run pipeline
-    scraper.run_full_pipeline(
-        scrape_colleges=True,
-        scrape_instagram=True,
-        scrape_linkedin=bool(proxycurl_key),  # Only if API key provided
-        output_dir='../data/scraped'
-    )
+    with profile_from_args(args, 'master_scraper'), trace_from_args(args, 'master_scraper'):
+        scraper.run_full_pipeline(
+            scrape_colleges=True,
+            scrape_instagram=True,
+            scrape_linkedin=bool(proxycurl_key),  # Only if API key provided
+            output_dir=args.output_dir,
+            metrics_textfile=os.getenv('SCRAPER_METRICS_TEXTFILE')
+        )
 
 
 if __name__ == '__main__':
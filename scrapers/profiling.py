@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Profiling
+One-flag CPU and memory profiling for the pipeline entry points
+
+    with RunProfiler('master_scraper'):
+        scraper.run_full_pipeline()
+
+Writes to a run directory (profiles/<name>_<timestamp>/ by default):
+    profile.prof    cProfile stats, for snakeviz / pstats
+    profile.txt     pstats listing by cumulative and own time
+    profile.html    pyinstrument call tree (sampling mode)
+    summary.json    top functions plus tracemalloc top allocations per stage
+
+Stages come from run_metrics.METRICS.stage(); memory is also reported for
+the run as a whole. cProfile and pyinstrument only see the thread that
+entered the profiler, not ThreadPoolExecutor workers.
+
+CLI entry points use add_profile_arguments() and profile_from_args().
+"""
+
+import cProfile
+import io
+import json
+import logging
+import os
+import pstats
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from run_metrics import METRICS
+
+try:
+    from pyinstrument import Profiler as SamplingProfiler
+    PYINSTRUMENT_AVAILABLE = True
+except ImportError:
+    PYINSTRUMENT_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROFILE_DIR = 'profiles'
+PROFILE_MODES = ('cprofile', 'sampling')
+
+
+def top_functions(stats: pstats.Stats, sort: str = 'cumulative', limit: int = 25) -> List[Dict]:
+    """The top rows of a pstats table as dicts"""
+    key = {'cumulative': 3, 'tottime': 2}[sort]
+    rows = sorted(stats.stats.items(), key=lambda item: item[1][key], reverse=True)[:limit]
+    return [
+        {
+            'function': f"{os.path.basename(filename)}:{line}({name})",
+            'calls': calls,
+            'own_seconds': round(own, 4),
+            'cumulative_seconds': round(cumulative, 4),
+        }
+        for (filename, line, name), (_, calls, own, cumulative, _) in rows
+    ]
+
+
+def top_allocations(after: tracemalloc.Snapshot, before: Optional[tracemalloc.Snapshot] = None,
+                    limit: int = 15) -> List[Dict]:
+    """Allocation sites that grew the most (or the largest live ones, without a baseline)"""
+    if before is None:
+        stats = after.statistics('lineno')[:limit]
+        return [
+            {'site': str(stat.traceback[0]), 'size_kb': round(stat.size / 1024, 1), 'count': stat.count}
+            for stat in stats
+        ]
+    stats = after.compare_to(before, 'lineno')[:limit]
+    return [
+        {
+            'site': str(stat.traceback[0]),
+            'size_kb': round(stat.size / 1024, 1),
+            'size_diff_kb': round(stat.size_diff / 1024, 1),
+            'count_diff': stat.count_diff,
+        }
+        for stat in stats
+    ]
+
+
+def _snapshot() -> tracemalloc.Snapshot:
+    # Leave out tracemalloc's and the import machinery's own allocations
+    return tracemalloc.take_snapshot().filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+        tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+    ))
+
+
+class RunProfiler:
+    """
+    Context manager that profiles a run into a run directory
+
+    Args:
+        name: Prefix for the run directory
+        mode: 'cprofile', or 'sampling' for pyinstrument (falls back to cProfile if not installed)
+        run_dir: Output directory (default profiles/<name>_<timestamp>)
+        memory: Track allocations with tracemalloc (slows the run noticeably)
+        top: Rows kept per table in the summary
+    """
+
+    def __init__(self, name: str, mode: str = 'cprofile', run_dir: Optional[str] = None,
+                 memory: bool = True, top: int = 25, trace_frames: int = 1):
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Unknown profile mode {mode!r}, expected one of {PROFILE_MODES}")
+        if mode == 'sampling' and not PYINSTRUMENT_AVAILABLE:
+            logger.warning("pyinstrument not installed (pip install pyinstrument), using cProfile")
+            mode = 'cprofile'
+
+        self.name = name
+        self.mode = mode
+        self.run_dir = run_dir or os.path.join(
+            DEFAULT_PROFILE_DIR, f"{name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        )
+        self.memory = memory
+        self.top = top
+        self.trace_frames = trace_frames
+        self.stages: List[Dict] = []
+        self._stage_snapshots: Dict[str, tracemalloc.Snapshot] = {}
+        self._profiler = None
+        self._started_tracemalloc = False
+
+    # -- run_metrics stage listener -------------------------------------------
+
+    @contextmanager
+    def _paused(self):
+        """Keeps the snapshot bookkeeping out of the CPU profile"""
+        if self.mode == 'cprofile' and self._profiler:
+            self._profiler.disable()
+            try:
+                yield
+            finally:
+                self._profiler.enable()
+        else:
+            yield
+
+    def stage_started(self, name: str):
+        if self.memory:
+            with self._paused():
+                self._stage_snapshots[name] = _snapshot()
+                tracemalloc.reset_peak()
+
+    def stage_finished(self, name: str, entry: Dict):
+        stage = {'stage': name, 'wall_seconds': entry['wall_seconds'], 'cpu_seconds': entry['cpu_seconds']}
+        before = self._stage_snapshots.pop(name, None)
+        if self.memory and before is not None:
+            with self._paused():
+                current, peak = tracemalloc.get_traced_memory()
+                stage['traced_current_mb'] = round(current / 1e6, 2)
+                stage['traced_peak_mb'] = round(peak / 1e6, 2)
+                stage['top_allocations'] = top_allocations(_snapshot(), before, limit=self.top)
+        self.stages.append(stage)
+
+    # -- context manager ------------------------------------------------------
+
+    def __enter__(self) -> 'RunProfiler':
+        os.makedirs(self.run_dir, exist_ok=True)
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start(self.trace_frames)
+            self._started_tracemalloc = True
+        METRICS.add_stage_listener(self)
+
+        if self.mode == 'sampling':
+            self._profiler = SamplingProfiler()
+            self._profiler.start()
+        else:
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self.mode == 'sampling':
+            self._profiler.stop()
+        else:
+            self._profiler.disable()
+        METRICS.remove_stage_listener(self)
+
+        try:
+            self._write_outputs()
+        finally:
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+
+    def _write_outputs(self):
+        summary = {
+            'name': self.name,
+            'mode': self.mode,
+            'finished_at': datetime.now().isoformat(),
+            'stages': self.stages,
+        }
+
+        if self.mode == 'sampling':
+            with open(os.path.join(self.run_dir, 'profile.html'), 'w') as f:
+                f.write(self._profiler.output_html())
+            with open(os.path.join(self.run_dir, 'profile.txt'), 'w') as f:
+                f.write(self._profiler.output_text(unicode=True, color=False))
+            summary['profile_duration_seconds'] = round(self._profiler.last_session.duration, 3)
+        else:
+            self._profiler.dump_stats(os.path.join(self.run_dir, 'profile.prof'))
+            listing = io.StringIO()
+            stats = pstats.Stats(self._profiler, stream=listing)
+            stats.sort_stats('cumulative').print_stats(self.top)
+            stats.sort_stats('tottime').print_stats(self.top)
+            with open(os.path.join(self.run_dir, 'profile.txt'), 'w') as f:
+                f.write(listing.getvalue())
+            summary['total_seconds'] = round(stats.total_tt, 3)
+            summary['top_cumulative'] = top_functions(stats, 'cumulative', self.top)
+            summary['top_own_time'] = top_functions(stats, 'tottime', self.top)
+
+        if self.memory and tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            # Stages reset the peak, so the run's peak is the largest seen anywhere
+            peak_mb = max([peak / 1e6] + [stage.get('traced_peak_mb', 0) for stage in self.stages])
+            summary['memory'] = {
+                'traced_current_mb': round(current / 1e6, 2),
+                'traced_peak_mb': round(peak_mb, 2),
+                'top_allocations': top_allocations(_snapshot(), limit=self.top),
+            }
+
+        with open(os.path.join(self.run_dir, 'summary.json'), 'w') as f:
+            json.dump(summary, f, indent=2)
+
+        self._log_summary(summary)
+
+    def _log_summary(self, summary: Dict):
+        logger.info(f"\n🔬 PROFILE ({self.mode}) → {self.run_dir}")
+        for row in summary.get('top_own_time', [])[:10]:
+            logger.info(f"  {row['own_seconds']:>8.3f}s own  {row['cumulative_seconds']:>8.3f}s cum  {row['function']}")
+        for stage in self.stages:
+            if 'traced_peak_mb' in stage:
+                logger.info(f"  {stage['stage']}: peak {stage['traced_peak_mb']:.1f} MB traced")
+        if 'memory' in summary:
+            logger.info(f"  run: peak {summary['memory']['traced_peak_mb']:.1f} MB traced")
+
+
+def add_profile_arguments(parser):
+    """Adds --profile [cprofile|sampling], --profile-dir and --profile-no-memory to an argparse parser"""
+    group = parser.add_argument_group('profiling')
+    group.add_argument('--profile', nargs='?', const='cprofile', choices=PROFILE_MODES,
+                       help="profile the run (cProfile by default, 'sampling' uses pyinstrument)")
+    group.add_argument('--profile-dir', help=f"run directory (default {DEFAULT_PROFILE_DIR}/<name>_<timestamp>)")
+    group.add_argument('--profile-no-memory', action='store_true',
+                       help="skip tracemalloc allocation tracking")
+    return parser
+
+
+def profile_from_args(args, name: str):
+    """A RunProfiler if --profile was given, otherwise a no-op context"""
+    if not getattr(args, 'profile', None):
+        return nullcontext()
+    return RunProfiler(name, mode=args.profile, run_dir=args.profile_dir, memory=not args.profile_no_memory)
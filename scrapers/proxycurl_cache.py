@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Proxycurl Cache
+Persistent response cache and spend governor for the pay-per-call Proxycurl API
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import date
+from typing import Dict, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = '../data/cache/proxycurl.sqlite3'
+DEFAULT_TTL_DAYS = 30
+COST_PER_PROFILE = 0.01  # USD, Proxycurl list price
+
+
+class BudgetExceeded(Exception):
+    """Raised when a paid call would push spend past the run or daily cap"""
+
+
+class ResponseCache:
+    """
+    SQLite-backed cache of Proxycurl JSON responses
+
+    Entries are keyed by endpoint + params and expire after ttl_seconds.
+    Safe to share between threads.
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, ttl_seconds: float = DEFAULT_TTL_DAYS * 86400):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY, endpoint TEXT, body TEXT, fetched_at REAL)"
+        )
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS spend (day TEXT PRIMARY KEY, amount REAL)"
+        )
+        self.conn.commit()
+
+    @staticmethod
+    def make_key(endpoint: str, params: Dict) -> str:
+        """Stable key for an endpoint + query params"""
+        raw = json.dumps([endpoint, sorted((k, str(v)) for k, v in params.items())])
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def contains(self, endpoint: str, params: Dict) -> bool:
+        """True if a fresh entry exists (does not count as a hit)"""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT fetched_at FROM responses WHERE key = ?",
+                (self.make_key(endpoint, params),)
+            ).fetchone()
+        return bool(row) and time.time() - row[0] < self.ttl_seconds
+
+    def get(self, endpoint: str, params: Dict) -> Optional[Dict]:
+        """Returns the cached JSON body or None if missing/expired"""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT body, fetched_at FROM responses WHERE key = ?",
+                (self.make_key(endpoint, params),)
+            ).fetchone()
+
+            if row and time.time() - row[1] < self.ttl_seconds:
+                self.hits += 1
+                return json.loads(row[0])
+
+            self.misses += 1
+            return None
+
+    def set(self, endpoint: str, params: Dict, body: Dict):
+        """Stores a JSON body"""
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses (key, endpoint, body, fetched_at) VALUES (?, ?, ?, ?)",
+                (self.make_key(endpoint, params), endpoint, json.dumps(body), time.time())
+            )
+            self.conn.commit()
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+
+class BudgetGovernor:
+    """
+    Tracks Proxycurl spend per run and per day and refuses calls past the caps
+
+    Calls reserve() with a worst-case estimate before a request and settle()
+    with the actual cost afterwards, so concurrent callers cannot overshoot.
+    Daily spend is persisted in the cache database.
+    """
+
+    def __init__(
+        self,
+        cache: ResponseCache,
+        run_cap: Optional[float] = None,
+        daily_cap: Optional[float] = None
+    ):
+        self.cache = cache
+        self.run_cap = run_cap
+        self.daily_cap = daily_cap
+        self.run_spent = 0.0
+        self.calls = 0
+        self._pending = 0.0
+        self._lock = threading.Lock()
+
+    def spent_today(self) -> float:
+        with self.cache._lock:
+            row = self.cache.conn.execute(
+                "SELECT amount FROM spend WHERE day = ?", (date.today().isoformat(),)
+            ).fetchone()
+        return row[0] if row else 0.0
+
+    def can_afford(self, amount: float) -> bool:
+        with self._lock:
+            return self._fits(amount)
+
+    def _fits(self, amount: float) -> bool:
+        committed = self.run_spent + self._pending + amount
+        if self.run_cap is not None and committed > self.run_cap:
+            return False
+        if self.daily_cap is not None and self.spent_today() + self._pending + amount > self.daily_cap:
+            return False
+        return True
+
+    def reserve(self, amount: float):
+        """Reserves an estimated cost or raises BudgetExceeded"""
+        with self._lock:
+            if not self._fits(amount):
+                raise BudgetExceeded(
+                    f"Proxycurl budget reached (run ${self.run_spent:.2f}"
+                    f"{f' / ${self.run_cap:.2f}' if self.run_cap is not None else ''}, "
+                    f"today ${self.spent_today():.2f}"
+                    f"{f' / ${self.daily_cap:.2f}' if self.daily_cap is not None else ''})"
+                )
+            self._pending += amount
+
+    def settle(self, reserved: float, actual: float):
+        """Replaces a reservation with the actual cost of the call"""
+        with self._lock:
+            self._pending -= reserved
+            self.run_spent += actual
+            self.calls += 1
+            if actual:
+                with self.cache._lock:
+                    self.cache.conn.execute(
+                        "INSERT INTO spend (day, amount) VALUES (?, ?) "
+                        "ON CONFLICT(day) DO UPDATE SET amount = amount + excluded.amount",
+                        (date.today().isoformat(), actual)
+                    )
+                    self.cache.conn.commit()
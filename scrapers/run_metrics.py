@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Run Metrics
+Counters, histograms and stage timers shared by the scrapers
+
+Scrapers record into the module-level METRICS registry:
+    METRICS.inc('scrape_errors_total', scraper='instagram')
+    with METRICS.timer('parse_seconds', scraper='college'):
+        ...
+    METRICS.sleep(2, reason='rate_limit', scraper='instagram')
+
+requests.Session objects are instrumented with instrument_session(), which
+counts requests, status codes, bytes and network time per host. At the end
+of a run the registry is written as a JSON report and, optionally, as a
+Prometheus textfile (for node_exporter's textfile collector).
+
+Stages, timers and responses also open spans in tracing.TRACER when tracing
+is enabled.
+"""
+
+import json
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from tracing import TRACER, trace_response
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+MAX_SAMPLES = 4096  # Reservoir size per histogram, for percentiles in the JSON report
+
+# Aggregates broken out per stage: where the time went
+NETWORK_METRIC = 'http_request_seconds'
+PARSE_METRIC = 'parse_seconds'
+SLEEP_METRIC = 'sleep_seconds_total'
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Dict) -> LabelKey:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+class Histogram:
+    """Bucketed distribution plus a bounded sample reservoir"""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+        self.samples: List[float] = []
+
+    def observe(self, value: float):
+        self.count += 1
+        self.sum += value
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        if len(self.samples) < MAX_SAMPLES:
+            self.samples.append(value)
+        else:
+            slot = random.randrange(self.count)
+            if slot < MAX_SAMPLES:
+                self.samples[slot] = value
+
+    def percentile(self, pct: float) -> float:
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(pct / 100 * len(ordered)))]
+
+    def summary(self) -> Dict:
+        return {
+            'count': self.count,
+            'sum': round(self.sum, 6),
+            'mean': round(self.sum / self.count, 6) if self.count else 0.0,
+            'p50': round(self.percentile(50), 6),
+            'p90': round(self.percentile(90), 6),
+            'p99': round(self.percentile(99), 6),
+            'max': round(max(self.samples), 6) if self.samples else 0.0,
+        }
+
+
+class Metrics:
+    """Thread-safe registry of counters and histograms, plus run stages"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counters: Dict[str, Dict[LabelKey, float]] = {}
+        self.histograms: Dict[str, Dict[LabelKey, Histogram]] = {}
+        self.stages: List[Dict] = []
+        self.stage_listeners: List = []
+        self.started_at = datetime.now().isoformat()
+
+    def reset(self):
+        with self._lock:
+            self.counters.clear()
+            self.histograms.clear()
+            self.stages.clear()
+            self.started_at = datetime.now().isoformat()
+
+    # -- recording ----------------------------------------------------------
+
+    def inc(self, name: str, amount: float = 1, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            series = self.counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + amount
+
+    def observe(self, name: str, value: float, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            series = self.histograms.setdefault(name, {})
+            if key not in series:
+                series[key] = Histogram()
+            series[key].observe(value)
+
+    @contextmanager
+    def timer(self, name: str, **labels):
+        """Observes the duration of the block (seconds) into a histogram"""
+        start = time.perf_counter()
+        try:
+            with TRACER.span(name.replace('_seconds', ''), **labels):
+                yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def sleep(self, seconds: float, **labels):
+        """time.sleep that is accounted for in sleep_seconds_total"""
+        if seconds <= 0:
+            return
+        self.inc(SLEEP_METRIC, seconds, **labels)
+        with TRACER.span('sleep', seconds=seconds, **labels):
+            time.sleep(seconds)
+
+    # -- reading ------------------------------------------------------------
+
+    def total(self, name: str) -> float:
+        """Sum of a counter, or of a histogram's observations, across all labels"""
+        with self._lock:
+            if name in self.counters:
+                return sum(self.counters[name].values())
+            return sum(h.sum for h in self.histograms.get(name, {}).values())
+
+    def add_stage_listener(self, listener):
+        """Registers an object with stage_started(name) and stage_finished(name, entry) hooks"""
+        self.stage_listeners.append(listener)
+
+    def remove_stage_listener(self, listener):
+        if listener in self.stage_listeners:
+            self.stage_listeners.remove(listener)
+
+    @contextmanager
+    def stage(self, name: str):
+        """
+        Times a pipeline stage and attributes network, parse and sleep time to it
+
+        Network/parse/sleep are summed across threads, so with concurrency they
+        can exceed the stage's wall time.
+        """
+        for listener in list(self.stage_listeners):
+            listener.stage_started(name)
+        before = {m: self.total(m) for m in (NETWORK_METRIC, PARSE_METRIC, SLEEP_METRIC)}
+        requests_before = self.total('http_requests_total')
+        start = time.perf_counter()
+        cpu_start = time.process_time()
+        error = None
+        try:
+            with TRACER.span(f"stage:{name}", stage=name):
+                yield
+        except BaseException as e:
+            error = repr(e)
+            raise
+        finally:
+            entry = {
+                'stage': name,
+                'wall_seconds': round(time.perf_counter() - start, 3),
+                'cpu_seconds': round(time.process_time() - cpu_start, 3),
+                'network_seconds': round(self.total(NETWORK_METRIC) - before[NETWORK_METRIC], 3),
+                'parse_seconds': round(self.total(PARSE_METRIC) - before[PARSE_METRIC], 3),
+                'sleep_seconds': round(self.total(SLEEP_METRIC) - before[SLEEP_METRIC], 3),
+                'requests': int(self.total('http_requests_total') - requests_before),
+            }
+            if error:
+                entry['error'] = error
+            with self._lock:
+                self.stages.append(entry)
+            self.observe('stage_seconds', entry['wall_seconds'], stage=name)
+            for listener in list(self.stage_listeners):
+                listener.stage_finished(name, entry)
+
+    # -- export -------------------------------------------------------------
+
+    def to_dict(self) -> Dict:
+        with self._lock:
+            return {
+                'started_at': self.started_at,
+                'finished_at': datetime.now().isoformat(),
+                'stages': list(self.stages),
+                'counters': {
+                    name: [{'labels': dict(key), 'value': round(value, 6)} for key, value in sorted(series.items())]
+                    for name, series in sorted(self.counters.items())
+                },
+                'histograms': {
+                    name: [{'labels': dict(key), **hist.summary()} for key, hist in sorted(series.items())]
+                    for name, series in sorted(self.histograms.items())
+                },
+            }
+
+    def write_json(self, path: str, extra: Optional[Dict] = None) -> str:
+        report = self.to_dict()
+        if extra:
+            report.update(extra)
+        _atomic_write(path, json.dumps(report, indent=2, default=str))
+        return path
+
+    def to_prometheus(self, prefix: str = 'scraper_') -> str:
+        lines = []
+        with self._lock:
+            for name, series in sorted(self.counters.items()):
+                metric = prefix + name
+                lines.append(f"# TYPE {metric} counter")
+                for key, value in sorted(series.items()):
+                    lines.append(f"{metric}{_prom_labels(key)} {value}")
+
+            for name, series in sorted(self.histograms.items()):
+                metric = prefix + name
+                lines.append(f"# TYPE {metric} histogram")
+                for key, hist in sorted(series.items()):
+                    cumulative = 0
+                    for bound, count in zip(hist.buckets, hist.counts):
+                        cumulative += count
+                        lines.append(f"{metric}_bucket{_prom_labels(key, le=bound)} {cumulative}")
+                    lines.append(f"{metric}_bucket{_prom_labels(key, le='+Inf')} {hist.count}")
+                    lines.append(f"{metric}_sum{_prom_labels(key)} {hist.sum}")
+                    lines.append(f"{metric}_count{_prom_labels(key)} {hist.count}")
+
+        lines.append(f"# TYPE {prefix}last_run_timestamp_seconds gauge")
+        lines.append(f"{prefix}last_run_timestamp_seconds {time.time():.0f}")
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str) -> str:
+        _atomic_write(path, self.to_prometheus())
+        return path
+
+
+def _prom_labels(key: LabelKey, **extra) -> str:
+    pairs = list(key) + [(k, str(v)) for k, v in extra.items()]
+    if not pairs:
+        return ''
+    escaped = (f'{k}="{v.replace(chr(92), chr(92) * 2).replace(chr(34), chr(92) + chr(34))}"' for k, v in pairs)
+    return '{' + ','.join(escaped) + '}'
+
+
+def _atomic_write(path: str, content: str):
+    if os.path.dirname(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+
+METRICS = Metrics()
+
+
+def record_response(response, scraper: str, metrics: Metrics = METRICS):
+    """Counts one HTTP response (requests or httpx): status, bytes and latency, per host"""
+    host = urlsplit(str(response.url)).netloc
+    metrics.inc('http_requests_total', scraper=scraper, host=host, status=response.status_code)
+    length = response.headers.get('Content-Length')
+    if length is None:
+        length = len(response.content or b'')
+    metrics.inc('http_response_bytes_total', int(length), scraper=scraper, host=host)
+    if response.elapsed is not None:
+        metrics.observe(NETWORK_METRIC, response.elapsed.total_seconds(), scraper=scraper, host=host)
+    trace_response(response, scraper)
+
+
+def instrument_session(session, scraper: str, metrics: Metrics = METRICS):
+    """Adds a response hook to a requests.Session that feeds record_response"""
+    session.hooks.setdefault('response', []).append(
+        lambda response, *args, **kwargs: record_response(response, scraper, metrics)
+    )
+    return session
@@ -6,18 +6,27 @@ Scrapes chapter data for all 58 NIC member fraternities
 
 import csv
 import json
+import re
 import time
 import requests
 from bs4 import BeautifulSoup
 from typing import List, Dict, Optional
 import logging
 from datetime import datetime
+from urllib.parse import urlsplit
+
+from adaptive_throttle import throttle_session
+from circuit_breaker import breaker_session
+from run_metrics import METRICS, instrument_session
+from tracing import TRACER
+from url_frontier import CHAPTER, DIRECTORY, OTHER, Frontier, is_pagination_link, normalize_url, url_domain
 
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler(f'fraternity_scrape_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log'),
+        # delay: no empty log file when an importer has already configured logging
+        logging.FileHandler(f'fraternity_scrape_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log', delay=True),
         logging.StreamHandler()
     ]
 )
@@ -49,6 +58,10 @@ FRATERNITY_CHAPTER_URLS = {
     # Add more as you find their chapter directory URLs
 }
 
+DEFAULT_MAX_PAGES = 300  # Pages fetched per fraternity site
+DIRECTORY_PATH = re.compile(r'chapters?|directory|find-a-chapter|locations', re.IGNORECASE)
+SOCIAL_SITES = ('facebook.com', 'twitter.com', 'x.com', 'linkedin.com', 'youtube.com', 'tiktok.com')
+
 
 class FraternityChapterScraper:
     """Scrapes chapter information from fraternity national websites"""
@@ -58,11 +71,28 @@ class FraternityChapterScraper:
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
         })
+        instrument_session(self.session, scraper='fraternity')
+        throttle_session(self.session)
+        breaker_session(self.session)
         self.all_chapters = []
 
-    def scrape_fraternity(self, fraternity_name: str, chapter_url: str) -> List[Dict]:
+    def scrape_fraternity(
+        self,
+        fraternity_name: str,
+        chapter_url: str,
+        max_pages: int = DEFAULT_MAX_PAGES,
+        max_depth: int = 1
+    ) -> List[Dict]:
         """
-        Scrapes chapter list for a specific fraternity
+        Crawls a fraternity's chapter directory: every page of it, then each chapter's own page
+
+        Pagination links are queued as directory pages (same depth), links
+        from directory rows as chapter pages, and other chapter/directory
+        links on the site as lower-priority pages (one level deeper each).
+
+        Args:
+            max_pages: Pages fetched per site at most
+            max_depth: Link hops followed beyond the directory pages
 
         Returns:
             List of chapter dictionaries
@@ -72,23 +102,87 @@ class FraternityChapterScraper:
         logger.info(f"URL: {chapter_url}")
         logger.info(f"{'='*80}")
 
-        try:
-            response = self.session.get(chapter_url, timeout=15)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-
-            # Each fraternity website has a different structure
-            # This is a generic parser - you'll need to customize per fraternity
-            chapters = self._parse_chapter_directory(soup, fraternity_name)
-
-            logger.info(f"✓ Found {len(chapters)} chapters for {fraternity_name}")
-            return chapters
-
-        except Exception as e:
-            logger.error(f"✗ Error scraping {fraternity_name}: {str(e)}")
-            return []
-
-    def _parse_chapter_directory(self, soup: BeautifulSoup, fraternity_name: str) -> List[Dict]:
+        frontier = Frontier(max_depth=max_depth, max_pages_per_domain=max_pages)
+        frontier.add(chapter_url, DIRECTORY)
+        chapters: Dict[tuple, Dict] = {}
+        chapters_by_url: Dict[str, Dict] = {}
+        pages = 0
+
+        with TRACER.span('fraternity', fraternity=fraternity_name, url=chapter_url) as span:
+            for entry in frontier:
+                pages += 1
+
+                try:
+                    response = self.session.get(entry.url, timeout=15)
+                    response.raise_for_status()
+                except Exception as e:
+                    METRICS.inc('scrape_errors_total', scraper='fraternity', error=type(e).__name__)
+                    if pages == 1:
+                        span.set_error(e)
+                        logger.error(f"✗ Error scraping {fraternity_name}: {str(e)}")
+                        return []
+                    logger.warning(f"  Skipping {entry.url}: {str(e)}")
+                    continue
+
+                with METRICS.timer('parse_seconds', scraper='fraternity'):
+                    soup = BeautifulSoup(response.content, 'html.parser')
+
+                    if entry.priority == CHAPTER:
+                        chapter = chapters_by_url.get(entry.url)
+                        if chapter is not None:
+                            self._parse_chapter_page(soup, entry.url, chapter)
+                        continue
+
+                    # Each fraternity website has a different structure
+                    # This is a generic parser - you'll need to customize per fraternity
+                    for chapter in self._parse_chapter_directory(soup, fraternity_name, entry.url):
+                        key = (chapter['university'], chapter.get('chapter_name'))
+                        if key in chapters:
+                            continue
+                        chapters[key] = chapter
+                        if chapter.get('chapter_url') and frontier.add(
+                                chapter['chapter_url'], CHAPTER, entry.depth + 1, referrer=entry.url):
+                            chapters_by_url[chapter['chapter_url']] = chapter
+
+                    self._queue_directory_links(soup, entry, frontier)
+
+            span.set_attribute('chapters', len(chapters))
+            span.set_attribute('pages', pages)
+
+        METRICS.inc('pages_total', pages, scraper='fraternity')
+        logger.info(f"✓ Found {len(chapters)} chapters for {fraternity_name} ({pages} pages)")
+        return list(chapters.values())
+
+    def _queue_directory_links(self, soup: BeautifulSoup, entry, frontier: Frontier):
+        """Queues pagination and other same-site directory links found on a directory page"""
+        domain = url_domain(entry.url)
+        for link in soup.find_all('a', href=True):
+            url = normalize_url(link['href'], base=entry.url)
+            if url is None or url_domain(url) != domain:
+                continue
+            if is_pagination_link(url, link.get_text(strip=True), link.get('rel'), page_url=entry.url):
+                frontier.add(url, DIRECTORY, entry.depth, referrer=entry.url)
+            elif DIRECTORY_PATH.search(urlsplit(url).path):
+                frontier.add(url, OTHER, entry.depth + 1, referrer=entry.url)
+
+    def _parse_chapter_page(self, soup: BeautifulSoup, page_url: str, chapter: Dict):
+        """Fills a chapter's contact details from its own page"""
+        domain = url_domain(page_url)
+        for link in soup.find_all('a', href=True):
+            href = link['href'].strip()
+            if href.lower().startswith('mailto:'):
+                chapter.setdefault('email', href[7:].split('?')[0])
+                continue
+            url = normalize_url(href, base=page_url)
+            if url is None:
+                continue
+            if 'instagram.com' in url:
+                chapter.setdefault('instagram', urlsplit(url).path.strip('/').split('/')[0] or None)
+            elif url_domain(url) != domain and not any(site in url for site in SOCIAL_SITES):
+                chapter.setdefault('website', url)
+
+    def _parse_chapter_directory(self, soup: BeautifulSoup, fraternity_name: str,
+                                 page_url: Optional[str] = None) -> List[Dict]:
         """
         Generic parser for chapter directories
 
@@ -96,6 +190,10 @@ class FraternityChapterScraper:
         """
         chapters = []
 
+        def chapter_link(element) -> Optional[str]:
+            link = element.find('a', href=True) if page_url else None
+            return normalize_url(link['href'], base=page_url) if link else None
+
         # Look for common patterns
         # Pattern 1: List items with college names
         for item in soup.find_all(['li', 'div'], class_=lambda x: x and 'chapter' in x.lower()):
@@ -104,7 +202,8 @@ class FraternityChapterScraper:
                 chapters.append({
                     'fraternity': fraternity_name,
                     'university': text,
-                    'status': 'active'
+                    'status': 'active',
+                    'chapter_url': chapter_link(item)
                 })
 
         # Pattern 2: Tables with chapter information
@@ -117,7 +216,8 @@ class FraternityChapterScraper:
                         'fraternity': fraternity_name,
                         'university': cells[0].get_text(strip=True),
                         'chapter_name': cells[1].get_text(strip=True) if len(cells) > 1 else None,
-                        'status': 'active'
+                        'status': 'active',
+                        'chapter_url': chapter_link(row)
                     })
 
         return chapters
@@ -142,7 +242,6 @@ class FraternityChapterScraper:
                 'chapters': chapters
             }
             self.all_chapters.extend(chapters)
-            time.sleep(2)  # Rate limiting
 
         results['total_chapters'] = len(self.all_chapters)
         return results
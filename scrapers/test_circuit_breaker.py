@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Offline tests for DNS failure handling in the circuit breakers (python -m pytest test_circuit_breaker.py)"""
+
+import socket
+
+import pytest
+import requests
+from urllib3.exceptions import MaxRetryError, NameResolutionError
+
+from circuit_breaker import CLOSED, OPEN, CircuitBreakers, CircuitOpen, classify_failure
+
+NXDOMAIN = (socket.EAI_NONAME, 'Name or service not known')
+TEMPORARY = (socket.EAI_AGAIN, 'Temporary failure in name resolution')
+
+
+def dns_error(host, failure):
+    """The exception requests raises for a failed lookup, wrapping urllib3's around the gaierror"""
+    gaierror = socket.gaierror(*failure)
+    try:
+        try:
+            raise gaierror
+        except socket.gaierror as e:
+            raise NameResolutionError(host, None, e) from e
+    except NameResolutionError as e:
+        reason = e
+    return requests.ConnectionError(MaxRetryError(None, f'http://{host}/', reason))
+
+
+def fetch(breakers, host, failure=None):
+    """One request to host through its breaker; failure is a gaierror (errno, message) or None"""
+    with breakers.guard(f'https://{host}/greek-life'):
+        if failure:
+            raise dns_error(host, failure)
+
+
+def try_fetch(breakers, host, failure=None):
+    try:
+        fetch(breakers, host, failure)
+    except requests.ConnectionError:
+        pass
+
+
+@pytest.fixture
+def breakers():
+    return CircuitBreakers(state_path=None)
+
+
+@pytest.mark.parametrize('failure, kind', [
+    (NXDOMAIN, 'dns'),
+    ((socket.EAI_NODATA, 'No address associated with hostname'), 'dns'),
+    (TEMPORARY, 'dns_temporary'),
+    ((socket.EAI_FAIL, 'Non-recoverable failure in name resolution'), 'dns_temporary'),
+])
+def test_classify_dns_by_errno(failure, kind):
+    assert classify_failure(dns_error('example.edu', failure)) == kind
+
+
+def test_nxdomain_candidates_do_not_look_like_a_resolver_outage(breakers):
+    # college_crawl guesses greeklife./fsl. subdomains; most do not exist, while the schools' own sites resolve
+    for i in range(8):
+        try_fetch(breakers, f'greeklife.school{i}.edu', NXDOMAIN)
+        try_fetch(breakers, f'fsl.school{i}.edu', NXDOMAIN)
+        if i % 4 == 0:
+            try_fetch(breakers, f'www.school{i}.edu')
+
+    try_fetch(breakers, 'dead.example', NXDOMAIN)
+    try_fetch(breakers, 'dead.example', NXDOMAIN)
+
+    assert not breakers._dns_outage
+    assert breakers.hosts['dead.example'].state == OPEN
+    assert breakers.hosts['greeklife.school0.edu'].failures == 1
+    with pytest.raises(CircuitOpen):
+        fetch(breakers, 'dead.example')
+
+
+def test_temporary_failures_everywhere_are_an_outage(breakers):
+    for _ in range(3):
+        for i in range(8):
+            try_fetch(breakers, f'www.school{i}.edu', TEMPORARY)
+
+    assert breakers._dns_outage
+    assert all(b.state == CLOSED and not b.failures for b in breakers.hosts.values())
+    # NXDOMAIN during the outage still counts: the resolver answered
+    try_fetch(breakers, 'dead.example', NXDOMAIN)
+    assert breakers.hosts['dead.example'].failures == 1
+
+
+def test_temporary_failure_on_one_host_still_counts(breakers):
+    for i in range(8):
+        try_fetch(breakers, f'www.school{i}.edu')
+    for _ in range(3):
+        try_fetch(breakers, 'flaky.example', TEMPORARY)
+
+    assert not breakers._dns_outage
+    assert breakers.hosts['flaky.example'].state == OPEN
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Offline tests for university name resolution (python -m pytest test_entity_resolution.py)"""
+
+import io
+
+import pytest
+
+from entity_resolution import UniversityResolver, normalize_name, read_csv_records
+
+UNIVERSITIES = [
+    {'id': 'psu', 'name': 'Penn State University', 'state': 'PA'},
+    {'id': 'psu-altoona', 'name': 'Pennsylvania State University, Altoona', 'state': 'PA'},
+    {'id': 'psu-harrisburg', 'name': 'Pennsylvania State University, Harrisburg', 'state': 'PA'},
+    {'id': 'ut-arlington', 'name': 'The University of Texas at Arlington', 'state': 'TX'},
+    {'id': 'ut-austin', 'name': 'University of Texas at Austin', 'state': 'TX'},
+    {'id': 'usc', 'name': 'University of Southern California', 'state': 'CA'},
+    {'id': 'rutgers-nb', 'name': 'Rutgers University–New Brunswick', 'state': 'NJ'},
+    {'id': 'rutgers-newark', 'name': 'Rutgers University–Newark', 'state': 'NJ'},
+]
+
+
+@pytest.fixture(scope='module')
+def resolver():
+    return UniversityResolver(UNIVERSITIES)
+
+
+def test_dash_and_comma_forms_normalize_alike():
+    assert normalize_name('Penn State - Altoona') == normalize_name('Pennsylvania State University, Altoona')
+    assert normalize_name('Penn State - Altoona') == 'pennsylvania state university altoona'
+
+
+@pytest.mark.parametrize('name, state, expected', [
+    ('Penn State - Altoona', 'PA', 'psu-altoona'),
+    ('Penn State - Harrisburg', None, 'psu-harrisburg'),
+    ('Pennsylvania State University, Altoona', 'PA', 'psu-altoona'),
+    ('Penn State', 'PA', 'psu'),
+    ('University of Texas - Arlington', 'TX', 'ut-arlington'),
+    ('Rutgers - Newark', 'NJ', 'rutgers-newark'),
+])
+def test_branch_campus_keeps_its_campus(resolver, name, state, expected):
+    match = resolver.resolve(name, state)
+    assert match is not None and match.id == expected
+
+
+def test_unknown_campus_is_not_merged_into_flagship(resolver):
+    assert resolver.resolve('Penn State - Nowhere', 'PA') is None
+
+
+@pytest.mark.parametrize('name', [
+    'USC - University of Southern California',
+    'University of Southern California - USC',
+])
+def test_dash_restating_the_name_falls_back_to_main_part(resolver, name):
+    match = resolver.resolve(name, 'CA')
+    assert match is not None and match.id == 'usc'
+
+
+def test_cache_is_per_instance():
+    first = UniversityResolver(UNIVERSITIES[:1])
+    second = UniversityResolver(UNIVERSITIES[1:])
+    assert first.resolve('Pennsylvania State University, Altoona', 'PA') is None
+    assert second.resolve('Pennsylvania State University, Altoona', 'PA').id == 'psu-altoona'
+
+
+def test_malformed_csv_rows_are_skipped():
+    source = io.StringIO('College,Fraternity Name,Instagram Handle\n'
+                         'Penn State University,Sigma Chi,@psusigmachi\n'
+                         'University of California, Los Angeles,Sigma Chi,@uclasigmachi\n'
+                         'Rutgers University\n'
+                         '"University of Southern California",Sigma Chi,@uscsigmachi\n')
+    skipped = []
+    records = list(read_csv_records(source, 'handles.csv', skipped))
+    assert [r['College'] for r in records] == ['Penn State University', 'University of Southern California']
+    assert skipped == [3, 4]
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""Offline tests for Instagram count parsing (python -m pytest test_instagram_metrics.py)"""
+
+import pytest
+
+from instagram_metrics import extract_counts, parse_count
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('1,234', 1234),
+    ('1,234 followers', 1234),
+    ('2.3K', 2300),
+    ('234k', 234000),
+    ('1.5M', 1500000),
+    ('1.2b', 1200000000),
+    (' 89 Posts', 89),
+    (567, 567),
+])
+def test_parse_count(text, expected):
+    assert parse_count(text) == expected
+
+
+@pytest.mark.parametrize('text', [None, '', 'N/A', 'followers', 'K', '--'])
+def test_parse_count_garbage(text):
+    assert parse_count(text) is None
+
+
+def test_extract_counts_meta_description():
+    description = ('1,234 Followers, 567 Following, 89 Posts - See Instagram photos and videos '
+                   'from Sigma Chi (@sigmachisc)')
+    assert extract_counts(description) == {'followers': 1234, 'following': 567, 'posts': 89}
+
+
+def test_extract_counts_suffixed_meta_description():
+    description = '2.3K Followers, 1,001 Following, 1.5M Posts'
+    assert extract_counts(description) == {'followers': 2300, 'following': 1001, 'posts': 1500000}
+
+
+def test_extract_counts_prefers_exact_json():
+    source = ('<meta content="2.3K Followers, 10 Following, 5 Posts">'
+              '<script>{"edge_followed_by":{"count":2318},"edge_follow":{"count":10}}</script>')
+    assert extract_counts(source) == {'followers': 2318, 'following': 10, 'posts': 5}
+
+
+def test_extract_counts_missing():
+    assert extract_counts('') == {'followers': None, 'following': None, 'posts': None}
+    assert extract_counts('no counts here') == {'followers': None, 'following': None, 'posts': None}
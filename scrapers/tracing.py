@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Tracing
+Lightweight nested spans (run → stage → entity → request) for the scrapers
+
+    with TRACER.span('college', college=name, url=url) as span:
+        ...
+        span.set_attribute('chapters', len(chapters))
+
+run_metrics stages and timers open spans, and every instrumented HTTP
+response becomes a request span (url, host, status, bytes). Tracing is off
+until configure() is called; disabled spans are a shared no-op object.
+
+Finished spans are written either as OTLP/JSON (what the OpenTelemetry
+collector's file exporter writes; Jaeger and other OTLP tools import it) or
+as Chrome trace events (open in https://ui.perfetto.dev or chrome://tracing).
+"""
+
+import contextvars
+import json
+import logging
+import os
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+TRACE_FORMATS = ('otlp', 'chrome')
+MAX_SPANS = 200_000  # Spans kept in memory per run; later ones are counted as dropped
+
+_current_span = contextvars.ContextVar('current_span', default=None)
+
+
+class Span:
+    """A timed operation with attributes, linked to its parent by span id"""
+
+    __slots__ = ('name', 'trace_id', 'span_id', 'parent_id', 'start_ns', 'end_ns',
+                 'attributes', 'error', 'thread')
+
+    def __init__(self, name: str, trace_id: str, parent_id: Optional[str], attributes: Dict,
+                 start_ns: Optional[int] = None):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent_id
+        self.start_ns = start_ns or time.time_ns()
+        self.end_ns = None
+        self.attributes = attributes
+        self.error = None
+        self.thread = threading.get_ident()
+
+    def set_attribute(self, key: str, value):
+        self.attributes[key] = value
+
+    def set_error(self, error: BaseException):
+        self.error = f"{type(error).__name__}: {error}"
+
+    @property
+    def duration_ms(self) -> float:
+        return ((self.end_ns or time.time_ns()) - self.start_ns) / 1e6
+
+
+class _NoopSpan:
+    """Returned while tracing is disabled"""
+
+    def set_attribute(self, key: str, value):
+        pass
+
+    def set_error(self, error: BaseException):
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class Tracer:
+    """Collects finished spans in memory and exports them at the end of a run"""
+
+    def __init__(self):
+        self.enabled = False
+        self.service_name = 'scrapers'
+        self.spans: List[Span] = []
+        self.dropped = 0
+        self._lock = threading.Lock()
+
+    def configure(self, enabled: bool = True, service_name: str = 'scrapers'):
+        self.enabled = enabled
+        self.service_name = service_name
+        with self._lock:
+            self.spans.clear()
+            self.dropped = 0
+
+    def _finish(self, span: Span):
+        span.end_ns = span.end_ns or time.time_ns()
+        with self._lock:
+            if len(self.spans) < MAX_SPANS:
+                self.spans.append(span)
+            else:
+                self.dropped += 1
+
+    @contextmanager
+    def span(self, name: str, **attributes):
+        """Opens a child of the current span (or a new trace) for the block"""
+        if not self.enabled:
+            yield NOOP_SPAN
+            return
+        parent = _current_span.get()
+        span = Span(name, parent.trace_id if parent else secrets.token_hex(16),
+                    parent.span_id if parent else None, attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.set_error(e)
+            raise
+        finally:
+            _current_span.reset(token)
+            self._finish(span)
+
+    def record(self, name: str, duration_seconds: float, error: Optional[str] = None, **attributes):
+        """Adds an already-finished child span that ended now, e.g. from a response hook"""
+        if not self.enabled:
+            return
+        parent = _current_span.get()
+        end_ns = time.time_ns()
+        span = Span(name, parent.trace_id if parent else secrets.token_hex(16),
+                    parent.span_id if parent else None, attributes,
+                    start_ns=end_ns - int(duration_seconds * 1e9))
+        span.end_ns = end_ns
+        span.error = error
+        self._finish(span)
+
+    def propagate(self, fn):
+        """Wraps fn so calls from worker threads stay children of the current span"""
+        context = contextvars.copy_context()
+        return lambda *args, **kwargs: context.copy().run(fn, *args, **kwargs)
+
+    # -- export -------------------------------------------------------------
+
+    def slowest(self, limit: int = 10, name: Optional[str] = None) -> List[Span]:
+        with self._lock:
+            spans = [s for s in self.spans if name is None or s.name == name]
+        return sorted(spans, key=lambda s: s.end_ns - s.start_ns, reverse=True)[:limit]
+
+    def to_otlp(self) -> Dict:
+        with self._lock:
+            spans = list(self.spans)
+        return {'resourceSpans': [{
+            'resource': {'attributes': [_otlp_attribute('service.name', self.service_name)]},
+            'scopeSpans': [{
+                'scope': {'name': 'fraternitybase.scrapers'},
+                'spans': [
+                    {
+                        'traceId': span.trace_id,
+                        'spanId': span.span_id,
+                        **({'parentSpanId': span.parent_id} if span.parent_id else {}),
+                        'name': span.name,
+                        'kind': 3 if span.name == 'request' else 1,  # CLIENT / INTERNAL
+                        'startTimeUnixNano': str(span.start_ns),
+                        'endTimeUnixNano': str(span.end_ns),
+                        'attributes': [_otlp_attribute(k, v) for k, v in span.attributes.items()],
+                        'status': {'code': 2, 'message': span.error} if span.error else {'code': 1},
+                    }
+                    for span in spans
+                ],
+            }],
+        }]}
+
+    def to_chrome(self) -> Dict:
+        with self._lock:
+            spans = list(self.spans)
+        origin = min((s.start_ns for s in spans), default=0)
+        events = [
+            {
+                'name': span.name,
+                'cat': span.name,
+                'ph': 'X',
+                'ts': (span.start_ns - origin) / 1000,
+                'dur': (span.end_ns - span.start_ns) / 1000,
+                'pid': os.getpid(),
+                'tid': span.thread,
+                'args': {**span.attributes, **({'error': span.error} if span.error else {})},
+            }
+            for span in spans
+        ]
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def export(self, path: str, trace_format: str = 'otlp') -> str:
+        """Writes the collected spans to path and logs the slowest entities"""
+        if trace_format not in TRACE_FORMATS:
+            raise ValueError(f"Unknown trace format {trace_format!r}, expected one of {TRACE_FORMATS}")
+        payload = self.to_otlp() if trace_format == 'otlp' else self.to_chrome()
+
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(payload, f, default=str)
+        os.replace(tmp_path, path)
+
+        logger.info(f"\n🧵 TRACE: {len(self.spans)} spans → {path} ({trace_format})")
+        if self.dropped:
+            logger.warning(f"  {self.dropped} spans dropped (over {MAX_SPANS})")
+        for span in self.slowest(5, name='request'):
+            logger.info(f"  {span.duration_ms:>9.1f} ms  {span.attributes.get('url', '')}")
+        return path
+
+
+def _otlp_attribute(key: str, value) -> Dict:
+    if isinstance(value, bool):
+        return {'key': key, 'value': {'boolValue': value}}
+    if isinstance(value, int):
+        return {'key': key, 'value': {'intValue': str(value)}}
+    if isinstance(value, float):
+        return {'key': key, 'value': {'doubleValue': value}}
+    return {'key': key, 'value': {'stringValue': str(value)}}
+
+
+TRACER = Tracer()
+
+
+def trace_response(response, scraper: str):
+    """Records a request span for an HTTP response (requests or httpx)"""
+    if not TRACER.enabled:
+        return
+    url = str(response.url)
+    length = response.headers.get('Content-Length')
+    TRACER.record(
+        'request',
+        response.elapsed.total_seconds() if response.elapsed is not None else 0.0,
+        error=f"HTTP {response.status_code}" if response.status_code >= 400 else None,
+        scraper=scraper,
+        url=url,
+        host=urlsplit(url).netloc,
+        status=response.status_code,
+        bytes=int(length) if length is not None else len(response.content or b''),
+    )
+
+
+def add_trace_arguments(parser):
+    """Adds --trace FILE and --trace-format to an argparse parser"""
+    group = parser.add_argument_group('tracing')
+    group.add_argument('--trace', metavar='FILE', default=os.getenv('SCRAPER_TRACE_FILE'),
+                       help="write spans to FILE (also SCRAPER_TRACE_FILE)")
+    group.add_argument('--trace-format', choices=TRACE_FORMATS, default='otlp',
+                       help="otlp: OTLP/JSON; chrome: trace events for Perfetto / chrome://tracing")
+    return parser
+
+
+@contextmanager
+def trace_from_args(args, service_name: str):
+    """Enables tracing for the block if --trace was given, then exports the spans"""
+    if not getattr(args, 'trace', None):
+        yield
+        return
+    TRACER.configure(enabled=True, service_name=service_name)
+    try:
+        with TRACER.span('run', service=service_name):
+            yield
+    finally:
+        TRACER.export(args.trace, args.trace_format)
+        TRACER.enabled = False
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+URL Frontier
+Prioritized, deduplicated queue of URLs for crawling multi-page directories
+
+    frontier = Frontier(max_depth=2, max_pages_per_domain=300)
+    frontier.add(start_url, DIRECTORY)
+    for entry in frontier:
+        page = fetch(entry.url)
+        for url in links(page):
+            frontier.add(url, CHAPTER, depth=entry.depth + 1, base=entry.url)
+
+Lower priorities are fetched first (directory pages, then chapter pages, then
+anything else), breadth-first within a priority. URLs are normalized before
+the seen check, so /chapters?page=2&utm_source=x and /chapters/?page=2 are
+fetched once. The seen-set is a plain set; pass make_seen_set(expected) a
+large expected count to get a Bloom filter with bounded memory instead.
+"""
+
+import hashlib
+import heapq
+import itertools
+import logging
+import math
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterator, Optional
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
+
+from run_metrics import METRICS
+
+logger = logging.getLogger(__name__)
+
+DIRECTORY, CHAPTER, OTHER = 0, 1, 2
+PRIORITY_NAMES = {DIRECTORY: 'directory', CHAPTER: 'chapter', OTHER: 'other'}
+
+BLOOM_THRESHOLD = 200_000  # Expected URLs above which make_seen_set() returns a Bloom filter
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+TRACKING_PARAMS = re.compile(r'^(utm_\w+|fbclid|gclid|mc_cid|mc_eid|_ga)$', re.IGNORECASE)
+PAGINATION_TEXT = re.compile(r'^(next|more|older|load more|›|»|>)$', re.IGNORECASE)
+PAGE_NUMBER_TEXT = re.compile(r'^\d{1,3}$')
+PAGINATION_URL = re.compile(r'([?&](page|p|pg|start|offset)=\d+)|(/page/\d+/?$)', re.IGNORECASE)
+
+
+def normalize_url(url: str, base: Optional[str] = None) -> Optional[str]:
+    """
+    Canonical form of an http(s) URL for deduplication
+
+    Resolves against base, lowercases scheme and host, drops default ports,
+    fragments, tracking parameters and trailing slashes, and sorts the query.
+
+    Returns:
+        The normalized URL, or None for mailto:, javascript:, malformed URLs etc.
+    """
+    if not url:
+        return None
+    url = url.strip()
+    if base:
+        url = urljoin(base, url)
+    try:
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        host = (parts.hostname or '').rstrip('.')
+        port = parts.port
+    except ValueError:
+        return None
+    if scheme not in DEFAULT_PORTS or not host:
+        return None
+
+    netloc = host if port in (None, DEFAULT_PORTS[scheme]) else f"{host}:{port}"
+    path = re.sub(r'/{2,}', '/', parts.path) or '/'
+    if path != '/' and path.endswith('/'):
+        path = path[:-1]
+    query = urlencode(sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not TRACKING_PARAMS.match(key)
+    ))
+    return urlunsplit((scheme, netloc, path, query, ''))
+
+
+def url_domain(url: str) -> str:
+    """Host without a leading www., the unit for per-domain budgets"""
+    host = urlsplit(url).hostname or ''
+    return host[4:] if host.startswith('www.') else host
+
+
+def is_pagination_link(url: str, text: str = '', rel=None, page_url: Optional[str] = None) -> bool:
+    """
+    True for next/numbered page links of a listing
+
+    A bare number as link text ("2") only counts when the URL looks like a
+    page URL or stays on the listing's own path (page_url), so numbered
+    chapter links ("/chapters/alpha-12" labelled "12") are not pagination.
+    """
+    rel = ' '.join(rel) if isinstance(rel, (list, tuple)) else (rel or '')
+    text = text.strip()
+    if 'next' in rel.lower() or PAGINATION_URL.search(url) or PAGINATION_TEXT.match(text):
+        return True
+    if PAGE_NUMBER_TEXT.match(text) and page_url:
+        return urlsplit(url).path.rstrip('/') == urlsplit(page_url).path.rstrip('/')
+    return False
+
+
+class BloomFilter:
+    """
+    Fixed-memory set membership with a bounded false-positive rate
+
+    A false positive means a new URL is treated as already seen and skipped;
+    there are no false negatives, so nothing is fetched twice.
+    """
+
+    __slots__ = ('capacity', 'error_rate', 'size', 'hashes', 'bits', 'count')
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str) -> Iterator[int]:
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+
+    def add(self, item: str):
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    def __len__(self) -> int:
+        return self.count
+
+    def nbytes(self) -> int:
+        return len(self.bits)
+
+
+def make_seen_set(expected_urls: int, error_rate: float = 0.001):
+    """A set for ordinary crawls, a Bloom filter when expected_urls is large"""
+    if expected_urls < BLOOM_THRESHOLD:
+        return set()
+    return BloomFilter(expected_urls, error_rate)
+
+
+@dataclass(slots=True)
+class FrontierEntry:
+    """A URL waiting to be fetched"""
+    url: str
+    priority: int
+    depth: int
+    referrer: Optional[str] = None
+
+
+class Frontier:
+    """
+    Priority queue of URLs to crawl with dedup, depth and per-domain budgets
+
+    Args:
+        max_depth: Links deeper than this are dropped (the start URL is depth 0;
+            callers choose how depth grows, e.g. pagination can keep the parent's)
+        max_pages_per_domain: URLs handed out per domain, so one site cannot eat the
+            crawl; counted as they are popped, so higher-priority pages found
+            later still get the budget first
+        seen: Seen-set to use (default a set; see make_seen_set)
+    """
+
+    def __init__(self, max_depth: int = 2, max_pages_per_domain: int = 500, seen=None):
+        self.max_depth = max_depth
+        self.max_pages_per_domain = max_pages_per_domain
+        self.seen = seen if seen is not None else set()
+        self.domain_counts: Dict[str, int] = {}
+        self.dropped: Dict[str, int] = {}
+        self._heap = []
+        self._sequence = itertools.count()
+
+    def _drop(self, reason: str) -> bool:
+        self.dropped[reason] = self.dropped.get(reason, 0) + 1
+        METRICS.inc('frontier_dropped_total', reason=reason)
+        return False
+
+    def add(self, url: str, priority: int = OTHER, depth: int = 0,
+            referrer: Optional[str] = None, base: Optional[str] = None) -> bool:
+        """
+        Queues a URL unless it is invalid, already seen, too deep or its domain is spent
+
+        Args:
+            base: Page the link was found on, for resolving relative URLs
+
+        Returns:
+            True if the URL was queued
+        """
+        normalized = normalize_url(url, base)
+        if normalized is None:
+            return self._drop('invalid')
+        if depth > self.max_depth:
+            return self._drop('depth')
+        if normalized in self.seen:
+            return self._drop('seen')
+
+        domain = url_domain(normalized)
+        if self.domain_counts.get(domain, 0) >= self.max_pages_per_domain:
+            return self._drop('domain_budget')
+
+        self.seen.add(normalized)
+        heapq.heappush(self._heap, (priority, depth, next(self._sequence),
+                                    FrontierEntry(normalized, priority, depth, referrer)))
+        METRICS.inc('frontier_added_total', priority=PRIORITY_NAMES.get(priority, str(priority)))
+        return True
+
+    def pop(self) -> Optional[FrontierEntry]:
+        """The next URL to fetch, or None when the frontier is empty"""
+        while self._heap:
+            entry = heapq.heappop(self._heap)[-1]
+            domain = url_domain(entry.url)
+            if self.domain_counts.get(domain, 0) >= self.max_pages_per_domain:
+                self._drop('domain_budget')
+                continue
+            self.domain_counts[domain] = self.domain_counts.get(domain, 0) + 1
+            return entry
+        return None
+
+    def __iter__(self) -> Iterator[FrontierEntry]:
+        """Pops entries until empty; URLs added while iterating are picked up"""
+        while True:
+            entry = self.pop()
+            if entry is None:
+                return
+            yield entry
+
+    def __len__(self) -> int:
+        return len(self._heap)
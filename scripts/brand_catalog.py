@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Fraternity Base - Brand Catalog
+Shared brand data for the brand research bot and the companies seeder
+
+Data lives in data/brands/:
+    categories.json       research categories (why they fit, where to look)
+    prospect_pool.json    candidate prospects for BRAND_PROSPECTS.md
+    catalog/*.json        seed brands, one file per category:
+                          {"category": "...", "brands": [{"name", "industry", "description"} | "Name", ...]}
+
+Files are read on first use and memoized, so importing this module is free.
+"""
+
+import json
+import os
+from functools import lru_cache
+from pathlib import Path
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data" / "brands"
+CATALOG_DIR = DATA_DIR / "catalog"
+
+
+def _read_json(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=None)
+def brand_categories():
+    """Research categories: name -> {"why": ..., "research_areas": [...]}"""
+    return _read_json(DATA_DIR / "categories.json")
+
+
+@lru_cache(maxsize=None)
+def prospect_pool():
+    """(name, description, category) tuples the research bot can add"""
+    return tuple(
+        (item["name"], item.get("description", ""), item["category"])
+        for item in _read_json(DATA_DIR / "prospect_pool.json")
+    )
+
+
+def catalog_files():
+    return sorted(CATALOG_DIR.glob("*.json"))
+
+
+@lru_cache(maxsize=None)
+def load_category(path):
+    """
+    Brands in one catalog file as dicts with name, industry and description
+
+    Entries given as a bare name use the category as their industry and a
+    generic description.
+    """
+    data = _read_json(path)
+    category = data["category"]
+    brands = []
+    for entry in data.get("brands", []):
+        if isinstance(entry, str):
+            entry = {"name": entry}
+        brands.append({
+            "name": entry["name"],
+            "industry": entry.get("industry") or category,
+            "description": entry.get("description")
+                or f"{entry['name']} - Popular with college students in the {category} category.",
+        })
+    return category, tuple(brands)
+
+
+def catalog_brands(categories=None):
+    """All seed brands, optionally limited to some category names"""
+    brands = []
+    for path in catalog_files():
+        category, entries = load_category(path)
+        if categories is None or category in categories:
+            brands.extend(dict(entry) for entry in entries)
+    return brands
+
+
+@lru_cache(maxsize=None)
+def get_supabase():
+    """Supabase client from SUPABASE_URL / SUPABASE_SERVICE_ROLE_KEY, created on first use"""
+    from supabase import create_client
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    return create_client(os.environ.get("SUPABASE_URL"), os.environ.get("SUPABASE_SERVICE_ROLE_KEY"))
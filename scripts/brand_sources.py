@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Fraternity Base - Brand Discovery Sources
+Async sources of new brand prospects for the brand research daemon
+
+Each source has a name and an async fetch() that returns
+(name, description, category) tuples. Blocking I/O runs in a worker thread
+so sources can be awaited concurrently with per-source timeouts.
+
+Run a local stand-in for an HTTP feed (for testing HttpFeedSource):
+    python3 scripts/brand_sources.py serve feed.json --port 8765
+"""
+
+import argparse
+import asyncio
+import json
+import random
+from functools import partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from brand_catalog import get_supabase
+
+
+def to_addition(record, default_category=None):
+    """Coerce a feed/table record into a (name, description, category) tuple, or None"""
+    if isinstance(record, (list, tuple)):
+        name, description, category = (list(record) + [None, None, None])[:3]
+    elif isinstance(record, dict):
+        name = record.get('name')
+        description = record.get('description')
+        category = record.get('category') or record.get('brand_industry') or record.get('industry')
+    else:
+        return None
+
+    name = (name or '').strip()
+    if not name:
+        return None
+    return (name, (description or '').strip(), category or default_category)
+
+
+def _parse_feed(data):
+    """Feeds are either a JSON list of records or {"brands": [...]}"""
+    if isinstance(data, dict):
+        data = data.get('brands', [])
+    return [a for a in (to_addition(r) for r in data) if a]
+
+
+class StaticPoolSource:
+    """A fixed list of candidates, e.g. brand_catalog.prospect_pool()"""
+
+    def __init__(self, pool, name="pool"):
+        self.name = name
+        self.pool = list(pool)
+
+    async def fetch(self):
+        pool = self.pool[:]
+        random.shuffle(pool)
+        return pool
+
+
+class JsonFeedSource:
+    """A local JSON file of brand records, re-read each cycle"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.name = f"json:{self.path.name}"
+
+    def _read(self):
+        with open(self.path, 'r') as f:
+            return _parse_feed(json.load(f))
+
+    async def fetch(self):
+        return await asyncio.to_thread(self._read)
+
+
+class HttpFeedSource:
+    """A JSON feed served over HTTP"""
+
+    def __init__(self, url, headers=None, timeout=30):
+        self.url = url
+        self.name = f"http:{url}"
+        self.headers = headers or {}
+        self.timeout = timeout
+
+    def _get(self):
+        import requests
+
+        response = requests.get(self.url, headers=self.headers, timeout=self.timeout)
+        response.raise_for_status()
+        return _parse_feed(response.json())
+
+    async def fetch(self):
+        return await asyncio.to_thread(self._get)
+
+
+class SupabaseBrandsSource:
+    """Brands already in the companies table (is_brand = true)"""
+
+    PAGE_SIZE = 1000
+
+    def __init__(self, limit=5000):
+        self.name = "supabase:companies"
+        self.limit = limit
+
+    def _read(self):
+        client = get_supabase()
+        records = []
+        for start in range(0, self.limit, self.PAGE_SIZE):
+            end = min(start + self.PAGE_SIZE, self.limit) - 1
+            page = (client.table('companies')
+                    .select('name, description, brand_industry')
+                    .eq('is_brand', True)
+                    .order('name')
+                    .range(start, end)
+                    .execute()).data or []
+            records.extend(page)
+            if len(page) < end - start + 1:
+                break
+        return _parse_feed(records)
+
+    async def fetch(self):
+        return await asyncio.to_thread(self._read)
+
+
+class _FeedHandler(BaseHTTPRequestHandler):
+    def __init__(self, body, *args, **kwargs):
+        self.body = body
+        super().__init__(*args, **kwargs)
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def make_feed_server(path, host="127.0.0.1", port=8765):
+    """HTTP server that answers every GET with the contents of a JSON feed file"""
+    with open(path, 'rb') as f:
+        body = f.read()
+    json.loads(body)  # Fail fast on a bad feed
+    return ThreadingHTTPServer((host, port), partial(_FeedHandler, body))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Brand discovery source utilities")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve = commands.add_parser("serve", help="serve a JSON feed locally as a stand-in HTTP source")
+    serve.add_argument("feed", help="JSON file with a list of {name, description, category}")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8765)
+
+    args = parser.parse_args()
+
+    server = make_feed_server(args.feed, args.host, args.port)
+    print(f"📡 Serving {args.feed} at http://{args.host}:{server.server_port}/")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Feed server stopped")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
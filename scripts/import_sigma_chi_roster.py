@@ -4,6 +4,7 @@ Secure Sigma Chi Roster Import Script
 Handles CSV/Excel import with PII encryption and data validation
 """
 
+import argparse
 import csv
 import json
 import hashlib
@@ -12,6 +13,7 @@ import sys
 from datetime import datetime
 from typing import Dict, List, Optional
 import uuid
+from pathlib import Path
 import psycopg2
 from psycopg2.extras import RealDictCursor, execute_batch
 import pandas as pd
@@ -22,6 +24,11 @@ import base64
 import logging
 from dotenv import load_dotenv
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scrapers"))
+from profiling import add_profile_arguments, profile_from_args
+from run_metrics import METRICS
+from tracing import TRACER, add_trace_arguments, trace_from_args
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -241,7 +248,7 @@ class SecureRosterImporter:
                 # Hashes for lookups
                 'email_hash': email_hash,
                 'phone_hash': self.hash_field(row.get('Cell Phone', '')),
-                'name_hash': self.hash_field(f"{row.get('First Name', '')} {row.get('Last Name', '')}")",
+                'name_hash': self.hash_field(f"{row.get('First Name', '')} {row.get('Last Name', '')}"),
 
                 # Non-PII fields
                 'member_type': row.get('Member Type', 'Undergrad'),
@@ -337,22 +344,24 @@ class SecureRosterImporter:
         self.create_import_batch(chapter_id, file_path)
 
         # Read CSV
-        with open(file_path, 'r', encoding='utf-8') as file:
+        with METRICS.stage('import_rows'), open(file_path, 'r', encoding='utf-8') as file:
             reader = csv.DictReader(file)
 
             for row in reader:
                 self.stats['total_rows'] += 1
-                self.import_member(row, chapter_id)
+                with TRACER.span('roster_row', row=self.stats['total_rows']) as span:
+                    span.set_attribute('imported', self.import_member(row, chapter_id))
 
                 # Log progress every 100 rows
                 if self.stats['total_rows'] % 100 == 0:
                     logger.info(f"Processed {self.stats['total_rows']} rows...")
 
-        # Update import batch status
-        self.finalize_import_batch()
+        with METRICS.stage('finalize'):
+            # Update import batch status
+            self.finalize_import_batch()
 
-        # Refresh materialized views
-        self.refresh_statistics()
+            # Refresh materialized views
+            self.refresh_statistics()
 
         logger.info("Import completed!")
         logger.info(f"Stats: {json.dumps(self.stats, indent=2)}")
@@ -424,13 +433,18 @@ def main():
     }
 
     # Check command line arguments
-    if len(sys.argv) < 3:
-        print("Usage: python import_sigma_chi_roster.py <csv_file> <chapter_name>")
-        print("Example: python import_sigma_chi_roster.py iota_psi_roster.csv 'Iota Psi'")
-        sys.exit(1)
-
-    csv_file = sys.argv[1]
-    chapter_name = sys.argv[2]
+    parser = argparse.ArgumentParser(
+        description="Import a Sigma Chi roster CSV with PII encryption",
+        epilog="Example: python import_sigma_chi_roster.py iota_psi_roster.csv 'Iota Psi'"
+    )
+    parser.add_argument('csv_file')
+    parser.add_argument('chapter_name')
+    add_profile_arguments(parser)
+    add_trace_arguments(parser)
+    args = parser.parse_args()
+
+    csv_file = args.csv_file
+    chapter_name = args.chapter_name
 
     if not os.path.exists(csv_file):
         print(f"Error: File {csv_file} not found")
@@ -441,7 +455,8 @@ def main():
 
     try:
         importer.connect()
-        importer.import_from_csv(csv_file, chapter_name)
+        with profile_from_args(args, 'import_sigma_chi_roster'), trace_from_args(args, 'import_sigma_chi_roster'):
+            importer.import_from_csv(csv_file, chapter_name)
     finally:
         importer.disconnect()
 
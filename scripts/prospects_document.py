@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Fraternity Base - Brand Prospects Document
+Section-aware model of BRAND_PROSPECTS.md with batched, atomic writes and a
+sidecar brand-name index for cheap duplicate checks
+"""
+
+import json
+import os
+import re
+import shutil
+import tempfile
+from pathlib import Path
+
+BRAND_LINE_RE = re.compile(r'^\s*(\d+)\.\s+\*\*(.+?)\*\*')
+STAT_LINE_RE = re.compile(r'^\*(Last Updated|Total Brands Listed|New Additions This Week):.*\*\s*$')
+
+
+def normalize_brand(name):
+    """Key used for duplicate checks ("Bumble BFF" == "bumble-bff")"""
+    return re.sub(r'[^a-z0-9]+', '', name.lower())
+
+
+def file_signature(path):
+    """(mtime_ns, size) of a file, or None if it does not exist"""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def atomic_write(path, text):
+    """Write text to path via a temp file in the same directory and os.replace"""
+    path = Path(path)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp creates the file 0600; keep the old file's mode, or the umask default for a new one
+        if path.exists():
+            shutil.copymode(path, tmp_path)
+        else:
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(tmp_path, 0o666 & ~umask)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+class Section:
+    """One ### category: its header line and the numbered brand lines under it"""
+
+    def __init__(self, title):
+        self.title = title
+        self.lines = []  # Every line after the header up to the next section/separator
+        self.last_number = 0
+        self.last_item = None  # Index in self.lines of the last numbered item
+
+    def append(self, line):
+        match = BRAND_LINE_RE.match(line)
+        if match:
+            self.last_number = max(self.last_number, int(match.group(1)))
+            self.last_item = len(self.lines)
+        self.lines.append(line)
+
+    def add_brand(self, name, description):
+        self.last_number += 1
+        line = f"{self.last_number}. **{name}** - {description}\n"
+        position = len(self.lines) if self.last_item is None else self.last_item + 1
+        self.lines.insert(position, line)
+        self.last_item = position
+
+
+class ProspectsDocument:
+    """
+    Parsed BRAND_PROSPECTS.md
+
+    The file is split into chunks: plain lines (intro, separators, footer) and
+    Section objects. Additions and statistics edits only touch memory until
+    save(), which writes the whole document once.
+    """
+
+    def __init__(self, path, chunks, signature):
+        self.path = Path(path)
+        self.chunks = chunks
+        self.signature = signature
+        self.brands = {}  # normalized name -> display name
+        self.dirty = False
+
+        for section in self.sections():
+            for line in section.lines:
+                match = BRAND_LINE_RE.match(line)
+                if match:
+                    name = match.group(2).strip()
+                    self.brands.setdefault(normalize_brand(name), name)
+
+    @classmethod
+    def load(cls, path):
+        path = Path(path)
+        chunks = []
+        section = None
+
+        if path.exists():
+            with open(path, 'r') as f:
+                for line in f:
+                    if '###' in line:
+                        section = Section(line)
+                        chunks.append(section)
+                    elif '---' in line or STAT_LINE_RE.match(line):
+                        section = None
+                        chunks.append(line)
+                    elif section is not None:
+                        section.append(line)
+                    else:
+                        chunks.append(line)
+
+        return cls(path, chunks, file_signature(path))
+
+    def sections(self):
+        return [chunk for chunk in self.chunks if isinstance(chunk, Section)]
+
+    def find_section(self, category):
+        """First section whose header mentions the category"""
+        for section in self.sections():
+            if category in section.title:
+                return section
+        return None
+
+    def __contains__(self, brand_name):
+        return normalize_brand(brand_name) in self.brands
+
+    def add(self, brand_name, description, category):
+        """Add one brand in memory; False if it is a duplicate or the category is unknown"""
+        key = normalize_brand(brand_name)
+        if key in self.brands:
+            return False
+
+        section = self.find_section(category)
+        if section is None:
+            return False
+
+        section.add_brand(brand_name, description)
+        self.brands[key] = brand_name
+        self.dirty = True
+        return True
+
+    def apply(self, additions):
+        """
+        Add a batch of (name, description, category) tuples across sections
+
+        Returns:
+            The tuples that were actually added
+        """
+        return [addition for addition in additions if self.add(*addition)]
+
+    def set_stat(self, label, value):
+        """Replace the value of a "*Label: value*" footer line"""
+        replacement = f"*{label}: {value}*\n"
+        for i, chunk in enumerate(self.chunks):
+            if isinstance(chunk, str) and chunk.startswith(f"*{label}:") and chunk.rstrip('\n') != replacement.rstrip('\n'):
+                self.chunks[i] = replacement
+                self.dirty = True
+
+    def render(self):
+        parts = []
+        for chunk in self.chunks:
+            if isinstance(chunk, Section):
+                parts.append(chunk.title)
+                parts.extend(chunk.lines)
+            else:
+                parts.append(chunk)
+        return "".join(parts)
+
+    def save(self, index=None):
+        """Write the document once (atomically) and refresh the sidecar index"""
+        if self.dirty:
+            atomic_write(self.path, self.render())
+            self.signature = file_signature(self.path)
+            self.dirty = False
+        if index is not None:
+            index.update(self.brands, self.signature)
+
+    def is_stale(self):
+        """True if the file changed on disk since it was loaded/saved"""
+        return file_signature(self.path) != self.signature
+
+
+class BrandIndex:
+    """
+    Sidecar JSON of brand names next to the prospects file
+
+    Trusted only while the prospects file's (mtime, size) matches the one
+    recorded with it, so duplicate checks do not need to parse the markdown.
+    """
+
+    def __init__(self, prospects_path):
+        prospects_path = Path(prospects_path)
+        self.prospects_path = prospects_path
+        self.path = prospects_path.parent / f".{prospects_path.stem}.index.json"
+        self.brands = {}
+        self.signature = None
+
+    def load(self):
+        """Load the sidecar; False if it is missing or out of date"""
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return False
+
+        if data.get('signature') != file_signature(self.prospects_path):
+            return False
+
+        self.brands = data.get('brands', {})
+        self.signature = data['signature']
+        return True
+
+    def update(self, brands, signature):
+        if brands == self.brands and signature == self.signature:
+            return
+        self.brands = dict(brands)
+        self.signature = signature
+        atomic_write(self.path, json.dumps({'signature': signature, 'brands': self.brands}, indent=0))
+
+    def __contains__(self, brand_name):
+        return normalize_brand(brand_name) in self.brands
+
+    def __len__(self):
+        return len(self.brands)
+
+    def names(self):
+        return set(self.brands.values())
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Fraternity Base - Brand Research Scheduler
+Cron-style scheduling and the async daemon that drives brand discovery sources
+"""
+
+import asyncio
+import datetime
+import random
+import signal
+
+from prospects_document import normalize_brand
+
+SCHEDULE_ALIASES = {
+    "@hourly": "0 * * * *",
+    "@daily": "0 0 * * *",
+    "@weekly": "0 0 * * 0",
+}
+
+
+class IntervalSchedule:
+    """Fixed interval, e.g. "@every 30m" / "@every 2h" """
+
+    UNITS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+    def __init__(self, seconds):
+        if seconds <= 0:
+            raise ValueError("Interval must be positive")
+        self.seconds = seconds
+
+    def next_after(self, moment):
+        return moment + datetime.timedelta(seconds=self.seconds)
+
+
+class CronSchedule:
+    """
+    Five-field cron expression: minute hour day-of-month month day-of-week
+
+    Fields accept *, n, a-b, a,b,c and /step. Day-of-week uses 0 = Sunday.
+    """
+
+    RANGES = [(0, 59), (0, 23), (1, 31), (1, 12), (0, 6)]
+
+    def __init__(self, expression):
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"Expected 5 cron fields, got {len(fields)}: {expression!r}")
+        self.expression = expression
+        self.minutes, self.hours, self.days, self.months, self.weekdays = (
+            self._parse_field(field, low, high) for field, (low, high) in zip(fields, self.RANGES)
+        )
+        self.any_day = fields[2] == '*'
+        self.any_weekday = fields[4] == '*'
+
+    @staticmethod
+    def _parse_field(field, low, high):
+        values = set()
+        for part in field.split(','):
+            spec, _, step = part.partition('/')
+            if spec == '*':
+                start, end = low, high
+            elif '-' in spec:
+                start, end = (int(x) for x in spec.split('-', 1))
+            else:
+                start = int(spec)
+                end = high if step else start
+            if start < low or end > high or start > end:
+                raise ValueError(f"Cron field {field!r} out of range {low}-{high}")
+            values.update(range(start, end + 1, int(step) if step else 1))
+        return values
+
+    def _day_matches(self, moment):
+        day_ok = moment.day in self.days
+        weekday_ok = (moment.weekday() + 1) % 7 in self.weekdays
+        if self.any_day:
+            return weekday_ok
+        if self.any_weekday:
+            return day_ok
+        return day_ok or weekday_ok  # cron semantics when both are restricted
+
+    def next_after(self, moment):
+        t = (moment + datetime.timedelta(minutes=1)).replace(second=0, microsecond=0)
+        limit = moment + datetime.timedelta(days=366 * 5)
+
+        while t <= limit:
+            if t.month not in self.months:
+                t = (t.replace(day=1) + datetime.timedelta(days=32)).replace(day=1, hour=0, minute=0)
+            elif not self._day_matches(t):
+                t = (t + datetime.timedelta(days=1)).replace(hour=0, minute=0)
+            elif t.hour not in self.hours:
+                t = (t + datetime.timedelta(hours=1)).replace(minute=0)
+            elif t.minute not in self.minutes:
+                t += datetime.timedelta(minutes=1)
+            else:
+                return t
+
+        raise ValueError(f"Cron expression never fires: {self.expression!r}")
+
+
+def parse_schedule(text):
+    """Cron expression, @hourly/@daily/@weekly, or "@every <n><s|m|h|d>" """
+    text = text.strip()
+    if text.startswith('@every'):
+        amount = text.split(None, 1)[1].strip()
+        unit = amount[-1] if amount[-1] in IntervalSchedule.UNITS else 's'
+        number = amount[:-1] if amount[-1] in IntervalSchedule.UNITS else amount
+        return IntervalSchedule(float(number) * IntervalSchedule.UNITS[unit])
+    return CronSchedule(SCHEDULE_ALIASES.get(text, text))
+
+
+class ResearchDaemon:
+    """
+    Runs research cycles on a schedule until stopped
+
+    Each cycle fetches every source concurrently (each under its own timeout),
+    drops brands already in the prospects index or seen earlier in the cycle,
+    and hands the rest to the researcher as one batch - one write per cycle
+    however many brands are found. SIGINT/SIGTERM stop the daemon after the
+    current cycle finishes.
+    """
+
+    def __init__(self, researcher, sources, schedule, jitter_seconds=0, source_timeout=30,
+                 max_per_cycle=None, fallback_category=None):
+        self.researcher = researcher
+        self.sources = sources
+        self.schedule = schedule
+        self.jitter_seconds = jitter_seconds
+        self.source_timeout = source_timeout
+        self.max_per_cycle = max_per_cycle
+        self.fallback_category = fallback_category
+        self.cycles = 0
+        self._stop = None
+
+    def stop(self):
+        if self._stop is not None:
+            self._stop.set()
+
+    async def _fetch(self, source):
+        try:
+            return await asyncio.wait_for(source.fetch(), timeout=self.source_timeout)
+        except asyncio.TimeoutError:
+            print(f"⏱️  {source.name} timed out after {self.source_timeout}s")
+        except Exception as e:
+            print(f"❌ {source.name} failed: {e}")
+        return []
+
+    async def run_cycle(self):
+        """Run one discovery cycle; returns the (name, description, category) tuples added"""
+        results = await asyncio.gather(*(self._fetch(source) for source in self.sources))
+
+        candidates = []
+        seen = set()
+        for source, found in zip(self.sources, results):
+            fresh = 0
+            for name, description, category in found:
+                key = normalize_brand(name)
+                if key in seen or self.researcher.is_known(name):
+                    continue
+                seen.add(key)
+                fresh += 1
+                candidates.append((name, description, category))
+            print(f"🔎 {source.name}: {len(found)} found, {fresh} new")
+
+        # Brands whose category has no section go to the fallback section, if any
+        document = self.researcher.document()
+        placed = []
+        for name, description, category in candidates:
+            if not category or document.find_section(category) is None:
+                category = self.fallback_category
+            if category:
+                placed.append((name, description, category))
+
+        if self.max_per_cycle is not None:
+            placed = placed[:self.max_per_cycle]
+
+        added = self.researcher.add_brands(placed, write=False)
+        self.researcher.update_statistics()  # Single write for the whole cycle
+        self.cycles += 1
+
+        skipped = len(candidates) - len(placed)
+        print(f"✅ Cycle {self.cycles}: added {len(added)} brand(s)"
+              f"{f', {skipped} without a matching category' if skipped else ''}")
+        return added
+
+    async def run(self, once=False):
+        self._stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self.stop)
+            except (NotImplementedError, RuntimeError):
+                pass  # Not supported on this platform/thread; Ctrl+C still raises
+
+        try:
+            while not self._stop.is_set():
+                try:
+                    await self.run_cycle()
+                except Exception as e:
+                    print(f"❌ Cycle failed: {e}")
+
+                if once:
+                    break
+
+                now = datetime.datetime.now()
+                delay = (self.schedule.next_after(now) - now).total_seconds()
+                delay += random.uniform(0, self.jitter_seconds)
+                print(f"💤 Next cycle in {delay / 60:.1f} minutes")
+                try:
+                    await asyncio.wait_for(self._stop.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                try:
+                    loop.remove_signal_handler(sig)
+                except (NotImplementedError, RuntimeError):
+                    pass
+
+        print("👋 Brand Research Bot stopped")
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Offline tests for export_service readers and writers (python -m pytest test_export_service.py)"""
+
+import json
+from decimal import Decimal
+
+import pytest
+
+import export_service
+from export_service import ENTITIES, PostgRESTReader, PsycopgReader, run_export
+
+UNIVERSITY = {
+    'id': '00000000-0000-0000-0000-000000000001', 'name': 'Penn State University', 'state': 'PA',
+    'location': 'University Park', 'student_count': 46810, 'greek_percentage': 0.12,
+    'website': 'https://psu.edu',
+}
+
+
+class _Response:
+    def __init__(self, data):
+        self.data = data
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.data
+
+
+class _Session:
+    """PostgREST stand-in: one page of rows, then nothing"""
+
+    def __init__(self, rows):
+        self.pages = [rows]
+
+    def get(self, url, params=None, timeout=None):
+        return _Response(self.pages.pop() if self.pages else [])
+
+    def close(self):
+        pass
+
+
+class _Cursor:
+    """psycopg2 stand-in returning DECIMAL columns as decimal.Decimal, as psycopg2 does"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.query = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+    def execute(self, query, params=None):
+        self.query = query
+
+    def fetchmany(self, size):
+        rows, self.rows = self.rows[:size], self.rows[size:]
+        return rows
+
+
+class _Connection:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def cursor(self, name=None):
+        return _Cursor(self.rows)
+
+    def commit(self):
+        pass
+
+
+def _postgrest_reader():
+    reader = PostgRESTReader('test-key', ranges_per_export=1)
+    reader.session = _Session([UNIVERSITY])
+    return reader
+
+
+def _psycopg_reader():
+    reader = PsycopgReader.__new__(PsycopgReader)  # no psycopg2 or database needed
+    reader.itersize = 100
+    row = tuple(Decimal('0.12') if key == 'greek_percentage' else value for key, value in UNIVERSITY.items())
+    reader._conn = lambda: _Connection([row])
+    return reader
+
+
+def test_float_columns_are_cast_in_sql():
+    query = ENTITIES['universities'].sql_query()
+    assert '(greek_percentage)::float8 AS "greek_percentage"' in query
+    assert '(student_count)::bigint AS "student_count"' in query
+
+
+@pytest.mark.parametrize('make_reader', [_postgrest_reader, _psycopg_reader])
+def test_readers_write_the_same_ndjson(tmp_path, make_reader):
+    path, count = run_export(ENTITIES['universities'], make_reader(), 'ndjson', str(tmp_path))
+    assert count == 1
+    with open(path, encoding='utf-8') as f:
+        row = json.loads(f.readline())
+    assert row['greek_percentage'] == 0.12 and isinstance(row['greek_percentage'], float)
+    assert row == UNIVERSITY
+
+
+@pytest.mark.parametrize('make_reader', [_postgrest_reader, _psycopg_reader])
+def test_readers_write_parquet(tmp_path, make_reader):
+    pq = pytest.importorskip('pyarrow.parquet')
+    path, count = run_export(ENTITIES['universities'], make_reader(), 'parquet', str(tmp_path))
+    assert count == 1
+    assert pq.read_table(path).to_pylist() == [UNIVERSITY]
+
+
+def test_decimal_is_converted_before_writing():
+    column = next(c for c in ENTITIES['universities'].columns if c.header == 'greek_percentage')
+    assert column.convert(Decimal('0.25')) == 0.25 and isinstance(column.convert(Decimal('0.25')), float)
+    assert column.convert(None) is None
+    assert export_service.rows_from_tuples(ENTITIES['universities'], [tuple(UNIVERSITY.values())]) == [UNIVERSITY]